@@ -0,0 +1,2 @@
+def libfunc(text):
+    print('got text:', text)
\ No newline at end of file
@@ -0,0 +1,2 @@
+def blibfunc(text):
+    print('blib got text:', text)
\ No newline at end of file
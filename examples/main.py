@@ -0,0 +1,6 @@
+
+import mlrun, sys
+if __name__ == "__main__":
+    context = mlrun.get_or_create_ctx("test1")
+    context.log_result("my_args", sys.argv)
+    context.commit(completed=True)
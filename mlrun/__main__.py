@@ -32,7 +32,7 @@ import mlrun
 
 from .builder import upload_tarball
 from .config import config as mlconf
-from .db import get_run_db
+from .db import FileRunDB, get_run_db
 from .k8s_utils import K8sHelper
 from .model import RunTemplate
 from .platforms import auto_mount as auto_mount_modifier
@@ -675,6 +675,14 @@ def db(port, dirpath):
         raise SystemExit(returncode)
 
 
+@main.command(name="db-index")
+@click.argument("dirpath", type=str)
+@click.option("--format", default=".yaml", help="db files format (.yaml or .json)")
+def db_index(dirpath, format):
+    """Rebuild the index of a file db dir (e.g. written by an older version)"""
+    FileRunDB(dirpath, format=format).rebuild_index()
+
+
 @main.command()
 def version():
     """get mlrun version"""
@@ -10,7 +10,7 @@ import mlrun.api.utils.clients.opa
 import mlrun.api.utils.singletons.project_member
 from mlrun.api import schemas
 from mlrun.api.api import deps
-from mlrun.api.api.utils import log_and_raise
+from mlrun.api.api.utils import log_and_raise, stream_paginated_records
 from mlrun.api.utils.singletons.db import get_db
 from mlrun.config import config
 from mlrun.utils import logger
@@ -144,6 +144,9 @@ def list_artifacts(
     labels: List[str] = Query([], alias="label"),
     iter: int = Query(None, ge=0),
     best_iteration: bool = Query(False, alias="best-iteration"),
+    page_size: int = Query(None, gt=0, le=schemas.ListPagination.max_page_size),
+    page_token: str = None,
+    format_: schemas.ListFormat = Query(schemas.ListFormat.json, alias="format"),
     auth_verifier: deps.AuthVerifierDep = Depends(deps.AuthVerifierDep),
     db_session: Session = Depends(deps.get_db_session),
 ):
@@ -151,28 +154,40 @@ def list_artifacts(
         project, mlrun.api.schemas.AuthorizationAction.read, auth_verifier.auth_info,
     )
 
-    artifacts = mlrun.api.crud.Artifacts().list_artifacts(
-        db_session,
-        project,
-        name,
-        tag,
-        labels,
-        kind=kind,
-        category=category,
-        iter=iter,
-        best_iteration=best_iteration,
-    )
-    artifacts = mlrun.api.utils.clients.opa.Client().filter_project_resources_by_permissions(
-        mlrun.api.schemas.AuthorizationResourceTypes.artifact,
-        artifacts,
-        lambda artifact: (
-            artifact.get("project", mlrun.mlconf.default_project),
-            artifact["db_key"],
-        ),
-        auth_verifier.auth_info,
-    )
+    def _list_artifacts_page(session: Session, page_token_: str = None):
+        artifacts = mlrun.api.crud.Artifacts().list_artifacts(
+            session,
+            project,
+            name,
+            tag,
+            labels,
+            kind=kind,
+            category=category,
+            iter=iter,
+            best_iteration=best_iteration,
+            page_size=page_size,
+            page_token=page_token_,
+        )
+        filtered_artifacts = mlrun.api.utils.clients.opa.Client().filter_project_resources_by_permissions(
+            mlrun.api.schemas.AuthorizationResourceTypes.artifact,
+            artifacts,
+            lambda artifact: (
+                artifact.get("project", mlrun.mlconf.default_project),
+                artifact["db_key"],
+            ),
+            auth_verifier.auth_info,
+        )
+        return filtered_artifacts, artifacts.next_page_token
+
+    if format_ == schemas.ListFormat.jsonl:
+        if not page_size and not best_iteration:
+            page_size = schemas.ListPagination.stream_page_size
+        return stream_paginated_records(_list_artifacts_page, page_token)
+
+    filtered_artifacts, next_page_token = _list_artifacts_page(db_session, page_token)
     return {
-        "artifacts": artifacts,
+        "artifacts": filtered_artifacts,
+        "next_page_token": next_page_token,
     }
 
 
@@ -1,11 +1,17 @@
+import asyncio
+import time
+import typing
+
 import fastapi
 import fastapi.concurrency
+import fastapi.responses
 import sqlalchemy.orm
 
 import mlrun.api.api.deps
 import mlrun.api.crud
 import mlrun.api.schemas
 import mlrun.api.utils.clients.opa
+import mlrun.runtimes.constants
 
 router = fastapi.APIRouter()
 
@@ -36,11 +42,13 @@ async def store_log(
 
 
 @router.get("/log/{project}/{uid}")
-def get_log(
+async def get_log(
     project: str,
     uid: str,
     size: int = -1,
     offset: int = 0,
+    since_seconds: int = None,
+    wait_timeout: int = 0,
     auth_verifier: mlrun.api.api.deps.AuthVerifierDep = fastapi.Depends(
         mlrun.api.api.deps.AuthVerifierDep
     ),
@@ -48,15 +56,25 @@ def get_log(
         mlrun.api.api.deps.get_db_session
     ),
 ):
-    mlrun.api.utils.clients.opa.Client().query_project_resource_permissions(
+    """
+    :param since_seconds: return only logs newer than this (relevant only for logs read from k8s)
+    :param wait_timeout: long-poll - when there are no new logs (after the offset) and the run is not in terminal state,
+        wait up to this many seconds (capped by httpdb.logs.max_wait_timeout) for new logs before responding, so
+        watchers don't need to sleep between calls
+    """
+    await fastapi.concurrency.run_in_threadpool(
+        mlrun.api.utils.clients.opa.Client().query_project_resource_permissions,
         mlrun.api.schemas.AuthorizationResourceTypes.log,
         project,
         uid,
         mlrun.api.schemas.AuthorizationAction.read,
         auth_verifier.auth_info,
     )
-    run_state, log = mlrun.api.crud.Logs().get_logs(
-        db_session, project, uid, size, offset
+    wait_timeout = max(
+        0, min(wait_timeout, int(mlrun.mlconf.httpdb.logs.max_wait_timeout))
+    )
+    run_state, wait_timeout = await _wait_for_logs(
+        db_session, project, uid, offset, wait_timeout
     )
     headers = {
         "x-mlrun-run-state": run_state,
@@ -64,5 +82,60 @@ def get_log(
         # clients will work with the API)
         # TODO: remove this in 0.7.0
         "pod_status": run_state,
+        # lets the clients know the server supports (and applied) long-poll, so they don't need to sleep
+        "x-mlrun-log-wait-timeout": str(wait_timeout),
     }
-    return fastapi.Response(content=log, media_type="text/plain", headers=headers)
+    # the log is streamed (iterated in the threadpool) so big logs won't be loaded into memory
+    return fastapi.responses.StreamingResponse(
+        mlrun.api.crud.Logs().iterate_logs(
+            project, uid, size, offset, since_seconds=since_seconds
+        ),
+        media_type="text/plain",
+        headers=headers,
+    )
+
+
+async def _wait_for_logs(
+    db_session: sqlalchemy.orm.Session,
+    project: str,
+    uid: str,
+    offset: int,
+    wait_timeout: int,
+) -> typing.Tuple[str, int]:
+    """
+    Wait until there are logs after the given offset, the run reaches a terminal state or the timeout passes.
+    Every check is a lookup of the run state column and a stat of the log file, so it is cheap to keep many waiters.
+    Logs which are read from k8s are checked by reading the logs since the previous read ended at the offset
+    :return: Tuple with the run state and the applied wait timeout (0 if waiting isn't applicable)
+    """
+    deadline = time.monotonic() + wait_timeout
+    while True:
+        run_state = await fastapi.concurrency.run_in_threadpool(
+            mlrun.api.crud.Logs().get_run_state, db_session, project, uid
+        )
+        # end the transaction, so the connection goes back to the pool while waiting and the next check doesn't
+        # read the same (stale) snapshot
+        await fastapi.concurrency.run_in_threadpool(db_session.commit)
+        if (
+            time.monotonic() >= deadline
+            or run_state in mlrun.runtimes.constants.RunStates.terminal_states()
+        ):
+            return run_state, wait_timeout
+        log_size = await fastapi.concurrency.run_in_threadpool(
+            mlrun.api.crud.Logs().get_log_size, project, uid
+        )
+        if log_size is not None:
+            has_logs = log_size > offset
+            poll_interval = float(mlrun.mlconf.httpdb.logs.wait_poll_interval)
+        else:
+            # the log isn't persisted (yet), it is read from k8s
+            has_logs = await fastapi.concurrency.run_in_threadpool(
+                mlrun.api.crud.Logs().has_k8s_logs_after, project, uid, offset
+            )
+            # there is no pod, or its logs weren't read up to the offset yet so they can't be checked cheaply
+            if has_logs is None:
+                return run_state, 0
+            poll_interval = float(mlrun.mlconf.httpdb.logs.k8s_wait_poll_interval)
+        if has_logs:
+            return run_state, wait_timeout
+        await asyncio.sleep(min(poll_interval, deadline - time.monotonic()))
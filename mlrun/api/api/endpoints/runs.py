@@ -1,4 +1,6 @@
+import asyncio
 import datetime
+import time
 from http import HTTPStatus
 from typing import List
 
@@ -11,7 +13,7 @@ import mlrun.api.schemas
 import mlrun.api.utils.clients.opa
 import mlrun.api.utils.singletons.project_member
 from mlrun.api.api import deps
-from mlrun.api.api.utils import log_and_raise
+from mlrun.api.api.utils import log_and_raise, stream_paginated_records
 from mlrun.utils import logger
 from mlrun.utils.helpers import datetime_from_iso
 
@@ -139,6 +141,13 @@ def list_runs(
     start_time_to: str = None,
     last_update_time_from: str = None,
     last_update_time_to: str = None,
+    page_size: int = Query(
+        None, gt=0, le=mlrun.api.schemas.ListPagination.max_page_size
+    ),
+    page_token: str = None,
+    format_: mlrun.api.schemas.ListFormat = Query(
+        mlrun.api.schemas.ListFormat.json, alias="format"
+    ),
     auth_verifier: deps.AuthVerifierDep = Depends(deps.AuthVerifierDep),
     db_session: Session = Depends(deps.get_db_session),
 ):
@@ -148,33 +157,96 @@ def list_runs(
             mlrun.api.schemas.AuthorizationAction.read,
             auth_verifier.auth_info,
         )
-    runs = mlrun.api.crud.Runs().list_runs(
-        db_session,
-        name=name,
-        uid=uid,
-        project=project,
-        labels=labels,
-        state=state,
-        sort=sort,
-        last=last,
-        iter=iter,
-        start_time_from=datetime_from_iso(start_time_from),
-        start_time_to=datetime_from_iso(start_time_to),
-        last_update_time_from=datetime_from_iso(last_update_time_from),
-        last_update_time_to=datetime_from_iso(last_update_time_to),
-    )
-    filtered_runs = mlrun.api.utils.clients.opa.Client().filter_project_resources_by_permissions(
+
+    def _list_runs_page(session: Session, page_token_: str = None):
+        runs = mlrun.api.crud.Runs().list_runs(
+            session,
+            name=name,
+            uid=uid,
+            project=project,
+            labels=labels,
+            state=state,
+            sort=sort,
+            last=last,
+            iter=iter,
+            start_time_from=datetime_from_iso(start_time_from),
+            start_time_to=datetime_from_iso(start_time_to),
+            last_update_time_from=datetime_from_iso(last_update_time_from),
+            last_update_time_to=datetime_from_iso(last_update_time_to),
+            page_size=page_size,
+            page_token=page_token_,
+        )
+        filtered_runs = mlrun.api.utils.clients.opa.Client().filter_project_resources_by_permissions(
+            mlrun.api.schemas.AuthorizationResourceTypes.run,
+            runs,
+            lambda run: (
+                run.get("metadata", {}).get("project", mlrun.mlconf.default_project),
+                run.get("metadata", {}).get("uid"),
+            ),
+            auth_verifier.auth_info,
+        )
+        return filtered_runs, runs.next_page_token
+
+    if format_ == mlrun.api.schemas.ListFormat.jsonl:
+        if not page_size and not last:
+            page_size = mlrun.api.schemas.ListPagination.stream_page_size
+        return stream_paginated_records(_list_runs_page, page_token)
+
+    filtered_runs, next_page_token = _list_runs_page(db_session, page_token)
+    return {
+        "runs": filtered_runs,
+        "next_page_token": next_page_token,
+    }
+
+
+@router.post("/runs/states")
+async def list_runs_states(
+    runs_states_input: mlrun.api.schemas.RunsStatesInput,
+    auth_verifier: deps.AuthVerifierDep = Depends(deps.AuthVerifierDep),
+    db_session: Session = Depends(deps.get_db_session),
+):
+    """
+    Return only the states of the given runs (read from the runs state column), so clients waiting for many runs
+    don't need to read each of them.
+    When wait_timeout is given - long-poll, wait up to this many seconds (capped by httpdb.runs.max_wait_timeout)
+    until the state of any of the runs differs from the (known) state given for it before responding
+    """
+    runs = [
+        (run.project or mlrun.mlconf.default_project, run.uid, run.iter)
+        for run in runs_states_input.runs
+    ]
+    await run_in_threadpool(
+        mlrun.api.utils.clients.opa.Client().query_project_resources_permissions,
         mlrun.api.schemas.AuthorizationResourceTypes.run,
         runs,
-        lambda run: (
-            run.get("metadata", {}).get("project", mlrun.mlconf.default_project),
-            run.get("metadata", {}).get("uid"),
-        ),
+        lambda run: (run[0], run[1]),
+        mlrun.api.schemas.AuthorizationAction.read,
         auth_verifier.auth_info,
     )
-    return {
-        "runs": filtered_runs,
-    }
+    wait_timeout = max(
+        0,
+        min(
+            runs_states_input.wait_timeout,
+            int(mlrun.mlconf.httpdb.runs.max_wait_timeout),
+        ),
+    )
+    known_states = [run.state for run in runs_states_input.runs]
+    deadline = time.monotonic() + wait_timeout
+    while True:
+        states = await run_in_threadpool(
+            mlrun.api.crud.Runs().list_runs_states, db_session, runs
+        )
+        if states != known_states or time.monotonic() >= deadline:
+            break
+        # ends the read transaction, so the next check sees the runs updates
+        await run_in_threadpool(db_session.commit)
+        await asyncio.sleep(
+            min(
+                float(mlrun.mlconf.httpdb.runs.wait_poll_interval),
+                deadline - time.monotonic(),
+            )
+        )
+    return mlrun.api.schemas.RunsStatesOutput(states=states, wait_timeout=wait_timeout)
 
 
 @router.delete("/runs")
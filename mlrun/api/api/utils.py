@@ -8,8 +8,10 @@ from pathlib import Path
 
 from fastapi import HTTPException
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+import mlrun.api.db.session
 import mlrun.api.utils.clients.opa
 import mlrun.errors
 from mlrun.api import schemas
@@ -21,7 +23,7 @@ from mlrun.config import config
 from mlrun.db.sqldb import SQLDB as SQLRunDB
 from mlrun.run import import_function, new_function
 from mlrun.runtimes.utils import enrich_function_from_dict
-from mlrun.utils import get_in, logger, parse_versioned_object_uri
+from mlrun.utils import dict_to_json, get_in, logger, parse_versioned_object_uri
 
 
 def log_and_raise(status=HTTPStatus.BAD_REQUEST.value, **kw):
@@ -31,6 +33,40 @@ def log_and_raise(status=HTTPStatus.BAD_REQUEST.value, **kw):
     raise HTTPException(status_code=status, detail={"reason": kw})
 
 
+def stream_paginated_records(
+    list_page: typing.Callable[
+        [Session, typing.Optional[str]], typing.Tuple[list, typing.Optional[str]]
+    ],
+    page_token: str = None,
+) -> StreamingResponse:
+    """
+    Stream records as json lines, fetching them from the db page by page so that the whole result is never held in
+    memory. list_page gets a db session and a page token and returns the page's records and the next page token.
+    A dedicated db session is used since the request's one may be closed before the response body is fully sent
+    """
+    db_session = mlrun.api.db.session.create_session()
+    try:
+        # the first page is fetched before responding so that errors (e.g. invalid token) will fail the request
+        records, next_page_token = list_page(db_session, page_token)
+    except Exception:
+        mlrun.api.db.session.close_session(db_session)
+        raise
+
+    def _generate_lines():
+        nonlocal records, next_page_token
+        try:
+            while True:
+                for record in records:
+                    yield dict_to_json(record) + "\n"
+                if not next_page_token:
+                    break
+                records, next_page_token = list_page(db_session, next_page_token)
+        finally:
+            mlrun.api.db.session.close_session(db_session)
+
+    return StreamingResponse(_generate_lines(), media_type="application/x-ndjson")
+
+
 def log_path(project, uid) -> Path:
     return project_logs_path(project) / uid
 
@@ -54,6 +54,8 @@ class Artifacts(metaclass=mlrun.utils.singleton.Singleton,):
         category: typing.Optional[mlrun.api.schemas.ArtifactCategories] = None,
         iter: typing.Optional[int] = None,
         best_iteration: bool = False,
+        page_size: typing.Optional[int] = None,
+        page_token: typing.Optional[str] = None,
     ) -> typing.List:
         project = project or mlrun.mlconf.default_project
         if labels is None:
@@ -70,6 +72,8 @@ class Artifacts(metaclass=mlrun.utils.singleton.Singleton,):
             category,
             iter,
             best_iteration,
+            page_size=page_size,
+            page_token=page_token,
         )
         return artifacts
 
@@ -1,5 +1,9 @@
+import collections
+import datetime
 import os
 import shutil
+import threading
+import time
 import typing
 from http import HTTPStatus
 
@@ -7,6 +11,7 @@ from sqlalchemy.orm import Session
 
 import mlrun.api.schemas
 import mlrun.api.utils.clients.opa
+import mlrun.errors
 import mlrun.utils.singleton
 from mlrun.api.api.utils import log_and_raise, log_path, project_logs_path
 from mlrun.api.constants import LogSources
@@ -15,7 +20,31 @@ from mlrun.api.utils.singletons.k8s import get_k8s
 from mlrun.runtimes.constants import PodPhases
 
 
+class _K8sLogCursor(typing.NamedTuple):
+    pod: str
+    # the position (in the logs without the timestamps) the last read ended at
+    offset: int
+    # the timestamp (seconds precision) of the last line which was read, and the bytes read from the lines of it
+    second: bytes
+    second_bytes: int
+
+    @property
+    def second_timestamp(self) -> float:
+        return (
+            datetime.datetime.strptime(self.second.decode(), "%Y-%m-%dT%H:%M:%S")
+            .replace(tzinfo=datetime.timezone.utc)
+            .timestamp()
+        )
+
+
 class Logs(metaclass=mlrun.utils.singleton.Singleton,):
+    # seconds added to the time since the last read when resuming to read k8s logs
+    _k8s_logs_since_margin = 10
+
+    def __init__(self):
+        self._k8s_log_cursors = collections.OrderedDict()
+        self._k8s_log_cursors_lock = threading.Lock()
+
     def store_log(
         self, body: bytes, project: str, uid: str, append: bool = True,
     ):
@@ -42,6 +71,7 @@ class Logs(metaclass=mlrun.utils.singleton.Singleton,):
         size: int = -1,
         offset: int = 0,
         source: LogSources = LogSources.AUTO,
+        since_seconds: int = None,
     ) -> typing.Tuple[str, bytes]:
         """
         :return: Tuple with:
@@ -49,26 +79,190 @@ class Logs(metaclass=mlrun.utils.singleton.Singleton,):
             2. bytes of the logs themselves
         """
         project = project or mlrun.mlconf.default_project
-        out = b""
-        log_file = log_path(project, uid)
-        data = get_db().read_run(db_session, uid, project)
-        if not data:
+        run_state = self.get_run_state(db_session, project, uid)
+        out = b"".join(
+            self.iterate_logs(project, uid, size, offset, source, since_seconds)
+        )
+        return run_state, out
+
+    def get_run_state(self, db_session: Session, project: str, uid: str) -> str:
+        project = project or mlrun.mlconf.default_project
+        try:
+            return get_db().read_run_state(db_session, uid, project)
+        except mlrun.errors.MLRunNotFoundError:
             log_and_raise(HTTPStatus.NOT_FOUND.value, project=project, uid=uid)
-        run_state = data.get("status", {}).get("state", "")
+
+    def iterate_logs(
+        self,
+        project: str,
+        uid: str,
+        size: int = -1,
+        offset: int = 0,
+        source: LogSources = LogSources.AUTO,
+        since_seconds: int = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> typing.Iterator[bytes]:
+        """
+        Yield the log bytes in the [offset, offset + size) range in chunks, so big logs won't be loaded into memory at
+        once. since_seconds is applicable only to logs read from k8s (and the offset is relative to it)
+        """
+        project = project or mlrun.mlconf.default_project
+        log_file = log_path(project, uid)
         if log_file.exists() and source in [LogSources.AUTO, LogSources.PERSISTENCY]:
             with log_file.open("rb") as fp:
                 fp.seek(offset)
-                out = fp.read(size)
+                remaining = size
+                while remaining != 0:
+                    chunk = fp.read(
+                        chunk_size if remaining < 0 else min(chunk_size, remaining)
+                    )
+                    if not chunk:
+                        break
+                    remaining -= len(chunk) if remaining > 0 else 0
+                    yield chunk
         elif source in [LogSources.AUTO, LogSources.K8S]:
-            if get_k8s():
-                pods = get_k8s().get_logger_pods(project, uid)
-                if pods:
-                    pod, pod_phase = list(pods.items())[0]
-                    if pod_phase != PodPhases.pending:
-                        resp = get_k8s().logs(pod)
-                        if resp:
-                            out = resp.encode()[offset:]
-        return run_state, out
+            pod, pod_phase = self._get_logger_pod(project, uid)
+            if pod and pod_phase != PodPhases.pending:
+                yield from self._iterate_k8s_logs(
+                    project, uid, pod, size, offset, since_seconds, chunk_size
+                )
+
+    def has_k8s_logs_after(
+        self, project: str, uid: str, offset: int
+    ) -> typing.Optional[bool]:
+        """
+        :return: whether the run pod has logs after the offset, None if it can't be checked cheaply - there is no pod,
+            or its logs weren't read up to this offset before (see _iterate_k8s_logs)
+        """
+        project = project or mlrun.mlconf.default_project
+        pod, pod_phase = self._get_logger_pod(project, uid)
+        if not pod:
+            return None
+        if pod_phase == PodPhases.pending:
+            return False
+        if pod_phase in PodPhases.terminal_phases():
+            return True
+        cursor = self._get_k8s_log_cursor(project, uid)
+        if not cursor or cursor.pod != pod or cursor.offset != offset:
+            return None
+        for _ in self._iterate_k8s_logs(
+            project, uid, pod, size=1, offset=offset, update_cursor=False
+        ):
+            return True
+        return False
+
+    @staticmethod
+    def _get_logger_pod(
+        project: str, uid: str
+    ) -> typing.Tuple[typing.Optional[str], typing.Optional[str]]:
+        """
+        :return: Tuple with the name and phase of the pod the run logs are read from, (None, None) if there is none
+        """
+        if not get_k8s():
+            return None, None
+        pods = get_k8s().get_logger_pods(project, uid)
+        if not pods:
+            return None, None
+        return list(pods.items())[0]
+
+    def _iterate_k8s_logs(
+        self,
+        project: str,
+        uid: str,
+        pod: str,
+        size: int = -1,
+        offset: int = 0,
+        since_seconds: int = None,
+        chunk_size: int = 1024 * 1024,
+        update_cursor: bool = True,
+    ) -> typing.Iterator[bytes]:
+        """
+        k8s can't serve the logs from a byte offset, so the logs are streamed with their timestamps (which are removed)
+        and the read position is counted. the position the read ended at is kept per run with the timestamp (seconds)
+        of the last line, so the next read from this position (a watcher) asks k8s only for the logs since that second,
+        instead of all the logs from the start
+        """
+        end = offset + size if size >= 0 else None
+        # the offset is relative to the since_seconds the caller asked for, so it can't be resumed from
+        resumable = not since_seconds
+        cursor = None
+        if resumable:
+            cursor = self._get_k8s_log_cursor(project, uid)
+            if cursor and cursor.pod == pod and cursor.offset == offset:
+                # with a margin, in case the API and the node clocks differ, the lines before it are skipped anyway
+                since_seconds = (
+                    max(int(time.time() - cursor.second_timestamp), 0)
+                    + self._k8s_logs_since_margin
+                )
+            else:
+                cursor = None
+        # the position (of the logs without the timestamps) of the current line, not known until the lines which
+        # were read before are skipped when resuming from the cursor
+        position = 0 if not cursor else None
+        second = None
+        second_start = 0
+        chunks = get_k8s().stream_logs(
+            pod, since_seconds=since_seconds, timestamps=True, chunk_size=chunk_size
+        )
+        try:
+            for timestamp, content in _iterate_timestamped_lines(chunks):
+                line_second = timestamp[:19]
+                if position is None:
+                    if line_second < cursor.second:
+                        continue
+                    position = cursor.offset
+                    if line_second == cursor.second:
+                        # the first bytes of the lines of the cursor second were read already
+                        position -= cursor.second_bytes
+                if line_second != second:
+                    second, second_start = line_second, position
+                line_end = position + len(content)
+                if line_end > offset:
+                    start = max(offset - position, 0)
+                    stop = (
+                        len(content)
+                        if end is None
+                        else min(end - position, len(content))
+                    )
+                    if stop > start:
+                        yield content[start:stop]
+                position = line_end
+                if end is not None and position >= end:
+                    break
+        finally:
+            # stops receiving the rest of the logs
+            chunks.close()
+
+        if update_cursor and resumable and second:
+            stop = position if end is None else min(position, end)
+            self._set_k8s_log_cursor(
+                project, uid, _K8sLogCursor(pod, stop, second, stop - second_start)
+            )
+
+    def _get_k8s_log_cursor(
+        self, project: str, uid: str
+    ) -> typing.Optional[_K8sLogCursor]:
+        with self._k8s_log_cursors_lock:
+            return self._k8s_log_cursors.get((project, uid))
+
+    def _set_k8s_log_cursor(self, project: str, uid: str, cursor: _K8sLogCursor):
+        with self._k8s_log_cursors_lock:
+            self._k8s_log_cursors[(project, uid)] = cursor
+            self._k8s_log_cursors.move_to_end((project, uid))
+            while len(self._k8s_log_cursors) > int(
+                mlrun.mlconf.httpdb.logs.k8s_cursors_cache_size
+            ):
+                self._k8s_log_cursors.popitem(last=False)
+
+    def get_log_size(self, project: str, uid: str) -> typing.Optional[int]:
+        """
+        :return: the size of the persisted log, None if it doesn't exist (e.g. logs are still only in k8s)
+        """
+        log_file = log_path(project or mlrun.mlconf.default_project, uid)
+        try:
+            return log_file.stat().st_size
+        except FileNotFoundError:
+            return None
 
     def get_log_mtime(self, project: str, uid: str) -> int:
         log_file = log_path(project, uid)
@@ -87,3 +281,19 @@ class Logs(metaclass=mlrun.utils.singleton.Singleton,):
             for file in os.listdir(str(logs_path))
             if os.path.isfile(os.path.join(str(logs_path), file))
         ]
+
+
+def _iterate_timestamped_lines(
+    chunks: typing.Iterator[bytes],
+) -> typing.Generator[typing.Tuple[bytes, bytes], None, None]:
+    """yield the timestamp and content of the lines of logs which were read (in chunks) with timestamps"""
+    remainder = b""
+    for chunk in chunks:
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        for line in lines:
+            timestamp, _, content = line.partition(b" ")
+            yield timestamp, content + b"\n"
+    if remainder:
+        timestamp, _, content = remainder.partition(b" ")
+        yield timestamp, content
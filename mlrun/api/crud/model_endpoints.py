@@ -1,3 +1,4 @@
+import concurrent.futures
 import json
 from typing import Any, Dict, List, Optional
 
@@ -40,6 +41,33 @@ class ModelEndpoints:
 
     ENDPOINTS = "endpoints"
     EVENTS = "events"
+    # the attributes needed to build the model endpoint objects, fetched when scanning the endpoints table
+    ENDPOINT_ATTRIBUTES = [
+        "endpoint_id",
+        "project",
+        "function_uri",
+        "model",
+        "model_class",
+        "labels",
+        "model_uri",
+        "stream_path",
+        "algorithm",
+        "active",
+        "state",
+        "feature_stats",
+        "current_stats",
+        "feature_names",
+        "label_names",
+        "children",
+        "monitor_configuration",
+        "drift_measures",
+        "drift_status",
+        "first_request",
+        "last_request",
+        "accuracy",
+        "error_count",
+    ]
+    CONVERSION_WORKERS = 4
 
     def create_or_patch(
         self,
@@ -207,6 +235,7 @@ class ModelEndpoints:
             end=end,
         )
 
+        access_key = self.get_access_key(auth_info)
         client = get_v3io_client(endpoint=config.v3io_api)
 
         path = config.model_endpoint_monitoring.store_prefixes.default.format(
@@ -214,32 +243,50 @@ class ModelEndpoints:
         )
         _, container, path = parse_model_endpoint_store_prefix(path)
 
+        # fetch the whole records in the scan itself rather than reading each endpoint separately
         cursor = client.kv.new_cursor(
             container=container,
             table_path=path,
-            access_key=auth_info.data_session,
+            access_key=access_key,
             filter_expression=self.build_kv_cursor_filter_expression(
                 project, function, model, labels
             ),
-            attribute_names=["endpoint_id"],
+            attribute_names=self.ENDPOINT_ATTRIBUTES,
         )
 
-        endpoint_list = ModelEndpointList(endpoints=[])
-        while True:
-            item = cursor.next_item()
-            if item is None:
-                break
-            endpoint_id = item["endpoint_id"]
-            endpoint = self.get_endpoint(
-                auth_info=auth_info,
+        # the records are converted (mostly decoding their json fields) by the executor while the cursor fetches the
+        # next ones
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.CONVERSION_WORKERS
+        ) as executor:
+            futures = []
+            while True:
+                item = cursor.next_item()
+                if item is None:
+                    break
+                futures.append(
+                    executor.submit(self._convert_into_model_endpoint_object, item)
+                )
+            endpoints = [future.result() for future in futures]
+
+        if metrics and endpoints:
+            endpoints_metrics = self.get_endpoints_metrics(
+                access_key=access_key,
                 project=project,
-                endpoint_id=endpoint_id,
+                # when listing all of the project endpoints there's no need to filter the metrics by them
+                endpoint_ids=[endpoint.metadata.uid for endpoint in endpoints]
+                if function or model or labels
+                else None,
                 metrics=metrics,
                 start=start,
                 end=end,
             )
-            endpoint_list.endpoints.append(endpoint)
-        return endpoint_list
+            for endpoint in endpoints:
+                endpoint_metrics = endpoints_metrics.get(endpoint.metadata.uid)
+                if endpoint_metrics:
+                    endpoint.status.metrics = endpoint_metrics
+
+        return ModelEndpointList(endpoints=endpoints)
 
     def get_endpoint(
         self,
@@ -287,6 +334,28 @@ class ModelEndpoints:
         if not endpoint:
             raise MLRunNotFoundError(f"Endpoint {endpoint_id} not found")
 
+        # the endpoint id isn't necessarily stored in the record attributes
+        endpoint = self._convert_into_model_endpoint_object(
+            {**endpoint, "endpoint_id": endpoint_id}, feature_analysis
+        )
+
+        if metrics:
+            endpoint_metrics = self.get_endpoint_metrics(
+                access_key=access_key,
+                project=project,
+                endpoint_id=endpoint_id,
+                start=start,
+                end=end,
+                metrics=metrics,
+            )
+            if endpoint_metrics:
+                endpoint.status.metrics = endpoint_metrics
+
+        return endpoint
+
+    def _convert_into_model_endpoint_object(
+        self, endpoint: Dict[str, Any], feature_analysis: bool = False
+    ) -> ModelEndpoint:
         labels = endpoint.get("labels")
 
         feature_names = endpoint.get("feature_names")
@@ -310,11 +379,11 @@ class ModelEndpoints:
         monitor_configuration = endpoint.get("monitor_configuration")
         monitor_configuration = self._json_loads_if_not_none(monitor_configuration)
 
-        endpoint = ModelEndpoint(
+        model_endpoint = ModelEndpoint(
             metadata=ModelEndpointMetadata(
                 project=endpoint.get("project"),
                 labels=self._json_loads_if_not_none(labels),
-                uid=endpoint_id,
+                uid=endpoint.get("endpoint_id"),
             ),
             spec=ModelEndpointSpec(
                 function_uri=endpoint.get("function_uri"),
@@ -348,22 +417,10 @@ class ModelEndpoints:
                 current_stats=current_stats,
             )
             if endpoint_features:
-                endpoint.status.features = endpoint_features
-                endpoint.status.drift_measures = drift_measures
-
-        if metrics:
-            endpoint_metrics = self.get_endpoint_metrics(
-                access_key=access_key,
-                project=project,
-                endpoint_id=endpoint_id,
-                start=start,
-                end=end,
-                metrics=metrics,
-            )
-            if endpoint_metrics:
-                endpoint.status.metrics = endpoint_metrics
+                model_endpoint.status.features = endpoint_features
+                model_endpoint.status.drift_measures = drift_measures
 
-        return endpoint
+        return model_endpoint
 
     def deploy_monitoring_functions(
         self,
@@ -450,6 +507,30 @@ class ModelEndpoints:
         start: str = "now-1h",
         end: str = "now",
     ) -> Dict[str, Metric]:
+        return self.get_endpoints_metrics(
+            access_key=access_key,
+            project=project,
+            endpoint_ids=[endpoint_id],
+            metrics=metrics,
+            start=start,
+            end=end,
+        ).get(endpoint_id, {})
+
+    def get_endpoints_metrics(
+        self,
+        access_key: str,
+        project: str,
+        endpoint_ids: Optional[List[str]],
+        metrics: List[str],
+        start: str = "now-1h",
+        end: str = "now",
+    ) -> Dict[str, Dict[str, Metric]]:
+        """
+        Reads the metrics of multiple endpoints in a single TSDB query
+
+        :param endpoint_ids: The ids of the endpoints to get the metrics for, None for all of the project endpoints
+        :return: A mapping of endpoint id to its metrics mapping (metric name to metric)
+        """
 
         if not metrics:
             raise MLRunInvalidArgumentError("Metric names must be provided")
@@ -463,27 +544,36 @@ class ModelEndpoints:
             token=access_key, address=config.v3io_framesd, container=container,
         )
 
+        read_kwargs = {}
+        if endpoint_ids is not None:
+            read_kwargs["filter"] = " OR ".join(
+                f"endpoint_id=='{endpoint_id}'" for endpoint_id in endpoint_ids
+            )
         data = client.read(
             backend="tsdb",
             table=path,
             columns=["endpoint_id", *metrics],
-            filter=f"endpoint_id=='{endpoint_id}'",
             start=start,
             end=end,
+            **read_kwargs,
         )
 
-        data_dict = data.to_dict()
-        metrics_mapping = {}
-        for metric in metrics:
-            metric_data = data_dict.get(metric)
-            if metric_data is None:
-                continue
-
-            values = [
-                (str(timestamp), value) for timestamp, value in metric_data.items()
-            ]
-            metrics_mapping[metric] = Metric(name=metric, values=values)
-        return metrics_mapping
+        endpoints_metrics = {}
+        if data.empty or "endpoint_id" not in data.columns:
+            return endpoints_metrics
+        for endpoint_id, endpoint_data in data.groupby("endpoint_id", sort=False):
+            metrics_mapping = {}
+            for metric in metrics:
+                if metric not in endpoint_data.columns:
+                    continue
+
+                values = [
+                    (str(timestamp), value)
+                    for timestamp, value in endpoint_data[metric].items()
+                ]
+                metrics_mapping[metric] = Metric(name=metric, values=values)
+            endpoints_metrics[endpoint_id] = metrics_mapping
+        return endpoints_metrics
 
     @staticmethod
     def deploy_model_monitoring_stream_processing(
@@ -520,7 +610,15 @@ class ModelEndpoints:
 
         fn.set_env("MODEL_MONITORING_ACCESS_KEY", model_monitoring_access_key)
         fn.set_env("MLRUN_AUTH_SESSION", model_monitoring_access_key)
-        fn.set_env("MODEL_MONITORING_PARAMETERS", json.dumps({"project": project}))
+        fn.set_env(
+            "MODEL_MONITORING_PARAMETERS",
+            json.dumps(
+                {
+                    "project": project,
+                    "columnar": config.model_endpoint_monitoring.columnar_stream_processing,
+                }
+            ),
+        )
 
         fn.apply(mlrun.mount_v3io())
         deploy_nuclio_function(fn, auth_info=auto_info)
@@ -1,3 +1,5 @@
+import typing
+
 import sqlalchemy.orm
 
 import mlrun.api.schemas
@@ -84,6 +86,16 @@ class Runs(metaclass=mlrun.utils.singleton.Singleton,):
             db_session, uid, project, iter
         )
 
+    def list_runs_states(
+        self, db_session: sqlalchemy.orm.Session, runs: typing.List[typing.Tuple],
+    ) -> typing.List[typing.Optional[str]]:
+        """return the states of the (project, uid, iter) runs, None for runs that were not found"""
+        runs = [
+            (project or mlrun.mlconf.default_project, uid, iter)
+            for project, uid, iter in runs
+        ]
+        return mlrun.api.utils.singletons.db.get_db().read_runs_states(db_session, runs)
+
     def list_runs(
         self,
         db_session: sqlalchemy.orm.Session,
@@ -99,6 +111,8 @@ class Runs(metaclass=mlrun.utils.singleton.Singleton,):
         start_time_to=None,
         last_update_time_from=None,
         last_update_time_to=None,
+        page_size: int = None,
+        page_token: str = None,
     ):
         project = project or mlrun.mlconf.default_project
         return mlrun.api.utils.singletons.db.get_db().list_runs(
@@ -115,6 +129,8 @@ class Runs(metaclass=mlrun.utils.singleton.Singleton,):
             start_time_to=start_time_to,
             last_update_time_from=last_update_time_from,
             last_update_time_to=last_update_time_to,
+            page_size=page_size,
+            page_token=page_token,
         )
 
     def delete_run(
@@ -16,6 +16,7 @@ import warnings
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
 
+import mlrun.errors
 from mlrun.api import schemas
 
 
@@ -52,6 +53,29 @@ class DBInterface(ABC):
     def read_run(self, session, uid, project="", iter=0):
         pass
 
+    def read_run_state(self, session, uid, project="", iter=0) -> str:
+        """
+        Read only the state of a run, used by flows that poll the run (e.g. watching its logs), implementations should
+        avoid loading the whole run object. The default one simply reads the run
+        """
+        run = self.read_run(session, uid, project, iter)
+        return run.get("status", {}).get("state", "")
+
+    def read_runs_states(
+        self, session, runs: List[Tuple[str, str, int]]
+    ) -> List[Optional[str]]:
+        """
+        Read only the states of multiple runs, given as (project, uid, iter) tuples, None for runs that don't exist.
+        The default implementation reads the states one by one
+        """
+        states = []
+        for project, uid, iter in runs:
+            try:
+                states.append(self.read_run_state(session, uid, project, iter))
+            except mlrun.errors.MLRunNotFoundError:
+                states.append(None)
+        return states
+
     @abstractmethod
     def list_runs(
         self,
@@ -68,9 +92,18 @@ class DBInterface(ABC):
         start_time_to=None,
         last_update_time_from=None,
         last_update_time_to=None,
+        page_size: int = None,
+        page_token: str = None,
     ):
         pass
 
+    def list_runs_for_monitoring(self, session, updated_after=None) -> List[dict]:
+        """
+        List the runs relevant for a runs monitoring cycle - runs in non-terminal state and runs that were updated after
+        the given time. Implementations may return a superset of these, the default one simply lists all runs
+        """
+        return self.list_runs(session, project="*")
+
     @abstractmethod
     def del_run(self, session, uid, project="", iter=0):
         pass
@@ -103,6 +136,8 @@ class DBInterface(ABC):
         category: schemas.ArtifactCategories = None,
         iter: int = None,
         best_iteration: bool = False,
+        page_size: int = None,
+        page_token: str = None,
     ):
         pass
 
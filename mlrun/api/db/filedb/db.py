@@ -53,7 +53,10 @@ class FileDB(DBInterface):
         start_time_to=None,
         last_update_time_from=None,
         last_update_time_to=None,
+        page_size: int = None,
+        page_token: str = None,
     ):
+        # pagination is not supported, the whole result is returned as a single page
         return self._transform_run_db_error(
             self.db.list_runs,
             name,
@@ -103,7 +106,10 @@ class FileDB(DBInterface):
         category: schemas.ArtifactCategories = None,
         iter: int = None,
         best_iteration: bool = False,
+        page_size: int = None,
+        page_token: str = None,
     ):
+        # pagination is not supported, the whole result is returned as a single page
         return self._transform_run_db_error(
             self.db.list_artifacts, name, project, tag, labels, since, until
         )
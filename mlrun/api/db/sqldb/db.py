@@ -17,9 +17,13 @@ import mlrun.errors
 from mlrun.api import schemas
 from mlrun.api.db.base import DBInterface
 from mlrun.api.db.sqldb.helpers import (
+    decode_page_token,
+    encode_page_token,
     generate_query_predicate_for_name,
     label_set,
     run_labels,
+    run_last_update,
+    run_name,
     run_start_time,
     run_state,
     update_labels,
@@ -51,7 +55,6 @@ from mlrun.utils import (
     generate_object_uri,
     get_in,
     logger,
-    match_times,
     update_in,
 )
 
@@ -107,11 +110,8 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
                 start_time=run_start_time(run_data) or datetime.now(timezone.utc),
             )
         labels = run_labels(run_data)
-        new_state = run_state(run_data)
-        if new_state:
-            run.state = new_state
+        self._update_run_record_from_struct(run, run_data)
         update_labels(run, labels)
-        run.struct = run_data
         self._upsert(session, run, ignore=True)
 
     def update_run(self, session, updates: dict, uid, project="", iter=0):
@@ -123,10 +123,7 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
         struct = run.struct
         for key, val in updates.items():
             update_in(struct, key, val)
-        run.struct = struct
-        new_state = run_state(struct)
-        if new_state:
-            run.state = new_state
+        self._update_run_record_from_struct(run, struct)
         start_time = run_start_time(struct)
         if start_time:
             run.start_time = start_time
@@ -138,6 +135,19 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
         session.commit()
         self._delete_empty_labels(session, Run.Label)
 
+    @staticmethod
+    def _update_run_record_from_struct(run: Run, struct: dict):
+        """
+        Sets the struct on the record together with the columns promoted from it (so queries can filter by them)
+        """
+        run.struct = struct
+        new_state = run_state(struct)
+        if new_state:
+            run.state = new_state
+        run.name = run_name(struct)
+        run.last_update = run_last_update(struct)
+        run.updated = datetime.now(timezone.utc)
+
     def read_run(self, session, uid, project=None, iter=0):
         project = project or config.default_project
         run = self._get_run(session, uid, project, iter)
@@ -145,6 +155,39 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
             raise mlrun.errors.MLRunNotFoundError(f"Run {uid}:{project} not found")
         return run.struct
 
+    def read_run_state(self, session, uid, project=None, iter=0) -> str:
+        project = project or config.default_project
+        run_state = self._query(
+            session, Run.state, uid=uid, project=project, iteration=iter
+        ).one_or_none()
+        if not run_state:
+            raise mlrun.errors.MLRunNotFoundError(f"Run {uid}:{project} not found")
+        return run_state.state or ""
+
+    def read_runs_states(
+        self, session, runs: List[typing.Tuple[str, str, int]]
+    ) -> List[typing.Optional[str]]:
+        runs = [
+            (project or config.default_project, uid, iter or 0)
+            for project, uid, iter in runs
+        ]
+        project_runs = collections.defaultdict(list)
+        for project, uid, iter in runs:
+            project_runs[project].append((uid, iter))
+        states = {}
+        for project, uids_and_iters in project_runs.items():
+            # chunked to stay below the max query variables
+            for start in range(0, len(uids_and_iters), 500):
+                chunk = uids_and_iters[start : start + 500]
+                query = session.query(Run.uid, Run.iteration, Run.state).filter(
+                    Run.project == project,
+                    Run.uid.in_({uid for uid, _ in chunk}),
+                    Run.iteration.in_({iter for _, iter in chunk}),
+                )
+                for uid, iteration, state in query:
+                    states[(project, uid, iteration)] = state or ""
+        return [states.get(run) for run in runs]
+
     def list_runs(
         self,
         session,
@@ -160,30 +203,104 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
         start_time_to=None,
         last_update_time_from=None,
         last_update_time_to=None,
+        page_size: int = None,
+        page_token: str = None,
     ):
+        """
+        When page_size is given a single page is returned, the returned list's next_page_token (None on the last page)
+        should be passed as the page_token to get the next one
+        """
+        if page_size and last:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "last cannot be used together with page_size"
+            )
         project = project or config.default_project
         query = self._find_runs(session, uid, project, labels)
+        query = self._add_runs_name_and_state_filters(query, name, state)
         if start_time_from:
             query = query.filter(Run.start_time >= start_time_from)
         if start_time_to:
             query = query.filter(Run.start_time <= start_time_to)
+        if last_update_time_from:
+            query = query.filter(Run.last_update >= last_update_time_from)
+        if last_update_time_to:
+            query = query.filter(Run.last_update <= last_update_time_to)
+        if not iter:
+            query = query.filter(Run.iteration == 0)
+        if page_size:
+            return self._list_runs_page(query, sort, page_size, page_token)
         if sort:
             query = query.order_by(Run.start_time.desc())
         if last:
             query = query.limit(last)
-        if not iter:
-            query = query.filter(Run.iteration == 0)
-
-        filtered_runs = self._post_query_runs_filter(
-            query, name, state, last_update_time_from, last_update_time_to
-        )
 
         runs = RunList()
-        for run in filtered_runs:
+        for run in query:
             runs.append(run.struct)
 
         return runs
 
+    @staticmethod
+    def _list_runs_page(query, sort, page_size, page_token=None) -> RunList:
+        # keyset pagination - the id is added to the sort key as a tie breaker so that the order will be total, and
+        # the page will start right after the position held in the token regardless of runs added in the meantime
+        position = decode_page_token(page_token) if page_token else None
+        if sort:
+            if position:
+                query = query.filter(
+                    SQLDB._runs_after_start_time_position_predicate(position)
+                )
+            query = query.order_by(Run.start_time.desc(), Run.id.desc())
+        else:
+            if position:
+                query = query.filter(Run.id > position.get("id", 0))
+            query = query.order_by(Run.id)
+
+        # fetch one extra record to know whether there's a next page
+        records = query.limit(page_size + 1).all()
+        runs = RunList(record.struct for record in records[:page_size])
+        if len(records) > page_size:
+            last_record = records[page_size - 1]
+            next_position = {"id": last_record.id}
+            if sort:
+                next_position["start_time"] = (
+                    last_record.start_time.isoformat()
+                    if last_record.start_time
+                    else None
+                )
+            runs.next_page_token = encode_page_token(next_position)
+        return runs
+
+    @staticmethod
+    def _runs_after_start_time_position_predicate(position: dict):
+        last_id = position.get("id", 0)
+        if not position.get("start_time"):
+            # null start times are sorted last (on descending order)
+            return and_(Run.start_time == NULL, Run.id < last_id)
+        start_time = datetime.fromisoformat(position["start_time"])
+        return or_(
+            Run.start_time < start_time,
+            and_(Run.start_time == start_time, Run.id < last_id),
+            Run.start_time == NULL,
+        )
+
+    def list_runs_for_monitoring(
+        self, session, updated_after: datetime = None,
+    ) -> List[dict]:
+        # import here to avoid circular imports
+        from mlrun.runtimes.constants import RunStates
+
+        # runs without state can't be known to be terminal, so they're included
+        predicates = [
+            Run.state.notin_(RunStates.terminal_states()),
+            Run.state == NULL,
+            Run.state == "",
+        ]
+        if updated_after:
+            predicates.append(Run.updated >= updated_after)
+        query = session.query(Run).filter(Run.iteration == 0).filter(or_(*predicates))
+        return [run.struct for run in query]
+
     def del_run(self, session, uid, project=None, iter=0):
         project = project or config.default_project
         # We currently delete *all* iterations
@@ -192,14 +309,13 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
     def del_runs(
         self, session, name=None, project=None, labels=None, state=None, days_ago=0
     ):
-        # FIXME: Run has no `name`
         project = project or config.default_project
         query = self._find_runs(session, None, project, labels)
+        query = self._add_runs_name_and_state_filters(query, name, state)
         if days_ago:
             since = datetime.now(timezone.utc) - timedelta(days=days_ago)
             query = query.filter(Run.start_time >= since)
-        filtered_runs = self._post_query_runs_filter(query, name, state)
-        for run in filtered_runs:  # Can not use query.delete with join
+        for run in query:  # Can not use query.delete with join
             session.delete(run)
         session.commit()
 
@@ -225,7 +341,8 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
         artifact = deepcopy(artifact)
         updated = artifact.get("updated")
         if not updated:
-            updated = artifact["updated"] = datetime.now(timezone.utc)
+            updated = datetime.now(timezone.utc)
+            artifact["updated"] = updated.isoformat()
         db_key = artifact.get("db_key")
         if db_key and db_key != key:
             raise mlrun.errors.MLRunInvalidArgumentError(
@@ -246,6 +363,7 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
         artifact.pop("tag", None)
 
         art.struct = artifact
+        art.kind = artifact.get("kind")
         self._upsert(session, art)
         if tag_artifact:
             tag = tag or "latest"
@@ -320,7 +438,14 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
         category: schemas.ArtifactCategories = None,
         iter: int = None,
         best_iteration: bool = False,
+        page_size: int = None,
+        page_token: str = None,
     ):
+        """
+        When page_size is given a single page is returned, the returned list's next_page_token (None on the last page)
+        should be passed as the page_token to get the next one. Pages are built before the post query filters (iteration
+        0, category links) are applied, so a page may hold less than page_size artifacts
+        """
         project = project or config.default_project
 
         if best_iteration and iter is not None:
@@ -339,10 +464,38 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
             else:
                 ids = self._resolve_tag(session, Artifact, project, tag)
 
+        if page_size and best_iteration:
+            # the linked best iteration artifact may be in a different page
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "best-iteration cannot be used together with page_size"
+            )
+
         artifacts = ArtifactList()
+        after_id = decode_page_token(page_token).get("id") if page_token else None
         artifact_records = self._find_artifacts(
-            session, project, ids, labels, since, until, name, kind, category, iter
-        )
+            session,
+            project,
+            ids,
+            labels,
+            since,
+            until,
+            name,
+            kind,
+            category,
+            iter,
+            after_id=after_id,
+            # fetch one extra record to know whether there's a next page
+            limit=page_size + 1 if page_size else None,
+        )
+        if page_size and len(artifact_records) > page_size:
+            artifact_records = artifact_records[:page_size]
+            artifacts.next_page_token = encode_page_token(
+                {"id": artifact_records[-1].id}
+            )
+        if category:
+            # TODO - this is a hack needed since link artifacts will be returned even for artifacts of
+            #        the wrong category. Remove this when we refactor this area.
+            artifact_records = self._filter_out_extra_link_artifacts(artifact_records)
         indexed_artifacts = {artifact.key: artifact for artifact in artifact_records}
         for artifact in artifact_records:
             has_iteration = self._name_with_iter_regex.match(artifact.key)
@@ -868,93 +1021,82 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
                 "Project resources counter cache expired. Calculating",
                 ttl=self._cache["project_resources_counters"]["ttl"],
             )
-            import mlrun.artifacts
+            self.refresh_project_resources_counters(session)
 
-            functions_count_per_project = (
-                session.query(Function.project, func.count(distinct(Function.name)))
-                .group_by(Function.project)
-                .all()
-            )
-            project_to_function_count = {
-                result[0]: result[1] for result in functions_count_per_project
-            }
-            feature_sets_count_per_project = (
-                session.query(FeatureSet.project, func.count(distinct(FeatureSet.name)))
-                .group_by(FeatureSet.project)
-                .all()
-            )
-            project_to_feature_set_count = {
-                result[0]: result[1] for result in feature_sets_count_per_project
-            }
-            # The kind filter is applied post the query to the DB (manually in python code), so counting should be that
-            # way as well, therefore we're doing it here, and can't do it with sql as the above
-            # We're using the "latest" which gives us only one version of each artifact key, which is what we want to
-            # count (artifact count, not artifact versions count)
-            model_artifacts = self._find_artifacts(
-                session, None, "latest", kind=mlrun.artifacts.model.ModelArtifact.kind
-            )
-            project_to_models_count = collections.defaultdict(int)
-            for model_artifact in model_artifacts:
-                project_to_models_count[model_artifact.project] += 1
-            runs = self._find_runs(session, None, "*", None)
-            project_to_recent_failed_runs_count = collections.defaultdict(int)
-            project_to_running_runs_count = collections.defaultdict(int)
-            # we want to count unique run names, and not all occurrences of all runs, therefore we're keeping set of
-            # names and only count new names
-            project_to_recent_failed_run_names = collections.defaultdict(set)
-            project_to_running_run_names = collections.defaultdict(set)
-            runs = runs.all()
-            for run in runs:
-                run_json = run.struct
-                if self._is_run_matching_state(
-                    run,
-                    run_json,
-                    mlrun.runtimes.constants.RunStates.non_terminal_states(),
-                ):
-                    if (
-                        run_json.get("metadata", {}).get("name")
-                        and run_json["metadata"]["name"]
-                        not in project_to_running_run_names[run.project]
-                    ):
-                        project_to_running_run_names[run.project].add(
-                            run_json["metadata"]["name"]
-                        )
-                        project_to_running_runs_count[run.project] += 1
-                if self._is_run_matching_state(
-                    run,
-                    run_json,
+        return self._cache["project_resources_counters"]["result"]
+
+    def refresh_project_resources_counters(self, session: Session):
+        """
+        Calculates the project resources counters and stores them in the cache. All the counters are calculated with
+        GROUP BY queries on indexed columns, so the cost is per project and not per run/artifact. The API calls it
+        periodically (see httpdb.projects.counters_refresh_interval) so requests are normally served from the cache
+        """
+        import mlrun.artifacts
+
+        project_to_function_count = self._count_per_project(
+            session.query(Function.project, func.count(distinct(Function.name))),
+            Function.project,
+        )
+        project_to_feature_set_count = self._count_per_project(
+            session.query(FeatureSet.project, func.count(distinct(FeatureSet.name))),
+            FeatureSet.project,
+        )
+        # We're using the "latest" which gives us only one version of each artifact key, which is what we want to
+        # count (artifact count, not artifact versions count)
+        models_query = self._latest_uid_filter(
+            session, session.query(Artifact.project, func.count(Artifact.id))
+        )
+        models_query = self._add_artifacts_kinds_filter(
+            models_query, [mlrun.artifacts.model.ModelArtifact.kind]
+        )
+        project_to_models_count = self._count_per_project(
+            models_query, Artifact.project
+        )
+        # we want to count unique run names, and not all occurrences of all runs
+        runs_query = session.query(Run.project, func.count(distinct(Run.name))).filter(
+            Run.name != NULL, Run.name != ""
+        )
+        project_to_running_runs_count = self._count_per_project(
+            runs_query.filter(
+                Run.state.in_(mlrun.runtimes.constants.RunStates.non_terminal_states())
+            ),
+            Run.project,
+        )
+        one_day_ago = datetime.now() - timedelta(hours=24)
+        project_to_recent_failed_runs_count = self._count_per_project(
+            runs_query.filter(
+                Run.state.in_(
                     [
                         mlrun.runtimes.constants.RunStates.error,
                         mlrun.runtimes.constants.RunStates.aborted,
-                    ],
-                ):
-                    one_day_ago = datetime.now() - timedelta(hours=24)
-                    if run.start_time and run.start_time >= one_day_ago:
-                        if (
-                            run_json.get("metadata", {}).get("name")
-                            and run_json["metadata"]["name"]
-                            not in project_to_recent_failed_run_names[run.project]
-                        ):
-                            project_to_recent_failed_run_names[run.project].add(
-                                run_json["metadata"]["name"]
-                            )
-                            project_to_recent_failed_runs_count[run.project] += 1
-
-            self._cache["project_resources_counters"]["result"] = (
-                project_to_function_count,
-                project_to_feature_set_count,
-                project_to_models_count,
-                project_to_recent_failed_runs_count,
-                project_to_running_runs_count,
-            )
-            ttl_time = datetime.now() + timedelta(
-                seconds=humanfriendly.parse_timespan(
-                    config.httpdb.projects.counters_cache_ttl
-                )
+                    ]
+                ),
+                Run.start_time >= one_day_ago,
+            ),
+            Run.project,
+        )
+
+        result = (
+            project_to_function_count,
+            project_to_feature_set_count,
+            project_to_models_count,
+            project_to_recent_failed_runs_count,
+            project_to_running_runs_count,
+        )
+        ttl_time = datetime.now() + timedelta(
+            seconds=humanfriendly.parse_timespan(
+                config.httpdb.projects.counters_cache_ttl
             )
-            self._cache["project_resources_counters"]["ttl"] = ttl_time
+        )
+        self._cache["project_resources_counters"]["result"] = result
+        self._cache["project_resources_counters"]["ttl"] = ttl_time
+        return result
 
-        return self._cache["project_resources_counters"]["result"]
+    @staticmethod
+    def _count_per_project(query, project_column):
+        return collections.defaultdict(
+            int, {project: count for project, count in query.group_by(project_column)}
+        )
 
     def generate_projects_summaries(
         self, session: Session, projects: List[str]
@@ -2026,82 +2168,13 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
         query = self._query(session, Run, uid=uid, project=project)
         return self._add_labels_filter(session, query, Run, labels)
 
-    def _post_query_runs_filter(
-        self,
-        query,
-        name=None,
-        state=None,
-        last_update_time_from=None,
-        last_update_time_to=None,
-    ):
-        """
-        This function is hacky and exists to cover on bugs we had with how we save our data in the DB
-        We're doing it the hacky way since:
-        1. SQLDB is about to be replaced
-        2. Schema + Data migration are complicated and as long we can avoid them, we prefer to (also because of 1)
-        name - the name is only saved in the json itself, therefore we can't use the SQL query filter and have to filter
-        it ourselves
-        state - the state is saved in a column, but, there was a bug in which the state was only getting updated in the
-        json itself, therefore, in field systems, most runs records will have an empty or not updated data in the state
-        column
-        """
-        if (
-            not name
-            and not state
-            and not last_update_time_from
-            and not last_update_time_to
-        ):
-            return query.all()
-
-        filtered_runs = []
-        for run in query:
-            run_json = run.struct
-            if name:
-                if not run_json or not isinstance(run_json, dict):
-                    continue
-
-                run_name = run_json.get("metadata", {}).get("name", "")
-                if name.startswith("~"):
-                    if name[1:].casefold() not in run_name.casefold():
-                        continue
-                elif name != run_name:
-                    continue
-            if state:
-                if not self._is_run_matching_state(run, run_json, state):
-                    continue
-            if last_update_time_from or last_update_time_to:
-                if not match_times(
-                    last_update_time_from,
-                    last_update_time_to,
-                    run_json,
-                    "status.last_update",
-                ):
-                    continue
-
-            filtered_runs.append(run)
-
-        return filtered_runs
-
-    def _is_run_matching_state(self, run, run_json, state):
-        requested_states = as_list(state)
-        record_state = run.state
-        json_state = None
-        if (
-            run_json
-            and isinstance(run_json, dict)
-            and run_json.get("status", {}).get("state")
-        ):
-            json_state = run_json.get("status", {}).get("state")
-        if not record_state and not json_state:
-            return False
-        # json_state has precedence over record state
-        if json_state:
-            if json_state in requested_states:
-                return True
-        else:
-            if record_state in requested_states:
-                return True
-        return False
+    @staticmethod
+    def _add_runs_name_and_state_filters(query, name=None, state=None):
+        if name:
+            query = query.filter(generate_query_predicate_for_name(Run.name, name))
+        if state:
+            query = query.filter(Run.state.in_(as_list(state)))
+        return query
 
     def _latest_uid_filter(self, session, query):
         # Create a sub query of latest uid (by updated) per (project,key)
@@ -2173,6 +2246,8 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
         kind=None,
         category: schemas.ArtifactCategories = None,
         iter=None,
+        after_id: int = None,
+        limit: int = None,
     ):
         """
         TODO: refactor this method
@@ -2208,50 +2283,28 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
         query = self._add_artifact_name_and_iter_query(query, name, iter)
 
         if kind:
-            return self._filter_artifacts_by_kinds(query, [kind])
-
+            query = self._add_artifacts_kinds_filter(query, [kind])
         elif category:
-            filtered_artifacts = self._filter_artifacts_by_category(query, category)
-            # TODO - this is a hack needed since link artifacts will be returned even for artifacts of
-            #        the wrong category. Remove this when we refactor this area.
-            return self._filter_out_extra_link_artifacts(filtered_artifacts)
-        else:
-            return query.all()
+            kinds, exclude = category.to_kinds_filter()
+            query = self._add_artifacts_kinds_filter(query, kinds, exclude)
 
-    def _filter_artifacts_by_category(
-        self, artifacts, category: schemas.ArtifactCategories
-    ):
-        kinds, exclude = category.to_kinds_filter()
-        return self._filter_artifacts_by_kinds(artifacts, kinds, exclude)
+        if after_id:
+            query = query.filter(Artifact.id > after_id)
+        if limit:
+            query = query.order_by(Artifact.id).limit(limit)
 
-    def _filter_artifacts_by_kinds(
-        self, artifacts, kinds: List[str], exclude: bool = False
-    ):
+        return query.all()
+
+    @staticmethod
+    def _add_artifacts_kinds_filter(query, kinds: List[str], exclude: bool = False):
         """
         :param kinds - list of kinds to filter by
         :param exclude - if true then the filter will be "all except" - get all artifacts excluding the ones who have
          any of the given kinds
         """
-        # see docstring of _post_query_runs_filter for why we're filtering it manually
-        filtered_artifacts = []
-        for artifact in artifacts:
-            artifact_json = artifact.struct
-            if (
-                artifact_json
-                and isinstance(artifact_json, dict)
-                and (
-                    (
-                        not exclude
-                        and any([kind == artifact_json.get("kind") for kind in kinds])
-                    )
-                    or (
-                        exclude
-                        and all([kind != artifact_json.get("kind") for kind in kinds])
-                    )
-                )
-            ):
-                filtered_artifacts.append(artifact)
-        return filtered_artifacts
+        if exclude:
+            return query.filter(or_(Artifact.kind.notin_(kinds), Artifact.kind == NULL))
+        return query.filter(Artifact.kind.in_(kinds))
 
     # TODO - this is a hack needed since link artifacts will be returned even for artifacts of
     #        the wrong category. Remove this when we refactor this area.
@@ -2262,7 +2315,7 @@ class SQLDB(mlrun.api.utils.projects.remotes.follower.Member, DBInterface):
         link_artifacts = []
         filtered_artifacts = []
         for artifact in artifacts:
-            if artifact.struct.get("kind") != "link":
+            if artifact.kind != "link":
                 existing_keys.add(artifact.key)
                 filtered_artifacts.append(artifact)
             else:
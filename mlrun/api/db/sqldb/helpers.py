@@ -1,5 +1,10 @@
+import base64
+import binascii
+import json
+
 from dateutil import parser
 
+import mlrun.errors
 from mlrun.api.db.sqldb.models import Base, _table2cls
 from mlrun.utils import get_in
 
@@ -26,6 +31,17 @@ def run_start_time(run):
     return parser.parse(ts)
 
 
+def run_last_update(run):
+    ts = get_in(run, "status.last_update", "")
+    if not ts:
+        return None
+    return parser.parse(ts)
+
+
+def run_name(run):
+    return get_in(run, "metadata.name", "")
+
+
 def run_labels(run) -> dict:
     return get_in(run, "metadata.labels", {})
 
@@ -69,3 +85,25 @@ def generate_query_predicate_for_name(column, query_string):
         return column.ilike(f"%{query_string[1:]}%")
     else:
         return column.__eq__(query_string)
+
+
+def encode_page_token(position: dict) -> str:
+    """
+    Page tokens are opaque to the clients, they hold the position (the sort key values of the last record) from which
+    the next page starts
+    """
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_page_token(page_token: str) -> dict:
+    try:
+        position = json.loads(base64.urlsafe_b64decode(page_token.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"Invalid page token: {page_token}"
+        ) from exc
+    if not isinstance(position, dict):
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"Invalid page token: {page_token}"
+        )
+    return position
@@ -33,6 +33,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import class_mapper, relationship
 
 from mlrun.api import schemas
+from mlrun.utils import dict_to_json
 
 Base = declarative_base()
 NULL = None  # Avoid flake8 issuing warnings when comparing in filter
@@ -73,6 +74,26 @@ class HasStruct(BaseModel):
         return super().to_dict(exclude)
 
 
+class HasJSONStruct(BaseModel):
+    @property
+    def struct(self):
+        if self._full_object:
+            return json.loads(self._full_object)
+
+    @struct.setter
+    def struct(self, value):
+        # the encoder handles the values json can't (e.g. numpy scalars in run results) which pickle used to handle
+        self._full_object = dict_to_json(value)
+
+    def to_dict(self, exclude=None):
+        """
+        NOTE - this function (currently) does not handle serializing relationships
+        """
+        exclude = exclude or []
+        exclude.append("object")
+        return super().to_dict(exclude)
+
+
 def make_label(table):
     class Label(Base, BaseModel):
         __tablename__ = f"{table}_labels"
@@ -125,7 +146,7 @@ def make_tag_v2(table):
 with warnings.catch_warnings():
     warnings.simplefilter("ignore")
 
-    class Artifact(Base, HasStruct):
+    class Artifact(Base, HasJSONStruct):
         __tablename__ = "artifacts"
         __table_args__ = (
             UniqueConstraint("uid", "project", "key", name="_artifacts_uc"),
@@ -139,8 +160,8 @@ with warnings.catch_warnings():
         project = Column(String)
         uid = Column(String)
         updated = Column(TIMESTAMP)
-        # TODO: change to JSON, see mlrun/api/schemas/function.py::FunctionState for reasoning
-        body = Column(BLOB)
+        kind = Column(String, index=True)
+        _full_object = Column("object", JSON)
         labels = relationship(Label)
 
         def get_identifier_string(self) -> str:
@@ -179,7 +200,7 @@ with warnings.catch_warnings():
         def get_identifier_string(self) -> str:
             return f"{self.project}/{self.uid}"
 
-    class Run(Base, HasStruct):
+    class Run(Base, HasJSONStruct):
         __tablename__ = "runs"
         __table_args__ = (
             UniqueConstraint("uid", "project", "iteration", name="_runs_uc"),
@@ -192,10 +213,14 @@ with warnings.catch_warnings():
         uid = Column(String)
         project = Column(String)
         iteration = Column(Integer)
-        state = Column(String)
-        # TODO: change to JSON, see mlrun/api/schemas/function.py::FunctionState for reasoning
-        body = Column(BLOB)
+        name = Column(String, index=True)
+        state = Column(String, index=True)
+        _full_object = Column("object", JSON)
         start_time = Column(TIMESTAMP)
+        # the status.last_update of the run
+        last_update = Column(TIMESTAMP, index=True)
+        # the time the record was last written, used to find runs that were touched since a given point in time
+        updated = Column(TIMESTAMP, index=True)
         labels = relationship(Label)
 
         def get_identifier_string(self) -> str:
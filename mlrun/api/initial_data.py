@@ -93,8 +93,10 @@ def _fix_datasets_large_previews(
 
                     # align stats
                     for column_to_remove in columns_to_remove:
-                        if column_to_remove in artifact_dict.get("stats", {}):
-                            del artifact_dict["stats"][column_to_remove]
+                        # the artifact is stored as JSON, so non string column names (e.g. ints) became strings
+                        for stats_key in [column_to_remove, str(column_to_remove)]:
+                            if stats_key in artifact_dict.get("stats", {}):
+                                del artifact_dict["stats"][stats_key]
 
                     # align schema
                     if artifact_dict.get("schema", {}).get("fields"):
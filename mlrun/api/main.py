@@ -1,11 +1,14 @@
 import asyncio
 import concurrent.futures
+import datetime
 import os
 import traceback
+import typing
 import uuid
 
 import fastapi
 import fastapi.concurrency
+import humanfriendly
 import uvicorn
 import uvicorn.protocols.utils
 from fastapi.exception_handlers import http_exception_handler
@@ -13,6 +16,7 @@ from fastapi.exception_handlers import http_exception_handler
 import mlrun.errors
 from mlrun.api.api.api import api_router
 from mlrun.api.db.session import close_session, create_session
+from mlrun.api.db.sqldb.db import SQLDB
 from mlrun.api.initial_data import init_data
 from mlrun.api.utils.periodic import (
     cancel_all_periodic_functions,
@@ -28,8 +32,14 @@ from mlrun.api.utils.singletons.scheduler import get_scheduler, initialize_sched
 from mlrun.config import config
 from mlrun.k8s_utils import get_k8s_helper
 from mlrun.runtimes import RuntimeKinds, get_runtime_handler
+from mlrun.runtimes.base import BaseRuntimeHandler
 from mlrun.utils import logger
 
+# start time of the last successful runs monitoring cycle, runs updated after it will be included in the next cycle
+_last_runs_monitoring_cycle_start_time: typing.Optional[datetime.datetime] = None
+# stats of the runs monitoring cycles (see get_runs_monitoring_cycle_stats)
+_runs_monitoring_cycle_stats: typing.Dict = {"cycles_count": 0}
+
 app = fastapi.FastAPI(
     title="MLRun",
     description="Machine Learning automation and tracking",
@@ -158,6 +168,7 @@ async def startup_event():
     if get_k8s_helper(silent=True).is_running_inside_kubernetes_cluster():
         _start_periodic_cleanup()
         _start_periodic_runs_monitoring()
+        _start_periodic_project_counters_refresh()
 
 
 @app.on_event("shutdown")
@@ -192,19 +203,77 @@ def _start_periodic_runs_monitoring():
         )
 
 
+def _start_periodic_project_counters_refresh():
+    interval = int(
+        humanfriendly.parse_timespan(config.httpdb.projects.counters_refresh_interval)
+    )
+    if interval > 0 and isinstance(get_db(), SQLDB):
+        logger.info("Starting periodic project counters refresh", interval=interval)
+        run_function_periodically(
+            interval,
+            _refresh_project_counters.__name__,
+            False,
+            _refresh_project_counters,
+        )
+
+
+def _refresh_project_counters():
+    db_session = create_session()
+    try:
+        get_db().refresh_project_resources_counters(db_session)
+    finally:
+        close_session(db_session)
+
+
 def _monitor_runs():
+    global _last_runs_monitoring_cycle_start_time
+    cycle_start_time = datetime.datetime.now(datetime.timezone.utc)
     db_session = create_session()
     try:
+        # one snapshot of the runs is shared between all the runtime kinds. it holds the runs that are not in terminal
+        # state and the ones that were updated since the previous cycle started
+        project_run_uid_map = BaseRuntimeHandler.list_runs_for_monitoring(
+            get_db(), db_session, _last_runs_monitoring_cycle_start_time
+        )
         for kind in RuntimeKinds.runtime_with_handlers():
             try:
                 runtime_handler = get_runtime_handler(kind)
-                runtime_handler.monitor_runs(get_db(), db_session)
+                runtime_handler.monitor_runs(get_db(), db_session, project_run_uid_map)
             except Exception as exc:
                 logger.warning(
                     "Failed monitoring runs. Ignoring", exc=str(exc), kind=kind
                 )
+        _last_runs_monitoring_cycle_start_time = cycle_start_time
     finally:
         close_session(db_session)
+    _runs_monitoring_cycle_stats.update(
+        {
+            "last_cycle_start_time": cycle_start_time.isoformat(),
+            "last_cycle_duration_seconds": (
+                datetime.datetime.now(datetime.timezone.utc) - cycle_start_time
+            ).total_seconds(),
+            "last_cycle_runs_count": sum(
+                len(runs) for runs in project_run_uid_map.values()
+            ),
+        }
+    )
+    _runs_monitoring_cycle_stats["cycles_count"] += 1
+    if _runs_monitoring_cycle_stats["last_cycle_duration_seconds"] > int(
+        config.runs_monitoring_interval
+    ):
+        logger.warning(
+            "Runs monitoring cycle took longer than the monitoring interval",
+            interval=config.runs_monitoring_interval,
+            **_runs_monitoring_cycle_stats,
+        )
+    else:
+        logger.debug("Runs monitoring cycle finished", **_runs_monitoring_cycle_stats)
+
+
+def get_runs_monitoring_cycle_stats() -> typing.Dict:
+    """return the stats of the runs monitoring cycles - the number of cycles, and the start time, duration and number
+    of monitored runs of the last one"""
+    return dict(_runs_monitoring_cycle_stats)
 
 
 def _cleanup_runtimes():
@@ -0,0 +1,29 @@
+"""Runs monitoring columns
+
+Revision ID: 5f1351c88a19
+Revises: d781f58f607f
+Create Date: 2021-08-03 10:12:43.218346
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5f1351c88a19"
+down_revision = "d781f58f607f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("runs") as batch_op:
+        batch_op.add_column(sa.Column("updated", sa.TIMESTAMP(), nullable=True))
+        batch_op.create_index(batch_op.f("ix_runs_state"), ["state"], unique=False)
+        batch_op.create_index(batch_op.f("ix_runs_updated"), ["updated"], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table("runs") as batch_op:
+        batch_op.drop_index(batch_op.f("ix_runs_updated"))
+        batch_op.drop_index(batch_op.f("ix_runs_state"))
+        batch_op.drop_column("updated")
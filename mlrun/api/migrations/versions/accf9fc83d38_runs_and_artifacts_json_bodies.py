@@ -0,0 +1,138 @@
+"""Runs and artifacts JSON bodies
+
+Revision ID: accf9fc83d38
+Revises: 5f1351c88a19
+Create Date: 2021-08-08 14:21:37.914552
+
+"""
+import json
+import pickle
+
+import sqlalchemy as sa
+from alembic import op
+from dateutil import parser
+
+from mlrun.utils import dict_to_json, get_in
+
+# revision identifiers, used by Alembic.
+revision = "accf9fc83d38"
+down_revision = "5f1351c88a19"
+branch_labels = None
+depends_on = None
+
+# rows are converted in chunks so that big tables won't be loaded into memory at once
+chunk_size = 1000
+
+
+def upgrade():
+    with op.batch_alter_table("runs") as batch_op:
+        batch_op.add_column(sa.Column("name", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("last_update", sa.TIMESTAMP(), nullable=True))
+        batch_op.add_column(sa.Column("object", sa.JSON(), nullable=True))
+        batch_op.create_index(batch_op.f("ix_runs_name"), ["name"], unique=False)
+        batch_op.create_index(
+            batch_op.f("ix_runs_last_update"), ["last_update"], unique=False
+        )
+    with op.batch_alter_table("artifacts") as batch_op:
+        batch_op.add_column(sa.Column("kind", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("object", sa.JSON(), nullable=True))
+        batch_op.create_index(batch_op.f("ix_artifacts_kind"), ["kind"], unique=False)
+
+    _convert_table_bodies("runs", _run_columns_from_struct)
+    _convert_table_bodies("artifacts", _artifact_columns_from_struct)
+
+    with op.batch_alter_table("runs") as batch_op:
+        batch_op.drop_column("body")
+    with op.batch_alter_table("artifacts") as batch_op:
+        batch_op.drop_column("body")
+
+
+def downgrade():
+    with op.batch_alter_table("runs") as batch_op:
+        batch_op.add_column(sa.Column("body", sa.BLOB(), nullable=True))
+    with op.batch_alter_table("artifacts") as batch_op:
+        batch_op.add_column(sa.Column("body", sa.BLOB(), nullable=True))
+
+    _convert_table_objects_to_bodies("runs")
+    _convert_table_objects_to_bodies("artifacts")
+
+    with op.batch_alter_table("artifacts") as batch_op:
+        batch_op.drop_index(batch_op.f("ix_artifacts_kind"))
+        batch_op.drop_column("object")
+        batch_op.drop_column("kind")
+    with op.batch_alter_table("runs") as batch_op:
+        batch_op.drop_index(batch_op.f("ix_runs_last_update"))
+        batch_op.drop_index(batch_op.f("ix_runs_name"))
+        batch_op.drop_column("object")
+        batch_op.drop_column("last_update")
+        batch_op.drop_column("name")
+
+
+def _run_columns_from_struct(struct: dict) -> dict:
+    columns = {"name": get_in(struct, "metadata.name", "")}
+    last_update = get_in(struct, "status.last_update")
+    if last_update:
+        columns["last_update"] = parser.parse(last_update)
+    # there was a bug in which the state was updated only in the body, so the body is the source of truth
+    state = get_in(struct, "status.state")
+    if state:
+        columns["state"] = state
+    return columns
+
+
+def _artifact_columns_from_struct(struct: dict) -> dict:
+    return {"kind": struct.get("kind")}
+
+
+def _table(table_name: str):
+    columns = {
+        "runs": [
+            sa.column("name", sa.String),
+            sa.column("state", sa.String),
+            sa.column("last_update", sa.TIMESTAMP),
+        ],
+        "artifacts": [sa.column("kind", sa.String)],
+    }[table_name]
+    return sa.table(
+        table_name,
+        sa.column("id", sa.Integer),
+        sa.column("body", sa.BLOB),
+        sa.column("object", sa.JSON),
+        *columns,
+    )
+
+
+def _iterate_table_in_chunks(table, column):
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select([table.c.id, column])
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(chunk_size)
+        ).fetchall()
+        if not rows:
+            break
+        for row in rows:
+            yield connection, row
+        last_id = rows[-1].id
+
+
+def _convert_table_bodies(table_name: str, columns_from_struct):
+    table = _table(table_name)
+    for connection, row in _iterate_table_in_chunks(table, table.c.body):
+        struct = pickle.loads(row.body) if row.body else None
+        values = {"object": dict_to_json(struct) if struct is not None else None}
+        if isinstance(struct, dict):
+            values.update(columns_from_struct(struct))
+        connection.execute(table.update().where(table.c.id == row.id).values(**values))
+
+
+def _convert_table_objects_to_bodies(table_name: str):
+    table = _table(table_name)
+    for connection, row in _iterate_table_in_chunks(table, table.c.object):
+        struct = json.loads(row.object) if row.object else None
+        connection.execute(
+            table.update().where(table.c.id == row.id).values(body=pickle.dumps(struct))
+        )
@@ -20,6 +20,8 @@ from .constants import (
     DeletionStrategy,
     FeatureStorePartitionByField,
     HeaderNames,
+    ListFormat,
+    ListPagination,
     OrderType,
     PatchMode,
     SortField,
@@ -89,6 +91,7 @@ from .project import (
     ProjectStatus,
     ProjectSummary,
 )
+from .run import RunIdentifier, RunsStatesInput, RunsStatesOutput
 from .runtime_resource import (
     GroupedByJobRuntimeResourcesOutput,
     GroupedByProjectRuntimeResourcesOutput,
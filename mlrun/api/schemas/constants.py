@@ -107,6 +107,19 @@ class OrderType(str, Enum):
             return db_field.desc()
 
 
+class ListFormat(str, Enum):
+    # a single page of records in one json response
+    json = "json"
+    # the records as json lines, streamed while fetching them from the db page by page
+    jsonl = "jsonl"
+
+
+class ListPagination:
+    max_page_size = 1000
+    # the size of the pages fetched from the db when streaming
+    stream_page_size = 500
+
+
 labels_prefix = "mlrun/"
 
 
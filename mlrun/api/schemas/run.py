@@ -0,0 +1,24 @@
+import typing
+
+import pydantic
+
+
+class RunIdentifier(pydantic.BaseModel):
+    project: typing.Optional[str]
+    uid: str
+    iter: int = 0
+    # the run state known to the client, used when waiting for a state change
+    state: typing.Optional[str]
+
+
+class RunsStatesInput(pydantic.BaseModel):
+    runs: typing.List[RunIdentifier]
+    # long-poll - wait up to this many seconds until the state of any of the runs differs from its known state
+    wait_timeout: int = 0
+
+
+class RunsStatesOutput(pydantic.BaseModel):
+    # the runs states, in the request order (None for runs that were not found)
+    states: typing.List[typing.Optional[str]]
+    # the applied wait timeout (0 when the server responded without waiting)
+    wait_timeout: int = 0
@@ -20,8 +20,9 @@ import mlrun
 import mlrun.errors
 
 from ..datastore import get_store_uri, is_store_uri, store_manager
+from ..datastore.transfer import TransferManager
 from ..model import ModelObj
-from ..utils import StorePrefix, calculate_local_file_hash, generate_artifact_uri
+from ..utils import StorePrefix, generate_artifact_uri
 
 calc_hash = True
 
@@ -166,10 +167,15 @@ class Artifact(ModelObj):
         store_manager.object(url=target or self.target_path).put(body)
 
     def _upload_file(self, src, target=None):
-        if calc_hash:
-            self.hash = calculate_local_file_hash(src)
         self.size = os.stat(src).st_size
-        store_manager.object(url=target or self.target_path).upload(src)
+        # the hash is calculated while the file is uploaded
+        file_hash = TransferManager().upload(
+            store_manager.object(url=target or self.target_path),
+            src,
+            calc_hash=calc_hash,
+        )
+        if calc_hash:
+            self.hash = file_hash
 
 
 class DirArtifact(Artifact):
@@ -194,12 +200,14 @@ class DirArtifact(Artifact):
             raise ValueError("local/source path not specified")
 
         files = os.listdir(self.src_path)
+        uploads = []
         for f in files:
             file_path = os.path.join(self.src_path, f)
             if not os.path.isfile(file_path):
                 raise ValueError(f"file {file_path} not found, cant upload")
             target = os.path.join(self.target_path, f)
-            store_manager.object(url=target).upload(file_path)
+            uploads.append((store_manager.object(url=target), file_path))
+        TransferManager().upload_files(uploads)
 
 
 class LinkArtifact(Artifact):
@@ -236,6 +244,7 @@ def upload_extra_data(
     if not extra_data:
         return
     target_path = artifact_spec.target_path
+    uploads = []
     for key, item in extra_data.items():
 
         if isinstance(item, bytes):
@@ -253,10 +262,11 @@ def upload_extra_data(
             if not os.path.isfile(src_path):
                 raise ValueError(f"extra data file {src_path} not found")
             target = os.path.join(target_path, item)
-            store_manager.object(url=target).upload(src_path)
+            uploads.append((store_manager.object(url=target), src_path))
 
         if update_spec:
             artifact_spec.extra_data[prefix + key] = item
+    TransferManager().upload_files(uploads)
 
 
 def get_artifact_meta(artifact):
@@ -16,13 +16,12 @@ import pathlib
 import typing
 from io import StringIO
 
-import numpy as np
-import pandas as pd
 from pandas.io.json import build_table_schema
 
 import mlrun
 import mlrun.utils.helpers
 
+from ..data_types import DFDataInfer, InferOptions
 from ..datastore import is_store_uri, store_manager
 from .base import Artifact
 
@@ -173,29 +172,14 @@ class DatasetArtifact(Artifact):
 
 
 def get_df_stats(df):
-    if hasattr(df, "dask"):
-        df = df.sample(frac=ddf_sample_pct).compute()
-    d = {}
-    for col, values in df.describe(include="all").items():
-        stats_dict = {}
-        for stat, val in values.dropna().items():
-            if isinstance(val, (float, np.floating, np.float64)):
-                stats_dict[stat] = float(val)
-            elif isinstance(val, (int, np.integer, np.int64)):
-                stats_dict[stat] = int(val)
-            else:
-                stats_dict[stat] = str(val)
-
-        if pd.api.types.is_numeric_dtype(df[col]):
-            # store histogram
-            try:
-                hist, bins = np.histogram(df[col], bins=20)
-                stats_dict["hist"] = [hist.tolist(), bins.tolist()]
-            except Exception:
-                pass
-
-        d[col] = stats_dict
-    return d
+    """get the dataset per column stats (incl. quartiles), dask dataframes are processed by partitions"""
+    return DFDataInfer.get_stats(
+        df,
+        InferOptions.Stats
+        + InferOptions.Histogram
+        + InferOptions.Quantiles
+        + InferOptions.Sample,
+    )
 
 
 def update_dataset_meta(
@@ -21,6 +21,7 @@ import mlrun
 
 from ..data_types import InferOptions, get_infer_interface
 from ..datastore import is_store_uri, store_manager
+from ..datastore.cache import get_local_cache
 from ..features import Feature
 from ..model import ObjectList
 from ..utils import StorePrefix
@@ -232,6 +233,14 @@ def get_model(model_dir, suffix=""):
     if obj.kind == "file":
         return model_file, model_spec, extra_dataitems
 
+    cache = get_local_cache()
+    if cache is not None:
+        # the model artifact hash is the model file content hash
+        content_hash = model_spec.hash if model_spec else None
+        local_path = cache.get_dataitem_path(obj, content_hash=content_hash)
+        if local_path:
+            return local_path, model_spec, extra_dataitems
+
     temp_path = tempfile.NamedTemporaryFile(suffix=suffix, delete=False).name
     obj.download(temp_path)
     return temp_path, model_spec, extra_dataitems
@@ -98,6 +98,27 @@ default_config = {
         "db_type": "sqldb",
         "max_workers": "",
         "db": {"commit_retry_timeout": 30, "commit_retry_interval": 3},
+        "logs": {
+            # the maximal time (seconds) a get log request waits for new logs (long-poll) before responding
+            "max_wait_timeout": 60,
+            # the interval (seconds) in which a waiting get log request checks for new logs
+            "wait_poll_interval": 1,
+            # the interval (seconds) for logs which are read from k8s (every check is a k8s API call)
+            "k8s_wait_poll_interval": 3,
+            # number of runs for which the position of the last k8s logs read is kept, so the next read of a run
+            # (from that position) fetches only the logs since then
+            "k8s_cursors_cache_size": 1000,
+            # the wait timeout (seconds) the client requests when watching logs
+            "watch_wait_timeout": 30,
+        },
+        "runs": {
+            # the maximal time (seconds) a runs states request waits for a state change (long-poll) before responding
+            "max_wait_timeout": 60,
+            # the interval (seconds) in which a waiting runs states request checks for state changes
+            "wait_poll_interval": 1,
+            # the wait timeout (seconds) the client requests when waiting for runs to complete
+            "watch_wait_timeout": 30,
+        },
         "jobs": {
             # whether to allow to run local runtimes in the API - configurable to allow the scheduler testing to work
             "allow_local_run": False,
@@ -156,6 +177,9 @@ default_config = {
             # This is used as the interval for the sync loop both when mlrun is leader and follower
             "periodic_sync_interval": "1 minute",
             "counters_cache_ttl": "10 seconds",
+            # the API refreshes the counters in the background so requests are served from the cache, should be lower
+            # than the cache ttl above. 0 to disable (counters will be calculated on request when the cache expires)
+            "counters_refresh_interval": "5 seconds",
             # access key to be used when the leader is iguazio and polling is done from it
             "iguazio_access_key": "",
             # the initial implementation was cache and was working great, now it's not needed because we get (read/list)
@@ -192,6 +216,8 @@ default_config = {
             "user_space": "v3io:///projects/{project}/model-endpoints/{kind}",
         },
         "batch_processing_function_branch": "master",
+        # process each model invocation in the monitoring stream as a single columnar batch (instead of per row)
+        "columnar_stream_processing": False,
     },
     "secret_stores": {
         "vault": {
@@ -224,6 +250,47 @@ default_config = {
         "default_targets": "parquet,nosql",
         "default_job_image": "mlrun/mlrun",
         "flush_interval": None,
+        # when retrieving offline features for entity rows with up to this many unique keys, the feature sets are
+        # read with a (pushed down) filter on the keys, so only the rows of these keys are read
+        "max_entity_filter_keys": 10000,
+    },
+    "local_cache": {
+        # on disk cache of remote objects read with DataItem.local(), get_model() and as_df(), keyed by the object
+        # content hash or url + size + modified time. processes using the same path share the cached objects
+        "enabled": False,
+        "path": "~/.mlrun/cache",
+        # max total size in bytes, the least recently used objects are evicted when exceeded
+        "max_size": 10 * 1024 ** 3,
+    },
+    "transfer": {
+        # max concurrent transfers (files of a dir artifact, or parts of a large object)
+        "max_workers": 8,
+        # objects larger than this (bytes) are downloaded/uploaded in parts, where the store supports it
+        "multipart_threshold": 64 * 1024 ** 2,
+        "part_size": 16 * 1024 ** 2,
+    },
+    "hyper_params": {
+        # executor of parallel (parallel_runs) local/handler hyper param runs without a dask cluster uri -
+        # "process" (process pool), "thread" (thread pool) or "dask" (local dask cluster)
+        "parallel_executor": "process",
+        # child runs (iterations) results and logs are written to the db in batches of this size
+        "db_batch_size": 100,
+    },
+    "run_updates": {
+        # write-behind of the run context commits (results, artifacts, state, ..), the changed run keys are
+        # coalesced and written with partial updates (update_run) from a background thread, the run is written
+        # synchronously on completion/error. when disabled every commit stores the whole run
+        "write_behind": False,
+        # seconds from the first pending update to the write, and max pending commits before an earlier write
+        "flush_interval": 5,
+        "max_pending": 100,
+    },
+    "stats": {
+        # max rows sampled (per chunk/partition) for the histograms, quantiles and value counts when the stats are
+        # inferred with InferOptions.Sample, the counts and moments (mean, std, min, max) are always exact
+        "sample_size": 100000,
+        # approximate number of centroids kept by the quantiles sketches (InferOptions.Quantiles)
+        "quantiles_compression": 100,
     },
     "ui": {
         "projects_prefix": "projects",  # The UI link prefix for projects
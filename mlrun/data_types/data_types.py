@@ -66,6 +66,21 @@ def pa_type_to_value_type(type_):
     return type_map.get(type_, ValueType.STRING)
 
 
+def value_type_to_pa_type(value_type):
+    """return the pyarrow type of a (scalar) feature value type, None if it is unknown or not fully specified
+    (e.g. the unit and time zone of datetime values)"""
+    type_map = {
+        ValueType.BOOL: pyarrow.bool_(),
+        ValueType.INT64: pyarrow.int64(),
+        ValueType.INT32: pyarrow.int32(),
+        ValueType.FLOAT: pyarrow.float32(),
+        ValueType.DOUBLE: pyarrow.float64(),
+        ValueType.STRING: pyarrow.string(),
+        ValueType.BYTES: pyarrow.binary(),
+    }
+    return type_map.get(value_type)
+
+
 def python_type_to_value_type(value_type):
     type_name = value_type.__name__
     type_map = {
@@ -116,6 +131,8 @@ class InferOptions:
     Stats = 8
     Histogram = 16
     Preview = 32
+    Quantiles = 64
+    Sample = 128
 
     @staticmethod
     def schema():
@@ -123,7 +140,13 @@ class InferOptions:
 
     @staticmethod
     def all_stats():
-        return InferOptions.Stats + InferOptions.Histogram + InferOptions.Preview
+        return (
+            InferOptions.Stats
+            + InferOptions.Histogram
+            + InferOptions.Preview
+            + InferOptions.Quantiles
+            + InferOptions.Sample
+        )
 
     @staticmethod
     def all():
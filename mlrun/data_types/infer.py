@@ -1,8 +1,12 @@
+import copy
+import warnings
+
 import numpy as np
 import pandas as pd
 import pyarrow
 from pandas.io.json._table_schema import convert_pandas_type_to_json_field
 
+from ..config import config
 from .data_types import InferOptions, pa_type_to_value_type, pd_schema_to_value_type
 
 default_num_bins = 20
@@ -75,44 +79,500 @@ def infer_schema_from_df(
     return timestamp_key
 
 
-def get_df_stats(df, options, num_bins=None):
-    """get per column data stats from dataframe"""
+def get_df_stats(
+    df, options, num_bins=None, sample_size=None, stratify_by=None, random_state=None,
+):
+    """get per column data stats from dataframe
+
+    the stats are computed by :py:class:`DFStatsAccumulator` (count, mean, std, min/max, histograms, value counts
+    and optionally quantiles), dask dataframes are processed partition by partition (in parallel) and the partitions
+    stats are merged. with the ``InferOptions.Sample`` option only a sample of up to ``sample_size`` rows (per
+    chunk/partition) is used for the histograms, quantiles and value counts, the counts and moments are exact
+
+    :param df:           pandas or dask dataframe
+    :param options:      InferOptions (Histogram, Quantiles, Sample, Index)
+    :param num_bins:     number of histogram bins
+    :param sample_size:  max sample size (with InferOptions.Sample), default to mlconf.stats.sample_size
+    :param stratify_by:  column to stratify the sample by (each value is sampled proportionally)
+    :param random_state: seed for the sampling
+    """
+    accumulator_args = dict(
+        options=options,
+        num_bins=num_bins,
+        sample_size=sample_size,
+        stratify_by=stratify_by,
+        random_state=random_state,
+        preview_lines=0,
+    )
+    if hasattr(df, "dask"):
+        return _get_dask_df_stats(df, **accumulator_args)
 
-    results_dict = {}
     if df.empty:
-        return results_dict
-    num_bins = num_bins or default_num_bins
-    if InferOptions.get_common_options(options, InferOptions.Index) and df.index.name:
-        df = df.reset_index()
-    for col, values in df.describe(
-        include="all", percentiles=[], datetime_is_numeric=True
-    ).items():
+        return {}
+    accumulator = DFStatsAccumulator(**accumulator_args)
+    accumulator.update(df)
+    return accumulator.get_stats()
+
+
+def _get_dask_df_stats(df, sample_size=None, **accumulator_args):
+    import dask
+
+    def get_partition_stats(partition):
+        accumulator = DFStatsAccumulator(sample_size=sample_size, **accumulator_args)
+        accumulator.update(partition)
+        return accumulator
+
+    if sample_size is None:
+        sample_size = int(config.stats.sample_size)
+    # the sample is split between the partitions
+    sample_size = max(1, int(np.ceil(sample_size / df.npartitions)))
+    accumulators = dask.compute(
+        *[dask.delayed(get_partition_stats)(part) for part in df.to_delayed()]
+    )
+    accumulator = accumulators[0]
+    for other in accumulators[1:]:
+        accumulator.merge(other)
+    return accumulator.get_stats()
+
+
+def _sample_df(df, sample_size, stratify_by=None, random_state=None):
+    """return a sample of up to sample_size rows and the number of rows each of the sampled rows stands for (a number,
+    or per row array for a stratified sample)"""
+    random = np.random.default_rng(random_state)
+    if stratify_by is None:
+        positions = random.choice(len(df), sample_size, replace=False)
+        positions.sort()
+        return df.iloc[positions], len(df) / sample_size
+
+    # proportional allocation, at least one row from each group
+    fraction = sample_size / len(df)
+    positions = []
+    weights = []
+    groups = df.groupby(stratify_by, sort=False, dropna=False).indices
+    for group_positions in groups.values():
+        group_size = max(1, int(round(len(group_positions) * fraction)))
+        positions.append(random.choice(group_positions, group_size, replace=False))
+        weights.append(np.full(group_size, len(group_positions) / group_size))
+    positions = np.concatenate(positions)
+    weights = np.concatenate(weights)
+    order = np.argsort(positions)
+    return df.iloc[positions[order]], weights[order]
+
+
+class DFStatsAccumulator:
+    """accumulate the per column data stats (in the form of get_df_stats) of data which is processed in chunks
+
+    the stats of every chunk are merged into the totals, so only the current chunk is held in memory. counts, means,
+    std, min/max are exact (merged moments, computed for all the numeric columns at once), value counts, histograms
+    and quantiles (t-digest like sketches, with InferOptions.Quantiles) are mergeable approximations: the chunks
+    histograms are merged into fixed bins over the total range (approximated by the chunk bins centers when the
+    chunks ranges differ). with InferOptions.Sample they are computed over a (uniform or stratified) sample of up to
+    sample_size rows of each chunk, weighted by the number of rows each sampled row stands for
+
+    example::
+
+        stats = DFStatsAccumulator(InferOptions.default())
+        for chunk in pd.read_csv("big.csv", chunksize=100000):
+            stats.update(chunk)
+        print(stats.get_stats())
+    """
+
+    def __init__(
+        self,
+        options=None,
+        num_bins=None,
+        preview_lines=20,
+        sample_size=None,
+        stratify_by=None,
+        random_state=None,
+    ):
+        self.options = InferOptions.default() if options is None else options
+        self.num_bins = num_bins or default_num_bins
+        self.preview_lines = preview_lines
+        self.sample_size = sample_size
+        self.stratify_by = stratify_by
+        self.random_state = random_state
+        self._columns = {}
+        self._head = None
+
+    def _has_option(self, option):
+        return InferOptions.get_common_options(self.options, option)
+
+    def update(self, df, weight=None):
+        """add the stats of a dataframe (chunk)
+
+        :param df:     dataframe (chunk)
+        :param weight: number of rows each of the df rows stands for, when the df is itself a sample (e.g. of a
+                       spark dataframe)
+        """
+        if df.empty:
+            return
+        if self.preview_lines and (
+            self._head is None or len(self._head) < self.preview_lines
+        ):
+            self._head = pd.concat([self._head, df.head(self.preview_lines)]).head(
+                self.preview_lines
+            )
+        if self._has_option(InferOptions.Index) and df.index.name:
+            df = df.reset_index()
+        weight = weight or 1.0
+
+        sample, sample_weights = df, 1.0
+        sample_size = self.sample_size
+        if sample_size is None:
+            sample_size = int(config.stats.sample_size)
+        if self._has_option(InferOptions.Sample) and len(df) > sample_size:
+            sample, sample_weights = _sample_df(
+                df, sample_size, self.stratify_by, self.random_state
+            )
+        sample_weights = sample_weights * weight
+
+        for col in df.columns:
+            if col not in self._columns:
+                self._columns[col] = _ColumnStats(df[col], self.num_bins)
+        self._update_numeric_moments(df, weight)
+        with_histogram = self._has_option(InferOptions.Histogram)
+        with_quantiles = self._has_option(InferOptions.Quantiles)
+        for col in df.columns:
+            self._columns[col].update(
+                df[col],
+                sample[col],
+                weight,
+                sample_weights,
+                with_histogram,
+                with_quantiles,
+            )
+
+    def _update_numeric_moments(self, df, weight):
+        columns = [col for col in df.columns if self._columns[col].kind == "numeric"]
+        if not columns:
+            return
+        numbers = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        counts = (~np.isnan(numbers)).sum(axis=0)
+        if (counts == len(numbers)).all():
+            # no nulls, the (faster) non nan aware functions can be used
+            means = numbers.mean(axis=0)
+            m2s = ((numbers - means) ** 2).sum(axis=0)
+            mins = numbers.min(axis=0)
+            maxs = numbers.max(axis=0)
+        else:
+            with warnings.catch_warnings(), np.errstate(all="ignore"):
+                # all nan columns
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                means = np.nanmean(numbers, axis=0)
+                m2s = np.nansum((numbers - means) ** 2, axis=0)
+                mins = np.nanmin(numbers, axis=0)
+                maxs = np.nanmax(numbers, axis=0)
+        for i, col in enumerate(columns):
+            if counts[i]:
+                self._columns[col].merge_moments(
+                    counts[i] * weight, means[i], m2s[i] * weight, mins[i], maxs[i]
+                )
+
+    def merge(self, other: "DFStatsAccumulator"):
+        """merge the stats accumulated by another accumulator (e.g. of another partition)"""
+        for col, other_column in other._columns.items():
+            column = self._columns.get(col)
+            if column is None:
+                self._columns[col] = other_column.copy()
+            else:
+                column.merge(other_column)
+        if self.preview_lines and other._head is not None:
+            self._head = pd.concat([self._head, other._head]).head(self.preview_lines)
+
+    def get_stats(self) -> dict:
+        """return the per column stats of all the data"""
+        return {
+            col: column.to_dict(self.num_bins) for col, column in self._columns.items()
+        }
+
+    def get_preview(self):
+        """return the preview of the first rows (as get_df_preview)"""
+        if self._head is None:
+            return None
+        return get_df_preview(self._head, self.preview_lines)
+
+
+class QuantileSketch:
+    """mergeable quantiles sketch (t-digest like)
+
+    the values are kept as weighted centroids, compressed so that there are about ``compression`` centroids, which
+    are smaller (more accurate) near the edges of the distribution
+
+    :param compression: the number of centroids to compress to, default to mlconf.stats.quantiles_compression
+    """
+
+    def __init__(self, compression: int = None):
+        if compression is None:
+            compression = int(config.stats.quantiles_compression)
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = None
+        self.max = None
+
+    def update(self, values, weights=None):
+        """add values (with optional weights, a number or per value array) to the sketch"""
+        values = np.asarray(values, dtype=np.float64)
+        weights = np.broadcast_to(
+            np.asarray(1.0 if weights is None else weights, dtype=np.float64),
+            values.shape,
+        )
+        valid = ~np.isnan(values)
+        values, weights = values[valid], weights[valid]
+        if not len(values):
+            return
+        self._add(values, weights, values.min(), values.max())
+
+    def merge(self, other: "QuantileSketch"):
+        """merge the centroids of another sketch"""
+        if other.min is not None:
+            self._add(other.means, other.weights, other.min, other.max)
+
+    def _add(self, means, weights, min_value, max_value):
+        self.min = min_value if self.min is None else min(self.min, min_value)
+        self.max = max_value if self.max is None else max(self.max, max_value)
+        self.means = np.concatenate([self.means, means])
+        self.weights = np.concatenate([self.weights, weights])
+        self._compress()
+
+    def _compress(self):
+        order = np.argsort(self.means, kind="mergesort")
+        means, weights = self.means[order], self.weights[order]
+        total = weights.sum()
+        # the centroids whose (mid) quantiles map to the same unit of the arcsin scale function are merged
+        quantiles = (np.cumsum(weights) - weights / 2) / total
+        scale = self.compression / np.pi * np.arcsin(2 * quantiles - 1)
+        buckets = np.floor(scale - scale[0]).astype(np.int64)
+        new_weights = np.bincount(buckets, weights=weights)
+        new_means = np.bincount(buckets, weights=weights * means)
+        used = new_weights > 0
+        self.weights = new_weights[used]
+        self.means = new_means[used] / self.weights
+
+    def quantile(self, q):
+        """return the (approximated) value at quantile q (0 to 1)"""
+        if self.min is None:
+            return None
+        total = self.weights.sum()
+        positions = np.concatenate(
+            [[0], np.cumsum(self.weights) - self.weights / 2, [total]]
+        )
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q * total, positions, values))
+
+
+class _ColumnStats:
+    """mergeable stats of a single column"""
+
+    percentiles = [0.25, 0.5, 0.75]
+
+    def __init__(self, values: pd.Series, num_bins: int):
+        if pd.api.types.is_bool_dtype(values):
+            self.kind = "bool"
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            self.kind = "datetime"
+        elif pd.api.types.is_numeric_dtype(
+            values
+        ) and not pd.api.types.is_complex_dtype(values):
+            self.kind = "numeric"
+        else:
+            self.kind = "other"
+        self.tz = getattr(values.dtype, "tz", None)
+        self.num_bins = num_bins
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        # datetimes moments are relative to the first seen value, to keep the float precision
+        self.origin = None
+        self.value_counts = None
+        self.histograms = []
+        self.sketch = None
+
+    def copy(self):
+        column = copy.copy(self)
+        column.histograms = list(self.histograms)
+        column.sketch = copy.deepcopy(self.sketch)
+        return column
+
+    def update(
+        self,
+        values: pd.Series,
+        sample: pd.Series,
+        weight=1.0,
+        sample_weights=1.0,
+        with_histogram=True,
+        with_quantiles=False,
+    ):
+        """add the values of a chunk, the numeric moments are merged by the accumulator (for all columns at once)
+
+        the sample weights are the number of rows each of the sample rows stands for (a number or a per row array)
+        """
+        if self.kind in ["bool", "other"]:
+            if np.ndim(sample_weights):
+                notnull = sample.notna().values
+                value_counts = (
+                    pd.Series(sample_weights[notnull], index=sample.values[notnull])
+                    .groupby(level=0, sort=False)
+                    .sum()
+                )
+            else:
+                # value_counts drops the nulls
+                value_counts = sample.value_counts(sort=False) * sample_weights
+            if value_counts.empty:
+                return
+            self._merge_values(values.count() * weight, value_counts)
+            if with_histogram and self.kind == "bool":
+                notnull = sample.notna().values
+                if np.ndim(sample_weights):
+                    sample_weights = sample_weights[notnull]
+                self._add_histogram(
+                    sample[notnull].astype(np.uint8).values, sample_weights
+                )
+            return
+
+        if self.kind == "datetime":
+            values = pd.to_datetime(values, errors="coerce").dropna()
+            if values.empty:
+                return
+            numbers = values.values.astype("datetime64[ns]").astype(np.int64)
+            if self.origin is None:
+                self.origin = int(numbers.min())
+            numbers = (numbers - self.origin).astype(np.float64)
+            self.merge_moments(
+                len(numbers) * weight,
+                float(numbers.mean()),
+                float(((numbers - numbers.mean()) ** 2).sum()) * weight,
+                numbers.min(),
+                numbers.max(),
+            )
+            return
+
+        numbers = sample.to_numpy(dtype=np.float64, na_value=np.nan)
+        notnull = ~np.isnan(numbers)
+        if not notnull.all():
+            numbers = numbers[notnull]
+            if np.ndim(sample_weights):
+                sample_weights = sample_weights[notnull]
+        if not len(numbers):
+            return
+        if with_histogram:
+            self._add_histogram(numbers, sample_weights)
+        if with_quantiles:
+            if self.sketch is None:
+                self.sketch = QuantileSketch()
+            self.sketch.update(numbers, sample_weights)
+
+    def merge(self, other: "_ColumnStats"):
+        if self.kind in ["bool", "other"]:
+            if other.value_counts is not None:
+                self._merge_values(other.count, other.value_counts)
+        elif other.count:
+            shift = 0
+            if self.kind == "datetime":
+                if self.origin is None:
+                    self.origin = other.origin
+                shift = other.origin - self.origin
+            self.merge_moments(
+                other.count,
+                other.mean + shift,
+                other.m2,
+                other.min + shift,
+                other.max + shift,
+            )
+        self.histograms.extend(other.histograms)
+        if other.sketch is not None:
+            if self.sketch is None:
+                self.sketch = QuantileSketch(other.sketch.compression)
+            self.sketch.merge(other.sketch)
+
+    def _merge_values(self, count, value_counts):
+        self.count += count
+        if self.value_counts is None:
+            self.value_counts = value_counts
+        else:
+            # keeps the values in the order they were first seen
+            self.value_counts = (
+                pd.concat([self.value_counts, value_counts])
+                .groupby(level=0, sort=False)
+                .sum()
+            )
+
+    def merge_moments(self, count, mean, m2, min_value, max_value):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.min = min_value if self.min is None else min(self.min, min_value)
+        self.max = max_value if self.max is None else max(self.max, max_value)
+
+    def _add_histogram(self, numbers, weights):
+        try:
+            if np.ndim(weights):
+                hist, bins = np.histogram(numbers, bins=self.num_bins, weights=weights)
+            else:
+                hist, bins = np.histogram(numbers, bins=self.num_bins)
+                if weights != 1:
+                    hist = hist * weights
+        except Exception:
+            return
+        self.histograms.append((hist, bins, numbers.min(), numbers.max()))
+
+    def _get_histogram(self, num_bins):
+        # the range of the data (the bins of a constant chunk are wider than its values)
+        bins_min = min(histogram[2] for histogram in self.histograms)
+        bins_max = max(histogram[3] for histogram in self.histograms)
+        centers = np.concatenate(
+            [(bins[:-1] + bins[1:]) / 2 for _, bins, _, _ in self.histograms]
+        )
+        centers = np.clip(centers, bins_min, bins_max)
+        weights = np.concatenate([hist for hist, _, _, _ in self.histograms])
+        hist, bins = np.histogram(
+            centers, bins=num_bins, range=(bins_min, bins_max), weights=weights
+        )
+        return [np.round(hist).astype(np.int64).tolist(), bins.tolist()]
+
+    def _to_timestamp(self, value):
+        timestamp = pd.Timestamp(int(round(value)) + self.origin)
+        if self.tz is not None:
+            timestamp = timestamp.tz_localize("UTC").tz_convert(self.tz)
+        return str(timestamp)
+
+    def to_dict(self, num_bins) -> dict:
         stats_dict = {}
-        for stat, val in values.dropna().items():
-            if stat != "50%":
-                if isinstance(val, (float, np.floating, np.float64)):
-                    stats_dict[stat] = float(val)
-                elif isinstance(val, (int, np.integer, np.int64)):
-                    # boolean values are considered subclass of int
-                    if isinstance(val, bool):
-                        stats_dict[stat] = bool(val)
-                    else:
-                        stats_dict[stat] = int(val)
-                else:
-                    stats_dict[stat] = str(val)
-
-        if InferOptions.get_common_options(
-            options, InferOptions.Histogram
-        ) and pd.api.types.is_numeric_dtype(df[col]):
-            # store histogram
-            try:
-                hist, bins = np.histogram(df[col], bins=num_bins)
-                stats_dict["hist"] = [hist.tolist(), bins.tolist()]
-            except Exception:
-                pass
-
-        results_dict[col] = stats_dict
-    return results_dict
+        if not self.count:
+            return stats_dict
+        count = int(round(self.count))
+        if self.kind in ["bool", "other"]:
+            value_counts = self.value_counts.sort_values(ascending=False, kind="stable")
+            stats_dict["count"] = count
+            stats_dict["unique"] = len(value_counts)
+            stats_dict["top"] = str(value_counts.index[0])
+            stats_dict["freq"] = int(round(value_counts.iloc[0]))
+        elif self.kind == "datetime":
+            stats_dict["count"] = count
+            stats_dict["mean"] = self._to_timestamp(self.mean)
+            stats_dict["min"] = self._to_timestamp(self.min)
+            stats_dict["max"] = self._to_timestamp(self.max)
+        else:
+            stats_dict["count"] = float(count)
+            stats_dict["mean"] = float(self.mean)
+            if self.count > 1:
+                stats_dict["std"] = float(np.sqrt(self.m2 / (self.count - 1)))
+            stats_dict["min"] = float(self.min)
+            if self.sketch is not None:
+                for percentile in self.percentiles:
+                    stats_dict[f"{percentile * 100:g}%"] = self.sketch.quantile(
+                        percentile
+                    )
+            stats_dict["max"] = float(self.max)
+
+        if self.histograms:
+            stats_dict["hist"] = self._get_histogram(num_bins)
+        return stats_dict
 
 
 def get_df_preview(df, preview_lines=20):
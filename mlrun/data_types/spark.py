@@ -1,6 +1,6 @@
-import numpy as np
-
+from ..config import config
 from .data_types import InferOptions, spark_to_value_type
+from .infer import DFStatsAccumulator
 
 try:
     import pyspark.sql.functions as funcs
@@ -132,26 +132,30 @@ def get_df_stats_spark(df, options, num_bins=20):
     if InferOptions.get_common_options(options, InferOptions.Index):
         df = df.select("*").withColumn("id", funcs.monotonically_increasing_id())
 
-    describe_df = df.toPandas().describe(
-        include="all", percentiles=[], datetime_is_numeric=True
+    # with InferOptions.Sample only a sample of the rows is collected, the stats are scaled back to the total rows,
+    # the counts and moments are then computed by spark over all the rows (see _update_exact_stats)
+    sample_df = df
+    total_rows = None
+    if InferOptions.get_common_options(options, InferOptions.Sample):
+        total_rows = df.count()
+        sample_size = int(config.stats.sample_size)
+        if total_rows > sample_size:
+            sample_df = df.sample(fraction=sample_size / total_rows)
+    pandas_df = sample_df.toPandas()
+    weight = None
+    if sample_df is not df and len(pandas_df):
+        weight = total_rows / len(pandas_df)
+
+    # the histograms are computed (over all the rows) by spark
+    accumulator = DFStatsAccumulator(
+        options & ~(InferOptions.Histogram | InferOptions.Sample | InferOptions.Index),
+        preview_lines=0,
     )
-    results_dict = {}
-    for col, values in describe_df.items():
-        stats_dict = {}
-        for stat, val in values.dropna().items():
-            if stat != "50%":
-                if isinstance(val, (float, np.floating, np.float64)):
-                    stats_dict[stat] = float(val)
-                elif isinstance(val, (int, np.integer, np.int64)):
-                    # boolean values are considered subclass of int
-                    if isinstance(val, bool):
-                        stats_dict[stat] = bool(val)
-                    else:
-                        stats_dict[stat] = int(val)
-                else:
-                    stats_dict[stat] = str(val)
-        results_dict[col] = stats_dict
-
+    accumulator.update(pandas_df, weight=weight)
+    results_dict = accumulator.get_stats()
+    if sample_df is not df:
+        _update_exact_stats(df, results_dict)
+    for col in results_dict.keys():
         if InferOptions.get_common_options(
             options, InferOptions.Histogram
         ) and get_dtype(df, col) in ["double", "int"]:
@@ -169,6 +173,36 @@ def get_df_stats_spark(df, options, num_bins=20):
     return results_dict
 
 
+_numeric_dtypes = ["tinyint", "smallint", "int", "bigint", "float", "double"]
+
+
+def _update_exact_stats(df, results_dict):
+    """set the counts, mean, std and min/max of the (sampled) stats to the ones of all the rows, in one aggregation"""
+    columns = [col for col in results_dict.keys() if col in df.columns]
+    numeric_columns = [col for col in columns if get_dtype(df, col) in _numeric_dtypes]
+    aggregations = [
+        funcs.count(col).alias(f"count_{i}") for i, col in enumerate(columns)
+    ]
+    for i, col in enumerate(numeric_columns):
+        aggregations += [
+            funcs.mean(col).alias(f"mean_{i}"),
+            funcs.stddev_samp(col).alias(f"std_{i}"),
+            funcs.min(col).alias(f"min_{i}"),
+            funcs.max(col).alias(f"max_{i}"),
+        ]
+    if not aggregations:
+        return
+    row = df.agg(*aggregations).collect()[0]
+    for i, col in enumerate(columns):
+        results_dict[col]["count"] = row[f"count_{i}"]
+    for i, col in enumerate(numeric_columns):
+        results_dict[col]["count"] = float(results_dict[col]["count"])
+        for stat in ["mean", "std", "min", "max"]:
+            value = row[f"{stat}_{i}"]
+            if value is not None:
+                results_dict[col][stat] = float(value)
+
+
 class SparkDataInfer:
     infer_schema = infer_schema_from_df_spark
     get_preview = get_df_preview_spark
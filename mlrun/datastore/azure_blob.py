@@ -83,11 +83,29 @@ class AzureBlobStore(DataStore):
                 container=self.endpoint, blob=key[1:]
             ) as blob_client:
                 with open(src_path, "rb") as data:
-                    blob_client.upload_blob(data, overwrite=True)
+                    # large blobs are uploaded in blocks, concurrently
+                    blob_client.upload_blob(
+                        data,
+                        overwrite=True,
+                        max_concurrency=int(mlrun.mlconf.transfer.max_workers),
+                    )
         else:
             remote_path = self._convert_key_to_remote_path(key)
             self._filesystem.put_file(src_path, remote_path, overwrite=True)
 
+    def _download(self, key, target_path):
+        if self.bsc:
+            with self.bsc.get_blob_client(
+                container=self.endpoint, blob=key[1:]
+            ) as blob_client:
+                with open(target_path, "wb") as fp:
+                    blob_client.download_blob(
+                        max_concurrency=int(mlrun.mlconf.transfer.max_workers)
+                    ).readinto(fp)
+        else:
+            remote_path = self._convert_key_to_remote_path(key)
+            self._filesystem.get_file(remote_path, target_path)
+
     def get(self, key, size=None, offset=0):
         if self.bsc:
             with self.bsc.get_blob_client(
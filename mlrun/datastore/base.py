@@ -14,6 +14,7 @@
 import sys
 import tempfile
 from base64 import b64encode
+from contextlib import contextmanager
 from os import getenv, path, remove
 
 import dask.dataframe as dd
@@ -27,6 +28,15 @@ import urllib3
 import mlrun.errors
 from mlrun.utils import is_ipython, logger
 
+from .cache import get_local_cache
+from .transfer import TransferManager
+from .utils import (
+    add_filters_columns,
+    and_filters,
+    filter_df_or_chunks,
+    normalize_filters,
+)
+
 verify_ssl = False
 if not verify_ssl:
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -78,6 +88,10 @@ class DataStore:
         """Whether the data store supports isdir"""
         return True
 
+    def supports_range_get(self):
+        """Whether the data store get() reads byte ranges (so large objects can be downloaded in parts)"""
+        return False
+
     def _get_secret_or_env(self, key, default=None):
         return self._secret(key) or getenv(key, default)
 
@@ -104,6 +118,22 @@ class DataStore:
     def get(self, key, size=None, offset=0):
         pass
 
+    def get_memoryview(self, key, size=None, offset=0):
+        """read all or a byte range as a memoryview, zero-copy where the store supports it"""
+        data = self.get(key, size=size, offset=offset)
+        if isinstance(data, str):
+            data = data.encode()
+        return memoryview(data)
+
+    @contextmanager
+    def open_buffer(self, key):
+        """open the object as a read only memoryview, valid inside the context"""
+        view = self.get_memoryview(key)
+        try:
+            yield view
+        finally:
+            view.release()
+
     def query(self, key, query="", **kwargs):
         raise ValueError("data store doesnt support structured queries")
 
@@ -117,6 +147,10 @@ class DataStore:
         raise ValueError("data store doesnt support listdir")
 
     def download(self, key, target_path):
+        TransferManager().download(self, key, target_path)
+
+    def _download(self, key, target_path):
+        """download the object in a single transfer"""
         data = self.get(key)
         mode = "wb"
         if isinstance(data, str):
@@ -138,16 +172,29 @@ class DataStore:
         start_time=None,
         end_time=None,
         time_column=None,
+        filters=None,
         **kwargs,
     ):
         df_module = df_module or pd
+        filters = normalize_filters(filters)
+        # filters which are applied to the rows after they are read
+        post_filters = None
         if url.endswith(".csv") or format == "csv":
             if columns:
-                kwargs["usecols"] = columns
+                kwargs["usecols"] = add_filters_columns(columns, filters)
+            post_filters = filters
             reader = df_module.read_csv
         elif url.endswith(".parquet") or url.endswith(".pq") or format == "parquet":
+            if filters and df_module == dd:
+                # dask only uses the filters to skip row groups/partitions
+                post_filters = filters
             if columns:
-                kwargs["columns"] = columns
+                kwargs["columns"] = (
+                    add_filters_columns(columns, filters) if post_filters else columns
+                )
+                if df_module == dd:
+                    # read the (pandas written) index columns as regular columns, so they can be selected
+                    kwargs["index"] = False
 
             def reader(*args, **kwargs):
                 if start_time or end_time:
@@ -183,32 +230,68 @@ class DataStore:
                         time_column,
                     )
                     kwargs["filters"] = filters
+                if row_filters:
+                    kwargs["filters"] = and_filters(kwargs.get("filters"), row_filters)
                 return df_module.read_parquet(*args, **kwargs)
 
+            row_filters = filters
+
         elif url.endswith(".json") or format == "json":
+            post_filters = filters
             reader = df_module.read_json
 
         else:
             raise Exception(f"file type unhandled {url}")
 
         fs = self.get_filesystem()
-        if fs:
-            if self.supports_isdir() and fs.isdir(url) or df_module == dd:
-                storage_options = self.get_storage_options()
-                if storage_options:
-                    kwargs["storage_options"] = storage_options
-                return reader(url, **kwargs)
+        df = None
+        if df_module != dd and not (start_time or end_time):
+            local_path = self._get_cached_path(url, subpath, fs)
+            if local_path:
+                df = reader(local_path, **kwargs)
+
+        if df is None:
+            if fs:
+                if self.supports_isdir() and fs.isdir(url) or df_module == dd:
+                    storage_options = self.get_storage_options()
+                    if storage_options:
+                        kwargs["storage_options"] = storage_options
+                    df = reader(url, **kwargs)
+                else:
+                    # If not dir, use fs.open() to avoid regression when pandas < 1.2 and does not
+                    # support the storage_options parameter.
+                    df = reader(fs.open(url), **kwargs)
             else:
-                # If not dir, use fs.open() to avoid regression when pandas < 1.2 and does not
-                # support the storage_options parameter.
-                return reader(fs.open(url), **kwargs)
-
-        temp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.download(self._join(subpath), temp_file.name)
-        df = reader(temp_file.name, **kwargs)
-        remove(temp_file.name)
+                temp_file = tempfile.NamedTemporaryFile(delete=False)
+                self.download(self._join(subpath), temp_file.name)
+                df = reader(temp_file.name, **kwargs)
+                remove(temp_file.name)
+
+        if post_filters:
+            df = filter_df_or_chunks(df, post_filters, columns)
         return df
 
+    def _get_cached_path(self, url, subpath, fs=None):
+        """return the local path of the object in the local cache, None if the cache is disabled or the object
+        cant be cached (e.g. a dir)"""
+        cache = get_local_cache()
+        if cache is None or self.kind in ["file", "memory"]:
+            return None
+        if fs and self.supports_isdir() and fs.isdir(url):
+            return None
+        key = self._join(subpath)
+        try:
+            stats = self.stat(key)
+        except Exception:
+            return None
+        _, suffix = path.splitext(subpath)
+        return cache.get_path(
+            url,
+            lambda target_path: self.download(key, target_path),
+            stats=stats,
+            suffix=suffix,
+        )
+
     def to_dict(self):
         return {
             "name": self.name,
@@ -299,18 +382,35 @@ class DataItem:
         """DataItem url e.g. /dir/path, s3://bucket/path"""
         return self._url
 
-    def get(self, size=None, offset=0, encoding=None):
+    def get(self, size=None, offset=0, encoding=None, as_memoryview=False):
         """read all or a byte range and return the content
 
-        :param size:     number of bytes to get
-        :param offset:   fetch from offset (in bytes)
-        :param encoding: encoding (e.g. "utf-8") for converting bytes to str
+        :param size:          number of bytes to get
+        :param offset:        fetch from offset (in bytes)
+        :param encoding:      encoding (e.g. "utf-8") for converting bytes to str
+        :param as_memoryview: return a read only memoryview, local files are memory mapped (not copied to memory)
         """
+        if as_memoryview:
+            if encoding:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    "encoding is not supported with as_memoryview"
+                )
+            return self._store.get_memoryview(self._path, size=size, offset=offset)
         body = self._store.get(self._path, size=size, offset=offset)
         if encoding and isinstance(body, bytes):
             body = body.decode(encoding)
         return body
 
+    def open_buffer(self):
+        """open the content as a read only memoryview (memory mapped for local files), valid inside the context
+
+        example::
+
+            with data_item.open_buffer() as buffer:
+                header = bytes(buffer[:8])
+        """
+        return self._store.open_buffer(self._path)
+
     def download(self, target_path):
         """download to the target dir/path
 
@@ -356,6 +456,12 @@ class DataItem:
         if self._local_path:
             return self._local_path
 
+        cache = get_local_cache()
+        if cache is not None:
+            self._local_path = cache.get_dataitem_path(self)
+            if self._local_path:
+                return self._local_path
+
         dot = self._path.rfind(".")
         suffix = "" if dot == -1 else self._path[dot:]
         temp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
@@ -424,7 +530,8 @@ class DataItem:
 def get_range(size, offset):
     byterange = f"bytes={offset}-"
     if size:
-        byterange += str(offset + size)
+        # the range end is inclusive
+        byterange += str(offset + size - 1)
     return byterange
 
 
@@ -447,6 +554,22 @@ def http_get(url, headers=None, auth=None):
     return response.content
 
 
+def http_download(url, target_path, headers=None, auth=None, chunk_size=1024 * 1024):
+    """stream the url content to a local file"""
+    try:
+        response = requests.get(
+            url, headers=headers, auth=auth, verify=verify_ssl, stream=True
+        )
+    except OSError as exc:
+        raise OSError(f"error: cannot connect to {url}: {exc}")
+
+    with response:
+        mlrun.errors.raise_for_status(response)
+        with open(target_path, "wb") as fp:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                fp.write(chunk)
+
+
 def http_head(url, headers=None, auth=None):
     try:
         response = requests.head(url, headers=headers, auth=auth, verify=verify_ssl)
@@ -494,6 +617,9 @@ class HttpStore(DataStore):
     def put(self, key, data, append=False):
         raise ValueError("unimplemented")
 
+    def _download(self, key, target_path):
+        http_download(self.url + self._join(key), target_path, None, self.auth)
+
     def get(self, key, size=None, offset=0):
         data = http_get(self.url + self._join(key), None, self.auth)
         if offset:
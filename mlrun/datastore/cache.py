@@ -0,0 +1,219 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import os
+import uuid
+from contextlib import contextmanager
+
+from ..config import config
+from ..utils import logger
+
+try:
+    import fcntl
+except ImportError:
+    # no cross process locking (e.g. on windows), fills are still atomic
+    fcntl = None
+
+_local_cache = None
+
+
+class LocalCache:
+    """on disk, size bounded, content addressed cache of remote objects (used by DataItem.local(), get_model()
+    and DataStore.as_df())
+
+    the objects are keyed by their content hash (when known, e.g. the model artifact hash) or by their url, size and
+    modified time, so a changed object gets a new entry. the objects are downloaded to a temp file and atomically
+    renamed, under a per key file lock, so multiple processes (e.g. serving workers/replicas sharing a volume) can use
+    the same cache dir and download each object only once. the least recently used objects are evicted when the
+    total size exceeds max_size
+
+    :param path:     cache root dir, default to mlconf.local_cache.path
+    :param max_size: max total size in bytes, default to mlconf.local_cache.max_size
+    """
+
+    def __init__(self, path: str = None, max_size: int = None):
+        self.path = os.path.expanduser(path or config.local_cache.path)
+        self.max_size = int(max_size or config.local_cache.max_size)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.downloaded_bytes = 0
+        self._objects_dir = os.path.join(self.path, "objects")
+        self._locks_dir = os.path.join(self.path, "locks")
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._locks_dir, exist_ok=True)
+
+    @staticmethod
+    def get_key(url: str, stats=None, content_hash: str = None):
+        """return the cache key of an object, None when it cant be identified (no hash and no stats)"""
+        if content_hash:
+            source = f"hash:{content_hash}"
+        elif stats is not None and stats.size is not None and stats.modified:
+            source = f"url:{url}:{stats.size}:{stats.modified!r}"
+        else:
+            return None
+        return hashlib.sha256(source.encode()).hexdigest()
+
+    def get_path(
+        self,
+        url: str,
+        download,
+        stats=None,
+        content_hash: str = None,
+        suffix: str = "",
+    ):
+        """return the local path of the cached object, download it (with download(target_path)) on a miss
+
+        :param url:          object url
+        :param download:     function which downloads the object to a given local path
+        :param stats:        object FileStats (size, modified), used as the key when there is no content_hash
+        :param content_hash: object content hash
+        :param suffix:       local file suffix (e.g. ".pkl"), some readers depend on it
+
+        :returns: the local path, or None when the object cant be cached (it has no hash or stats)
+        """
+        key = self.get_key(url, stats, content_hash)
+        if key is None:
+            return None
+        object_dir = os.path.join(self._objects_dir, key[:2])
+        object_path = os.path.join(object_dir, key + suffix)
+        if self._touch(object_path):
+            self.hits += 1
+            return object_path
+
+        with self._lock(key):
+            # may have been filled by another process while waiting for the lock
+            if self._touch(object_path):
+                self.hits += 1
+                return object_path
+            self.misses += 1
+            logger.info(f"downloading {url} to the local cache")
+            os.makedirs(object_dir, exist_ok=True)
+            temp_path = f"{object_path}.{uuid.uuid4().hex}.tmp"
+            try:
+                download(temp_path)
+                os.replace(temp_path, object_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            self.downloaded_bytes += os.path.getsize(object_path)
+
+        self.evict(keep=object_path)
+        return object_path
+
+    def get_dataitem_path(self, item, content_hash: str = None):
+        """return the local (cached) path of a DataItem, None when it cant be cached"""
+        stats = None
+        if not content_hash:
+            try:
+                stats = item.stat()
+            except Exception:
+                return None
+        return self.get_path(
+            item.url,
+            item.download,
+            stats=stats,
+            content_hash=content_hash,
+            suffix=item.suffix,
+        )
+
+    def evict(self, keep: str = None):
+        """remove the least recently used objects until the cache size is below max_size"""
+        entries = []
+        total_size = 0
+        for entry_path, entry_stat in self._iterate_objects():
+            entries.append((entry_stat.st_mtime, entry_stat.st_size, entry_path))
+            total_size += entry_stat.st_size
+        if total_size <= self.max_size:
+            return
+        for _, size, entry_path in sorted(entries):
+            if entry_path == keep:
+                continue
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                # evicted by another process
+                pass
+            else:
+                self.evictions += 1
+            total_size -= size
+            if total_size <= self.max_size:
+                break
+
+    def clear(self):
+        """remove all the cached objects"""
+        for entry_path, _ in self._iterate_objects():
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
+
+    def size(self) -> int:
+        """return the total size (bytes) of the cached objects"""
+        return sum(entry_stat.st_size for _, entry_stat in self._iterate_objects())
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "downloaded_bytes": self.downloaded_bytes,
+        }
+
+    def _iterate_objects(self):
+        for dir_path, _, files in os.walk(self._objects_dir):
+            for file in files:
+                if file.endswith(".tmp"):
+                    # partial downloads
+                    continue
+                entry_path = os.path.join(dir_path, file)
+                try:
+                    yield entry_path, os.stat(entry_path)
+                except FileNotFoundError:
+                    pass
+
+    @staticmethod
+    def _touch(object_path):
+        """mark the object as recently used, return False if it is not cached"""
+        try:
+            os.utime(object_path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    @contextmanager
+    def _lock(self, key):
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self._locks_dir, key + ".lock"), "w") as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fp, fcntl.LOCK_UN)
+
+
+def get_local_cache():
+    """return the local objects cache, None when it is disabled (mlconf.local_cache.enabled)"""
+    global _local_cache
+    if not config.local_cache.enabled:
+        return None
+    path = os.path.expanduser(config.local_cache.path)
+    if _local_cache is None or _local_cache.path != path:
+        _local_cache = LocalCache(path)
+    _local_cache.max_size = int(config.local_cache.max_size)
+    return _local_cache
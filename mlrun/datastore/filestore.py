@@ -12,12 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from os import listdir, makedirs, path, stat
+import mmap
+from contextlib import contextmanager
+from os import fstat, listdir, makedirs, path, stat
 from shutil import copyfile
 
 import fsspec
+import pandas as pd
+import pyarrow.parquet as pq
 
 from .base import DataStore, FileStats
+from .utils import normalize_filters
 
 
 class FileStore(DataStore):
@@ -45,6 +50,70 @@ class FileStore(DataStore):
                 size = -1
             return fp.read(size)
 
+    def get_memoryview(self, key, size=None, offset=0):
+        with open(self._join(key), "rb") as fp:
+            if not fstat(fp.fileno()).st_size:
+                return memoryview(b"")
+            # the mapping stays open as long as the view (or its slices) are referenced
+            view = memoryview(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ))
+        return view[offset : offset + size if size else None]
+
+    @contextmanager
+    def open_buffer(self, key):
+        with open(self._join(key), "rb") as fp:
+            if not fstat(fp.fileno()).st_size:
+                yield memoryview(b"")
+                return
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    def as_df(
+        self,
+        url,
+        subpath,
+        columns=None,
+        df_module=None,
+        format="",
+        start_time=None,
+        end_time=None,
+        time_column=None,
+        filters=None,
+        **kwargs,
+    ):
+        is_parquet = (
+            url.endswith(".parquet") or url.endswith(".pq") or format == "parquet"
+        )
+        if (
+            is_parquet
+            and df_module in [None, pd]
+            and not (start_time or end_time or kwargs)
+            and path.isfile(url)
+        ):
+            # memory mapped by arrow, the file isn't read (copied) through python file objects
+            return pq.read_table(
+                url,
+                columns=columns,
+                filters=normalize_filters(filters),
+                memory_map=True,
+                use_pandas_metadata=True,
+            ).to_pandas()
+        return super().as_df(
+            url,
+            subpath,
+            columns=columns,
+            df_module=df_module,
+            format=format,
+            start_time=start_time,
+            end_time=end_time,
+            time_column=time_column,
+            filters=filters,
+            **kwargs,
+        )
+
     def put(self, key, data, append=False):
         dir = path.dirname(self._join(key))
         if dir:
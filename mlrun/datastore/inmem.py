@@ -19,6 +19,7 @@ import pandas as pd
 import mlrun
 
 from .base import DataStore, FileStats
+from .utils import add_filters_columns, filter_df, filter_df_or_chunks
 
 
 class InMemoryStore(DataStore):
@@ -42,6 +43,17 @@ class InMemoryStore(DataStore):
         item = self._get_item(key)
         return item
 
+    def get_memoryview(self, key, size=None, offset=0):
+        item = self._get_item(key)
+        if isinstance(item, str):
+            item = item.encode()
+        elif not isinstance(item, (bytes, bytearray, memoryview)):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"item {key} is not bytes or str, cant read it as a buffer"
+            )
+        # a view of the stored object, not a copy
+        return memoryview(item)[offset : offset + size if size else None]
+
     def put(self, key, data, append=False):
         if append and key in self._items:
             self._items[key] = self._items[key] + data
@@ -58,10 +70,19 @@ class InMemoryStore(DataStore):
     def listdir(self, key):
         return []
 
-    def as_df(self, url, subpath, columns=None, df_module=None, format="", **kwargs):
+    def as_df(
+        self,
+        url,
+        subpath,
+        columns=None,
+        df_module=None,
+        format="",
+        filters=None,
+        **kwargs,
+    ):
         item = self._get_item(subpath)
         if hasattr(item, "to_csv"):  # detect if it is a dataframe type
-            return item
+            return filter_df(item, filters)
         if isinstance(item, str):
             item = StringIO(item)
         else:
@@ -70,15 +91,18 @@ class InMemoryStore(DataStore):
         df_module = df_module or pd
         if url.endswith(".csv") or format == "csv":
             if columns:
-                kwargs["usecols"] = columns
+                kwargs["usecols"] = add_filters_columns(columns, filters)
             reader = df_module.read_csv
         elif url.endswith(".parquet") or url.endswith(".pq") or format == "parquet":
             if columns:
-                kwargs["columns"] = columns
+                kwargs["columns"] = add_filters_columns(columns, filters)
             reader = df_module.read_parquet
         elif url.endswith(".json") or format == "json":
             reader = df_module.read_json
         else:
             raise mlrun.errors.MLRunInvalidArgumentError(f"file type unhandled {url}")
 
-        return reader(item, **kwargs)
+        df = reader(item, **kwargs)
+        if filters:
+            df = filter_df_or_chunks(df, filters, columns)
+        return df
@@ -16,6 +16,7 @@ import time
 
 import boto3
 import fsspec
+from boto3.s3.transfer import TransferConfig
 
 import mlrun.errors
 
@@ -63,9 +64,24 @@ class S3Store(DataStore):
             secret=self._get_secret_or_env("AWS_SECRET_ACCESS_KEY"),
         )
 
+    @staticmethod
+    def _transfer_config():
+        # large objects are transferred in parts, concurrently
+        transfer_config = mlrun.mlconf.transfer
+        return TransferConfig(
+            multipart_threshold=int(transfer_config.multipart_threshold),
+            multipart_chunksize=int(transfer_config.part_size),
+            max_concurrency=int(transfer_config.max_workers),
+        )
+
     def upload(self, key, src_path):
-        self.s3.Object(self.endpoint, self._join(key)[1:]).put(
-            Body=open(src_path, "rb")
+        self.s3.Object(self.endpoint, self._join(key)[1:]).upload_file(
+            src_path, Config=self._transfer_config()
+        )
+
+    def _download(self, key, target_path):
+        self.s3.Object(self.endpoint, self._join(key)[1:]).download_file(
+            target_path, Config=self._transfer_config()
         )
 
     def get(self, key, size=None, offset=0):
@@ -15,12 +15,24 @@ from copy import copy
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
+import pandas as pd
+
 import mlrun
 
 from ..config import config
 from ..model import DataSource
 from ..utils import get_class
-from .utils import store_path_to_spark
+from .utils import (
+    add_filters_columns,
+    and_filters,
+    filter_df_or_chunks,
+    filters_to_spark,
+    row_group_may_match,
+    store_path_to_spark,
+)
+
+# rows per dataframe when a filtered/projected source is streamed to a storey flow
+flow_chunk_size = 10000
 
 
 def get_source_from_dict(source):
@@ -39,6 +51,11 @@ def get_source_step(source, key_fields=None, time_field=None, context=None):
     return source.to_step(key_fields, time_field, context)
 
 
+def _iterate_df_chunks(df, chunk_size):
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start : start + chunk_size]
+
+
 class BaseSourceDriver(DataSource):
     support_spark = False
     support_storey = False
@@ -56,12 +73,37 @@ class BaseSourceDriver(DataSource):
         """get storey Table object"""
         return None
 
+    def _get_columns(self, key_field=None, time_field=None):
+        """return the columns to read (None for all), including the key and time fields"""
+        if not self.columns:
+            return None
+        columns = list(self.columns)
+        key_fields = self.key_field or key_field or []
+        if isinstance(key_fields, str):
+            key_fields = [key_fields]
+        for field in key_fields + [self.time_field or time_field]:
+            if field and field not in columns:
+                columns.append(field)
+        return columns
+
     def to_dataframe(self):
-        return mlrun.store_manager.object(url=self.path).as_df()
+        return mlrun.store_manager.object(url=self.path).as_df(
+            columns=self._get_columns(), filters=self.filters
+        )
+
+    def to_dataframe_chunks(self, chunk_size: int):
+        """iterate over the source data in dataframes of (up to) chunk_size rows"""
+        return _iterate_df_chunks(self.to_dataframe(), chunk_size)
 
     def to_spark_df(self, session, named_view=False):
         if self.support_spark:
             df = session.read.load(**self.get_spark_options())
+            # pushed down to the (parquet) scan by spark
+            if self.filters:
+                df = df.filter(filters_to_spark(self.filters))
+            columns = self._get_columns()
+            if columns:
+                df = df.select(*columns)
             if named_view:
                 df.createOrReplaceTempView(self.name)
             return df
@@ -86,6 +128,11 @@ class CSVSource(BaseSourceDriver):
         :parameter attributes: additional parameters to pass to storey.
         :parameter parse_dates: Optional. List of columns (names or integers, other than time_field) that will be
             attempted to parse as date column.
+        :parameter columns: Optional. List of columns to read (the key and time fields are always read), the other
+            columns are not parsed.
+        :parameter filters: Optional. Row filters, a list of (column, op, value) tuples which must all match, e.g.
+            [("ticker", "in", ["GOOG", "MSFT"])], or a list of such lists (of which any can match). ops are
+            =, ==, !=, <, <=, >, >=, in, not in
         """
 
     kind = "csv"
@@ -101,8 +148,19 @@ class CSVSource(BaseSourceDriver):
         time_field: str = None,
         schedule: str = None,
         parse_dates: Optional[Union[List[int], List[str]]] = None,
+        columns: List[str] = None,
+        filters: list = None,
     ):
-        super().__init__(name, path, attributes, key_field, time_field, schedule)
+        super().__init__(
+            name,
+            path,
+            attributes,
+            key_field,
+            time_field,
+            schedule,
+            columns=columns,
+            filters=filters,
+        )
         self._parse_dates = parse_dates
 
     def to_step(self, key_field=None, time_field=None, context=None):
@@ -111,6 +169,20 @@ class CSVSource(BaseSourceDriver):
         attributes = self.attributes or {}
         if context:
             attributes["context"] = context
+        if self.columns or self.filters:
+            # storey.CSVSource parses all the rows and columns, stream the projected and filtered chunks instead
+            time_field = self.time_field or time_field
+            parse_dates = list(self._parse_dates or [])
+            if time_field and time_field not in parse_dates:
+                parse_dates.append(time_field)
+            return storey.DataframeSource(
+                dfs=self._read_chunks(
+                    flow_chunk_size, parse_dates, key_field, time_field
+                ),
+                key_field=self.key_field or key_field,
+                time_field=time_field,
+                context=context,
+            )
         return storey.CSVSource(
             paths=self.path,
             header=True,
@@ -132,7 +204,21 @@ class CSVSource(BaseSourceDriver):
 
     def to_dataframe(self):
         return mlrun.store_manager.object(url=self.path).as_df(
-            parse_dates=self._parse_dates
+            parse_dates=self._parse_dates,
+            columns=self._get_columns(),
+            filters=self.filters,
+        )
+
+    def to_dataframe_chunks(self, chunk_size: int):
+        return self._read_chunks(chunk_size, self._parse_dates)
+
+    def _read_chunks(self, chunk_size, parse_dates, key_field=None, time_field=None):
+        # only a chunk is read to memory at a time
+        return mlrun.store_manager.object(url=self.path).as_df(
+            parse_dates=parse_dates,
+            chunksize=chunk_size,
+            columns=self._get_columns(key_field, time_field),
+            filters=self.filters,
         )
 
 
@@ -153,6 +239,10 @@ class ParquetSource(BaseSourceDriver):
        :parameter schedule: string to configure scheduling of the ingestion job. For example '*/30 * * * *' will
             cause the job to run every 30 minutes
        :parameter attributes: additional parameters to pass to storey.
+       :parameter columns: Optional. List of columns to read (the key and time fields are always read)
+       :parameter filters: Optional. Row filters, a list of (column, op, value) tuples which must all match, e.g.
+            [("ticker", "in", ["GOOG", "MSFT"])], or a list of such lists (of which any can match). ops are
+            =, ==, !=, <, <=, >, >=, in, not in. row groups which cant match (by their statistics) are not read
     """
 
     kind = "parquet"
@@ -169,6 +259,8 @@ class ParquetSource(BaseSourceDriver):
         schedule: str = None,
         start_time: Optional[Union[datetime, str]] = None,
         end_time: Optional[Union[datetime, str]] = None,
+        columns: List[str] = None,
+        filters: list = None,
     ):
         super().__init__(
             name,
@@ -179,6 +271,8 @@ class ParquetSource(BaseSourceDriver):
             schedule,
             start_time,
             end_time,
+            columns,
+            filters,
         )
 
     def to_step(
@@ -194,8 +288,23 @@ class ParquetSource(BaseSourceDriver):
         attributes = self.attributes or {}
         if context:
             attributes["context"] = context
+        columns = self._get_columns(key_field, time_field)
+        if self.filters:
+            # storey.ParquetSource has no row filters, stream the filtered row groups instead
+            time_field = self.time_field or time_field
+            return storey.DataframeSource(
+                dfs=self._read_chunks(
+                    flow_chunk_size,
+                    columns,
+                    and_filters(self.filters, self._get_time_filters(time_field)),
+                ),
+                key_field=self.key_field or key_field,
+                time_field=time_field,
+                context=context,
+            )
         return storey.ParquetSource(
             paths=self.path,
+            columns=columns,
             key_field=self.key_field or key_field,
             time_field=self.time_field or time_field,
             storage_options=self._get_store().get_storage_options(),
@@ -211,8 +320,56 @@ class ParquetSource(BaseSourceDriver):
             "format": "parquet",
         }
 
+    def _get_time_filters(self, time_field):
+        if not time_field:
+            return None
+        filters = []
+        if self.start_time:
+            filters.append((time_field, ">=", pd.Timestamp(self.start_time)))
+        if self.end_time:
+            filters.append((time_field, "<", pd.Timestamp(self.end_time)))
+        return filters
+
     def to_dataframe(self):
-        return mlrun.store_manager.object(url=self.path).as_df(format="parquet")
+        return mlrun.store_manager.object(url=self.path).as_df(
+            format="parquet", columns=self._get_columns(), filters=self.filters
+        )
+
+    def to_dataframe_chunks(self, chunk_size: int):
+        """iterate over the source data in dataframes of (up to) chunk_size rows, the parquet files (of a directory)
+        are read a row group at a time, so only (up to) a row group is held in memory"""
+        return self._read_chunks(chunk_size, self._get_columns(), self.filters)
+
+    def _read_chunks(self, chunk_size, columns=None, filters=None):
+        import pyarrow.parquet as pq
+
+        fs = self._get_store().get_filesystem(False)
+        if fs.isdir(self.path):
+            paths = sorted(
+                path
+                for path in fs.find(self.path)
+                if path.endswith((".parquet", ".pq"))
+            )
+        else:
+            paths = [self.path]
+        for path in paths:
+            with fs.open(path, "rb") as fp:
+                parquet_file = pq.ParquetFile(fp)
+                for index in range(parquet_file.num_row_groups):
+                    if not row_group_may_match(
+                        parquet_file.metadata.row_group(index), filters
+                    ):
+                        continue
+                    df = parquet_file.read_row_group(
+                        index,
+                        columns=add_filters_columns(columns, filters)
+                        if columns
+                        else None,
+                        use_pandas_metadata=True,
+                    ).to_pandas()
+                    if filters:
+                        df = filter_df_or_chunks(df, filters, columns)
+                    yield from _iterate_df_chunks(df, chunk_size)
 
 
 class CustomSource(BaseSourceDriver):
@@ -271,6 +428,9 @@ class DataFrameSource:
     def to_dataframe(self):
         return self._df
 
+    def to_dataframe_chunks(self, chunk_size: int):
+        return _iterate_df_chunks(self._df, chunk_size)
+
 
 class OnlineSource(BaseSourceDriver):
     """online data source spec"""
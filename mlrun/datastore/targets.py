@@ -14,6 +14,7 @@
 import os
 import sys
 import typing
+import uuid
 import warnings
 from collections import Counter
 from copy import copy
@@ -28,7 +29,7 @@ from mlrun.utils.v3io_clients import get_frames_client
 from .. import errors
 from ..data_types import ValueType
 from ..platforms.iguazio import parse_v3io_path, split_path
-from .utils import store_path_to_spark
+from .utils import filter_df, store_path_to_spark
 
 
 class TargetTypes:
@@ -174,6 +175,14 @@ def add_target_states(graph, resource, targets, to_df=False, final_state=None):
     return add_target_steps(graph, resource, targets, to_df, final_state)
 
 
+def _is_local_fs(fs):
+    # newer fsspec versions list all the protocol aliases (e.g. ("file", "local"))
+    protocol = fs.protocol
+    return protocol == "file" or (
+        isinstance(protocol, (tuple, list)) and "file" in protocol
+    )
+
+
 def add_target_steps(graph, resource, targets, to_df=False, final_step=None):
     """add the target steps to the graph"""
     targets = targets or []
@@ -341,8 +350,13 @@ class BaseStoreTarget(DataTargetBase):
         return result
 
     def write_dataframe(
-        self, df, key_column=None, timestamp_key=None, **kwargs,
+        self, df, key_column=None, timestamp_key=None, chunk_id=None, **kwargs,
     ) -> typing.Optional[int]:
+        """write a dataframe to the target, return the written size (when known)
+
+        :param chunk_id: optional, index of the chunk when the data is written in chunks (e.g. chunked ingestion),
+                         the chunks after the first one (chunk_id > 0) are appended to the target
+        """
         if hasattr(df, "rdd"):
             options = self.get_spark_options(key_column, timestamp_key)
             options.update(kwargs)
@@ -363,14 +377,23 @@ class BaseStoreTarget(DataTargetBase):
             except Exception as exc:
                 raise RuntimeError(f"Failed to write Dask Dataframe for {exc}.")
         else:
-            target_path = self._target_path
+            if chunk_id is None:
+                target_path = self._target_path
+            else:
+                target_path = self._get_chunk_path(chunk_id)
             fs = self._get_store().get_filesystem(False)
-            if fs.protocol == "file":
+            if _is_local_fs(fs):
                 dir = os.path.dirname(target_path)
                 if dir:
                     os.makedirs(dir, exist_ok=True)
-            self._write_dataframe(df, fs, target_path, **kwargs)
+            if chunk_id:
+                self._append_dataframe(df, fs, target_path, **kwargs)
+            else:
+                self._write_dataframe(df, fs, target_path, **kwargs)
             try:
+                if chunk_id is not None:
+                    # the size of all the chunks written so far
+                    return fs.du(self._target_path)
                 return fs.size(target_path)
             except Exception:
                 return None
@@ -379,6 +402,14 @@ class BaseStoreTarget(DataTargetBase):
     def _write_dataframe(df, fs, target_path, **kwargs):
         raise NotImplementedError()
 
+    @staticmethod
+    def _append_dataframe(df, fs, target_path, **kwargs):
+        raise NotImplementedError()
+
+    def _get_chunk_path(self, chunk_id):
+        """return the path a chunk of the data is written to"""
+        return self._target_path
+
     def set_secrets(self, secrets):
         self._secrets = secrets
 
@@ -408,8 +439,12 @@ class BaseStoreTarget(DataTargetBase):
         driver._resource = resource
         return driver
 
-    def get_table_object(self):
-        """get storey Table object"""
+    def get_table_object(self, driver_wrapper: typing.Callable = None):
+        """get storey Table object
+
+        :param driver_wrapper: optional function which gets the storey driver of the table and returns the driver
+                               to use instead (e.g. a caching driver which wraps it)
+        """
         return None
 
     @property
@@ -463,14 +498,20 @@ class BaseStoreTarget(DataTargetBase):
         start_time=None,
         end_time=None,
         time_column=None,
+        filters=None,
     ):
-        """return the target data as dataframe"""
+        """return the target data as dataframe
+
+        :param filters: optional, row filters (pyarrow format), a list of (column, op, value) tuples or a list of
+                        such lists, pushed down to the reader
+        """
         return mlrun.get_dataitem(self._target_path).as_df(
             columns=columns,
             df_module=df_module,
             start_time=start_time,
             end_time=end_time,
             time_column=time_column,
+            filters=filters,
         )
 
     def get_spark_options(self, key_column=None, timestamp_key=None):
@@ -511,6 +552,7 @@ class ParquetTarget(BaseStoreTarget):
     support_spark = True
     support_storey = True
     support_dask = True
+    _chunks_write_id = None
 
     def __init__(
         self,
@@ -578,6 +620,56 @@ class ParquetTarget(BaseStoreTarget):
         with fs.open(target_path, "wb") as fp:
             df.to_parquet(fp, **kwargs)
 
+    # every chunk is written to its own part file
+    _append_dataframe = _write_dataframe
+
+    def _get_chunk_path(self, chunk_id):
+        # the chunks are written as the part files of a parquet dataset (directory), which is read as a whole
+        if not chunk_id or not self._chunks_write_id:
+            self._chunks_write_id = uuid.uuid4().hex[:8]
+        return f"{self._target_path.rstrip('/')}/part-{self._chunks_write_id}-{chunk_id:05d}.parquet"
+
+    def write_dataframe_chunks(
+        self, chunks: typing.Iterable, schema=None
+    ) -> typing.Optional[int]:
+        """write an iterable of (pandas) dataframes with the same columns as a single parquet file, one row group per
+        chunk, so only one chunk is held in memory at a time
+
+        :param chunks: iterable of dataframes
+        :param schema: optional, the pyarrow schema to write, every chunk is converted to it. by default it is
+                       inferred from the first chunk, so the following chunks must have the same types (e.g. an int
+                       column can't have missing values (NaN) only in a later chunk)
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        target_path = self._target_path
+        fs = self._get_store().get_filesystem(False)
+        if _is_local_fs(fs):
+            dir = os.path.dirname(target_path)
+            if dir:
+                os.makedirs(dir, exist_ok=True)
+        with fs.open(target_path, "wb") as fp:
+            writer = None
+            try:
+                for chunk in chunks:
+                    if writer is None:
+                        schema = schema or pa.Schema.from_pandas(
+                            chunk, preserve_index=False
+                        )
+                        writer = pq.ParquetWriter(fp, schema)
+                    table = pa.Table.from_pandas(
+                        chunk, schema=writer.schema, preserve_index=False
+                    )
+                    writer.write_table(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+        try:
+            return fs.size(target_path)
+        except Exception:
+            return None
+
     def add_writer_state(
         self, graph, after, features, key_columns=None, timestamp_key=None
     ):
@@ -682,6 +774,7 @@ class ParquetTarget(BaseStoreTarget):
         start_time=None,
         end_time=None,
         time_column=None,
+        filters=None,
     ):
         """return the target data as dataframe"""
         return mlrun.get_dataitem(self._target_path).as_df(
@@ -691,6 +784,7 @@ class ParquetTarget(BaseStoreTarget):
             start_time=start_time,
             end_time=end_time,
             time_column=time_column,
+            filters=filters,
         )
 
     def is_single_file(self):
@@ -707,16 +801,23 @@ class CSVTarget(BaseStoreTarget):
     support_storey = True
 
     @staticmethod
-    def _write_dataframe(df, fs, target_path, **kwargs):
-        mode = "wb"
+    def _write_dataframe(df, fs, target_path, mode="w", **kwargs):
         # We generally prefer to open in a binary mode so that different encodings could be used, but pandas had a bug
         # with such files until version 1.2.0, in this version they dropped support for python 3.6.
         # So only for python 3.6 we're using text mode which might prevent some features
         if sys.version_info[0] == 3 and sys.version_info[1] == 6:
-            mode = "wt"
+            mode += "t"
+        else:
+            mode += "b"
         with fs.open(target_path, mode) as fp:
             df.to_csv(fp, **kwargs)
 
+    @staticmethod
+    def _append_dataframe(df, fs, target_path, **kwargs):
+        CSVTarget._write_dataframe(
+            df, fs, target_path, mode="a", header=False, **kwargs
+        )
+
     def add_writer_state(
         self, graph, after, features, key_columns=None, timestamp_key=None
     ):
@@ -770,10 +871,12 @@ class CSVTarget(BaseStoreTarget):
         start_time=None,
         end_time=None,
         time_column=None,
+        filters=None,
     ):
-        df = super().as_df(columns=columns, df_module=df_module, entities=entities)
-        df.set_index(keys=entities, inplace=True)
-        return df
+        df = super().as_df(
+            columns=columns, df_module=df_module, entities=entities, filters=filters
+        )
+        return df.set_index(keys=entities)
 
 
 class NoSqlTarget(BaseStoreTarget):
@@ -783,14 +886,15 @@ class NoSqlTarget(BaseStoreTarget):
     support_spark = True
     support_storey = True
 
-    def get_table_object(self):
+    def get_table_object(self, driver_wrapper: typing.Callable = None):
         from storey import Table, V3ioDriver
 
         # TODO use options/cred
         endpoint, uri = parse_v3io_path(self._target_path)
+        driver = V3ioDriver(webapi=endpoint)
         return Table(
             uri,
-            V3ioDriver(webapi=endpoint),
+            driver_wrapper(driver) if driver_wrapper else driver,
             flush_interval_secs=mlrun.mlconf.feature_store.flush_interval,
         )
 
@@ -865,7 +969,10 @@ class NoSqlTarget(BaseStoreTarget):
     def as_df(self, columns=None, df_module=None):
         raise NotImplementedError()
 
-    def write_dataframe(self, df, key_column=None, timestamp_key=None, **kwargs):
+    def write_dataframe(
+        self, df, key_column=None, timestamp_key=None, chunk_id=None, **kwargs
+    ):
+        # the chunks keys are upserted to the table, so they are written the same way
         if hasattr(df, "rdd"):
             options = self.get_spark_options(key_column, timestamp_key)
             options.update(kwargs)
@@ -988,7 +1095,9 @@ class TSDBTarget(BaseStoreTarget):
     def as_df(self, columns=None, df_module=None):
         raise NotImplementedError()
 
-    def write_dataframe(self, df, key_column=None, timestamp_key=None, **kwargs):
+    def write_dataframe(
+        self, df, key_column=None, timestamp_key=None, chunk_id=None, **kwargs
+    ):
         access_key = self._secrets.get("V3IO_ACCESS_KEY", os.getenv("V3IO_ACCESS_KEY"))
 
         new_index = []
@@ -1121,8 +1230,9 @@ class DFTarget(BaseStoreTarget):
         start_time=None,
         end_time=None,
         time_column=None,
+        filters=None,
     ):
-        return self._df
+        return filter_df(self._df, filters)
 
 
 kind_to_driver = {
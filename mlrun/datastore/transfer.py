@@ -0,0 +1,120 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import config
+from ..utils import calculate_local_file_hash
+
+
+class TransferManager:
+    """concurrent multi file transfers, and ranged (multipart) downloads of large objects
+
+    large objects of stores which support ranged reads (e.g. v3io) are downloaded in parts by concurrent workers
+    and written in place, so at most max_workers parts are held in memory. stores with native multipart transfers
+    (S3, Azure) use them with the same settings, others (e.g. http) stream the object to the target file
+
+    :param max_workers:         max concurrent transfers (files or parts), default to mlconf.transfer.max_workers
+    :param multipart_threshold: objects larger than this (bytes) are downloaded in parts,
+                                default to mlconf.transfer.multipart_threshold
+    :param part_size:           part size in bytes, default to mlconf.transfer.part_size
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        multipart_threshold: int = None,
+        part_size: int = None,
+    ):
+        self.max_workers = int(max_workers or config.transfer.max_workers)
+        self.multipart_threshold = int(
+            multipart_threshold or config.transfer.multipart_threshold
+        )
+        self.part_size = int(part_size or config.transfer.part_size)
+
+    def download(self, store, key, target_path):
+        """download a store object (key) to a local file, in parts when it is large and the store supports it"""
+        size = None
+        if store.supports_range_get():
+            try:
+                size = store.stat(key).size
+            except Exception:
+                size = None
+        if size and size > self.multipart_threshold:
+            self._download_parts(store, key, target_path, size)
+        else:
+            store._download(key, target_path)
+
+    def _download_parts(self, store, key, target_path, size):
+        with open(target_path, "wb") as fp:
+            fp.truncate(size)
+
+        def download_part(offset):
+            length = min(self.part_size, size - offset)
+            data = store.get(key, size=length, offset=offset)
+            if len(data) < length:
+                raise OSError(
+                    f"incomplete download of {key}, got {len(data)} bytes at offset {offset}, expected {length}"
+                )
+            with open(target_path, "r+b") as fp:
+                fp.seek(offset)
+                fp.write(data[:length])
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # list() raises the first failed part error
+            list(executor.map(download_part, range(0, size, self.part_size)))
+
+    def upload(self, item, src_path, calc_hash=False):
+        """upload a local file to a DataItem, the file hash is calculated while it is uploaded
+
+        :param item:      target DataItem
+        :param src_path:  local file path
+        :param calc_hash: calculate and return the file (sha1) hash
+
+        :returns: the file hash (if calc_hash is set)
+        """
+        if not calc_hash:
+            item.upload(src_path)
+            return None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            file_hash = executor.submit(calculate_local_file_hash, src_path)
+            item.upload(src_path)
+            return file_hash.result()
+
+    def upload_files(self, items, calc_hash=False):
+        """upload local files concurrently
+
+        :param items:     list of (target DataItem, local file path) tuples
+        :param calc_hash: calculate the files hashes
+
+        :returns: list of the files hashes (None if calc_hash is not set), in the items order
+        """
+        return self._map(
+            lambda item: self.upload(item[0], item[1], calc_hash=calc_hash), items
+        )
+
+    def download_files(self, items):
+        """download DataItems concurrently
+
+        :param items: list of (DataItem, local target path) tuples
+        """
+        self._map(lambda item: item[0].download(item[1]), items)
+
+    def _map(self, func, items):
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items))
+        ) as executor:
+            return list(executor.map(func, items))
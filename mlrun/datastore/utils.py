@@ -1,6 +1,202 @@
+import itertools
+
+import mlrun.errors
+
+filter_operators = ["=", "==", "!=", "<", "<=", ">", ">=", "in", "not in"]
+
+
 def store_path_to_spark(path):
     if path.startswith("v3io:///"):
         path = "v3io:" + path[len("v3io:/") :]
     elif path.startswith("s3:///"):
         path = "s3a:" + path[len("s3:/") :]
     return path
+
+
+def _is_predicate(item):
+    return (
+        isinstance(item, (list, tuple))
+        and len(item) == 3
+        and isinstance(item[0], str)
+        and isinstance(item[1], str)
+    )
+
+
+def normalize_filters(filters):
+    """return row filters in disjunctive normal form (a list of lists of (column, op, value) tuples), None if empty
+
+    the filters are in the pyarrow format, a list of (column, op, value) predicates which must all match, e.g.
+    [("ticker", "in", ["GOOG", "MSFT"]), ("price", ">", 100)], or a list of such lists, of which any can match.
+    the supported ops are: =, ==, !=, <, <=, >, >=, in, not in
+    """
+    if not filters:
+        return None
+    if all(_is_predicate(item) for item in filters):
+        filters = [filters]
+    normalized = []
+    for conjunction in filters:
+        predicates = []
+        for predicate in conjunction:
+            if not _is_predicate(predicate):
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"illegal filter {predicate}, filters must be (column, op, value) tuples"
+                )
+            column, op, value = predicate
+            op = op.lower()
+            if op not in filter_operators:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"illegal filter operator {op}, must be one of {filter_operators}"
+                )
+            if op in ["in", "not in"]:
+                value = list(value)
+            predicates.append((column, op, value))
+        normalized.append(predicates)
+    return normalized
+
+
+def and_filters(*filters_list):
+    """return the filters which match rows that match all the given filters"""
+    normalized = [normalize_filters(filters) for filters in filters_list]
+    normalized = [filters for filters in normalized if filters]
+    if not normalized:
+        return None
+    return [
+        [predicate for conjunction in conjunctions for predicate in conjunction]
+        for conjunctions in itertools.product(*normalized)
+    ]
+
+
+def get_filters_columns(filters):
+    """return the columns the filters refer to"""
+    columns = []
+    for conjunction in normalize_filters(filters) or []:
+        for column, _, _ in conjunction:
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+def _predicate_mask(values, op, value):
+    if op in ["=", "=="]:
+        return values == value
+    if op == "!=":
+        return values != value
+    if op == "<":
+        return values < value
+    if op == "<=":
+        return values <= value
+    if op == ">":
+        return values > value
+    if op == ">=":
+        return values >= value
+    if op == "in":
+        return values.isin(value)
+    return ~values.isin(value)
+
+
+def filter_df(df, filters):
+    """return the rows of a (pandas or dask) dataframe which match the filters"""
+    filters = normalize_filters(filters)
+    if not filters:
+        return df
+    mask = None
+    for conjunction in filters:
+        conjunction_mask = None
+        for column, op, value in conjunction:
+            predicate_mask = _predicate_mask(df[column], op, value)
+            if conjunction_mask is None:
+                conjunction_mask = predicate_mask
+            else:
+                conjunction_mask = conjunction_mask & predicate_mask
+        mask = conjunction_mask if mask is None else mask | conjunction_mask
+    return df[mask]
+
+
+def add_filters_columns(columns, filters):
+    """return the columns to read, including the columns the filters refer to"""
+    return list(columns) + [
+        column for column in get_filters_columns(filters) if column not in columns
+    ]
+
+
+def filter_df_or_chunks(df, filters, columns=None):
+    """filter the rows of a dataframe (or of the chunks of a chunked reader), and drop the columns which were
+    only read for the filters"""
+
+    def _filter(chunk):
+        chunk = filter_df(chunk, filters)
+        if columns:
+            chunk = chunk[[column for column in chunk.columns if column in columns]]
+        return chunk
+
+    if hasattr(df, "columns"):
+        return _filter(df)
+    return (_filter(chunk) for chunk in df)
+
+
+def _predicate_may_match(statistics, op, value):
+    if statistics is None or not statistics.has_min_max:
+        return True
+    try:
+        if op in ["=", "=="]:
+            return statistics.min <= value <= statistics.max
+        if op == "<":
+            return statistics.min < value
+        if op == "<=":
+            return statistics.min <= value
+        if op == ">":
+            return statistics.max > value
+        if op == ">=":
+            return statistics.max >= value
+        if op == "in":
+            return any(statistics.min <= item <= statistics.max for item in value)
+    except TypeError:
+        # not comparable (e.g. different types)
+        return True
+    return True
+
+
+def row_group_may_match(row_group, filters):
+    """return False if the parquet row group statistics (min/max) show none of its rows can match the filters
+
+    :param row_group: parquet row group metadata (pyarrow.parquet.RowGroupMetaData)
+    :param filters:   row filters
+    """
+    filters = normalize_filters(filters)
+    if not filters:
+        return True
+    statistics = {}
+    for index in range(row_group.num_columns):
+        column = row_group.column(index)
+        statistics[column.path_in_schema] = column.statistics
+    for conjunction in filters:
+        if all(
+            _predicate_may_match(statistics.get(column), op, value)
+            for column, op, value in conjunction
+        ):
+            return True
+    return False
+
+
+def filters_to_spark(filters):
+    """return the spark (Column) condition of the filters"""
+    import pyspark.sql.functions as funcs
+
+    condition = None
+    for conjunction in normalize_filters(filters) or []:
+        conjunction_condition = None
+        for column, op, value in conjunction:
+            predicate = _predicate_mask(funcs.col(column), op, value)
+            if op == "in":
+                predicate = funcs.col(column).isin(value)
+            elif op == "not in":
+                predicate = ~funcs.col(column).isin(value)
+            if conjunction_condition is None:
+                conjunction_condition = predicate
+            else:
+                conjunction_condition = conjunction_condition & predicate
+        if condition is None:
+            condition = conjunction_condition
+        else:
+            condition = condition | conjunction_condition
+    return condition
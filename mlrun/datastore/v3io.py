@@ -27,6 +27,7 @@ from .base import (
     FileStats,
     basic_auth_header,
     get_range,
+    http_download,
     http_get,
     http_head,
     http_put,
@@ -88,9 +89,15 @@ class V3ioStore(DataStore):
     def get_storage_options(self):
         return dict(v3io_access_key=self._get_secret_or_env("V3IO_ACCESS_KEY"))
 
+    def supports_range_get(self):
+        return True
+
     def upload(self, key, src_path):
         http_upload(self.url + self._join(key), src_path, self.headers, None)
 
+    def _download(self, key, target_path):
+        http_download(self.url + self._join(key), target_path, self.headers)
+
     def get(self, key, size=None, offset=0):
         headers = self.headers
         if size or offset:
@@ -14,8 +14,9 @@
 
 import warnings
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
+import mlrun.errors
 from mlrun.api import schemas
 from mlrun.api.schemas import ModelEndpoint
 
@@ -43,6 +44,18 @@ class RunDBInterface(ABC):
     def store_run(self, struct, uid, project="", iter=0):
         pass
 
+    def store_runs(self, runs: List[dict]):
+        """store multiple runs (e.g. the child runs of a hyper param job), identified by their metadata
+        (project, uid and iteration), DBs which support it write them in a single batch"""
+        for run in runs:
+            metadata = run.get("metadata", {})
+            self.store_run(
+                run,
+                metadata.get("uid"),
+                metadata.get("project", ""),
+                iter=metadata.get("iteration", 0) or 0,
+            )
+
     @abstractmethod
     def update_run(self, updates: dict, uid, project="", iter=0):
         pass
@@ -69,6 +82,30 @@ class RunDBInterface(ABC):
     ):
         pass
 
+    def list_runs_states(
+        self,
+        runs: List[Tuple[str, str, int]],
+        known_states: List[str] = None,
+        wait_timeout: int = 0,
+    ) -> List[Optional[str]]:
+        """return the states of multiple runs (in a single call where supported), None for runs that were not found
+
+        :param runs:         list of (project, uid, iter) tuples
+        :param known_states: the runs states known to the caller (in the runs order), used with wait_timeout
+        :param wait_timeout: long-poll, wait up to this many seconds until the state of any of the runs differs from
+                             its known state, only DBs which can wait without reading the runs (the API) do, the
+                             default implementation reads the runs and returns immediately
+        """
+        states = []
+        for project, uid, iter in runs:
+            try:
+                run = self.read_run(uid, project, iter=iter)
+            except mlrun.errors.MLRunNotFoundError:
+                states.append(None)
+                continue
+            states.append((run or {}).get("status", {}).get("state", ""))
+        return states
+
     @abstractmethod
     def del_run(self, uid, project="", iter=0):
         pass
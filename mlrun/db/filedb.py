@@ -43,6 +43,7 @@ from ..utils import (
     update_in,
 )
 from .base import RunDBError, RunDBInterface
+from .fileindex import FileDBIndex
 
 run_logs = "runs"
 artifacts_dir = "artifacts"
@@ -51,15 +52,82 @@ schedules_dir = "schedules"
 
 
 class FileRunDB(RunDBInterface):
+    """file based run db, the objects are stored in (yaml/json) files under dirpath
+
+    :param dirpath:   db root dir
+    :param format:    files format (".yaml" or ".json")
+    :param use_index: list the runs, artifacts and functions using an (sqlite) index of their fields, so only the
+                      files of the listed objects are read, the index is built on first use if it doesn't exist.
+                      the index file (.index.sqlite) is kept in dirpath, so it is not used without a dirpath (the
+                      default), rather than creating it in the working dir
+    """
+
     kind = "file"
 
-    def __init__(self, dirpath="", format=".yaml"):
+    def __init__(self, dirpath="", format=".yaml", use_index=True):
         self.format = format
         self.dirpath = dirpath
+        self.use_index = use_index
         self._datastore = None
         self._subpath = None
+        self._index = None
         makedirs(self.schedules_dir, exist_ok=True)
 
+    def _get_index(self):
+        """return the db index (built on first use), None if not used"""
+        if not self.use_index or not self.dirpath:
+            return None
+        if self._index is None:
+            makedirs(self.dirpath or ".", exist_ok=True)
+            index = FileDBIndex(self.dirpath)
+            self._index = index
+            if not index.is_built():
+                self.rebuild_index()
+        return self._index
+
+    def rebuild_index(self):
+        """(re)build the db index from the runs, artifacts and functions files, e.g. for dirs written by older
+        versions (without an index) or modified by other tools"""
+        index = self._index or FileDBIndex(self.dirpath)
+        self._index = index
+        runs, artifacts, functions = [], [], []
+        for project_dir in self._iterate_dirs(path.join(self.dirpath, run_logs)):
+            project = path.basename(project_dir)
+            for run, filepath in self._load_list(project_dir, "*"):
+                runs.append((filepath, project, run))
+        for project_dir in self._iterate_dirs(path.join(self.dirpath, artifacts_dir)):
+            project = path.basename(project_dir)
+            for artifact, filepath in self._load_list(project_dir, "*/**/*"):
+                tree = pathlib.Path(filepath).relative_to(project_dir).parts[0]
+                artifacts.append((filepath, project, tree, artifact))
+        for project_dir in self._iterate_dirs(path.join(self.dirpath, functions_dir)):
+            project = path.basename(project_dir)
+            for function, filepath in self._load_list(project_dir, "*/*"):
+                name = path.basename(path.dirname(filepath))
+                functions.append((filepath, project, name, function))
+
+        index.clear()
+        index.put_runs(runs)
+        index.put_artifacts(artifacts)
+        index.put_functions(functions)
+        index.mark_built()
+        logger.info(
+            f"indexed {len(runs)} runs, {len(artifacts)} artifacts and {len(functions)} functions in {self.dirpath}"
+        )
+
+    @staticmethod
+    def _iterate_dirs(dirpath):
+        if not path.isdir(dirpath):
+            return []
+        return [entry.path for entry in scandir(dirpath) if entry.is_dir()]
+
+    def _load_indexed(self, filepath):
+        """load an indexed object file, None (and remove it from the index) if it was deleted"""
+        if not path.isfile(filepath):
+            self._index.remove([filepath])
+            return None
+        return self._loads(pathlib.Path(filepath).read_text())
+
     def connect(self, secrets=None):
         sm = store_manager.set(secrets)
         self._datastore, self._subpath = sm.get_or_create_store(self.dirpath)
@@ -96,6 +164,27 @@ class FileRunDB(RunDBInterface):
             + self.format
         )
         self._datastore.put(filepath, data)
+        index = self._get_index()
+        if index:
+            if hasattr(struct, "to_dict"):
+                struct = struct.to_dict()
+            index.put_runs([(filepath, project or config.default_project, struct)])
+
+    def store_runs(self, runs: List[dict]):
+        indexed = []
+        for run in runs:
+            uid = get_in(run, "metadata.uid")
+            project = get_in(run, "metadata.project", "")
+            iter = get_in(run, "metadata.iteration", 0) or 0
+            filepath = (
+                self._filepath(run_logs, project, self._run_path(uid, iter), "")
+                + self.format
+            )
+            self._datastore.put(filepath, self._dumps(run))
+            indexed.append((filepath, project or config.default_project, run))
+        index = self._get_index()
+        if index and indexed:
+            index.put_runs(indexed)
 
     def update_run(self, updates: dict, uid, project="", iter=0):
         run = self.read_run(uid, project, iter=iter)
@@ -118,6 +207,21 @@ class FileRunDB(RunDBInterface):
         data = self._datastore.get(filepath)
         return self._loads(data)
 
+    def list_runs_states(self, runs, known_states=None, wait_timeout=0):
+        index = self._get_index()
+        if not index:
+            return super().list_runs_states(runs)
+        filepaths = [
+            path.normpath(
+                self._filepath(run_logs, project, self._run_path(uid, iter), "")
+                + self.format
+            )
+            for project, uid, iter in runs
+        ]
+        # the states are read from the index, rather than reading (parsing) every run file
+        states = index.query_runs_states(filepaths)
+        return [states.get(filepath) for filepath in filepaths]
+
     def list_runs(
         self,
         name="",
@@ -138,8 +242,9 @@ class FileRunDB(RunDBInterface):
         results = RunList()
         if isinstance(labels, str):
             labels = labels.split(",")
-        for run, _ in self._load_list(filepath, "*"):
-            if (
+
+        def match(run):
+            return (
                 match_value(name, run, "metadata.name")
                 and match_labels(get_in(run, "metadata.labels", {}), labels)
                 and match_value_options(state, run, "status.state")
@@ -154,7 +259,30 @@ class FileRunDB(RunDBInterface):
                     "status.last_update",
                 )
                 and (iter or get_in(run, "metadata.iteration", 0) == 0)
+            )
+
+        index = self._get_index()
+        if index:
+            # sorted by the index, only the files of the (last) matching runs are read
+            for run_path, stub in index.query_runs(
+                project or config.default_project,
+                name=name,
+                uid=uid,
+                states=state,
+                iteration=None if iter else 0,
+                sort=sort or last,
             ):
+                if not match(stub):
+                    continue
+                run = self._load_indexed(run_path)
+                if run:
+                    results.append(run)
+                    if last and len(results) >= last:
+                        break
+            return results
+
+        for run, _ in self._load_list(filepath, "*"):
+            if match(run):
                 results.append(run)
 
         if sort or last:
@@ -193,7 +321,15 @@ class FileRunDB(RunDBInterface):
                 return False
             return parse_time(d) < days_ago
 
-        for run, p in self._load_list(filepath, "*"):
+        index = self._get_index()
+        if index:
+            runs = index.query_runs(
+                project or config.default_project, name=name, sort=False
+            )
+            runs = [(stub, run_path) for run_path, stub in runs]
+        else:
+            runs = self._load_list(filepath, "*")
+        for run, p in runs:
             if (
                 match_value(name, run, "metadata.name")
                 and match_labels(get_in(run, "metadata.labels", {}), labels)
@@ -208,12 +344,16 @@ class FileRunDB(RunDBInterface):
         data = self._dumps(artifact)
         if iter:
             key = f"{iter}-{key}"
-        filepath = self._filepath(artifacts_dir, project, key, uid) + self.format
-        self._datastore.put(filepath, data)
-        filepath = (
-            self._filepath(artifacts_dir, project, key, tag or "latest") + self.format
-        )
-        self._datastore.put(filepath, data)
+        index_artifacts = []
+        for tree in [uid, tag or "latest"]:
+            filepath = self._filepath(artifacts_dir, project, key, tree) + self.format
+            self._datastore.put(filepath, data)
+            index_artifacts.append(
+                (filepath, project or config.default_project, tree, artifact)
+            )
+        index = self._get_index()
+        if index:
+            index.put_artifacts(index_artifacts)
 
     def read_artifact(self, key, tag="", iter=None, project=""):
         tag = tag or "latest"
@@ -259,12 +399,32 @@ class FileRunDB(RunDBInterface):
             mask = "**/*"
 
         time_pred = make_time_pred(since, until)
-        for artifact, p in self._load_list(filepath, mask):
-            if (name == "" or name in get_in(artifact, "key", "")) and match_labels(
-                get_in(artifact, "labels", {}), labels
+
+        def match(artifact):
+            return (
+                (name == "" or name in get_in(artifact, "key", ""))
+                and match_labels(get_in(artifact, "labels", {}), labels)
+                and time_pred(artifact)
+            )
+
+        index = self._get_index()
+        if index:
+            for artifact_path, _, stub in index.query_artifacts(
+                project or config.default_project, None if tag == "*" else tag
             ):
-                if not time_pred(artifact):
+                if tag == "*" and name and name not in path.basename(artifact_path):
                     continue
+                if not match(stub):
+                    continue
+                artifact = self._load_indexed(artifact_path)
+                if artifact:
+                    if "artifacts/latest" in artifact_path:
+                        artifact["tree"] = "latest"
+                    results.append(artifact)
+            return results
+
+        for artifact, p in self._load_list(filepath, mask):
+            if match(artifact):
                 if "artifacts/latest" in p:
                     artifact["tree"] = "latest"
                 results.append(artifact)
@@ -290,7 +450,20 @@ class FileRunDB(RunDBInterface):
         else:
             mask = "**/*"
 
-        for artifact, p in self._load_list(filepath, mask):
+        index = self._get_index()
+        if index:
+            artifacts = [
+                (stub, artifact_path)
+                for artifact_path, _, stub in index.query_artifacts(
+                    project or config.default_project, None if tag == "*" else tag
+                )
+                if not (
+                    tag == "*" and name and name not in path.basename(artifact_path)
+                )
+            ]
+        else:
+            artifacts = self._load_list(filepath, mask)
+        for artifact, p in artifacts:
             if (name == "" or name == get_in(artifact, "key", "")) and match_labels(
                 get_in(artifact, "labels", {}), labels
             ):
@@ -314,6 +487,8 @@ class FileRunDB(RunDBInterface):
             + self.format
         )
         self._datastore.put(filepath, data)
+        project = project or config.default_project
+        index_functions = [(filepath, project, name, function)]
         if versioned:
 
             # the "hash_key" version should not include the status
@@ -333,6 +508,10 @@ class FileRunDB(RunDBInterface):
             )
             data = self._dumps(function)
             self._datastore.put(filepath, data)
+            index_functions.append((filepath, project, name, function))
+        index = self._get_index()
+        if index:
+            index.put_functions(index_functions)
         return hash_key
 
     def get_function(self, name, project="", tag="", hash_key=""):
@@ -381,7 +560,20 @@ class FileRunDB(RunDBInterface):
         if name:
             filepath = f"{filepath}{name}/"
             mask = "*"
-        for func, fullname in self._load_list(filepath, mask):
+        index = self._get_index()
+        if index:
+            # only the files of the functions with matching labels are read
+            functions = (
+                (self._load_indexed(function_path), function_path)
+                for function_path, stub in index.query_functions(
+                    project or config.default_project, name
+                )
+                if match_labels(get_in(stub, "metadata.labels", {}), labels)
+            )
+            functions = ((func, fullname) for func, fullname in functions if func)
+        else:
+            functions = self._load_list(filepath, mask)
+        for func, fullname in functions:
             if match_labels(get_in(func, "metadata.labels", {}), labels):
                 file_name, _ = path.splitext(path.basename(fullname))
                 function_name = path.basename(path.dirname(fullname))
@@ -539,6 +731,9 @@ class FileRunDB(RunDBInterface):
     def _safe_del(self, filepath):
         if path.isfile(filepath):
             remove(filepath)
+            index = self._get_index()
+            if index:
+                index.remove([filepath])
         else:
             raise RunDBError(f"run file is not found or valid ({filepath})")
 
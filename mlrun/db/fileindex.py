@@ -0,0 +1,281 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from os import makedirs, path
+
+from ..utils import as_list, get_in
+
+index_filename = ".index.sqlite"
+
+_schema = [
+    """CREATE TABLE IF NOT EXISTS runs (
+        path TEXT PRIMARY KEY,
+        project TEXT,
+        uid TEXT,
+        iteration INTEGER,
+        name TEXT,
+        state TEXT,
+        start_time TEXT,
+        last_update TEXT,
+        labels TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS runs_start_time ON runs (project, start_time)",
+    "CREATE INDEX IF NOT EXISTS runs_name ON runs (project, name)",
+    "CREATE INDEX IF NOT EXISTS runs_uid ON runs (project, uid)",
+    """CREATE TABLE IF NOT EXISTS artifacts (
+        path TEXT PRIMARY KEY,
+        project TEXT,
+        tree TEXT,
+        key TEXT,
+        updated TEXT,
+        labels TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS artifacts_tree ON artifacts (project, tree)",
+    """CREATE TABLE IF NOT EXISTS functions (
+        path TEXT PRIMARY KEY,
+        project TEXT,
+        name TEXT,
+        hash TEXT,
+        labels TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS functions_name ON functions (project, name)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+]
+
+
+def _time_str(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value) if value else ""
+
+
+def _labels_str(labels):
+    return json.dumps(labels or {}, default=str)
+
+
+class FileDBIndex:
+    """sqlite index (sidecar file in the db dir) of the file db runs, artifacts and functions
+
+    the index holds the fields the objects are listed by (name, state, labels, times, uid, iteration, ..) and the
+    object file path, so listing is an index query and only the files of the listed objects are read (parsed).
+    the index is updated on every store/delete, `FileRunDB.rebuild_index()` (or `mlrun db-index`) re-creates it
+    from the files, e.g. for dirs written by older versions or changed by other tools
+
+    the query methods return "stub" records, dicts in the objects structure with only the indexed fields, so the
+    same match functions can be used on them and on the full objects
+    """
+
+    def __init__(self, dirpath: str):
+        # absolute, the index (with the db object) may be used from another working dir, e.g. in a dask worker
+        self.path = path.abspath(path.join(dirpath, index_filename))
+        with self._connect():
+            pass
+
+    @contextmanager
+    def _connect(self):
+        # the schema is (re)created when the file is missing, e.g. when the db dir was deleted
+        exists = path.isfile(self.path)
+        makedirs(path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=60)
+        if not exists:
+            with conn:
+                for statement in _schema:
+                    conn.execute(statement)
+        try:
+            # commits (or rolls back) the transaction
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def is_built(self):
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'built'").fetchone()
+        return row is not None
+
+    def clear(self):
+        with self._connect() as conn:
+            for table in ["runs", "artifacts", "functions", "meta"]:
+                conn.execute(f"DELETE FROM {table}")
+
+    def mark_built(self):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('built', ?)",
+                (datetime.now().isoformat(),),
+            )
+
+    @staticmethod
+    def _run_row(filepath, project, run):
+        return (
+            path.normpath(filepath),
+            project,
+            get_in(run, "metadata.uid", ""),
+            int(get_in(run, "metadata.iteration", 0) or 0),
+            get_in(run, "metadata.name", ""),
+            get_in(run, "status.state", ""),
+            _time_str(get_in(run, "status.start_time", "")),
+            _time_str(get_in(run, "status.last_update", "")),
+            _labels_str(get_in(run, "metadata.labels", {})),
+        )
+
+    @staticmethod
+    def _artifact_row(filepath, project, tree, artifact):
+        return (
+            path.normpath(filepath),
+            project,
+            tree,
+            artifact.get("key", ""),
+            _time_str(artifact.get("updated", "")),
+            _labels_str(artifact.get("labels", {})),
+        )
+
+    @staticmethod
+    def _function_row(filepath, project, name, function):
+        return (
+            path.normpath(filepath),
+            project,
+            name,
+            get_in(function, "metadata.hash", ""),
+            _labels_str(get_in(function, "metadata.labels", {})),
+        )
+
+    def put_runs(self, runs):
+        """index runs, a list of (file path, project, run dict) tuples"""
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._run_row(*run) for run in runs],
+            )
+
+    def put_artifacts(self, artifacts):
+        """index artifacts, a list of (file path, project, tree/tag, artifact dict) tuples"""
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?)",
+                [self._artifact_row(*artifact) for artifact in artifacts],
+            )
+
+    def put_functions(self, functions):
+        """index functions, a list of (file path, project, name, function dict) tuples"""
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO functions VALUES (?, ?, ?, ?, ?)",
+                [self._function_row(*function) for function in functions],
+            )
+
+    def remove(self, filepaths):
+        """remove the objects of the file paths from the index"""
+        filepaths = [(path.normpath(filepath),) for filepath in filepaths]
+        with self._connect() as conn:
+            for table in ["runs", "artifacts", "functions"]:
+                conn.executemany(f"DELETE FROM {table} WHERE path = ?", filepaths)
+
+    def query_runs(
+        self, project, name="", uid=None, states=None, iteration=None, sort=True
+    ):
+        """return (file path, stub run) of the project runs matching the name, uid, states and iteration,
+        sorted by start time (descending) if sort is set"""
+        query = "SELECT * FROM runs WHERE project = ?"
+        args = [project]
+        if name:
+            query += " AND name = ?"
+            args.append(name)
+        if uid:
+            query += " AND uid = ?"
+            args.append(uid)
+        if states:
+            states = as_list(states)
+            query += f" AND state IN ({', '.join('?' * len(states))})"
+            args.extend(states)
+        if iteration is not None:
+            query += " AND iteration = ?"
+            args.append(iteration)
+        query += " ORDER BY start_time DESC, path" if sort else " ORDER BY path"
+        with self._connect() as conn:
+            rows = conn.execute(query, args).fetchall()
+        for (
+            filepath,
+            _,
+            uid,
+            iteration,
+            name,
+            state,
+            start_time,
+            last_update,
+            labels,
+        ) in rows:
+            yield filepath, {
+                "metadata": {
+                    "uid": uid,
+                    "iteration": iteration,
+                    "name": name,
+                    "labels": json.loads(labels),
+                },
+                "status": {
+                    "state": state,
+                    "start_time": start_time,
+                    "last_update": last_update,
+                },
+            }
+
+    def query_runs_states(self, filepaths):
+        """return the {file path: state} of the indexed runs of the file paths, in a single query (the paths are
+        passed as one json parameter, so there is no limit on their number)"""
+        query = (
+            "SELECT runs.path, runs.state FROM json_each(?) AS paths"
+            " JOIN runs ON runs.path = paths.value"
+        )
+        filepaths = json.dumps([path.normpath(filepath) for filepath in filepaths])
+        with self._connect() as conn:
+            return dict(conn.execute(query, (filepaths,)).fetchall())
+
+    def query_artifacts(self, project, tree=None):
+        """return (file path, tree, stub artifact) of the project artifacts (of the tree/tag if specified)"""
+        query = "SELECT * FROM artifacts WHERE project = ?"
+        args = [project]
+        if tree:
+            query += " AND tree = ?"
+            args.append(tree)
+        query += " ORDER BY path"
+        with self._connect() as conn:
+            rows = conn.execute(query, args).fetchall()
+        for filepath, _, tree, key, updated, labels in rows:
+            yield filepath, tree, {
+                "key": key,
+                "updated": updated,
+                "labels": json.loads(labels),
+            }
+
+    def query_functions(self, project, name=None):
+        """return (file path, stub function) of the project functions (with the name if specified)"""
+        query = "SELECT * FROM functions WHERE project = ?"
+        args = [project]
+        if name:
+            query += " AND name = ?"
+            args.append(name)
+        query += " ORDER BY path"
+        with self._connect() as conn:
+            rows = conn.execute(query, args).fetchall()
+        for filepath, _, name, hash_key, labels in rows:
+            yield filepath, {
+                "metadata": {
+                    "name": name,
+                    "hash": hash_key,
+                    "labels": json.loads(labels),
+                }
+            }
@@ -19,7 +19,7 @@ import time
 import warnings
 from datetime import datetime
 from os import path, remove
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import kfp
 import requests
@@ -335,15 +335,25 @@ class HTTPRunDB(RunDBInterface):
             - content - The actual log content.
         """
 
+        state, content, _ = self._get_log(uid, project, offset, size)
+        return state, content
+
+    def _get_log(self, uid, project="", offset=0, size=-1, wait_timeout=0):
         params = {"offset": offset, "size": size}
+        timeout = 45
+        if wait_timeout:
+            params["wait_timeout"] = wait_timeout
+            timeout += wait_timeout
         path = self._path_of("log", project, uid)
         error = f"get log {project}/{uid}"
-        resp = self.api_call("GET", path, error, params=params)
+        resp = self.api_call("GET", path, error, params=params, timeout=timeout)
         if resp.headers:
             state = resp.headers.get("x-mlrun-run-state", "")
-            return state.lower(), resp.content
+            # older servers don't support long-poll, and it's not applicable to all the logs sources
+            waited = float(resp.headers.get("x-mlrun-log-wait-timeout") or 0) > 0
+            return state.lower(), resp.content, waited
 
-        return "unknown", resp.content
+        return "unknown", resp.content, False
 
     def watch_log(self, uid, project="", watch=True, offset=0):
         """ Retrieve logs of a running process, and watch the progress of the execution until it completes. This
@@ -363,13 +373,19 @@ class HTTPRunDB(RunDBInterface):
             print(text.decode())
         if watch:
             nil_resp = 0
+            wait_timeout = int(config.httpdb.logs.watch_wait_timeout)
+            waited = True
             while state in ["pending", "running"]:
                 offset += len(text)
-                if nil_resp < 3:
-                    time.sleep(3)
-                else:
-                    time.sleep(10)
-                state, text = self.get_log(uid, project, offset=offset)
+                # the server waits for new logs (long-poll), so sleeping only if it responded without waiting
+                if not waited:
+                    if nil_resp < 3:
+                        time.sleep(3)
+                    else:
+                        time.sleep(10)
+                state, text, waited = self._get_log(
+                    uid, project, offset=offset, wait_timeout=wait_timeout
+                )
                 if text:
                     nil_resp = 0
                     print(text.decode(), end="")
@@ -422,6 +438,45 @@ class HTTPRunDB(RunDBInterface):
         resp = self.api_call("GET", path, error, params=params)
         return resp.json()["data"]
 
+    def list_runs_states(
+        self,
+        runs: List[Tuple[str, str, int]],
+        known_states: List[str] = None,
+        wait_timeout: int = 0,
+    ) -> List[Optional[str]]:
+        """ Return the states of multiple runs in a single call, None for runs that were not found.
+
+        :param runs: List of (project, uid, iter) tuples.
+        :param known_states: The runs states known to the caller (in the runs order), used with ``wait_timeout``.
+        :param wait_timeout: Long-poll, the server waits up to this many seconds (capped by its
+            ``httpdb.runs.max_wait_timeout``) until the state of any of the runs differs from its known state.
+        """
+        known_states = known_states or [None] * len(runs)
+        body = {
+            "runs": [
+                {
+                    "project": project or config.default_project,
+                    "uid": uid,
+                    "iter": iter or 0,
+                    "state": state,
+                }
+                for (project, uid, iter), state in zip(runs, known_states)
+            ],
+            "wait_timeout": wait_timeout,
+        }
+        try:
+            response = self.api_call(
+                "POST",
+                "runs/states",
+                "list runs states",
+                json=body,
+                timeout=45 + wait_timeout,
+            )
+        except mlrun.errors.MLRunNotFoundError:
+            # older servers without the bulk endpoint
+            return super().list_runs_states(runs)
+        return response.json()["states"]
+
     def del_run(self, uid, project="", iter=0):
         """ Delete details of a specific run from DB.
 
@@ -449,6 +504,8 @@ class HTTPRunDB(RunDBInterface):
         start_time_to: datetime = None,
         last_update_time_from: datetime = None,
         last_update_time_to: datetime = None,
+        page_size: int = None,
+        page_token: str = None,
     ) -> RunList:
         """ Retrieve a list of runs, filtered by various options.
         Example::
@@ -466,13 +523,18 @@ class HTTPRunDB(RunDBInterface):
         :param state: List only runs whose state is specified.
         :param sort: Whether to sort the result according to their start time. Otherwise results will be
             returned by their internal order in the DB (order will not be guaranteed).
-        :param last: Deprecated - currently not used.
+        :param last: Return only the first ``last`` runs (the latest ones when ``sort`` is ``True``). Can't be used
+            together with ``page_size``.
         :param iter: If ``True`` return runs from all iterations. Otherwise, return only runs whose ``iter`` is 0.
         :param start_time_from: Filter by run start time in ``[start_time_from, start_time_to]``.
         :param start_time_to: Filter by run start time in ``[start_time_from, start_time_to]``.
         :param last_update_time_from: Filter by run last update time in ``(last_update_time_from,
             last_update_time_to)``.
         :param last_update_time_to: Filter by run last update time in ``(last_update_time_from, last_update_time_to)``.
+        :param page_size: Return a single page of at most ``page_size`` runs. The returned list's ``next_page_token``
+            (``None`` on the last page) should be passed as the ``page_token`` to get the next page. See
+            :py:func:`~iter_runs` for iterating over all of the pages.
+        :param page_token: The token of the page to return, as returned in a previous page's ``next_page_token``.
         """
 
         project = project or config.default_project
@@ -483,15 +545,67 @@ class HTTPRunDB(RunDBInterface):
             "label": labels or [],
             "state": state,
             "sort": bool2str(sort),
+            "last": last,
             "iter": bool2str(iter),
             "start_time_from": datetime_to_iso(start_time_from),
             "start_time_to": datetime_to_iso(start_time_to),
             "last_update_time_from": datetime_to_iso(last_update_time_from),
             "last_update_time_to": datetime_to_iso(last_update_time_to),
+            "page_size": page_size,
+            "page_token": page_token,
         }
         error = "list runs"
         resp = self.api_call("GET", "runs", error, params=params)
-        return RunList(resp.json()["runs"])
+        response = resp.json()
+        runs = RunList(response["runs"])
+        runs.next_page_token = response.get("next_page_token")
+        return runs
+
+    def iter_runs(
+        self,
+        name=None,
+        uid=None,
+        project=None,
+        labels=None,
+        state=None,
+        sort=True,
+        iter=False,
+        start_time_from: datetime = None,
+        start_time_to: datetime = None,
+        last_update_time_from: datetime = None,
+        last_update_time_to: datetime = None,
+        page_size: int = 200,
+    ) -> Iterator[dict]:
+        """ Iterate over the runs matching the given filters (see :py:func:`~list_runs`), fetching them lazily page
+        by page, so that only a single page is held in memory at a time.
+        Example::
+
+            for run in db.iter_runs(project='iris', state='error'):
+                print(run['metadata']['uid'])
+
+        :param page_size: The number of runs to fetch in each request.
+        """
+        page_token = None
+        while True:
+            runs = self.list_runs(
+                name=name,
+                uid=uid,
+                project=project,
+                labels=labels,
+                state=state,
+                sort=sort,
+                iter=iter,
+                start_time_from=start_time_from,
+                start_time_to=start_time_to,
+                last_update_time_from=last_update_time_from,
+                last_update_time_to=last_update_time_to,
+                page_size=page_size,
+                page_token=page_token,
+            )
+            yield from runs
+            page_token = runs.next_page_token
+            if not page_token:
+                break
 
     def del_runs(self, name=None, project=None, labels=None, state=None, days_ago=0):
         """ Delete a group of runs identified by the parameters of the function.
@@ -574,6 +688,8 @@ class HTTPRunDB(RunDBInterface):
         until=None,
         iter: int = None,
         best_iteration: bool = False,
+        page_size: int = None,
+        page_token: str = None,
     ) -> ArtifactList:
         """ List artifacts filtered by various parameters.
 
@@ -596,6 +712,11 @@ class HTTPRunDB(RunDBInterface):
         :param best_iteration: Returns the artifact which belongs to the best iteration of a given run, in the case of
             artifacts generated from a hyper-param run. If only a single iteration exists, will return the artifact
             from that iteration. If using ``best_iter``, the ``iter`` parameter must not be used.
+        :param page_size: Return a single page of artifacts. Since the page is built before some of the filters are
+            applied, it may hold less than ``page_size`` artifacts. The returned list's ``next_page_token`` (``None``
+            on the last page) should be passed as the ``page_token`` to get the next page. See
+            :py:func:`~iter_artifacts` for iterating over all of the pages. Can't be used with ``best_iteration``.
+        :param page_token: The token of the page to return, as returned in a previous page's ``next_page_token``.
         """
 
         project = project or config.default_project
@@ -606,13 +727,47 @@ class HTTPRunDB(RunDBInterface):
             "label": labels or [],
             "iter": iter,
             "best-iteration": best_iteration,
+            "page_size": page_size,
+            "page_token": page_token,
         }
         error = "list artifacts"
         resp = self.api_call("GET", "artifacts", error, params=params)
-        values = ArtifactList(resp.json()["artifacts"])
+        response = resp.json()
+        values = ArtifactList(response["artifacts"])
         values.tag = tag
+        values.next_page_token = response.get("next_page_token")
         return values
 
+    def iter_artifacts(
+        self,
+        name=None,
+        project=None,
+        tag=None,
+        labels=None,
+        iter: int = None,
+        page_size: int = 200,
+    ) -> Iterator[dict]:
+        """ Iterate over the artifacts matching the given filters (see :py:func:`~list_artifacts`), fetching them lazily
+        page by page, so that only a single page is held in memory at a time.
+
+        :param page_size: The number of artifacts to fetch in each request.
+        """
+        page_token = None
+        while True:
+            artifacts = self.list_artifacts(
+                name=name,
+                project=project,
+                tag=tag,
+                labels=labels,
+                iter=iter,
+                page_size=page_size,
+                page_token=page_token,
+            )
+            yield from artifacts
+            page_token = artifacts.next_page_token
+            if not page_token:
+                break
+
     def del_artifacts(self, name=None, project=None, tag=None, labels=None, days_ago=0):
         """ Delete artifacts referenced by the parameters.
 
@@ -84,6 +84,13 @@ class SQLDB(RunDBInterface):
             mlrun.api.crud.Runs().get_run, self.session, uid, iter, project,
         )
 
+    def list_runs_states(self, runs, known_states=None, wait_timeout=0):
+        import mlrun.api.crud
+
+        return self._transform_db_error(
+            mlrun.api.crud.Runs().list_runs_states, self.session, runs,
+        )
+
     def list_runs(
         self,
         name=None,
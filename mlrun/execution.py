@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import os
+import threading
+import time
 import uuid
 from copy import deepcopy
 from datetime import datetime
@@ -26,6 +29,7 @@ from mlrun.datastore.store_resources import get_store_resource
 from mlrun.errors import MLRunInvalidArgumentError
 
 from .artifacts import ArtifactManager, DatasetArtifact
+from .config import config
 from .datastore import store_manager
 from .db import get_run_db
 from .features import Feature
@@ -77,6 +81,9 @@ class MLClientCtx(object):
         self._log_level = "info"
         self._matrics_db = None
         self._autocommit = autocommit
+        self._store_run = True
+        self._write_behind = config.run_updates.write_behind
+        self._updates_writer = None
 
         self._labels = {}
         self._annotations = {}
@@ -241,10 +248,15 @@ class MLClientCtx(object):
         host=None,
         log_stream=None,
         is_api=False,
+        store_run=True,
     ):
-        """create execution context from dict"""
+        """create execution context from dict
+
+        store_run=False doesn't store the run in the db (the caller does), artifacts are still stored
+        """
 
         self = cls(autocommit=autocommit, tmp=tmp, log_stream=log_stream)
+        self._store_run = store_run
 
         meta = attrs.get("metadata")
         if meta:
@@ -794,7 +806,7 @@ class MLClientCtx(object):
         if self._children:
             self.update_child_iterations(commit_children=True)
         self._last_update = now_date()
-        self._update_db(commit=True, message=message)
+        self._update_db(commit=True, message=message, sync=self._is_terminal())
 
     def set_state(self, state: str = None, error: str = None, commit=True):
         """modify and store the run state or mark an error
@@ -816,9 +828,14 @@ class MLClientCtx(object):
         self._last_update = now_date()
 
         if self._rundb and commit:
-            self._rundb.update_run(
-                updates, self._uid, self.project, iter=self._iteration
-            )
+            if self._updates_writer:
+                self._updates_writer.update(updates)
+                if self._is_terminal():
+                    self._flush_updates()
+            else:
+                self._rundb.update_run(
+                    updates, self._uid, self.project, iter=self._iteration
+                )
 
     def set_hostname(self, host: str):
         """update the hostname, for internal use"""
@@ -883,7 +900,15 @@ class MLClientCtx(object):
         """convert the run context to a json buffer"""
         return dict_to_json(self.to_dict())
 
-    def _update_db(self, commit=False, message=""):
+    def _flush_updates(self):
+        """write the pending (write-behind) run updates and stop the background writer"""
+        if self._updates_writer:
+            self._updates_writer.close()
+
+    def _is_terminal(self):
+        return self._state in mlrun.runtimes.constants.RunStates.terminal_states()
+
+    def _update_db(self, commit=False, message="", sync=False):
         self.last_update = now_date()
         if self._tmpfile:
             data = self.to_json()
@@ -893,10 +918,140 @@ class MLClientCtx(object):
 
         if commit or self._autocommit:
             self._commit = message
-            if self._rundb:
+            if self._rundb and self._store_run:
+                struct = self.to_dict()
+                if self._updates_writer:
+                    self._updates_writer.update_from_struct(struct)
+                    if sync:
+                        self._flush_updates()
+                    return
                 self._rundb.store_run(
-                    self.to_dict(), self._uid, self.project, iter=self._iteration
+                    struct, self._uid, self.project, iter=self._iteration
+                )
+                if self._write_behind and not sync:
+                    # the next commits only write the changed keys
+                    self._updates_writer = _RunUpdatesWriter(
+                        self._rundb, self._uid, self.project, self._iteration, struct
+                    )
+
+
+class _RunUpdatesWriter:
+    """write-behind of a run context updates
+
+    the commits are coalesced to the changed (second level) run keys, e.g. "status.results", and written with
+    a partial update (update_run) from a background thread, once flush_interval passed since the first pending
+    update or when max_pending commits are pending. close() writes the pending updates synchronously (and stops
+    the thread, a later update restarts it)
+    """
+
+    def __init__(self, db, uid, project, iteration, struct):
+        self._db = db
+        self._uid = uid
+        self._project = project
+        self._iteration = iteration
+        self._flush_interval = float(config.run_updates.flush_interval)
+        self._max_pending = int(config.run_updates.max_pending)
+        self._stored = self._flatten(deepcopy(struct))
+        self._pending = {}
+        self._pending_count = 0
+        self._first_pending = None
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+
+    @staticmethod
+    def _flatten(struct):
+        updates = {}
+        for section, values in struct.items():
+            if isinstance(values, dict):
+                for key, value in values.items():
+                    updates[f"{section}.{key}"] = value
+        return updates
+
+    def update_from_struct(self, struct: dict):
+        """queue the keys of the run dict which changed since the last update"""
+        self.update(
+            {
+                key: value
+                for key, value in self._flatten(struct).items()
+                if self._stored.get(key) != value
+            }
+        )
+
+    def update(self, updates: dict):
+        """queue run updates (dotted key: value)"""
+        if not updates:
+            return
+        updates = deepcopy(updates)
+        with self._condition:
+            self._stored.update(updates)
+            self._pending.update(updates)
+            self._pending_count += 1
+            if self._first_pending is None:
+                self._first_pending = time.monotonic()
+            if not self._thread:
+                self._stopped = False
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    if self._pending and self._pending_count >= self._max_pending:
+                        break
+                    timeout = None
+                    if self._pending:
+                        timeout = (
+                            self._first_pending
+                            + self._flush_interval
+                            - time.monotonic()
+                        )
+                        if timeout <= 0:
+                            break
+                    self._condition.wait(timeout)
+                if self._stopped:
+                    return
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.warning(f"failed to update run {self._uid}, will retry: {exc}")
+
+    def flush(self):
+        """write the pending updates"""
+        with self._flush_lock:
+            with self._condition:
+                updates, self._pending = self._pending, {}
+                self._pending_count = 0
+                self._first_pending = None
+            if not updates:
+                return
+            try:
+                self._db.update_run(
+                    updates, self._uid, self._project, iter=self._iteration
                 )
+            except Exception:
+                # keep the updates (unless newer ones were queued) for the next write
+                with self._condition:
+                    self._pending = {**updates, **self._pending}
+                    self._pending_count += 1
+                    if self._first_pending is None:
+                        self._first_pending = time.monotonic()
+                raise
+
+    def close(self):
+        """stop the background thread and write the pending updates"""
+        with self._condition:
+            thread, self._thread = self._thread, None
+            self._stopped = True
+            self._condition.notify()
+        if thread:
+            thread.join()
+            atexit.unregister(self.close)
+        self.flush()
 
 
 def _cast_result(value):
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 from urllib.parse import urlparse
 
 import pandas as pd
@@ -21,6 +21,7 @@ import mlrun
 import mlrun.errors
 
 from ..data_types import InferOptions, get_infer_interface
+from ..data_types.infer import DFStatsAccumulator
 from ..datastore.sources import BaseSourceDriver, StreamSource
 from ..datastore.store_resources import parse_store_uri
 from ..datastore.targets import (
@@ -47,10 +48,11 @@ from .ingestion import (
     add_source_trigger,
     context_to_ingestion_params,
     init_featureset_graph,
+    iterate_source_chunks,
     run_ingestion_job,
     run_spark_graph,
 )
-from .retrieval import LocalFeatureMerger, init_feature_vector_graph, run_merge_job
+from .retrieval import get_merger, init_feature_vector_graph, run_merge_job
 
 _v3iofs = None
 spark_transform_handler = "transform"
@@ -82,6 +84,9 @@ def get_offline_features(
     drop_columns: List[str] = None,
     start_time: Optional[pd.Timestamp] = None,
     end_time: Optional[pd.Timestamp] = None,
+    chunk_size: int = None,
+    engine: str = None,
+    engine_args: dict = None,
 ) -> OfflineVectorResponse:
     """retrieve offline feature vector results
 
@@ -116,6 +121,12 @@ def get_offline_features(
         entity_timestamp_column must be passed when using time filtering.
     :param end_time:        datetime, high limit of time needed to be filtered. Optional.
         entity_timestamp_column must be passed when using time filtering.
+    :param chunk_size:      join the (time sorted) entity rows in chunks of this many rows. Optional. when the target
+        is a ParquetTarget, the chunks are written to it as they are joined instead of holding the whole vector in
+        memory (local merge only)
+    :param engine:          the merger engine, "local" (pandas, default) or "dask" (joins the feature sets lazily as
+        dask dataframes, e.g. for large partitioned parquet targets). Optional.
+    :param engine_args:     kwargs for the merger engine (e.g. npartitions for dask). Optional.
     """
     feature_vector = _features_to_vector(feature_vector)
 
@@ -136,7 +147,8 @@ def get_offline_features(
         raise TypeError(
             "entity_timestamp_column or feature_vector.spec.timestamp_field is required when passing start/end time"
         )
-    merger = LocalFeatureMerger(feature_vector)
+    merger_engine = get_merger(engine)
+    merger = merger_engine(feature_vector, **(engine_args or {}))
     return merger.start(
         entity_rows,
         entity_timestamp_column,
@@ -144,6 +156,7 @@ def get_offline_features(
         drop_columns=drop_columns,
         start_time=start_time,
         end_time=end_time,
+        chunk_size=chunk_size,
     )
 
 
@@ -151,6 +164,9 @@ def get_online_feature_service(
     feature_vector: Union[str, FeatureVector],
     run_config: RunConfig = None,
     fixed_window_type: FixedWindowType = FixedWindowType.LastClosedWindow,
+    cache_size: int = 0,
+    cache_ttl: Union[float, Dict[str, float]] = 60,
+    cache_negative_ttl: float = None,
 ) -> OnlineVectorService:
     """initialize and return online feature vector service api,
     returns :py:class:`~mlrun.feature_store.OnlineVectorService`
@@ -163,13 +179,28 @@ def get_online_feature_service(
         resp = svc.get([{"ticker": "AAPL"}], as_list=True)
         print(resp)
 
-    :param feature_vector:    feature vector uri or FeatureVector object
-    :param run_config:        function and/or run configuration for remote jobs/services
-    :param fixed_window_type: determines how to query the fixed window values which were previously inserted by ingest.
+    hot entities can be served from a local cache (instead of the online target) by setting a cache size, e.g.::
+
+        svc = get_online_feature_service(vector_uri, cache_size=10000, cache_ttl={"stocks": 30})
+        print(svc.cache_stats)
+
+    :param feature_vector:     feature vector uri or FeatureVector object
+    :param run_config:         function and/or run configuration for remote jobs/services
+    :param fixed_window_type:  determines how to query the fixed window values which were previously inserted by ingest.
+    :param cache_size:         max entities to cache per feature set, 0 (default) disables the cache
+    :param cache_ttl:          seconds an entity is cached, or dict of feature set name to seconds (feature sets which
+                               aren't in the dict are not cached)
+    :param cache_negative_ttl: seconds an entity which wasn't found is cached (0 to not cache), defaults to cache_ttl
     """
     feature_vector = _features_to_vector(feature_vector)
-    graph, index_columns = init_feature_vector_graph(feature_vector, fixed_window_type)
-    service = OnlineVectorService(feature_vector, graph, index_columns)
+    graph, index_columns, online_caches = init_feature_vector_graph(
+        feature_vector,
+        fixed_window_type,
+        cache_size=cache_size,
+        cache_ttl=cache_ttl,
+        cache_negative_ttl=cache_negative_ttl,
+    )
+    service = OnlineVectorService(feature_vector, graph, index_columns, online_caches)
 
     # todo: support remote service (using remote nuclio/mlrun function if run_config)
     return service
@@ -186,6 +217,7 @@ def ingest(
     mlrun_context=None,
     spark_context=None,
     overwrite=None,
+    chunk_size: int = None,
 ) -> pd.DataFrame:
     """Read local DataFrame, file, URL, or source into the feature store
     Ingest reads from the source, run the graph transformations, infers  metadata and stats
@@ -225,6 +257,10 @@ def ingest(
     :param overwrite:     delete the targets' data prior to ingestion
                           (default: True for non scheduled ingest - deletes the targets that are about to be ingested.
                                     False for scheduled ingest - does not delete the target)
+    :param chunk_size:    optional, ingest the source (DataFrame, csv/parquet file or source) in chunks of this many
+                          rows, every chunk is run through the graph and appended to the targets and the stats are
+                          merged chunk by chunk, so sources which don't fit in memory can be ingested (when
+                          return_df=False)
 
     """
     if featureset:
@@ -255,7 +291,13 @@ def ingest(
         # remote job execution
         run_config = run_config.copy() if run_config else RunConfig()
         source, run_config.parameters = set_task_params(
-            featureset, source, targets, run_config.parameters, infer_options, overwrite
+            featureset,
+            source,
+            targets,
+            run_config.parameters,
+            infer_options,
+            overwrite,
+            chunk_size,
         )
         name = f"{featureset.metadata.name}_ingest"
         return run_ingestion_job(
@@ -275,6 +317,7 @@ def ingest(
             infer_options,
             overwrite,
         ) = context_to_ingestion_params(mlrun_context)
+        chunk_size = chunk_size or mlrun_context.get_param("chunk_size", None)
         if not source:
             raise mlrun.errors.MLRunInvalidArgumentError(
                 "data source was not specified"
@@ -349,7 +392,7 @@ def ingest(
             namespace=namespace,
         )
 
-    if isinstance(source, str):
+    if isinstance(source, str) and not chunk_size:
         source = mlrun.store_manager.object(url=source).as_df()
 
     schema_options = InferOptions.get_common_options(
@@ -357,24 +400,47 @@ def ingest(
     )
     if schema_options:
         preview(
-            featureset, source, options=schema_options, namespace=namespace,
+            featureset,
+            # the schema is inferred from the first chunk
+            next(iter(iterate_source_chunks(source, chunk_size)))
+            if chunk_size
+            else source,
+            options=schema_options,
+            namespace=namespace,
         )
     infer_stats = InferOptions.get_common_options(
         infer_options, InferOptions.all_stats()
     )
-    return_df = return_df or infer_stats != InferOptions.Null
+    if not InferOptions.get_common_options(
+        infer_stats, InferOptions.Index
+    ) and InferOptions.get_common_options(infer_options, InferOptions.Index):
+        infer_stats += InferOptions.Index
+    stats = None
+    if chunk_size and infer_stats != InferOptions.Null:
+        # the stats are merged chunk by chunk, the results aren't kept for them
+        stats = DFStatsAccumulator(infer_stats)
+    else:
+        return_df = return_df or infer_stats != InferOptions.Null
     featureset.save()
 
     targets = targets or featureset.spec.targets or get_default_targets()
     df = init_featureset_graph(
-        source, featureset, namespace, targets=targets, return_df=return_df,
+        source,
+        featureset,
+        namespace,
+        targets=targets,
+        return_df=return_df,
+        chunk_size=chunk_size,
+        stats=stats,
     )
-    if not InferOptions.get_common_options(
-        infer_stats, InferOptions.Index
-    ) and InferOptions.get_common_options(infer_options, InferOptions.Index):
-        infer_stats += InferOptions.Index
 
-    infer_from_static_df(df, featureset, options=infer_stats)
+    if stats is not None:
+        if InferOptions.get_common_options(infer_stats, InferOptions.Stats):
+            featureset.status.stats = stats.get_stats()
+        if InferOptions.get_common_options(infer_stats, InferOptions.Preview):
+            featureset.status.preview = stats.get_preview()
+    else:
+        infer_from_static_df(df, featureset, options=infer_stats)
     _post_ingestion(mlrun_context, featureset, spark_context)
 
     return df
@@ -633,12 +699,15 @@ def set_task_params(
     parameters: dict = None,
     infer_options: InferOptions = InferOptions.Null,
     overwrite=None,
+    chunk_size: int = None,
 ):
     """convert ingestion parameters to dict, return source + params dict"""
     source = source or featureset.spec.source
     parameters = parameters or {}
     parameters["infer_options"] = infer_options
     parameters["overwrite"] = overwrite
+    if chunk_size:
+        parameters["chunk_size"] = chunk_size
     parameters["featureset"] = featureset.uri
     if source:
         parameters["source"] = source.to_dict()
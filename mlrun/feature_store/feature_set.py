@@ -555,8 +555,20 @@ class FeatureSet(ModelObj):
         start_time=None,
         end_time=None,
         time_column=None,
+        filters=None,
     ):
-        """return featureset (offline) data as dataframe"""
+        """return featureset (offline) data as dataframe
+
+        :param columns:     list of columns to select (the entities and timestamp key are always selected)
+        :param df_module:   optional, dataframe module (e.g. pd, dd)
+        :param target_name: offline target name, default to the first offline target
+        :param start_time:  filter by time (timestamp >= start_time)
+        :param end_time:    filter by time (timestamp < end_time)
+        :param time_column: the time column to filter by, default to the timestamp key
+        :param filters:     row filters, a list of (column, op, value) tuples which must all match, e.g.
+                            [("ticker", "in", ["GOOG", "MSFT"])], or a list of such lists (of which any can match),
+                            pushed down to the target reader
+        """
         entities = list(self.spec.entities.keys())
         if columns:
             if self.spec.timestamp_key and self.spec.timestamp_key not in entities:
@@ -574,6 +586,7 @@ class FeatureSet(ModelObj):
             start_time=start_time,
             end_time=end_time,
             time_column=time_column,
+            filters=filters,
         )
 
     def save(self, tag="", versioned=False):
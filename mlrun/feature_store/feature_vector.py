@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import collections
+import operator
 from copy import copy
 from enum import Enum
-from typing import List
+from typing import List, Union
 
 import pandas as pd
 
@@ -332,54 +333,118 @@ class FeatureVector(ModelObj):
 class OnlineVectorService:
     """get_online_feature_service response object"""
 
-    def __init__(self, vector, graph, index_columns):
+    def __init__(self, vector, graph, index_columns, online_caches=None):
         self.vector = vector
         self._controller = graph.controller
         self._index_columns = index_columns
+        self._online_caches = online_caches or {}
 
     @property
     def status(self):
         """vector merger function status (ready, running, error)"""
         return "ready"
 
-    def get(self, entity_rows: List[dict], as_list=False):
-        """get feature vector given the provided entity inputs"""
-        results = []
-        futures = []
+    @property
+    def cache_stats(self):
+        """online cache counters (size, hits, negative_hits, misses, evictions, expirations) per feature set"""
+        return {name: cache.stats() for name, cache in self._online_caches.items()}
+
+    def get(
+        self,
+        entity_rows: Union[List[dict], pd.DataFrame],
+        as_list=False,
+        return_df=False,
+    ):
+        """get feature vector given the provided entity inputs
+
+        the entity rows are emitted to the graph at once (and awaited after), identical entity rows are queried once
+
+        :param entity_rows: list of entity dicts or a DataFrame with a row per entity
+        :param as_list:     return each vector as a list of the feature values (None for entities which weren't found)
+        :param return_df:   return a DataFrame with a row per entity (and a column per feature)
+        """
         if isinstance(entity_rows, dict):
             entity_rows = [entity_rows]
+        elif isinstance(entity_rows, pd.DataFrame):
+            entity_rows = entity_rows.to_dict(orient="records")
         if not isinstance(entity_rows, list):
             raise mlrun.errors.MLRunInvalidArgumentError(
                 f"{entity_rows} is of type {type(entity_rows)}. It should be list of Dictionaries"
             )
-        for row in entity_rows:
-            futures.append(self._controller.emit(row, return_awaitable_result=True))
-        for future in futures:
-            result = future.await_result()
-            data = result.body
-            for key in self._index_columns:
-                if data and key in data:
-                    del data[key]
-            if not data:
-                data = None
+
+        row_keys = [
+            self._get_row_key(index, row) for index, row in enumerate(entity_rows)
+        ]
+        futures = {}
+        for row_key, row in zip(row_keys, entity_rows):
+            if row_key not in futures:
+                futures[row_key] = self._controller.emit(
+                    row, return_awaitable_result=True
+                )
+        feature_columns = self._get_feature_columns()
+        results = {
+            row_key: self._process_result(future.await_result().body, feature_columns)
+            for row_key, future in futures.items()
+        }
+
+        if return_df:
+            return pd.DataFrame.from_records(
+                [results[row_key] or {} for row_key in row_keys],
+                columns=self._get_feature_columns(with_label=True),
+            )
+        if as_list:
+            # the missing features were filled with None, so all the columns exist
+            if len(feature_columns) == 1:
+                column = feature_columns[0]
+
+                def get_values(data):
+                    return (data[column],)
+
             else:
-                requested_columns = self.vector.status.features.keys()
-                actual_columns = data.keys()
-                for column in requested_columns:
-                    if (
-                        column not in actual_columns
-                        and column != self.vector.status.label_column
-                    ):
-                        data[column] = None
-            if as_list:
-                data = [
-                    result.body[key]
-                    for key in self.vector.status.features.keys()
-                    if key != self.vector.status.label_column
-                ]
-            results.append(data)
-
-        return results
+                get_values = operator.itemgetter(*feature_columns)
+            return [
+                list(get_values(results[row_key])) if results[row_key] else None
+                for row_key in row_keys
+            ]
+
+        # rows with identical entities get their own copy of the (shared) result
+        seen = set()
+        vectors = []
+        for row_key in row_keys:
+            data = results[row_key]
+            if data is not None and row_key in seen:
+                data = dict(data)
+            seen.add(row_key)
+            vectors.append(data)
+        return vectors
+
+    @staticmethod
+    def _get_row_key(index, row):
+        try:
+            row_key = tuple(sorted(row.items()))
+            hash(row_key)
+            return row_key
+        except (TypeError, AttributeError):
+            # unhashable/unsortable values (or not a dict) - the row is queried on its own
+            return index
+
+    def _process_result(self, data, feature_columns):
+        for key in self._index_columns:
+            if data and key in data:
+                del data[key]
+        if not data:
+            return None
+        for column in feature_columns:
+            if column not in data:
+                data[column] = None
+        return data
+
+    def _get_feature_columns(self, with_label=False):
+        return [
+            column
+            for column in self.vector.status.features.keys()
+            if with_label or column != self.vector.status.label_column
+        ]
 
     def close(self):
         """terminate the async loop"""
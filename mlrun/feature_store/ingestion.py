@@ -14,11 +14,15 @@
 
 import uuid
 
+import pandas as pd
 import v3io
 
 import mlrun
 from mlrun.datastore.sources import (
+    CSVSource,
+    DataFrameSource,
     HttpSource,
+    ParquetSource,
     StreamSource,
     get_source_from_dict,
     get_source_step,
@@ -40,9 +44,22 @@ from ..utils import logger
 
 
 def init_featureset_graph(
-    source, featureset, namespace, targets=None, return_df=True, verbose=False
+    source,
+    featureset,
+    namespace,
+    targets=None,
+    return_df=True,
+    verbose=False,
+    chunk_size=None,
+    stats=None,
 ):
-    """create storey ingestion graph/DAG from feature set object"""
+    """create storey ingestion graph/DAG from feature set object
+
+    :param chunk_size: optional, run the graph on the source data in chunks of this many rows, the results of every
+                       chunk are appended to the targets
+    :param stats:      optional stats accumulator (DFStatsAccumulator), updated with the results chunk by chunk
+                       (chunked ingestion)
+    """
 
     cache = ResourceCache()
     graph = featureset.spec.graph.copy()
@@ -53,6 +70,8 @@ def init_featureset_graph(
     server.init_states(context=None, namespace=namespace, resource_cache=cache)
 
     if graph.engine != "sync":
+        if chunk_size:
+            source = DataFrameSource(iterate_source_chunks(source, chunk_size))
         _add_data_steps(
             graph,
             cache,
@@ -61,6 +80,8 @@ def init_featureset_graph(
             source=source,
             return_df=return_df,
             context=server.context,
+            stats=stats,
+            stats_batch_size=chunk_size,
         )
 
     server.init_object(namespace)
@@ -68,6 +89,11 @@ def init_featureset_graph(
     if graph.engine != "sync":
         return graph.wait_for_completion()
 
+    if chunk_size:
+        return _run_chunked_graph(
+            server, featureset, source, targets, chunk_size, return_df, stats, verbose
+        )
+
     if hasattr(source, "to_dataframe"):
         source = source.to_dataframe()
     elif not hasattr(source, "to_csv"):
@@ -85,6 +111,54 @@ def init_featureset_graph(
     return data
 
 
+def _run_chunked_graph(
+    server, featureset, source, targets, chunk_size, return_df, stats, verbose
+):
+    """run the (sync) graph chunk by chunk, so only the current chunk is held in memory (unless return_df)"""
+    targets = [get_target_driver(target, featureset) for target in targets]
+    sizes = [None] * len(targets)
+    results = []
+    chunk_id = 0
+    for chunk in iterate_source_chunks(source, chunk_size):
+        data = server.run(MockEvent(body=chunk), get_body=True)
+        if data is None or data.empty:
+            continue
+        for index, target in enumerate(targets):
+            sizes[index] = target.write_dataframe(data, chunk_id=chunk_id)
+        if stats is not None:
+            stats.update(data)
+        if return_df:
+            results.append(data)
+        chunk_id += 1
+
+    for target, size in zip(targets, sizes):
+        target_status = target.update_resource_status("ready", size=size)
+        if verbose:
+            logger.info(f"wrote target: {target_status}")
+    if verbose:
+        logger.info(f"ingested {chunk_id} chunks")
+    return pd.concat(results) if results else None
+
+
+def iterate_source_chunks(source, chunk_size: int):
+    """iterate over the data of a source (dataframe, csv/parquet file path or source object) in dataframes of (up to)
+    chunk_size rows"""
+    if isinstance(source, str):
+        if source.endswith(".csv"):
+            source = CSVSource(path=source)
+        elif source.endswith(".parquet") or source.endswith(".pq"):
+            source = ParquetSource(path=source)
+        else:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"only csv and parquet files can be read in chunks, got {source}"
+            )
+    elif hasattr(source, "to_csv"):
+        source = DataFrameSource(source)
+    if not hasattr(source, "to_dataframe_chunks"):
+        raise mlrun.errors.MLRunInvalidArgumentError("illegal source")
+    return source.to_dataframe_chunks(chunk_size)
+
+
 def featureset_initializer(server):
     """graph server hook to initialize feature set ingestion graph/DAG"""
 
@@ -136,7 +210,15 @@ def context_to_ingestion_params(context):
 
 
 def _add_data_steps(
-    graph, cache, featureset, targets, source, return_df=False, context=None
+    graph,
+    cache,
+    featureset,
+    targets,
+    source,
+    return_df=False,
+    context=None,
+    stats=None,
+    stats_batch_size=None,
 ):
     _, default_final_step, _ = graph.check_and_process_graph(allow_empty=True)
     validate_target_list(targets=targets)
@@ -151,6 +233,27 @@ def _add_data_steps(
     entity_columns = list(featureset.spec.entities.keys())
     key_fields = entity_columns if entity_columns else None
 
+    if stats is not None:
+        # update the stats with batches of the results, instead of collecting all of them to a dataframe
+        def update_stats(bodies):
+            df = pd.DataFrame(bodies)
+            if entity_columns and set(entity_columns).issubset(df.columns):
+                df.set_index(entity_columns, inplace=True)
+            stats.update(df)
+
+        graph.add_step(
+            name="StatsBatch",
+            after=default_final_step,
+            class_name="storey.Batch",
+            max_events=stats_batch_size or 10000,
+        )
+        graph.add_step(
+            name="UpdateStats",
+            after="StatsBatch",
+            class_name="storey.Map",
+            fn=update_stats,
+        )
+
     if source is not None:
         source = get_source_step(
             source,
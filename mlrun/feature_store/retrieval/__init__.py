@@ -12,6 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mlrun.errors
+
+from .dask_merger import DaskFeatureMerger  # noqa
 from .job import run_merge_job  # noqa
 from .local_merger import LocalFeatureMerger  # noqa
 from .online import init_feature_vector_graph  # noqa
+
+mergers_map = {
+    "local": LocalFeatureMerger,
+    "dask": DaskFeatureMerger,
+}
+
+
+def get_merger(kind):
+    if not kind:
+        return LocalFeatureMerger
+    merger = mergers_map.get(kind)
+    if not merger:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"merger engine must be one of {list(mergers_map.keys())}, got {kind}"
+        )
+    return merger
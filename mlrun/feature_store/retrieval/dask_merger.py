@@ -0,0 +1,125 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dask.dataframe as dd
+import pandas as pd
+
+import mlrun.errors
+
+from .local_merger import LocalFeatureMerger
+
+
+class DaskFeatureMerger(LocalFeatureMerger):
+    """feature vector merger which loads the feature sets (e.g. partitioned parquet targets) as dask dataframes and
+    joins them lazily, partition by partition, the result is computed once (and written to the target if given)
+
+    :param vector:      feature vector object
+    :param npartitions: number of partitions to split the entity rows to, when they are passed as a pandas dataframe
+    """
+
+    _df_module = dd
+
+    def __init__(self, vector, npartitions: int = None):
+        super().__init__(vector)
+        self.npartitions = npartitions or 1
+
+    def _iterate_merged_chunks(
+        self,
+        entity_df,
+        entity_timestamp_column: str,
+        featuresets: list,
+        featureset_dfs: list,
+        chunk_size: int = None,
+    ):
+        if chunk_size:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "chunk_size is not supported by the dask engine, the data is processed by partitions"
+            )
+        featuresets = list(featuresets)
+        featureset_dfs = [self._to_dask(df) for df in featureset_dfs]
+        merged_df = self._to_dask(entity_df)
+        if merged_df is None and featureset_dfs:
+            merged_df = featureset_dfs.pop(0)
+            featureset = featuresets.pop(0)
+            entity_timestamp_column = (
+                entity_timestamp_column or featureset.spec.timestamp_key
+            )
+
+        for featureset, featureset_df in zip(featuresets, featureset_dfs):
+            if featureset.spec.timestamp_key:
+                merge_func = self._asof_join
+            else:
+                merge_func = self._join
+
+            merged_df = merge_func(
+                merged_df, entity_timestamp_column, featureset, featureset_df,
+            )
+        if merged_df is not None and merged_df.index.name is not None:
+            # the as-of joins are done on the timestamp index
+            merged_df = merged_df.reset_index()
+        yield merged_df
+
+    def _to_dask(self, df):
+        if isinstance(df, pd.DataFrame):
+            return dd.from_pandas(df, npartitions=self.npartitions, sort=False)
+        return df
+
+    @staticmethod
+    def _prepare_for_asof_join(df, timestamp_column, drop=True):
+        """
+        set the (datetime) timestamp column as the sorted index of the dask dataframe, which is what the partition
+        wise as-of join works on, skipped when it is already set (e.g. the result of a previous as-of join)
+        """
+        if df.index.name == timestamp_column and df.known_divisions:
+            return df
+        if df.index.name is not None:
+            # named indexes (e.g. the entities) are needed as columns for the join
+            df = df.reset_index()
+        if not pd.api.types.is_datetime64_any_dtype(df[timestamp_column].dtype):
+            df = df.assign(**{timestamp_column: dd.to_datetime(df[timestamp_column])})
+        return df.set_index(timestamp_column, drop=drop)
+
+    def _asof_join(
+        self, entity_df, entity_timestamp_column: str, featureset, featureset_df,
+    ):
+        indexes = list(featureset.spec.entities.keys())
+        timestamp_key = featureset.spec.timestamp_key
+        entity_df = self._prepare_for_asof_join(entity_df, entity_timestamp_column)
+        # keep the feature set timestamp column when it has a different name, as the pandas merger does
+        featureset_df = self._prepare_for_asof_join(
+            featureset_df, timestamp_key, drop=timestamp_key == entity_timestamp_column
+        )
+
+        return dd.merge_asof(
+            entity_df, featureset_df, left_index=True, right_index=True, by=indexes,
+        )
+
+    def _join(
+        self, entity_df, entity_timestamp_column: str, featureset, featureset_df,
+    ):
+        indexes = list(featureset.spec.entities.keys())
+        if entity_df.index.name is not None:
+            entity_df = entity_df.reset_index()
+        if featureset_df.index.name is not None:
+            featureset_df = featureset_df.reset_index()
+        return dd.merge(entity_df, featureset_df, on=indexes)
+
+    def _finalize_chunk(self, df, drop_columns):
+        # computed once, both for writing to the target and for the result
+        return super()._finalize_chunk(df, drop_columns).persist()
+
+    def _set_indexes(self, df):
+        if isinstance(df, dd.DataFrame):
+            df = df.compute()
+        return super()._set_indexes(df)
@@ -12,20 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import itertools
 from typing import List
 
 import pandas as pd
+import pyarrow as pa
 
 import mlrun
 import mlrun.errors
 
+from ...data_types.data_types import value_type_to_pa_type
+from ...datastore.targets import ParquetTarget, get_offline_target
+from ...datastore.utils import and_filters
 from ...utils import logger
 from ..feature_vector import OfflineVectorResponse
 
 
 class LocalFeatureMerger:
+    # dataframe module the feature sets are loaded with (e.g. pd, dd), None for pandas
+    _df_module = None
+
     def __init__(self, vector):
         self._result_df = None
+        self._target = None
+        self._index_columns = []
+        self._drop_indexes = True
         self.vector = vector
 
     def start(
@@ -36,7 +48,14 @@ class LocalFeatureMerger:
         drop_columns=None,
         start_time=None,
         end_time=None,
+        chunk_size=None,
     ):
+        """
+        :param chunk_size: optional, join the (time sorted) entity rows in chunks of this many rows, when the target is
+                           a ParquetTarget the chunks are written as they are joined, so the full vector is not kept in
+                           memory (get_df will read it from the target). the as-of joined feature sets with
+                           parquet targets are read by the time windows of the chunks, rather than as a whole
+        """
         if not drop_columns:
             drop_columns = []
         index_columns = []
@@ -61,84 +80,178 @@ class LocalFeatureMerger:
         # load dataframes
         feature_sets = []
         dfs = []
-        df_module = None  # for use of dask or other non pandas df module
+        # the value types of the features, by the feature sets join kind (as-of joins can miss)
+        asof_feature_types = {}
+        join_feature_types = {}
+        df_module = self._df_module
         for name, columns in feature_set_fields.items():
             feature_set = feature_set_objects[name]
             feature_sets.append(feature_set)
             column_names = [name for name, alias in columns]
+            aliases = {name: alias for name, alias in columns if alias}
+            read_kwargs = dict(
+                columns=column_names,
+                df_module=df_module,
+                time_column=entity_timestamp_column,
+                filters=self._get_entity_filters(entity_rows, feature_set),
+            )
             # handling case where there are multiple feature sets and user creates vector where entity_timestamp_
             # column is from a specific feature set (can't be entity timestamp)
             if (
                 entity_timestamp_column in column_names
                 or feature_set.spec.timestamp_key == entity_timestamp_column
             ):
-                df = feature_set.to_dataframe(
-                    columns=column_names,
-                    df_module=df_module,
-                    start_time=start_time,
-                    end_time=end_time,
-                    time_column=entity_timestamp_column,
-                )
+                read_kwargs.update(start_time=start_time, end_time=end_time)
+            if chunk_size and self._can_read_windows(entity_rows, feature_set):
+                # the rows are read per chunk, by time, instead of loading the whole feature set
+                df = _AsofWindowReader(feature_set, aliases, read_kwargs)
             else:
-                df = feature_set.to_dataframe(
-                    columns=column_names,
-                    df_module=df_module,
-                    time_column=entity_timestamp_column,
-                )
-            # rename columns with aliases
-            df.rename(
-                columns={name: alias for name, alias in columns if alias}, inplace=True
-            )
+                df = feature_set.to_dataframe(**read_kwargs)
+                # rename columns with aliases
+                df = df.rename(columns=aliases)
             dfs.append(df)
+            feature_types = (
+                asof_feature_types
+                if feature_set.spec.timestamp_key
+                else join_feature_types
+            )
+            features = feature_set.spec.features
+            for name, alias in columns:
+                feature_types[alias or name] = (
+                    features[name].value_type if name in features.keys() else None
+                )
             if not entity_timestamp_column and drop_indexes:
                 append_drop_column(feature_set.spec.timestamp_key)
             for key in feature_set.spec.entities.keys():
                 append_index(key)
 
-        self.merge(entity_rows, entity_timestamp_column, feature_sets, dfs)
-
-        self._result_df.drop(columns=drop_columns, inplace=True, errors="ignore")
+        self._index_columns = index_columns
+        self._drop_indexes = drop_indexes
+        chunks = (
+            self._finalize_chunk(chunk, drop_columns)
+            for chunk in self._iterate_merged_chunks(
+                entity_rows, entity_timestamp_column, feature_sets, dfs, chunk_size
+            )
+        )
 
-        if self.vector.status.label_column:
-            self._result_df = self._result_df.dropna(
-                subset=[self.vector.status.label_column]
+        if chunk_size and isinstance(target, ParquetTarget):
+            # stream the joined chunks to the target, the result is read back from it only if requested
+            first_chunk = next(chunks)
+            schema = self._get_chunks_schema(
+                first_chunk, asof_feature_types, join_feature_types
             )
+            self._write_to_target(
+                target,
+                functools.partial(target.write_dataframe_chunks, schema=schema),
+                itertools.chain([first_chunk], chunks),
+            )
+            self._target = target
+            return OfflineVectorResponse(self)
 
+        self._result_df = pd.concat(list(chunks)) if chunk_size else next(chunks)
         if target:
-            is_persistent_vector = self.vector.metadata.name is not None
-            if not target.path and not is_persistent_vector:
-                raise mlrun.errors.MLRunInvalidArgumentError(
-                    "target path was not specified"
-                )
-            target.set_resource(self.vector)
-            size = target.write_dataframe(self._result_df)
-            if is_persistent_vector:
-                target_status = target.update_resource_status("ready", size=size)
-                logger.info(f"wrote target: {target_status}")
-                self.vector.save()
+            self._write_to_target(target, target.write_dataframe, self._result_df)
 
+        self._result_df = self._set_indexes(self._result_df)
+        return OfflineVectorResponse(self)
+
+    @staticmethod
+    def _can_read_windows(entity_rows, feature_set):
+        # the as-of joined feature sets are read by time windows of the (time sorted) entity rows, the time filters
+        # are pushed down to parquet targets (csv values are read as strings)
+        return (
+            isinstance(entity_rows, pd.DataFrame)
+            and feature_set.spec.timestamp_key
+            and isinstance(get_offline_target(feature_set), ParquetTarget)
+        )
+
+    @staticmethod
+    def _get_chunks_schema(first_chunk, asof_feature_types, join_feature_types):
+        """return the pyarrow schema of the joined chunks. it is inferred from the first chunk, but the type of the
+        features can differ in the next chunks: a feature without values in the first chunk is of an unknown (null)
+        type, and an int feature becomes float when an as-of join has no match (NaN), so the feature value types
+        are used and the as-of joined ints are written as float"""
+        schema = pa.Schema.from_pandas(first_chunk, preserve_index=False)
+        for index, field in enumerate(schema):
+            if field.name in asof_feature_types:
+                value_type = asof_feature_types[field.name]
+                nullable = True
+            elif field.name in join_feature_types:
+                value_type = join_feature_types[field.name]
+                nullable = False
+            else:
+                continue
+            type_ = field.type
+            if pa.types.is_null(type_):
+                type_ = value_type_to_pa_type(value_type) or pa.string()
+            if nullable and pa.types.is_integer(type_):
+                type_ = pa.float64()
+            schema = schema.set(index, field.with_type(type_))
+        return schema
+
+    @staticmethod
+    def _get_entity_filters(entity_rows, feature_set):
+        """return filters which select the feature set rows of the entity rows keys, so only the rows which can be
+        joined are read, None if the keys are unknown or there are too many of them"""
+        if not isinstance(entity_rows, pd.DataFrame):
+            return None
+        max_keys = int(mlrun.mlconf.feature_store.max_entity_filter_keys or 0)
+        filters = []
+        for key in feature_set.spec.entities.keys():
+            if key in entity_rows.columns:
+                values = entity_rows[key]
+            elif key in entity_rows.index.names:
+                values = entity_rows.index.get_level_values(key)
+            else:
+                return None
+            values = pd.unique(values)
+            if len(values) > max_keys:
+                return None
+            filters.append((key, "in", values.tolist()))
+        return filters or None
+
+    def _write_to_target(self, target, write, data):
+        is_persistent_vector = self.vector.metadata.name is not None
+        if not target.path and not is_persistent_vector:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "target path was not specified"
+            )
+        target.set_resource(self.vector)
+        size = write(data)
+        if is_persistent_vector:
+            target_status = target.update_resource_status("ready", size=size)
+            logger.info(f"wrote target: {target_status}")
+            self.vector.save()
+
+    def _finalize_chunk(self, df, drop_columns):
+        df = df.drop(columns=drop_columns, errors="ignore")
+        if self.vector.status.label_column:
+            df = df.dropna(subset=[self.vector.status.label_column])
+        return df
+
+    def _set_indexes(self, df):
         # check if need to set indices
-        if drop_indexes:
-            self._result_df.reset_index(drop=True, inplace=True)
-        elif index_columns:
+        if self._drop_indexes:
+            df.reset_index(drop=True, inplace=True)
+        elif self._index_columns:
 
             # in case of using spark engine the index will be of the default type 'RangeIndex' and it will be replaced,
             # in other cases the index should already be set correctly.
-            if self._result_df.index is None or isinstance(
-                self._result_df.index, pd.core.indexes.range.RangeIndex
+            if df.index is None or isinstance(
+                df.index, pd.core.indexes.range.RangeIndex
             ):
                 index_columns_missing = []
-                for index in index_columns:
-                    if index not in self._result_df.columns:
+                for index in self._index_columns:
+                    if index not in df.columns:
                         index_columns_missing.append(index)
                 if not index_columns_missing:
-                    self._result_df.set_index(index_columns, inplace=True)
+                    df.set_index(self._index_columns, inplace=True)
                 else:
                     logger.warn(
                         f"Can't set index, not all index columns found: {index_columns_missing}. "
                         f"It is possible that column was already indexed."
                     )
-        return OfflineVectorResponse(self)
+        return df
 
     def merge(
         self,
@@ -147,7 +260,27 @@ class LocalFeatureMerger:
         featuresets: list,
         featureset_dfs: List[pd.DataFrame],
     ):
+        self._result_df = next(
+            self._iterate_merged_chunks(
+                entity_df, entity_timestamp_column, featuresets, featureset_dfs
+            )
+        )
+
+    def _iterate_merged_chunks(
+        self,
+        entity_df,
+        entity_timestamp_column: str,
+        featuresets: list,
+        featureset_dfs: List[pd.DataFrame],
+        chunk_size: int = None,
+    ):
+        """
+        join the feature sets to the entity rows and yield the result, in chunks of chunk_size (time sorted) entity
+        rows if given. every input is converted and sorted (for the as-of joins) at most once, up front
+        """
         merged_df = entity_df
+        featuresets = list(featuresets)
+        featureset_dfs = list(featureset_dfs)
         if entity_df is None and featureset_dfs:
             merged_df = featureset_dfs.pop(0)
             featureset = featuresets.pop(0)
@@ -155,17 +288,50 @@ class LocalFeatureMerger:
                 entity_timestamp_column or featureset.spec.timestamp_key
             )
 
-        for featureset, featureset_df in zip(featuresets, featureset_dfs):
-            if featureset.spec.timestamp_key:
-                merge_func = self._asof_join
-            else:
-                merge_func = self._join
+        if any(featureset.spec.timestamp_key for featureset in featuresets):
+            merged_df = self._prepare_for_asof_join(merged_df, entity_timestamp_column)
+            featureset_dfs = [
+                self._prepare_for_asof_join(
+                    featureset_df, featureset.spec.timestamp_key
+                )
+                if featureset.spec.timestamp_key
+                and not isinstance(featureset_df, _AsofWindowReader)
+                else featureset_df
+                for featureset, featureset_df in zip(featuresets, featureset_dfs)
+            ]
 
-            merged_df = merge_func(
-                merged_df, entity_timestamp_column, featureset, featureset_df,
-            )
+        chunk_size = chunk_size or len(merged_df) or 1
+        for start in range(0, max(len(merged_df), 1), chunk_size):
+            chunk = merged_df.iloc[start : start + chunk_size]
+            for featureset, featureset_df in zip(featuresets, featureset_dfs):
+                if isinstance(featureset_df, _AsofWindowReader):
+                    featureset_df = featureset_df.read_until(
+                        chunk[entity_timestamp_column].iloc[-1] if len(chunk) else None
+                    )
+                if featureset.spec.timestamp_key:
+                    merge_func = self._asof_join
+                else:
+                    merge_func = self._join
 
-        self._result_df = merged_df
+                chunk = merge_func(
+                    chunk, entity_timestamp_column, featureset, featureset_df,
+                )
+            yield chunk
+
+    @staticmethod
+    def _prepare_for_asof_join(df, timestamp_column):
+        """
+        reset the index and sort by the (datetime) timestamp column, each step is skipped when the data frame is
+        already in that form (e.g. the result of a previous as-of join, or data that was written sorted)
+        """
+        if type(df.index) != pd.RangeIndex:
+            # named indexes (e.g. the entities) are needed as columns for the join, unnamed ones are dropped
+            df = df.reset_index(drop=all(name is None for name in df.index.names))
+        if not pd.api.types.is_datetime64_any_dtype(df[timestamp_column]):
+            df = df.assign(**{timestamp_column: pd.to_datetime(df[timestamp_column])})
+        if not df[timestamp_column].is_monotonic_increasing:
+            df = df.sort_values(by=timestamp_column, ignore_index=True)
+        return df
 
     def _asof_join(
         self,
@@ -175,42 +341,26 @@ class LocalFeatureMerger:
         featureset_df: pd.DataFrame,
     ):
         indexes = list(featureset.spec.entities.keys())
-        index_col_not_in_entity = "index" not in entity_df.columns
-        index_col_not_in_featureset = "index" not in featureset_df.columns
-        # Sort left and right keys
-        if type(entity_df.index) != pd.RangeIndex:
-            entity_df = entity_df.reset_index()
-        if type(featureset_df.index) != pd.RangeIndex:
-            featureset_df = featureset_df.reset_index()
-        entity_df[entity_timestamp_column] = pd.to_datetime(
-            entity_df[entity_timestamp_column]
-        )
-        featureset_df[featureset.spec.timestamp_key] = pd.to_datetime(
-            featureset_df[featureset.spec.timestamp_key]
-        )
-        entity_df = entity_df.sort_values(by=entity_timestamp_column)
-        featureset_df = featureset_df.sort_values(by=entity_timestamp_column)
+        timestamp_key = featureset.spec.timestamp_key
+        # no-ops when the inputs were prepared up front
+        entity_df = self._prepare_for_asof_join(entity_df, entity_timestamp_column)
+        featureset_df = self._prepare_for_asof_join(featureset_df, timestamp_key)
 
-        merged_df = pd.merge_asof(
+        # feature rows which are later than all the entity rows can't be joined, so not passing them to the join
+        if len(entity_df):
+            last_row = featureset_df[timestamp_key].searchsorted(
+                entity_df[entity_timestamp_column].iloc[-1], side="right"
+            )
+            featureset_df = featureset_df.iloc[:last_row]
+
+        return pd.merge_asof(
             entity_df,
             featureset_df,
             left_on=entity_timestamp_column,
-            right_on=featureset.spec.timestamp_key,
+            right_on=timestamp_key,
             by=indexes,
         )
 
-        # Undo indexing tricks for asof merge
-        # to return the correct indexes and not
-        # overload `index` columns
-        if (
-            "index" not in indexes
-            and index_col_not_in_entity
-            and index_col_not_in_featureset
-            and "index" in merged_df.columns
-        ):
-            merged_df = merged_df.drop(columns="index")
-        return merged_df
-
     def _join(
         self,
         entity_df,
@@ -223,9 +373,47 @@ class LocalFeatureMerger:
         return merged_df
 
     def get_status(self):
-        if self._result_df is None:
+        if self._result_df is None and self._target is None:
             raise RuntimeError("unexpected status, no result df")
         return "completed"
 
     def get_df(self):
+        if self._result_df is None and self._target is not None:
+            self._result_df = self._set_indexes(self._target.as_df())
         return self._result_df
+
+
+class _AsofWindowReader:
+    """reads the rows of an as-of joined feature set by consecutive time windows (of the time sorted entity rows
+    chunks), instead of loading it as a whole. the last row of every key is kept for the next windows, as the
+    later entity rows can be joined with it"""
+
+    def __init__(self, feature_set, aliases: dict, read_kwargs: dict):
+        self._feature_set = feature_set
+        self._aliases = aliases
+        self._read_kwargs = read_kwargs
+        self._last_time = None
+        self._last_rows = None
+
+    def read_until(self, until=None) -> pd.DataFrame:
+        """return the (time sorted) rows which can be joined with entity rows up to the until time: the rows of the
+        window since the previous call, and the last row of every key before it"""
+        timestamp_key = self._feature_set.spec.timestamp_key
+        window_filters = []
+        if self._last_time is not None:
+            window_filters.append((timestamp_key, ">", self._last_time))
+        if until is not None:
+            window_filters.append((timestamp_key, "<=", until))
+        read_kwargs = dict(self._read_kwargs)
+        read_kwargs["filters"] = and_filters(read_kwargs.get("filters"), window_filters)
+        df = self._feature_set.to_dataframe(**read_kwargs).rename(columns=self._aliases)
+        df = LocalFeatureMerger._prepare_for_asof_join(df, timestamp_key)
+        if self._last_rows is not None:
+            # the kept rows are earlier than the window
+            df = pd.concat([self._last_rows, df], ignore_index=True)
+
+        keys = list(self._feature_set.spec.entities.keys())
+        self._last_rows = df.groupby(keys, sort=False).tail(1)
+        if until is not None:
+            self._last_time = until
+        return df
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 
 import mlrun
 from mlrun.datastore.store_resources import ResourceCache
@@ -57,7 +58,17 @@ def _build_feature_vector_graph(
     return graph
 
 
-def init_feature_vector_graph(vector, query_options):
+def init_feature_vector_graph(
+    vector, query_options, cache_size=0, cache_ttl=60, cache_negative_ttl=None
+):
+    """build and init the feature vector (QueryByKey) graph
+
+    :param cache_size:         max keys to cache per feature set (0 to query the online target on every lookup)
+    :param cache_ttl:          seconds to cache looked up keys, or dict of feature set name to seconds (feature sets
+                               which aren't in the dict are not cached)
+    :param cache_negative_ttl: seconds to cache keys which were not found (0 to not cache them), defaults to cache_ttl
+    :return: the graph, index columns and dict of feature set name to its OnlineCache
+    """
     try:
         from storey import SyncEmitSource
     except ImportError as exc:
@@ -72,16 +83,25 @@ def init_feature_vector_graph(vector, query_options):
 
     cache = ResourceCache()
     index_columns = []
-    for featureset in feature_set_objects.values():
+    online_caches = {}
+    for name, featureset in feature_set_objects.items():
         driver = get_online_target(featureset)
         if not driver:
             raise mlrun.errors.MLRunInvalidArgumentError(
                 f"resource {featureset.uri} does not have an online data target"
             )
-        cache.cache_table(featureset.uri, driver.get_table_object())
+        ttl = cache_ttl.get(name) if isinstance(cache_ttl, dict) else cache_ttl
+        driver_wrapper = None
+        if cache_size and ttl:
+            from .online_cache import CachedDriver, OnlineCache
+
+            online_caches[name] = OnlineCache(cache_size, ttl, cache_negative_ttl)
+            driver_wrapper = functools.partial(CachedDriver, cache=online_caches[name])
+        table = driver.get_table_object(driver_wrapper=driver_wrapper)
+        cache.cache_table(featureset.uri, table)
         for key in featureset.spec.entities.keys():
             if not vector.spec.with_indexes and key not in index_columns:
                 index_columns.append(key)
     server.init_states(context=None, namespace=None, resource_cache=cache)
     server.init_object(None)
-    return graph, index_columns
+    return graph, index_columns, online_caches
@@ -0,0 +1,148 @@
+# Copyright 2018 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import collections
+import time
+
+from storey import Driver
+
+_missing = object()
+
+
+class OnlineCache:
+    """size bounded LRU cache with ttl for online feature lookups
+
+    :param max_size:     max number of cached keys, the least recently used key is evicted when exceeded
+    :param ttl:          seconds a looked up key is kept in the cache
+    :param negative_ttl: seconds a key which wasn't found is kept in the cache (0 to not cache missing keys),
+                         defaults to ttl
+    """
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._items = collections.OrderedDict()
+
+    def get(self, key):
+        """return the cached value of the key (None for cached missing keys), or _missing"""
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return _missing
+        value, expiration = item
+        if expiration < time.monotonic():
+            del self._items[key]
+            self.expirations += 1
+            self.misses += 1
+            return _missing
+        self._items.move_to_end(key)
+        if value is None:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """cache the value of the key, None marks the key as missing (negative caching)"""
+        ttl = self.ttl if value is not None else self.negative_ttl
+        if not ttl or ttl <= 0:
+            return
+        self._items[key] = (value, time.monotonic() + ttl)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key):
+        self._items.pop(key, None)
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._items),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class CachedDriver(Driver):
+    """storey driver which serves the key lookups of a (read only) online table from an OnlineCache and goes to the
+    wrapped driver (e.g. the KV store) only on a cache miss
+
+    the table is created with it (see the driver_wrapper of get_table_object). the QueryByKey steps read their
+    (read only) table keys from the driver on every event, so the cache sees all the lookups"""
+
+    def __init__(self, driver: Driver, cache: OnlineCache):
+        self._driver = driver
+        self.cache = cache
+
+    async def _save_schema(self, container, table_path, schema):
+        return await self._driver._save_schema(container, table_path, schema)
+
+    async def _load_schema(self, container, table_path):
+        return await self._driver._load_schema(container, table_path)
+
+    async def _save_key(
+        self, container, table_path, key, aggr_item, partitioned_by_key, additional_data
+    ):
+        self.cache.invalidate(("aggregates", table_path, key))
+        self.cache.invalidate(("attributes", table_path, key, "*"))
+        return await self._driver._save_key(
+            container, table_path, key, aggr_item, partitioned_by_key, additional_data
+        )
+
+    async def _load_aggregates_by_key(self, container, table_path, key):
+        cache_key = ("aggregates", table_path, key)
+        cached = self.cache.get(cache_key)
+        if cached is _missing:
+            aggregates, additional_data = await self._driver._load_aggregates_by_key(
+                container, table_path, key
+            )
+            found = aggregates is not None or additional_data is not None
+            self.cache.set(cache_key, (aggregates, additional_data) if found else None)
+            return aggregates, additional_data
+        if cached is None:
+            return None, None
+        aggregates, additional_data = cached
+        # the table keeps (and updates) the additional data as the key attributes
+        return aggregates, dict(additional_data) if additional_data else additional_data
+
+    async def _load_by_key(self, container, table_path, key, attribute):
+        cache_key = (
+            "attributes",
+            table_path,
+            key,
+            attribute if isinstance(attribute, str) else tuple(attribute),
+        )
+        cached = self.cache.get(cache_key)
+        if cached is _missing:
+            attributes = await self._driver._load_by_key(
+                container, table_path, key, attribute
+            )
+            self.cache.set(cache_key, attributes or None)
+            return attributes
+        return dict(cached) if cached else None
+
+    async def close(self):
+        return await self._driver.close()
@@ -148,10 +148,15 @@ class K8sHelper:
             name, namespace, raise_on_not_found=True
         ).status.phase.lower()
 
-    def logs(self, name, namespace=None):
+    def logs(self, name, namespace=None, since_seconds=None, limit_bytes=None):
+        kwargs = {}
+        if since_seconds:
+            kwargs["since_seconds"] = since_seconds
+        if limit_bytes:
+            kwargs["limit_bytes"] = limit_bytes
         try:
             resp = self.v1api.read_namespaced_pod_log(
-                name=name, namespace=self.resolve_namespace(namespace)
+                name=name, namespace=self.resolve_namespace(namespace), **kwargs
             )
         except ApiException as exc:
             logger.error(f"failed to get pod logs: {exc}")
@@ -159,6 +164,37 @@ class K8sHelper:
 
         return resp
 
+    def stream_logs(
+        self,
+        name,
+        namespace=None,
+        since_seconds=None,
+        timestamps=False,
+        chunk_size=64 * 1024,
+    ):
+        """yield the pod logs in chunks as they are received, without loading them into memory, the connection is
+        closed when the generator is closed (so the rest of the logs isn't transferred)"""
+        kwargs = {}
+        if since_seconds:
+            kwargs["since_seconds"] = since_seconds
+        try:
+            resp = self.v1api.read_namespaced_pod_log(
+                name=name,
+                namespace=self.resolve_namespace(namespace),
+                timestamps=timestamps,
+                _preload_content=False,
+                **kwargs,
+            )
+        except ApiException as exc:
+            logger.error(f"failed to get pod logs: {exc}")
+            raise exc
+
+        try:
+            yield from resp.stream(chunk_size)
+        finally:
+            resp.close()
+            resp.release_conn()
+
     def run_job(self, pod, timeout=600):
         pod_name, namespace = self.create_pod(pod)
         if not pod_name:
@@ -24,6 +24,9 @@ from .utils import flatten, get_artifact_target, get_in
 
 
 class RunList(list):
+    # set when the list is a single page of a paginated listing, pass it back to get the next page
+    next_page_token = None
+
     def to_rows(self):
         """return the run list as flattened rows"""
         rows = []
@@ -81,6 +84,9 @@ class RunList(list):
 
 
 class ArtifactList(list):
+    # set when the list is a single page of a paginated listing, pass it back to get the next page
+    next_page_token = None
+
     def __init__(self, *args):
         super().__init__(*args)
         self.tag = ""
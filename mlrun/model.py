@@ -345,6 +345,9 @@ class HyperParamStrategies:
     list = "list"
     random = "random"
     custom = "custom"
+    halving = "halving"
+    hyperband = "hyperband"
+    bayesian = "bayesian"
 
     @staticmethod
     def all():
@@ -353,6 +356,32 @@ class HyperParamStrategies:
             HyperParamStrategies.list,
             HyperParamStrategies.random,
             HyperParamStrategies.custom,
+            HyperParamStrategies.halving,
+            HyperParamStrategies.hyperband,
+            HyperParamStrategies.bayesian,
+        ]
+
+    @staticmethod
+    def adaptive():
+        """strategies which pick the next iterations by the results (selector) of the completed ones"""
+        return [
+            HyperParamStrategies.halving,
+            HyperParamStrategies.hyperband,
+            HyperParamStrategies.bayesian,
+        ]
+
+
+class HyperParamExecutors:
+    process = "process"
+    thread = "thread"
+    dask = "dask"
+
+    @staticmethod
+    def all():
+        return [
+            HyperParamExecutors.process,
+            HyperParamExecutors.thread,
+            HyperParamExecutors.dask,
         ]
 
 
@@ -361,14 +390,24 @@ class HyperParamOptions(ModelObj):
 
     Parameters:
         param_file (str):       hyper params input file path/url, instead of inline
-        strategy (str):         hyper param strategy - grid, list or random
+        strategy (str):         hyper param strategy - grid, list, random, or the adaptive halving (successive
+                                halving), hyperband and bayesian (sequential model based optimization)
         selector (str):         selection criteria for best result ([min|max.]<result>), e.g. max.accuracy
         stop_condition (str):   early stop condition e.g. "accuracy > 0.9"
-        parallel_runs (int):    number of param combinations to run in parallel (over Dask)
+        parallel_runs (int):    number of param combinations to run in parallel (over Dask or a local pool)
         dask_cluster_uri (str): db uri for a deployed dask cluster function, e.g. db://myproject/dask
-        max_iterations (int):   max number of runs (in random strategy)
+        max_iterations (int):   max number of runs (in random and bayesian strategies), or of sampled
+                                configurations (in halving strategy, default to all the grid)
         max_errors (int):       max number of child runs errors for the overall job to fail
         teardown_dask (bool):   kill the dask cluster pods after the runs
+        parallel_executor (str): executor of the parallel runs of local/handler functions - process (local process
+                                pool), thread (local thread pool) or dask, default to dask when dask_cluster_uri
+                                is set, otherwise to mlconf.hyper_params.parallel_executor (process)
+        resource_param (str):   name of the budget param (e.g. epochs) set by the halving and hyperband strategies
+        min_resource (int):     budget of the first (lowest) rung, default to 1
+        max_resource (int):     max budget of a run
+        reduction_factor (int): halving and hyperband keep the best 1/reduction_factor of the configurations in
+                                each rung, and multiply their budget by it, default to 3
     """
 
     def __init__(
@@ -382,6 +421,11 @@ class HyperParamOptions(ModelObj):
         max_iterations=None,
         max_errors=None,
         teardown_dask=None,
+        parallel_executor=None,
+        resource_param=None,
+        min_resource=None,
+        max_resource=None,
+        reduction_factor=None,
     ):
         self.param_file = param_file
         self.strategy = strategy
@@ -392,15 +436,42 @@ class HyperParamOptions(ModelObj):
         self.parallel_runs = parallel_runs
         self.dask_cluster_uri = dask_cluster_uri
         self.teardown_dask = teardown_dask
+        self.parallel_executor = parallel_executor
+        self.resource_param = resource_param
+        self.min_resource = min_resource
+        self.max_resource = max_resource
+        self.reduction_factor = reduction_factor
 
     def validate(self):
         if self.strategy and self.strategy not in HyperParamStrategies.all():
             raise mlrun.errors.MLRunInvalidArgumentError(
                 f"illegal hyper param strategy, use {','.join(HyperParamStrategies.all())}"
             )
-        if self.max_iterations and self.strategy != HyperParamStrategies.random:
+        if self.max_iterations and self.strategy not in [
+            HyperParamStrategies.random,
+            HyperParamStrategies.halving,
+            HyperParamStrategies.bayesian,
+        ]:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "max_iterations is only valid in random, halving and bayesian strategies"
+            )
+        if self.strategy in HyperParamStrategies.adaptive() and not self.selector:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"a selector (e.g. max.accuracy) is required in {self.strategy} strategy"
+            )
+        if self.strategy in [
+            HyperParamStrategies.halving,
+            HyperParamStrategies.hyperband,
+        ] and not (self.resource_param and self.max_resource):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"resource_param and max_resource are required in {self.strategy} strategy"
+            )
+        if (
+            self.parallel_executor
+            and self.parallel_executor not in HyperParamExecutors.all()
+        ):
             raise mlrun.errors.MLRunInvalidArgumentError(
-                "max_iterations is only valid in random strategy"
+                f"illegal parallel executor, use {','.join(HyperParamExecutors.all())}"
             )
 
 
@@ -1008,6 +1079,8 @@ class DataSource(ModelObj):
         "max_age",
         "start_time",
         "end_time",
+        "columns",
+        "filters",
     ]
     kind = None
 
@@ -1021,6 +1094,8 @@ class DataSource(ModelObj):
         schedule: str = None,
         start_time: Optional[Union[datetime, str]] = None,
         end_time: Optional[Union[datetime, str]] = None,
+        columns: List[str] = None,
+        filters: list = None,
     ):
 
         self.name = name
@@ -1031,6 +1106,8 @@ class DataSource(ModelObj):
         self.time_field = time_field
         self.start_time = start_time
         self.end_time = end_time
+        self.columns = columns
+        self.filters = filters
 
         self.online = None
         self.max_age = None
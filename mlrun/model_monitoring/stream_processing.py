@@ -5,6 +5,7 @@ from datetime import datetime
 from os import environ
 from typing import Any, Dict, List, Optional, Set, Union
 
+import numpy as np
 import pandas as pd
 import v3io
 from nuclio import Event
@@ -71,6 +72,9 @@ CUSTOM_METRICS = "custom_metrics"
 ENDPOINT_FEATURES = "endpoint_features"
 METRICS = "metrics"
 BATCH_TIMESTAMP = "batch_timestamp"
+ROWS = "rows"
+LATENCY_TOTAL = "latency_total"
+LATENCY_ROWS = "latency_rows"
 TIME_FORMAT: str = "%Y-%m-%d %H:%M:%S.%f"  # ISO 8061
 
 
@@ -91,8 +95,16 @@ class EventStreamProcessor:
         v3io_access_key: Optional[str] = None,
         v3io_framesd: Optional[str] = None,
         v3io_api: Optional[str] = None,
+        columnar: bool = False,
     ):
+        """
+        :param columnar: process each model invocation as a single batch event holding its features and
+                         predictions as 2D numpy arrays (instead of exploding it into an event per row),
+                         rows are only materialized when writing to parquet. note that the sample window
+                         then samples invocations instead of rows
+        """
         self.project = project
+        self.columnar = columnar
         self.sample_window = sample_window
         self.tsdb_batching_max_events = tsdb_batching_max_events
         self.tsdb_batching_timeout_secs = tsdb_batching_timeout_secs
@@ -166,43 +178,45 @@ class EventStreamProcessor:
                     kv_container=self.kv_container,
                     kv_path=self.kv_path,
                     v3io_access_key=self.v3io_access_key,
+                    columnar=self.columnar,
                 ),
                 FilterNotNone(),
-                FlatMap(lambda x: x),
+                *([] if self.columnar else [FlatMap(lambda x: x)]),
                 MapFeatureNames(
                     kv_container=self.kv_container,
                     kv_path=self.kv_path,
                     access_key=self.v3io_access_key,
                     infer_columns_from_data=True,
+                    columnar=self.columnar,
                 ),
                 # Branch 1: Aggregate events, count averages and update TSDB and KV
                 [
                     AggregateByKey(
-                        aggregates=[
-                            FieldAggregator(
-                                PREDICTIONS,
-                                ENDPOINT_ID,
-                                ["count"],
-                                SlidingWindows(
-                                    self.aggregate_count_windows,
-                                    self.aggregate_count_period,
-                                ),
+                        aggregates=build_aggregators(
+                            self.columnar,
+                            SlidingWindows(
+                                self.aggregate_count_windows,
+                                self.aggregate_count_period,
                             ),
-                            FieldAggregator(
-                                LATENCY,
-                                LATENCY,
-                                ["avg"],
-                                SlidingWindows(
-                                    self.aggregate_avg_windows,
-                                    self.aggregate_avg_period,
-                                ),
+                            SlidingWindows(
+                                self.aggregate_avg_windows, self.aggregate_avg_period,
                             ),
-                        ],
+                        ),
                         table=Table("notable", NoopDriver()),
                     ),
                     SampleWindow(
                         self.sample_window, key=ENDPOINT_ID,
                     ),  # Add required gap between event to apply sampling
+                    *(
+                        [
+                            ComputeColumnarAggregations(
+                                self.aggregate_count_windows,
+                                self.aggregate_avg_windows,
+                            )
+                        ]
+                        if self.columnar
+                        else []
+                    ),
                     Map(self.compute_predictions_per_second),
                     # Branch 1.1: Updated KV
                     [
@@ -217,6 +231,7 @@ class EventStreamProcessor:
                     ],
                     # Branch 1.2: Update TSDB
                     [
+                        *([Map(select_last_row)] if self.columnar else []),
                         # Map the event into taggable fields, add record type to each field
                         Map(self.process_before_events_tsdb),
                         [
@@ -275,6 +290,7 @@ class EventStreamProcessor:
                 ],
                 # Branch 2: Batch events, write to parquet
                 [
+                    *([FlatMap(explode_columnar_event)] if self.columnar else []),
                     Map(self.process_before_parquet),
                     ParquetTarget(
                         path=self.parquet_path,
@@ -386,11 +402,19 @@ class EventStreamProcessor:
 
 
 class ProcessEndpointEvent(MapClass):
-    def __init__(self, kv_container: str, kv_path: str, v3io_access_key: str, **kwargs):
+    def __init__(
+        self,
+        kv_container: str,
+        kv_path: str,
+        v3io_access_key: str,
+        columnar: bool = False,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.kv_container: str = kv_container
         self.kv_path: str = kv_path
         self.v3io_access_key: str = v3io_access_key
+        self.columnar = columnar
         self.first_request: Dict[str, str] = dict()
         self.last_request: Dict[str, str] = dict()
         self.error_count: Dict[str, int] = defaultdict(int)
@@ -439,6 +463,33 @@ class ProcessEndpointEvent(MapClass):
 
         unpacked_labels = {f"_{k}": v for k, v in event.get(LABELS, {}).items()}
 
+        if self.columnar:
+            features = self.to_columns(endpoint_id, features, ["request", "inputs"])
+            predictions = self.to_columns(endpoint_id, predictions, ["resp", "outputs"])
+            if features is None or predictions is None:
+                return None
+            rows = min(len(features), len(predictions))
+            return {
+                FUNCTION_URI: function_uri,
+                MODEL: versioned_model,
+                MODEL_CLASS: model_class,
+                TIMESTAMP: timestamp,
+                ENDPOINT_ID: endpoint_id,
+                REQUEST_ID: request_id,
+                LATENCY: latency,
+                LATENCY_TOTAL: latency * rows,
+                ROWS: rows,
+                FEATURES: features[:rows],
+                PREDICTION: predictions[:rows],
+                FIRST_REQUEST: self.first_request[endpoint_id],
+                LAST_REQUEST: self.last_request[endpoint_id],
+                ERROR_COUNT: self.error_count[endpoint_id],
+                LABELS: event.get(LABELS, {}),
+                METRICS: event.get(METRICS, {}),
+                ENTITIES: event.get("request", {}).get(ENTITIES, {}),
+                UNPACKED_LABELS: unpacked_labels,
+            }
+
         # Separate each model invocation into sub events
         events = []
         for i, (feature, prediction) in enumerate(zip(features, predictions)):
@@ -475,6 +526,34 @@ class ProcessEndpointEvent(MapClass):
             )
         return events
 
+    def to_columns(
+        self, endpoint_id: str, values: list, dict_path: List[str]
+    ) -> Optional[np.ndarray]:
+        """convert the invocation rows to a (rows, columns) array, scalar rows become a single column"""
+        try:
+            columns = np.asarray(values)
+        except ValueError:
+            # ragged rows
+            columns = None
+        if columns is not None and columns.ndim == 1:
+            columns = columns.reshape(-1, 1)
+        is_valid = (
+            columns is not None
+            and columns.ndim == 2
+            and (
+                dict_path[-1] != "inputs"
+                or np.issubdtype(columns.dtype, np.number)
+                or columns.dtype == np.bool_
+            )
+        )
+        if not is_valid:
+            logger.error(
+                f"Expected event field is not a matrix of values: {values} [Event -> {''.join(dict_path)}]"
+            )
+            self.error_count[endpoint_id] += 1
+            return None
+        return columns
+
     def resume_state(self, endpoint_id):
         # Make sure process is resumable, if process fails for any reason, be able to pick things up close to where we
         # left them
@@ -556,6 +635,91 @@ def is_list_of_numerics(
     return False
 
 
+def build_aggregators(
+    columnar: bool, count_windows: SlidingWindows, avg_windows: SlidingWindows
+) -> List[FieldAggregator]:
+    if not columnar:
+        return [
+            FieldAggregator(PREDICTIONS, ENDPOINT_ID, ["count"], count_windows),
+            FieldAggregator(LATENCY, LATENCY, ["avg"], avg_windows),
+        ]
+
+    # a columnar event holds many rows, sum the rows (and the latency of all the rows) so that
+    # the counts and averages are per row, same as in the row mode
+    return [
+        FieldAggregator(PREDICTIONS, ROWS, ["sum"], count_windows),
+        FieldAggregator(LATENCY_TOTAL, LATENCY_TOTAL, ["sum"], avg_windows),
+        FieldAggregator(LATENCY_ROWS, ROWS, ["sum"], avg_windows),
+    ]
+
+
+class ComputeColumnarAggregations(MapClass):
+    """turn the columnar aggregation sums into the row mode counts and averages"""
+
+    def __init__(self, count_windows: List[str], avg_windows: List[str], **kwargs):
+        super().__init__(**kwargs)
+        self.count_windows = count_windows
+        self.avg_windows = avg_windows
+
+    def do(self, event: dict):
+        for window in self.count_windows:
+            event[f"{PREDICTIONS}_count_{window}"] = event.pop(
+                f"{PREDICTIONS}_sum_{window}"
+            )
+        for window in self.avg_windows:
+            latency_total = event.pop(f"{LATENCY_TOTAL}_sum_{window}")
+            rows = event.pop(f"{LATENCY_ROWS}_sum_{window}")
+            event[f"{LATENCY}_avg_{window}"] = latency_total / rows if rows else 0
+        return event
+
+
+def select_last_row(event: dict) -> dict:
+    """columnar events write a single (sampled) row to the TSDB, same as sampled row events"""
+    event = dict(event)
+    for key in [NAMED_FEATURES, NAMED_PREDICTIONS]:
+        event[key] = {name: column[-1].item() for name, column in event[key].items()}
+    return event
+
+
+def explode_columnar_event(event: dict) -> List[dict]:
+    """materialize the rows of a columnar event, as emitted in the row mode"""
+    base_event = {
+        key: value
+        for key, value in event.items()
+        if key
+        not in [
+            FEATURES,
+            PREDICTION,
+            NAMED_FEATURES,
+            NAMED_PREDICTIONS,
+            ROWS,
+            LATENCY_TOTAL,
+        ]
+    }
+    features = event[FEATURES].tolist()
+    predictions = event[PREDICTION].tolist()
+    named_features = {
+        name: column.tolist() for name, column in event[NAMED_FEATURES].items()
+    }
+    named_predictions = {
+        name: column.tolist() for name, column in event[NAMED_PREDICTIONS].items()
+    }
+    return [
+        {
+            **base_event,
+            FEATURES: features[index],
+            PREDICTION: predictions[index],
+            NAMED_FEATURES: {
+                name: column[index] for name, column in named_features.items()
+            },
+            NAMED_PREDICTIONS: {
+                name: column[index] for name, column in named_predictions.items()
+            },
+        }
+        for index in range(event[ROWS])
+    ]
+
+
 class FilterNotNone(Filter):
     def __init__(self, **kwargs):
         super().__init__(fn=lambda event: event is not None, **kwargs)
@@ -597,6 +761,7 @@ class MapFeatureNames(MapClass):
         kv_path: str,
         access_key: str,
         infer_columns_from_data: bool = False,
+        columnar: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -604,18 +769,26 @@ class MapFeatureNames(MapClass):
         self.kv_path = kv_path
         self.access_key = access_key
         self._infer_columns_from_data = infer_columns_from_data
+        self.columnar = columnar
         self.feature_names = {}
         self.label_columns = {}
 
+    def _columns_count(self, values):
+        return values.shape[1] if self.columnar else len(values)
+
     def _infer_feature_names_from_data(self, event):
         for endpoint_id in self.feature_names:
-            if len(self.feature_names[endpoint_id]) >= len(event[FEATURES]):
+            if len(self.feature_names[endpoint_id]) >= self._columns_count(
+                event[FEATURES]
+            ):
                 return self.feature_names[endpoint_id]
         return None
 
     def _infer_label_columns_from_data(self, event):
         for endpoint_id in self.label_columns:
-            if len(self.label_columns[endpoint_id]) >= len(event[PREDICTION]):
+            if len(self.label_columns[endpoint_id]) >= self._columns_count(
+                event[PREDICTION]
+            ):
                 return self.label_columns[endpoint_id]
         return None
 
@@ -643,7 +816,9 @@ class MapFeatureNames(MapClass):
                     "Feature names are not initialized, they will be automatically generated",
                     endpoint_id=endpoint_id,
                 )
-                feature_names = [f"f{i}" for i, _ in enumerate(event[FEATURES])]
+                feature_names = [
+                    f"f{i}" for i in range(self._columns_count(event[FEATURES]))
+                ]
                 get_v3io_client().kv.update(
                     container=self.kv_container,
                     table_path=self.kv_path,
@@ -661,7 +836,9 @@ class MapFeatureNames(MapClass):
                     "label column names are not initialized, they will be automatically generated",
                     endpoint_id=endpoint_id,
                 )
-                label_columns = [f"p{i}" for i, _ in enumerate(event[PREDICTION])]
+                label_columns = [
+                    f"p{i}" for i in range(self._columns_count(event[PREDICTION]))
+                ]
                 get_v3io_client().kv.update(
                     container=self.kv_container,
                     table_path=self.kv_path,
@@ -683,6 +860,21 @@ class MapFeatureNames(MapClass):
 
         feature_names = self.feature_names[endpoint_id]
         features = event[FEATURES]
+        if self.columnar:
+            # name the columns of the whole batch at once
+            event[NAMED_FEATURES] = {
+                name: features[:, index]
+                for index, name in enumerate(feature_names[: features.shape[1]])
+            }
+            prediction = event[PREDICTION]
+            event[NAMED_PREDICTIONS] = {
+                name: prediction[:, index]
+                for index, name in enumerate(
+                    self.label_columns[endpoint_id][: prediction.shape[1]]
+                )
+            }
+            return event
+
         event[NAMED_FEATURES] = {
             name: feature for name, feature in zip(feature_names, features)
         }
@@ -1133,11 +1133,17 @@ def download_object(url, target, secrets=None):
     stores.object(url=url).download(target_path=target)
 
 
-def wait_for_runs_completion(runs: list, sleep=3, timeout=0, silent=False):
+def wait_for_runs_completion(
+    runs: list, sleep=3, timeout=0, silent=False, max_sleep=30
+):
     """wait for multiple runs to complete
 
     Note: need to use `watch=False` in `.run()` so the run will not wait for completion
 
+    the states of all the runs are read in a single (bulk) db call, with the API the server waits for a state change
+    (long-poll), with other dbs the states are checked every `sleep` seconds, backing off exponentially (up to
+    `max_sleep`) while none of the runs state changes. a run is read (refreshed) only once it completes
+
     example::
 
         # run two training functions in parallel and wait for the results
@@ -1150,32 +1156,69 @@ def wait_for_runs_completion(runs: list, sleep=3, timeout=0, silent=False):
                                  'label_column': 'label'})
         completed = wait_for_runs_completion([run1, run2])
 
-    :param runs:    list of run objects (the returned values of function.run())
-    :param sleep:   time to sleep between checks (in seconds)
-    :param timeout: maximum time to wait in seconds (0 for unlimited)
-    :param silent:  set to True for silent exit on timeout
+    :param runs:      list of run objects (the returned values of function.run())
+    :param sleep:     time to sleep between checks (in seconds), when the db doesn't wait for state changes
+    :param timeout:   maximum time to wait in seconds (0 for unlimited)
+    :param silent:    set to True for silent exit on timeout
+    :param max_sleep: maximum time to sleep between checks (in seconds), when backing off
     :return: list of completed runs
     """
+    terminal_states = mlrun.runtimes.constants.RunStates.terminal_states()
     completed = []
-    total_time = 0
-    while True:
-        running = []
-        for run in runs:
-            state = run.state()
-            if state in mlrun.runtimes.constants.RunStates.terminal_states():
+    running = []
+    for run in runs:
+        if run.status.state in terminal_states:
+            completed.append(run)
+        else:
+            running.append(run)
+
+    db = get_run_db()
+    watch_wait_timeout = int(mlconf.httpdb.runs.watch_wait_timeout)
+    start_time = time.monotonic()
+    interval = sleep
+    known_states = None
+    while running:
+        # the first call only reads the states
+        wait_timeout = watch_wait_timeout if known_states is not None else 0
+        if timeout:
+            remaining = timeout - (time.monotonic() - start_time)
+            wait_timeout = max(0, min(wait_timeout, int(remaining)))
+        request_time = time.monotonic()
+        states = db.list_runs_states(
+            [
+                (run.metadata.project, run.metadata.uid, run.metadata.iteration)
+                for run in running
+            ],
+            known_states,
+            wait_timeout=wait_timeout,
+        )
+        changed = states != known_states
+        still_running = []
+        for run, state in zip(running, states):
+            if state in terminal_states or state is None:
+                # reads the full run (results, outputs), raises if the run doesn't exist
+                run.refresh()
+            if run.status.state in terminal_states:
                 completed.append(run)
             else:
-                running.append(run)
-        if len(running) == 0:
+                run.status.state = state
+                still_running.append(run)
+        running = still_running
+        known_states = [run.status.state for run in running]
+        if not running:
             break
-        time.sleep(sleep)
-        total_time += sleep
-        if timeout and total_time > timeout:
+
+        if timeout and time.monotonic() - start_time > timeout:
             if silent:
                 break
             raise mlrun.errors.MLRunTimeoutError(
                 "some runs did not reach terminal state on time"
             )
-        runs = running
+        if changed:
+            interval = sleep
+        elif time.monotonic() - request_time < wait_timeout or not wait_timeout:
+            # the db responded without waiting for a change
+            time.sleep(interval)
+            interval = min(interval * 2, max_sleep)
 
     return completed
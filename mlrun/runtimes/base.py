@@ -68,7 +68,7 @@ from ..utils import (
 )
 from .constants import PodPhases, RunStates
 from .funcdoc import update_function_entry_points
-from .generators import get_generator
+from .generators import get_generator, wait_for_results
 from .utils import RunError, calc_hash, results_to_iter
 
 run_modes = ["pass"]
@@ -627,10 +627,14 @@ class BaseRuntime(ModelObj):
         num_errors = 0
         tasks = generator.generate(runobj)
         for task in tasks:
+            if task is wait_for_results:
+                # the iterations run one by one, the results were already recorded
+                continue
             try:
                 self.store_run(task)
                 resp = self._run(task, execution)
                 resp = self._update_run_state(resp, task=task)
+                generator.record_result(resp)
                 run_results = resp["status"].get("results", {})
                 if generator.eval_stop_condition(run_results):
                     logger.info(
@@ -643,6 +647,7 @@ class BaseRuntime(ModelObj):
                 task.status.state = "error"
                 task.status.error = str(err)
                 resp = self._update_run_state(task=task, err=err)
+                generator.record_result(resp)
                 num_errors += 1
                 if num_errors > generator.max_errors:
                     logger.error("too many errors, stopping iterations!")
@@ -1077,7 +1082,17 @@ class BaseRuntimeHandler(ABC):
         )
         self.delete_resources(db, db_session, label_selector, force, grace_period)
 
-    def monitor_runs(self, db: DBInterface, db_session: Session):
+    def monitor_runs(
+        self,
+        db: DBInterface,
+        db_session: Session,
+        project_run_uid_map: Optional[Dict] = None,
+    ):
+        """
+        :param project_run_uid_map: Snapshot of the runs to monitor (see list_runs_for_monitoring), when monitoring
+            several runtime kinds in the same cycle the snapshot should be created once and shared between them. When
+            not given, a new snapshot will be created
+        """
         k8s_helper = get_k8s_helper()
         namespace = k8s_helper.resolve_namespace()
         label_selector = self._get_default_label_selector()
@@ -1088,7 +1103,8 @@ class BaseRuntimeHandler(ABC):
             runtime_resources = self._list_crd_objects(namespace, label_selector)
         else:
             runtime_resources = self._list_pods(namespace, label_selector)
-        project_run_uid_map = self._list_runs_for_monitoring(db, db_session)
+        if project_run_uid_map is None:
+            project_run_uid_map = self.list_runs_for_monitoring(db, db_session)
         for runtime_resource in runtime_resources:
             try:
                 self._monitor_runtime_resource(
@@ -1604,10 +1620,16 @@ class BaseRuntimeHandler(ABC):
 
         return True, last_update
 
-    def _list_runs_for_monitoring(
-        self, db: DBInterface, db_session: Session,
-    ):
-        runs = db.list_runs(db_session, project="*")
+    @staticmethod
+    def list_runs_for_monitoring(
+        db: DBInterface, db_session: Session, updated_after: datetime = None,
+    ) -> Dict:
+        """
+        Build the project -> uid -> run map used by monitor_runs. Only runs that monitoring may change are loaded - runs
+        in non-terminal state, and runs that were updated after the given time (e.g. the start of the previous cycle),
+        runs that are missing from it are read one by one when a runtime resource related to them is found
+        """
+        runs = db.list_runs_for_monitoring(db_session, updated_after)
         project_run_uid_map = {}
         run_with_missing_data = []
         duplicated_runs = []
@@ -1669,6 +1691,13 @@ class BaseRuntimeHandler(ABC):
             # )
             return
         run = project_run_uid_map.get(project, {}).get(uid)
+        if run is None:
+            # the map holds only the runs that may still change, a run that isn't there might have reached terminal
+            # state long ago while its runtime resource wasn't removed yet
+            try:
+                run = db.read_run(db_session, uid, project)
+            except mlrun.errors.MLRunNotFoundError:
+                run = None
         if runtime_resource_is_crd:
             (_, _, run_state,) = self._resolve_crd_object_status_info(
                 db, db_session, runtime_resource
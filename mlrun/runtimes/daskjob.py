@@ -567,7 +567,10 @@ class DaskRuntimeHandler(BaseRuntimeHandler):
     # It means that monitoring runtime resources state doesn't say anything about the run state.
     # Therefore dask run monitoring is done completely by the SDK, so overriding the monitoring method with no logic
     def monitor_runs(
-        self, db: DBInterface, db_session: Session, leader_session: Optional[str] = None
+        self,
+        db: DBInterface,
+        db_session: Session,
+        project_run_uid_map: Optional[Dict] = None,
     ):
         return
 
@@ -41,6 +41,7 @@ from ..platforms.iguazio import mount_v3io, parse_v3io_path, split_path, v3io_cr
 from ..utils import enrich_image_url, get_in, logger, update_in
 from .base import FunctionStatus, RunError
 from .constants import NuclioIngressAddTemplatedIngressModes
+from .generators import wait_for_results
 from .pod import KubeResource, KubeResourceSpec
 from .utils import get_item_name, log_std
 
@@ -792,7 +793,7 @@ class RemoteRuntime(KubeResource):
             command = f"{command}/{runobj.spec.handler_name}"
         loop = asyncio.get_event_loop()
         future = asyncio.ensure_future(
-            self._invoke_async(tasks, command, headers, secrets)
+            self._invoke_async(tasks, command, headers, secrets, generator=generator)
         )
 
         loop.run_until_complete(future)
@@ -805,25 +806,36 @@ class RemoteRuntime(KubeResource):
         self._store_run_dict(rundict)
         return rundict
 
-    async def _invoke_async(self, runs, url, headers, secrets):
+    async def _invoke_async(self, runs, url, headers, secrets, generator=None):
         results = RunList()
         tasks = []
 
-        async with ClientSession() as session:
-            for run in runs:
-                self.store_run(run)
-                run.spec.secret_sources = secrets or []
-                tasks.append(asyncio.ensure_future(submit(session, url, run, headers),))
-
+        async def process_tasks():
             for status, resp, logs, run in await asyncio.gather(*tasks):
 
                 if status != 200:
                     logger.error(f"failed to access {url} - {resp}")
                 else:
-                    results.append(self._update_state(json.loads(resp)))
+                    result = self._update_state(json.loads(resp))
+                    results.append(result)
+                    if generator:
+                        generator.record_result(result)
 
                 if logs:
                     log_std(self._db_conn, run, parse_logs(logs))
+            tasks.clear()
+
+        async with ClientSession() as session:
+            for run in runs:
+                if run is wait_for_results:
+                    # the next runs depend on the results of the submitted ones
+                    await process_tasks()
+                    continue
+                self.store_run(run)
+                run.spec.secret_sources = secrets or []
+                tasks.append(asyncio.ensure_future(submit(session, url, run, headers),))
+
+            await process_tasks()
 
         return results
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
+import math
 import random
 import sys
 from copy import deepcopy
@@ -21,9 +22,20 @@ import pandas as pd
 from ..model import HyperParamOptions, RunObject, RunSpec
 from ..utils import get_in
 
-hyper_types = ["list", "grid", "random"]
+hyper_types = ["list", "grid", "random", "halving", "hyperband", "bayesian"]
 default_max_iterations = 10
 default_max_errors = 3
+default_reduction_factor = 3
+
+
+class _WaitForResults:
+    def __repr__(self):
+        return "wait_for_results"
+
+
+# yielded by the adaptive generators when the next tasks depend on the results of the submitted ones, the runners
+# wait for the submitted tasks to complete (and record their results) before taking the next task
+wait_for_results = _WaitForResults()
 
 
 def get_generator(spec: RunSpec, execution):
@@ -31,6 +43,7 @@ def get_generator(spec: RunSpec, execution):
     strategy = spec.strategy or options.strategy
     if not spec.is_hyper_job() or strategy == "custom":
         return None
+    options.selector = options.selector or spec.selector
     options.validate()
     hyperparams = spec.hyperparams
     param_file = spec.param_file or options.param_file
@@ -40,7 +53,6 @@ def get_generator(spec: RunSpec, execution):
     if param_file and hyperparams:
         raise ValueError("hyperparams and param_file cannot be used together")
 
-    options.selector = options.selector or spec.selector
     if options.selector:
         parse_selector(options.selector)
 
@@ -49,7 +61,7 @@ def get_generator(spec: RunSpec, execution):
         obj = execution.get_dataitem(param_file)
         if not strategy and obj.suffix == ".csv":
             strategy = "list"
-        if not strategy or strategy in ["grid", "random"]:
+        if not strategy or strategy != "list":
             hyperparams = json.loads(obj.get())
 
     if not strategy or strategy == "grid":
@@ -58,6 +70,14 @@ def get_generator(spec: RunSpec, execution):
     if strategy == "random":
         return RandomGenerator(hyperparams, options)
 
+    if strategy in ["halving", "hyperband"]:
+        return SuccessiveHalvingGenerator(
+            hyperparams, options, hyperband=strategy == "hyperband"
+        )
+
+    if strategy == "bayesian":
+        return BayesianGenerator(hyperparams, options)
+
     if obj:
         df = obj.as_df()
     else:
@@ -83,6 +103,11 @@ class TaskGenerator:
     def generate(self, run: RunObject):
         pass
 
+    def record_result(self, result: dict):
+        """called by the runners with each completed iteration (run dict, also of failed iterations),
+        adaptive generators pick the next tasks by the results"""
+        pass
+
     def eval_stop_condition(self, results) -> bool:
         if not self.options.stop_condition:
             return False
@@ -95,18 +120,13 @@ class GridGenerator(TaskGenerator):
         self.hyperparams = hyperparams
 
     def generate(self, run: RunObject):
-        i = 0
-        params = self.grid_to_list()
-        max = len(next(iter(params.values())))
-
-        while i < max:
+        # the combinations are generated lazily, the grid (cartesian product) is not expanded in memory
+        for i in range(grid_size(self.hyperparams)):
             newrun = get_run_copy(run)
             param_dict = newrun.spec.parameters or {}
-            for key, values in params.items():
-                param_dict[key] = values[i]
+            param_dict.update(grid_combination(self.hyperparams, i))
             newrun.spec.parameters = param_dict
             newrun.metadata.iteration = i + 1
-            i += 1
             yield newrun
 
     def grid_to_list(self):
@@ -162,11 +182,283 @@ class ListGenerator(TaskGenerator):
             yield newrun
 
 
+def grid_size(hyperparams: dict) -> int:
+    """number of combinations (cartesian product size) of the hyper params grid"""
+    size = 1
+    for values in hyperparams.values():
+        size *= len(values)
+    return size
+
+
+def grid_combination(hyperparams: dict, index: int) -> dict:
+    """the params of the grid combination at the index (the first param changes fastest), without expanding
+    the grid"""
+    params = {}
+    for key, values in hyperparams.items():
+        index, position = divmod(index, len(values))
+        params[key] = values[position]
+    return params
+
+
+class _AdaptiveGenerator(TaskGenerator):
+    """base for the generators which pick the next tasks by the (selector) results of the completed ones"""
+
+    def __init__(self, hyperparams: dict, options=None):
+        super().__init__(options)
+        self.hyperparams = hyperparams
+        if not options.selector:
+            raise ValueError(f"a selector is required in {options.strategy} strategy")
+        self._op, self._criteria = parse_selector(options.selector)
+        self._iteration = 0
+        # iteration -> selector result (None for failed iterations or missing results)
+        self._scores = {}
+
+    def record_result(self, result: dict):
+        if not result:
+            return
+        iteration = get_in(result, "metadata.iteration")
+        value = get_in(result, ["status", "results", self._criteria])
+        if get_in(result, "status.state") == "error":
+            value = None
+        try:
+            value = float(value) if value is not None else None
+        except (TypeError, ValueError):
+            value = None
+        self._scores[iteration] = value
+
+    def _score(self, iteration):
+        """comparable score of the iteration (higher is better), None if it has no result"""
+        value = self._scores.get(iteration)
+        if value is None:
+            return None
+        return value if self._op == "max" else -value
+
+    def _rank(self, candidates):
+        """sort (iteration, params) candidates best first, the ones without result last"""
+        return sorted(
+            candidates,
+            key=lambda candidate: (
+                self._score(candidate[0]) is None,
+                -(self._score(candidate[0]) or 0),
+            ),
+        )
+
+    def _new_task(self, run: RunObject, params: dict) -> RunObject:
+        newrun = get_run_copy(run)
+        param_dict = newrun.spec.parameters or {}
+        param_dict.update(params)
+        newrun.spec.parameters = param_dict
+        self._iteration += 1
+        newrun.metadata.iteration = self._iteration
+        return newrun
+
+    def _sample(self, count: int, exclude=None) -> list:
+        """sample up to count distinct grid combinations (indexes), without expanding the grid"""
+        size = grid_size(self.hyperparams)
+        exclude = exclude or {}
+        count = min(count, size - len(exclude))
+        if count <= 0:
+            return []
+        if not exclude:
+            return random.sample(range(size), count)
+        if len(exclude) > size // 2:
+            return random.sample(
+                [index for index in range(size) if index not in exclude], count
+            )
+        sampled = []
+        while len(sampled) < count:
+            index = random.randrange(size)
+            if index not in exclude and index not in sampled:
+                sampled.append(index)
+        return sampled
+
+
+class SuccessiveHalvingGenerator(_AdaptiveGenerator):
+    """successive halving - run the configurations with a small budget (the resource_param, e.g. epochs), keep the
+    best 1/reduction_factor of them (by the selector result logged with log_result) and run those again with
+    reduction_factor times the budget, up to max_resource
+
+    the configurations are the grid combinations, or max_iterations random ones, with hyperband=True runs several
+    successive halving brackets, from many configurations with min_resource to a few with max_resource
+    """
+
+    def __init__(self, hyperparams: dict, options=None, hyperband=False):
+        super().__init__(hyperparams, options)
+        if not options.resource_param or not options.max_resource:
+            raise ValueError(
+                f"resource_param and max_resource are required in {options.strategy} strategy"
+            )
+        self.hyperband = hyperband
+        self.resource_param = options.resource_param
+        self.max_resource = options.max_resource
+        self.min_resource = options.min_resource or 1
+        self.reduction_factor = options.reduction_factor or default_reduction_factor
+        if self.reduction_factor < 2 or self.min_resource > self.max_resource:
+            raise ValueError(
+                "reduction_factor must be >= 2 and min_resource <= max_resource"
+            )
+
+    def generate(self, run: RunObject):
+        if not self.hyperband:
+            if self.options.max_iterations:
+                configs = self._sample(self.options.max_iterations)
+            else:
+                configs = range(grid_size(self.hyperparams))
+            yield from self._halving(run, configs, self.min_resource)
+            return
+
+        # hyperband brackets, from the most configurations with the lowest budget to the fewest with the max budget
+        brackets = 0
+        while (
+            self.min_resource * self.reduction_factor ** (brackets + 1)
+            <= self.max_resource
+        ):
+            brackets += 1
+        for bracket in range(brackets, -1, -1):
+            count = math.ceil(
+                (brackets + 1) / (bracket + 1) * self.reduction_factor ** bracket
+            )
+            resource = self.max_resource / self.reduction_factor ** bracket
+            yield from self._halving(run, self._sample(count), resource)
+
+    def _halving(self, run: RunObject, configs, resource):
+        configs = list(configs)
+        while configs:
+            rung = []
+            for index in configs:
+                params = grid_combination(self.hyperparams, index)
+                params[self.resource_param] = self._resource_value(resource)
+                task = self._new_task(run, params)
+                rung.append((task.metadata.iteration, index))
+                yield task
+            yield wait_for_results
+
+            if resource >= self.max_resource or len(configs) <= 1:
+                return
+            keep = max(1, len(configs) // self.reduction_factor)
+            configs = [index for _, index in self._rank(rung)[:keep]]
+            resource = min(resource * self.reduction_factor, self.max_resource)
+
+    def _resource_value(self, resource):
+        if isinstance(self.min_resource, int) and isinstance(self.max_resource, int):
+            return int(round(resource))
+        return resource
+
+
+class BayesianGenerator(_AdaptiveGenerator):
+    """sequential model based optimization over the hyper params values (lists, as in the grid strategy)
+
+    starts with random configurations, then picks the configurations most likely to improve the selector result
+    by a tree-structured parzen estimator - the observed iterations are split to the best (top quarter) and the
+    rest, and candidates are ranked by the ratio of their values frequencies in the two groups
+    runs max_iterations configurations, in batches of parallel_runs (each batch waits for the previous results)
+    """
+
+    gamma = 0.25
+    candidates_count = 24
+
+    def __init__(self, hyperparams: dict, options=None):
+        super().__init__(hyperparams, options)
+        self.batch_size = options.parallel_runs or 1
+        self.initial_count = min(self.max_iterations, max(self.batch_size, 5))
+
+    def generate(self, run: RunObject):
+        tried = {}
+        while self._iteration < self.max_iterations:
+            count = min(self.batch_size, self.max_iterations - self._iteration)
+            if self._iteration < self.initial_count:
+                count = min(count, self.initial_count - self._iteration)
+                batch = self._sample(count, exclude=tried)
+            else:
+                batch = self._suggest(count, tried)
+            if not batch:
+                # all the combinations were tried
+                return
+            for index in batch:
+                task = self._new_task(run, grid_combination(self.hyperparams, index))
+                tried[index] = task.metadata.iteration
+                yield task
+            yield wait_for_results
+
+    def _suggest(self, count: int, tried: dict) -> list:
+        observed = self._rank(
+            [(iteration, index) for index, iteration in tried.items()]
+        )
+        good_count = max(1, math.ceil(self.gamma * len(observed)))
+        good = [index for _, index in observed[:good_count]]
+        bad = [index for _, index in observed[good_count:]]
+
+        # per param, the smoothed frequencies of the values (positions) in the good and bad groups
+        densities = []
+        for key, values in self.hyperparams.items():
+            good_counts = [1.0] * len(values)
+            bad_counts = [1.0] * len(values)
+            for group, counts in [(good, good_counts), (bad, bad_counts)]:
+                for index in group:
+                    counts[self._position(index, key)] += 1
+            densities.append(
+                (
+                    [c / sum(good_counts) for c in good_counts],
+                    [c / sum(bad_counts) for c in bad_counts],
+                )
+            )
+
+        suggested = []
+        for _ in range(count):
+            best, best_ratio = None, None
+            for _ in range(self.candidates_count):
+                positions = [
+                    random.choices(range(len(good_density)), weights=good_density)[0]
+                    for good_density, _ in densities
+                ]
+                index = self._index(positions)
+                if index in tried or index in suggested:
+                    continue
+                ratio = 1.0
+                for position, (good_density, bad_density) in zip(positions, densities):
+                    ratio *= good_density[position] / bad_density[position]
+                if best_ratio is None or ratio > best_ratio:
+                    best, best_ratio = index, ratio
+            if best is None:
+                # the sampled candidates were all tried, fall back to a random untried one
+                remaining = self._sample(1, exclude=set(tried) | set(suggested))
+                if not remaining:
+                    break
+                best = remaining[0]
+            suggested.append(best)
+        return suggested
+
+    def _position(self, index: int, key: str) -> int:
+        for param, values in self.hyperparams.items():
+            index, position = divmod(index, len(values))
+            if param == key:
+                return position
+
+    def _index(self, positions: list) -> int:
+        index, multiplier = 0, 1
+        for position, values in zip(positions, self.hyperparams.values()):
+            index += position * multiplier
+            multiplier *= len(values)
+        return index
+
+
 def get_run_copy(run):
-    newrun = deepcopy(run)
-    newrun.spec.hyperparams = None
-    newrun.spec.param_file = None
-    newrun.spec.hyper_param_options = None
+    # the hyper params (which can be large) are detached while copying, the child runs don't have them
+    spec = run.spec
+    hyperparams, param_file, options = (
+        spec.hyperparams,
+        spec.param_file,
+        spec._hyper_param_options,
+    )
+    spec.hyperparams = spec.param_file = spec._hyper_param_options = None
+    try:
+        newrun = deepcopy(run)
+    finally:
+        spec.hyperparams, spec.param_file, spec._hyper_param_options = (
+            hyperparams,
+            param_file,
+            options,
+        )
     return newrun
 
 
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import functools
 import importlib.util as imputil
 import inspect
 import json
@@ -20,8 +22,9 @@ import shlex
 import socket
 import sys
 import tempfile
+import threading
 import traceback
-from contextlib import redirect_stdout
+from contextlib import contextmanager, redirect_stdout
 from copy import copy
 from io import StringIO
 from os import environ, remove
@@ -29,6 +32,7 @@ from pathlib import Path
 from subprocess import PIPE, Popen
 from sys import executable
 
+import cloudpickle
 from distributed import Client, as_completed
 from nuclio import Event
 
@@ -36,13 +40,14 @@ import mlrun
 from mlrun.lists import RunList
 
 from ..execution import MLClientCtx
-from ..model import RunObject
-from ..utils import logger
+from ..model import HyperParamExecutors, RunObject
+from ..utils import logger, now_date, update_in
 from ..utils.clones import extract_source
 from .base import BaseRuntime
+from .generators import wait_for_results
 from .kubejob import KubejobRuntime
 from .remotesparkjob import RemoteSparkRuntime
-from .utils import RunError, global_context, log_std
+from .utils import BatchRunsWriter, RunError, global_context, log_std
 
 
 class ParallelRunner:
@@ -58,6 +63,17 @@ class ParallelRunner:
     def _parallel_run_many(
         self, generator, execution: MLClientCtx, runobj: RunObject
     ) -> RunList:
+        options = generator.options
+        executor = options.parallel_executor
+        if not executor:
+            executor = (
+                HyperParamExecutors.dask
+                if options.dask_cluster_uri
+                else mlrun.mlconf.hyper_params.parallel_executor
+            )
+        if executor != HyperParamExecutors.dask:
+            return self._pool_run_many(generator, execution, runobj, executor)
+
         results = RunList()
         tasks = generator.generate(runobj)
         handler = runobj.spec.handler
@@ -80,6 +96,7 @@ class ParallelRunner:
             except RunError as err:
                 resp = self._update_run_state(resp, err=str(err))
                 num_errors += 1
+            generator.record_result(resp)
             results.append(resp)
             if num_errors > generator.max_errors:
                 logger.error("max errors reached, stopping iterations!")
@@ -94,6 +111,14 @@ class ParallelRunner:
 
         completed_iter = as_completed([])
         for task in tasks:
+            if task is wait_for_results:
+                early_stop = False
+                for future in completed_iter:
+                    early_stop = process_result(future) or early_stop
+                queued_runs = 0
+                if early_stop:
+                    break
+                continue
             resp = client.submit(
                 remote_handler_wrapper, task.to_json(), handler, self.spec.workdir
             )
@@ -118,12 +143,135 @@ class ParallelRunner:
 
         return results
 
+    def _pool_run_many(
+        self, generator, execution: MLClientCtx, runobj: RunObject, executor: str
+    ) -> RunList:
+        """run the iterations in a local process or thread pool (no dask), up to parallel_runs at a time
+
+        the iterations results and logs are written to the db in batches, on early stop (stop condition or max
+        errors) the queued iterations are cancelled and only the ones already running are waited for
+        """
+        results = RunList()
+        tasks = generator.generate(runobj)
+        handler = runobj.spec.handler
+        self._force_handler(handler)
+        set_paths(self.spec.pythonpath)
+        _, handler = self._get_handler(handler)
+
+        parallel_runs = generator.options.parallel_runs or 4
+        writer = BatchRunsWriter(self._get_db())
+        num_errors = 0
+        stopped = False
 
-def remote_handler_wrapper(task, handler, workdir=None):
+        def process_result(future, task):
+            nonlocal num_errors, stopped
+            if future.cancelled():
+                return
+            try:
+                resp, sout, serr = future.result()
+                log_std(
+                    writer, RunObject.from_dict(resp), sout, serr, skip=self.is_child
+                )
+            except Exception as err:
+                if not isinstance(err, RunError):
+                    task.status.state = "error"
+                    task.status.error = str(err)
+                    resp = task.to_dict()
+                update_in(resp, "status.state", "error")
+                update_in(resp, "status.error", str(err))
+                num_errors += 1
+            update_in(resp, "status.last_update", now_date().isoformat())
+            writer.store_run(resp)
+            generator.record_result(resp)
+            results.append(resp)
+            if stopped:
+                return
+
+            if num_errors > generator.max_errors:
+                logger.error("max errors reached, stopping iterations!")
+                stopped = True
+            elif resp["status"].get("state") != "error":
+                run_results = resp["status"].get("results", {})
+                if generator.eval_stop_condition(run_results):
+                    logger.info(
+                        f"reached early stop condition ({generator.options.stop_condition}), stopping iterations!"
+                    )
+                    stopped = True
+
+        if executor == HyperParamExecutors.thread:
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=parallel_runs)
+            run_task = functools.partial(
+                remote_handler_wrapper, handler=handler, store_run=False
+            )
+            stdout = _ThreadStdout(sys.stdout)
+        else:
+            pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=parallel_runs,
+                initializer=_init_pool_worker,
+                initargs=(cloudpickle.dumps(handler), self.spec.workdir),
+            )
+            run_task = _run_pool_task
+            stdout = sys.stdout
+
+        old_dir = os.getcwd()
+        pending = {}
+        try:
+            if executor == HyperParamExecutors.thread and self.spec.workdir:
+                # the (process wide) working dir is set once for all the threads
+                os.chdir(self.spec.workdir)
+            with pool, redirect_stdout(stdout):
+                for task in tasks:
+                    if task is wait_for_results:
+                        for future in concurrent.futures.as_completed(pending):
+                            process_result(future, pending[future])
+                        pending = {}
+                        if stopped:
+                            break
+                        continue
+                    pending[pool.submit(run_task, task.to_dict())] = task
+                    while len(pending) >= parallel_runs and not stopped:
+                        done, _ = concurrent.futures.wait(
+                            pending, return_when=concurrent.futures.FIRST_COMPLETED
+                        )
+                        for future in done:
+                            process_result(future, pending.pop(future))
+                    if stopped:
+                        break
+
+                if stopped:
+                    for future in pending:
+                        future.cancel()
+                for future in concurrent.futures.as_completed(pending):
+                    process_result(future, pending[future])
+        finally:
+            os.chdir(old_dir)
+            writer.flush()
+
+        return results
+
+
+# the handler and workdir of the process pool workers, set by the pool initializer
+_pool_handler = None
+_pool_workdir = None
+
+
+def _init_pool_worker(handler, workdir):
+    global _pool_handler, _pool_workdir
+    _pool_handler = cloudpickle.loads(handler)
+    _pool_workdir = workdir
+
+
+def _run_pool_task(task):
+    return remote_handler_wrapper(task, _pool_handler, _pool_workdir, store_run=False)
+
+
+def remote_handler_wrapper(task, handler, workdir=None, store_run=True):
     if task and not isinstance(task, dict):
         task = json.loads(task)
 
-    context = MLClientCtx.from_dict(task, autocommit=False, host=socket.gethostname(),)
+    context = MLClientCtx.from_dict(
+        task, autocommit=False, host=socket.gethostname(), store_run=store_run
+    )
     runobj = RunObject.from_dict(task)
 
     sout, serr = exec_from_params(handler, runobj, context, workdir)
@@ -334,9 +482,46 @@ def run_exec(cmd, args, env=None, cwd=None):
     return out, err
 
 
+class _ThreadStdout(object):
+    """sys.stdout of handlers running in a thread pool, writes to the stream set for the current thread
+    (by _redirect_stdout), redirect_stdout() is process wide and can't be used concurrently"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def _current(self):
+        return getattr(self.local, "stream", None) or self.stream
+
+    def write(self, message):
+        return self._current().write(message)
+
+    def flush(self):
+        self._current().flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+@contextmanager
+def _redirect_stdout(stream):
+    if not isinstance(sys.stdout, _ThreadStdout):
+        with redirect_stdout(stream):
+            yield
+        return
+    thread_stdout = sys.stdout
+    thread_stdout.local.stream = stream
+    try:
+        yield
+    finally:
+        thread_stdout.local.stream = None
+
+
 class _DupStdout(object):
     def __init__(self):
         self.terminal = sys.stdout
+        if isinstance(self.terminal, _ThreadStdout):
+            self.terminal = self.terminal.stream
         self.buf = StringIO()
 
     def write(self, message):
@@ -357,7 +542,7 @@ def exec_from_params(handler, runobj: RunObject, context: MLClientCtx, cwd=None)
     err = ""
     val = None
     old_dir = os.getcwd()
-    with redirect_stdout(stdout):
+    with _redirect_stdout(stdout):
         context.set_logger_stream(stdout)
         try:
             if cwd:
@@ -82,4 +82,6 @@ def nuclio_jobs_handler(context, event):
     except Exception as exc:
         err = str(exc)
         ctx.set_state(error=err)
+    # the caller stores the returned run, pending (write-behind) updates are written before
+    ctx._flush_updates()
     return ctx.to_json()
@@ -168,6 +168,41 @@ class AsyncLogWriter:
         pass
 
 
+class BatchRunsWriter:
+    """buffers child runs and their logs (e.g. of hyper param iterations) and writes them to the db in batches,
+    the logs are appended in one write per run uid, the runs with db.store_runs()
+
+    has the db store_log() signature, so it can be passed to log_std() instead of the db
+    """
+
+    def __init__(self, db, batch_size: int = None):
+        self.db = db
+        self.batch_size = int(batch_size or config.hyper_params.db_batch_size)
+        self._runs = []
+        self._logs = {}
+
+    def __bool__(self):
+        return bool(self.db)
+
+    def store_log(self, uid, project="", body=None, append=False):
+        self._logs.setdefault((uid, project), []).append(body or b"")
+
+    def store_run(self, run: dict):
+        self._runs.append(run)
+        if len(self._runs) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        runs, self._runs = self._runs, []
+        logs, self._logs = self._logs, {}
+        if not self.db:
+            return
+        for (uid, project), bodies in logs.items():
+            self.db.store_log(uid, project, b"".join(bodies), append=True)
+        if runs:
+            self.db.store_runs(runs)
+
+
 def add_code_metadata(path=""):
     if path:
         if "://" in path:
@@ -12,15 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import concurrent
+import asyncio
+import concurrent.futures
 import copy
 import json
+import time
 import traceback
 from enum import Enum
 from io import BytesIO
 
 import numpy as np
-from numpy.core.fromnumeric import mean
 
 import mlrun
 from mlrun.utils import logger, now_date, parse_versioned_object_uri
@@ -216,6 +217,9 @@ class VotingEnsemble(BaseModelRouter):
         vote_type=None,
         executor_type=None,
         prediction_col_name=None,
+        first_k: int = None,
+        timeout: float = None,
+        max_workers: int = None,
         **kwargs,
     ):
         """Voting Ensemble
@@ -295,13 +299,28 @@ class VotingEnsemble(BaseModelRouter):
                 - float prediction type: regression
                 - int prediction type: classification
         executor_type : str, optional
-            Parallelism mechanism, out of `ParallelRunnerModes`, by default `threads`
+            Parallelism mechanism, out of `ParallelRunnerModes`, by default `thread`.
+            The thread pool is created once (on `post_init`) and reused by all the requests.
+            When the ensemble runs in an async graph (`engine="async"`) the models are
+            fanned out with asyncio (on the same thread pool) without blocking the event loop.
         prediction_col_name: str, optional
             The dict key for the predictions column in the model's responses output.
             Example: If the model returns
                     {id: <id>, model_name: <name>, outputs: {..., prediction: [<predictions>], ...}}
                     the prediction_col_name should be `prediction`.
             by default, `prediction`
+        first_k : int, optional
+            Vote as soon as `first_k` models responded instead of waiting for all the models
+            (thread/async fan-out only), by default None (wait for all the models)
+        timeout : float, optional
+            Latency budget in seconds, vote on the models which responded within it
+            (thread/async fan-out only), by default None (no timeout).
+            The budget starts when the event arrives, so it also bounds the time models wait for a free
+            pool thread. Models which didn't start by the deadline are cancelled, models which are already
+            running can't be stopped, they keep their pool thread until they return
+        max_workers : int, optional
+            Size of the thread pool shared by all the events, by default the number of models times 4
+            (4 concurrent events fanned out without waiting for each other)
         """
         super().__init__(
             context, name, routes, protocol, url_prefix, health_prefix, **kwargs
@@ -309,7 +328,11 @@ class VotingEnsemble(BaseModelRouter):
         self.name = name or "VotingEnsemble"
         self.vote_type = vote_type
         self.vote_flag = True if self.vote_type is not None else False
-        self.executor_type = executor_type
+        self.executor_type = executor_type or ParallelRunnerModes.thread
+        self.first_k = first_k
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._executor = None
         self._model_logger = (
             _ModelLogPusher(self, context) if context.stream.enabled else None
         )
@@ -319,6 +342,7 @@ class VotingEnsemble(BaseModelRouter):
         self.format_response_with_col_name_flag = False
 
     def post_init(self, mode="sync"):
+        self._get_executor()
         server = getattr(self.context, "_server", None) or getattr(
             self.context, "server", None
         )
@@ -414,31 +438,36 @@ class VotingEnsemble(BaseModelRouter):
         return model, None, subpath
 
     def _max_vote(self, all_predictions):
-        """Returns most predicted class for each event
+        """Returns most predicted class for each event, ties are broken in favor of the smallest class
 
         Args:
-            all_predictions (List[List[Int]]): The predictions from all models, per event
+            all_predictions (np.ndarray): The int predictions from all models, per event (# samples, # predictors)
 
         Returns:
             List[Int]: The most predicted class by all models, per event
         """
-        return [
-            max(predictions, key=predictions.count) for predictions in all_predictions
-        ]
+        all_predictions = np.asarray(all_predictions, dtype=int)
+        samples_count = all_predictions.shape[0]
+        classes, class_indices = np.unique(all_predictions, return_inverse=True)
+
+        # count the votes of each class per sample in a single (# samples, # classes) histogram
+        sample_offsets = np.arange(samples_count)[:, np.newaxis] * len(classes)
+        class_indices = class_indices.reshape(all_predictions.shape) + sample_offsets
+        votes = np.bincount(
+            class_indices.ravel(), minlength=samples_count * len(classes)
+        ).reshape(samples_count, len(classes))
+        return classes[votes.argmax(axis=1)].tolist()
 
     def _mean_vote(self, all_predictions):
         """Returns mean of the predictions
 
         Args:
-            all_predictions (List[List[float]]): The predictions from all models, per event
+            all_predictions (np.ndarray): The predictions from all models, per event (# samples, # predictors)
 
         Returns:
             List[Float]: The mean of predictions from all models, per event
         """
-        return [mean(predictions) for predictions in all_predictions]
-
-    def _is_int(self, value):
-        return float(value).is_integer()
+        return np.mean(all_predictions, axis=1).tolist()
 
     def logic(self, predictions):
         self.context.logger.debug(f"Applying logic to {predictions}")
@@ -446,15 +475,7 @@ class VotingEnsemble(BaseModelRouter):
         if not self.vote_flag:
             # Are we dealing with an All-Int predictions
             # e.g. Classification
-            if all(
-                [
-                    all(response)
-                    for response in [
-                        list(map(self._is_int, prediction_array))
-                        for prediction_array in predictions
-                    ]
-                ]
-            ):
+            if np.all(np.mod(predictions, 1) == 0):
                 self.vote_type = VotingTypes.classification
             # Do we have `float` predictions
             # e.g. Regression
@@ -466,10 +487,7 @@ class VotingEnsemble(BaseModelRouter):
 
         # Apply voting logic
         if self.vote_type == VotingTypes.classification:
-            int_predictions = [
-                list(map(int, sample_predictions)) for sample_predictions in predictions
-            ]
-            votes = self._max_vote(int_predictions)
+            votes = self._max_vote(np.asarray(predictions).astype(int))
         else:
             votes = self._mean_vote(predictions)
 
@@ -490,13 +508,8 @@ class VotingEnsemble(BaseModelRouter):
             List of the resulting voted predictions
         """
 
-        # Flatten predictions by sample instead of by model as received
-        flattened_predictions = [
-            [predictions[j][i] for j in range(len(predictions))]
-            for i in range(len(predictions[0]))
-        ]
-
-        return self.logic(flattened_predictions)
+        # Transpose the (# predictors, # samples) predictions to be by sample instead of by model as received
+        return self.logic(np.asarray(predictions, dtype=float).T)
 
     def do_event(self, event, *args, **kwargs):
         """Handles incoming requests.
@@ -512,53 +525,102 @@ class VotingEnsemble(BaseModelRouter):
             Event response after running the requested logic
         """
         start = now_date()
+        event, name, route, request = self._route_event(event)
+        if name is None:
+            return event
+
+        # If this is a Router Operation
+        if name == self.name:
+            predictions = self._parallel_run(event, self.executor_type)
+            response = self._build_ensemble_response(event, predictions)
+        # A specific model event
+        else:
+            response = route.run(event)
+            event.body = response.body if response else None
+
+        return self._postprocess_response(start, request, response)
 
+    async def do_event_async(self, event, *args, **kwargs):
+        """Handles incoming requests in async graphs, same as `do_event()` but the models are
+        run on the thread pool without blocking the event loop.
+
+        Parameters
+        ----------
+        event : nuclio.Event
+            Incoming request as a nuclio.Event.
+
+        Returns
+        -------
+        Response
+            Event response after running the requested logic
+        """
+        start = now_date()
+        event, name, route, request = self._route_event(event)
+        if name is None:
+            return event
+
+        if name == self.name:
+            predictions = await self._async_parallel_run(event)
+            response = self._build_ensemble_response(event, predictions)
+        else:
+            response = await asyncio.get_event_loop().run_in_executor(
+                self._get_executor(), route.run, event
+            )
+            event.body = response.body if response else None
+
+        return self._postprocess_response(start, request, response)
+
+    def _route_event(self, event):
+        """Preprocesses the event and resolves its route
+
+        Returns
+        -------
+        Tuple
+            (event, model name, route, request), model name is None when the event
+            was already handled (e.g. health check or models list)
+        """
         # Handle and verify the request
         event = self.preprocess(event)
         event = self._pre_handle_event(event)
 
         # Should we terminate the event?
         if hasattr(event, "terminated") and event.terminated:
-            return event
+            return event, None, None, None
 
         # Extract route information
         name, route, subpath = self._resolve_route(event.body, event.path)
         self.context.logger.debug(f"router run model {name}, op={subpath}")
         event.path = subpath
 
-        # Return the correct response
         # If no model name was given and no operation
         if not name and route is None:
             # Return model list
             setattr(event, "terminated", True)
             event.body = {"models": list(self.routes.keys()) + [self.name]}
-            return event
-        else:
-            # Verify we use the V2 protocol
-            request = self.validate(event.body)
-
-            # If this is a Router Operation
-            if name == self.name:
-                predictions = self._parallel_run(event)
-                votes = self._apply_logic(predictions)
-                # Format the prediction response like the regular
-                # model's responses
-                if self.format_response_with_col_name_flag:
-                    votes = {self.prediction_col_name: votes}
-                response = copy.copy(event)
-                response_body = {
-                    "id": event.id,
-                    "model_name": self.name,
-                    "outputs": votes,
-                }
-                if self.version:
-                    response_body["model_version"] = self.version
-                response.body = response_body
-            # A specific model event
-            else:
-                response = route.run(event)
-                event.body = response.body if response else None
+            return event, None, None, None
+
+        # Verify we use the V2 protocol
+        request = self.validate(event.body)
+        return event, name, route, request
+
+    def _build_ensemble_response(self, event, predictions):
+        votes = self._apply_logic(predictions)
+        # Format the prediction response like the regular
+        # model's responses
+        if self.format_response_with_col_name_flag:
+            votes = {self.prediction_col_name: votes}
+        response = copy.copy(event)
+        response_body = {
+            "id": event.id,
+            "model_name": self.name,
+            "outputs": votes,
+        }
+        if self.version:
+            response_body["model_version"] = self.version
+        response.body = response_body
+        return response
 
+    def _postprocess_response(self, start, request, response):
         response = self.postprocess(response)
 
         if self._model_logger and self.log_router:
@@ -593,6 +655,29 @@ class VotingEnsemble(BaseModelRouter):
                 f"in the model's response ({response.keys()})"
             )
 
+    def _get_executor(self):
+        # the pool lives as long as the router, so requests don't pay for spawning threads
+        if not self._executor:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers or max(len(self.routes), 1) * 4
+            )
+        return self._executor
+
+    def _required_responses(self):
+        if self.first_k:
+            return min(self.first_k, len(self.routes))
+        return len(self.routes)
+
+    def _deadline(self):
+        return time.monotonic() + self.timeout if self.timeout else None
+
+    @staticmethod
+    def _remaining_time(deadline):
+        """time left of the event latency budget (None when there is no timeout)"""
+        if deadline is None:
+            return None
+        return max(deadline - time.monotonic(), 0)
+
     def _parallel_run(self, event, mode: str = ParallelRunnerModes.thread):
         """Executes the processing logic in parallel
 
@@ -601,36 +686,101 @@ class VotingEnsemble(BaseModelRouter):
             mode (str, optional): Parallel processing method. Defaults to "thread".
 
         Returns:
-            dict[str, nuclio.Event]: {model_name: model_response} for selected all models the registry
+            List[List]: The predictions of the models which responded, per model
         """
         if mode == ParallelRunnerModes.array:
-            results = {
-                model_name: model.run(copy.copy(event))
-                for model_name, model in self.routes.items()
-            }
+            responses = [model.run(copy.copy(event)) for model in self.routes.values()]
         elif mode == ParallelRunnerModes.thread:
-            pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(self.routes))
-            with pool as executor:
-                results = []
-                futures = [
-                    executor.submit(self.routes[model].run, copy.copy(event))
-                    for model in self.routes.keys()
-                ]
-                for future in concurrent.futures.as_completed(futures):
-                    try:
-                        results.append(future.result())
-                    except Exception as exc:
-                        print(f"child route generated an exception: {exc}")
-                results = [
-                    self.extract_results_from_response(event.body["outputs"])
-                    for event in results
-                ]
-                self.context.logger.debug(f"Collected results from models: {results}")
+            deadline = self._deadline()
+            executor = self._get_executor()
+            pending = {
+                executor.submit(model.run, copy.copy(event))
+                for model in self.routes.values()
+            }
+            responses = []
+            failed = 0
+            required = self._required_responses()
+            while pending and len(responses) < required:
+                done, pending = concurrent.futures.wait(
+                    pending,
+                    timeout=self._remaining_time(deadline),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+                failed += self._collect_responses(done, responses)
+            for future in pending:
+                future.cancel()
+            self._verify_responses(responses, failed)
         else:
             raise ValueError(
                 f"{mode} is not a supported parallel run mode, please select from "
                 f"{[mode.value for mode in list(ParallelRunnerModes)]}"
             )
+        return self._extract_predictions(responses)
+
+    async def _async_parallel_run(self, event):
+        """Executes the processing logic in parallel on the thread pool, awaiting the models
+        responses (first `first_k` / within `timeout`) on the event loop
+
+        Args:
+            event (nuclio.Event): Incoming event after router preprocessing
+
+        Returns:
+            List[List]: The predictions of the models which responded, per model
+        """
+        deadline = self._deadline()
+        loop = asyncio.get_event_loop()
+        executor = self._get_executor()
+        pending = {
+            loop.run_in_executor(executor, model.run, copy.copy(event))
+            for model in self.routes.values()
+        }
+        responses = []
+        failed = 0
+        required = self._required_responses()
+        while pending and len(responses) < required:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=self._remaining_time(deadline),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                break
+            failed += self._collect_responses(done, responses)
+        for future in pending:
+            future.cancel()
+        self._verify_responses(responses, failed)
+        return self._extract_predictions(responses)
+
+    def _collect_responses(self, done_futures, responses):
+        """appends the results of the done models to responses, returns the number of failed models"""
+        failed = 0
+        for future in done_futures:
+            try:
+                responses.append(future.result())
+            except Exception as exc:
+                failed += 1
+                self.context.logger.warn(f"child route generated an exception: {exc}")
+        return failed
+
+    def _verify_responses(self, responses, failed):
+        if responses:
+            return
+        if failed == len(self.routes):
+            raise mlrun.errors.MLRunRuntimeError(
+                f"All the models of {self.name} failed to process the event"
+            )
+        raise mlrun.errors.MLRunTimeoutError(
+            f"None of the models of {self.name} responded within {self.timeout} seconds"
+        )
+
+    def _extract_predictions(self, responses):
+        results = [
+            self.extract_results_from_response(response.body["outputs"])
+            for response in responses
+        ]
+        self.context.logger.debug(f"Collected results from models: {results}")
         return results
 
     def validate(self, request):
@@ -711,11 +861,16 @@ class FeatureEnricher:
     """
 
     def __init__(
-        self, feature_vector_uri, impute_policy: dict = {}, index_keys: list = None
+        self,
+        feature_vector_uri,
+        impute_policy: dict = {},
+        index_keys: list = None,
+        feature_cache: dict = None,
     ):
         self.feature_vector_uri = feature_vector_uri
         self.impute_policy = impute_policy
         self.index_keys = index_keys
+        self.feature_cache = feature_cache or {}
 
         self._feature_service = None
         self._impute_values = {}
@@ -724,7 +879,7 @@ class FeatureEnricher:
     def load(self):
         """load the enricher: start the feature service and prep the imputing logic"""
         self._feature_service = mlrun.feature_store.get_online_feature_service(
-            feature_vector=self.feature_vector_uri
+            feature_vector=self.feature_vector_uri, **self.feature_cache
         )
         vector = self._feature_service.vector
         feature_stats = vector.get_stats_table()
@@ -798,7 +953,11 @@ class FeatureEnricher:
 
 
 class EnrichmentModelRouter(ModelRouter):
-    """model router with feature enrichment and imputing"""
+    """model router with feature enrichment and imputing
+
+    the feature_cache dict enables caching the online features, e.g. {"cache_size": 10000, "cache_ttl": 30}
+    (see :py:func:`~mlrun.feature_store.get_online_feature_service` for the cache options)
+    """
 
     def __init__(
         self,
@@ -811,13 +970,16 @@ class EnrichmentModelRouter(ModelRouter):
         feature_vector_uri: str = "",
         impute_policy: dict = {},
         index_keys: list = None,
+        feature_cache: dict = None,
         **kwargs,
     ):
         super().__init__(
             context, name, routes, protocol, url_prefix, health_prefix, **kwargs,
         )
 
-        self._enricher = FeatureEnricher(feature_vector_uri, impute_policy, index_keys)
+        self._enricher = FeatureEnricher(
+            feature_vector_uri, impute_policy, index_keys, feature_cache
+        )
 
     def post_init(self, mode="sync"):
         super().post_init(mode)
@@ -832,7 +994,11 @@ class EnrichmentModelRouter(ModelRouter):
 
 
 class EnrichmentVotingEnsemble(VotingEnsemble):
-    """model ensemble with feature enrichment and imputing"""
+    """model ensemble with feature enrichment and imputing
+
+    the feature_cache dict enables caching the online features, e.g. {"cache_size": 10000, "cache_ttl": 30}
+    (see :py:func:`~mlrun.feature_store.get_online_feature_service` for the cache options)
+    """
 
     def __init__(
         self,
@@ -848,6 +1014,7 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
         feature_vector_uri: str = "",
         impute_policy: dict = {},
         index_keys: list = None,
+        feature_cache: dict = None,
         **kwargs,
     ):
         super().__init__(
@@ -863,7 +1030,9 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
             **kwargs,
         )
 
-        self._enricher = FeatureEnricher(feature_vector_uri, impute_policy, index_keys)
+        self._enricher = FeatureEnricher(
+            feature_vector_uri, impute_policy, index_keys, feature_cache
+        )
 
     def post_init(self, mode="sync"):
         super().post_init(mode)
@@ -15,10 +15,13 @@
 __all__ = ["GraphServer", "create_graph_server", "GraphContext", "MockEvent"]
 
 import asyncio
+import atexit
+import collections
 import json
 import os
 import socket
 import sys
+import threading
 import traceback
 import uuid
 from typing import Union
@@ -31,16 +34,141 @@ from ..datastore import get_stream_pusher
 from ..datastore.store_resources import ResourceCache
 from ..errors import MLRunInvalidArgumentError
 from ..model import ModelObj
-from ..utils import create_logger, get_caller_globals, parse_versioned_object_uri
+from ..utils import (
+    create_logger,
+    get_caller_globals,
+    logger,
+    parse_versioned_object_uri,
+)
 from .states import RootFlowStep, RouterStep, get_function, graph_root_setter
 
 
+class _BufferedStreamPusher:
+    """pushes records to a stream from a background thread, so that the request path
+    only appends the records to a bounded in-memory buffer
+
+    the buffer is flushed when it holds flush_size records or every flush_interval seconds,
+    when the buffer is full (the stream is slow or unavailable) the full_policy applies:
+        drop_oldest - (default) drop the oldest buffered record (ring buffer)
+        drop_newest - drop the new record
+        block       - block the caller until there is room in the buffer (backpressure)
+
+    the records are buffered as is (not copied), the callers must not change them after they are pushed.
+    the buffer is flushed (for up to exit_flush_timeout seconds) when the process exits
+    """
+
+    full_policies = ["drop_oldest", "drop_newest", "block"]
+
+    def __init__(
+        self,
+        output_stream,
+        buffer_size: int = 10000,
+        flush_size: int = 100,
+        flush_interval: float = 1.0,
+        full_policy: str = "drop_oldest",
+        exit_flush_timeout: float = 10.0,
+    ):
+        if full_policy not in self.full_policies:
+            raise MLRunInvalidArgumentError(
+                f"illegal stream full policy {full_policy}, use one of {self.full_policies}"
+            )
+        self.output_stream = output_stream
+        self.buffer_size = buffer_size
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.full_policy = full_policy
+        self.exit_flush_timeout = exit_flush_timeout
+        self.dropped_records = 0
+        self.flushed_records = 0
+        self.failed_records = 0
+        self._buffer = collections.deque()
+        self._condition = threading.Condition()
+        self._flush_requested = False
+        self._in_flight = 0
+        self._worker = None
+
+    def push(self, records: list, flush: bool = False):
+        """add records to the buffer, flush=True wakes the flusher without waiting for the interval"""
+        if not self._worker:
+            self._start_worker()
+        with self._condition:
+            for record in records:
+                if len(self._buffer) >= self.buffer_size:
+                    if self.full_policy == "block":
+                        self._condition.wait_for(
+                            lambda: len(self._buffer) < self.buffer_size
+                        )
+                    elif self.full_policy == "drop_newest":
+                        self.dropped_records += 1
+                        continue
+                    else:
+                        self._buffer.popleft()
+                        self.dropped_records += 1
+                self._buffer.append(record)
+            if flush:
+                self._flush_requested = True
+            if flush or len(self._buffer) >= self.flush_size:
+                self._condition.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """wait until all the buffered records were pushed, returns False on timeout"""
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: not self._buffer and not self._in_flight, timeout
+            )
+
+    def _start_worker(self):
+        with self._condition:
+            if not self._worker:
+                self._worker = threading.Thread(
+                    target=self._run, name="stream-pusher", daemon=True
+                )
+                self._worker.start()
+                atexit.register(self._flush_at_exit)
+
+    def _flush_at_exit(self):
+        if not self.flush(self.exit_flush_timeout):
+            logger.warn(
+                f"{len(self._buffer)} tracking records were not pushed to the stream on exit"
+            )
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if len(self._buffer) < self.flush_size and not self._flush_requested:
+                    self._condition.wait(self.flush_interval)
+                records = [
+                    self._buffer.popleft()
+                    for _ in range(min(len(self._buffer), self.flush_size))
+                ]
+                if not self._buffer:
+                    self._flush_requested = False
+                self._in_flight = len(records)
+
+            if records:
+                try:
+                    self.output_stream.push(records)
+                    self.flushed_records += len(records)
+                except Exception as exc:
+                    self.failed_records += len(records)
+                    logger.warn(
+                        f"failed to push {len(records)} records to the stream, {exc}"
+                    )
+
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+
 class _StreamContext:
     def __init__(self, enabled, parameters, function_uri):
         self.enabled = False
         self.hostname = socket.gethostname()
         self.function_uri = function_uri
         self.output_stream = None
+        self.log_pusher = None
         self.stream_uri = None
 
         log_stream = parameters.get("log_stream", "")
@@ -63,6 +191,18 @@ class _StreamContext:
             self.stream_uri = stream_uri
 
             self.output_stream = get_stream_pusher(stream_uri, **stream_args)
+            self.log_pusher = _BufferedStreamPusher(
+                self.output_stream,
+                buffer_size=int(parameters.get("log_stream_buffer_size", 10000)),
+                flush_size=int(parameters.get("log_stream_flush_size", 100)),
+                flush_interval=float(parameters.get("log_stream_flush_interval", 1)),
+                full_policy=parameters.get("log_stream_full_policy", "drop_oldest"),
+            )
+
+    def flush(self, timeout: float = None):
+        """wait for the buffered tracking records to be pushed to the stream"""
+        if self.log_pusher:
+            self.log_pusher.flush(timeout)
 
 
 class GraphServer(ModelObj):
@@ -266,7 +406,10 @@ class GraphServer(ModelObj):
 
     def wait_for_completion(self):
         """wait for async operation to complete"""
-        self.graph.wait_for_completion()
+        if hasattr(self.graph, "wait_for_completion"):
+            self.graph.wait_for_completion()
+        if self.context:
+            self.context.stream.flush()
 
 
 def v2_serving_init(context, namespace=None):
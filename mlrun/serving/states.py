@@ -14,6 +14,7 @@
 
 __all__ = ["TaskStep", "RouterStep", "RootFlowStep"]
 
+import asyncio
 import json
 import os
 import pathlib
@@ -32,7 +33,7 @@ from ..datastore import get_stream_pusher
 from ..errors import MLRunInvalidArgumentError
 from ..model import ModelObj, ObjectDict
 from ..platforms.iguazio import parse_v3io_path
-from ..utils import get_class, get_function
+from ..utils import get_class, get_function, logger
 
 callable_prefix = "_"
 path_splitter = "/"
@@ -988,12 +989,30 @@ class FlowStep(BaseStep):
                     step.async_object, "_outlets"
                 ):
                     # if regular class, wrap with storey Map
-                    step._async_object = storey.Map(
-                        step._handler,
-                        full_event=step.full_event,
-                        name=step.name,
-                        context=self.context,
-                    )
+                    handler = step._handler
+                    max_in_flight = None
+                    if step.full_event and not step.handler:
+                        # classes can provide a native coroutine flavor of do_event for async flows
+                        handler = getattr(step._object, "do_event_async", handler)
+                        # and handle several events concurrently (e.g. to batch them)
+                        max_in_flight = getattr(
+                            step._object, "async_max_in_flight", None
+                        )
+                    if max_in_flight and asyncio.iscoroutinefunction(handler):
+                        step._async_object = _concurrent_map(
+                            handler,
+                            max_in_flight=max_in_flight,
+                            full_event=step.full_event,
+                            name=step.name,
+                            context=self.context,
+                        )
+                    else:
+                        step._async_object = storey.Map(
+                            handler,
+                            full_event=step.full_event,
+                            name=step.name,
+                            context=self.context,
+                        )
                 if not step.next and hasattr(step, "responder") and step.responder:
                     # if responder step (return result), add Complete()
                     step.async_object.to(storey.Complete(full_event=True))
@@ -1179,6 +1198,44 @@ classes_map = {
 }
 
 
+def _concurrent_map(handler, max_in_flight, **kwargs):
+    """storey step which runs the (coroutine) handler of up to max_in_flight events concurrently, the results
+    are passed downstream in the events order"""
+    # storey has no public concurrent step, its internal concurrent execution base (storey~=0.7) is used when it
+    # is available, otherwise the events are handled one at a time
+    import storey
+
+    try:
+        from storey.flow import _ConcurrentJobExecution
+    except ImportError:
+        _ConcurrentJobExecution = None
+    required_methods = [
+        "_process_event",
+        "_handle_completed",
+        "_get_event_or_body",
+        "_user_fn_output_to_event",
+        "_do_downstream",
+    ]
+    if not _ConcurrentJobExecution or not all(
+        hasattr(_ConcurrentJobExecution, method) for method in required_methods
+    ):
+        logger.warning(
+            "Concurrent event handling is not supported by this storey version, events are handled one at a time",
+            step=kwargs.get("name"),
+            storey_version=getattr(storey, "__version__", None),
+        )
+        return storey.Map(handler, **kwargs)
+
+    class _ConcurrentMap(_ConcurrentJobExecution):
+        async def _process_event(self, event):
+            return await handler(self._get_event_or_body(event))
+
+        async def _handle_completed(self, event, response):
+            await self._do_downstream(self._user_fn_output_to_event(event, response))
+
+    return _ConcurrentMap(max_in_flight=max_in_flight, **kwargs)
+
+
 def get_current_function(context):
     if context and hasattr(context, "current_function"):
         return context.current_function or ""
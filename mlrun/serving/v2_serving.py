@@ -11,10 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import concurrent.futures
+import copy
+import queue
 import threading
 import time
 import traceback
-from typing import Dict
+from typing import Dict, List
 
 import mlrun
 from mlrun.api.schemas import (
@@ -43,6 +47,15 @@ class V2ModelServer:
     you can add custom api endpoint by adding method op_xx(event), will be invoked by
     calling the <model-url>/xx (operation = xx)
 
+    dynamic (micro) batching can be enabled by setting the `max_batch_size` param (model
+    class arg or function param), concurrent infer requests are then collected for up to
+    `max_batch_wait_ms` milliseconds (default 10), the `inputs` of requests with the same other
+    fields (e.g. parameters) are concatenated and predict() is called once per such group,
+    predict() must return a list with one result per input row (or a dict of such lists), which
+    is split back to the requests. in async graphs the model step handles up to `max_batch_size`
+    events concurrently so they can be batched, models called synchronously on the event loop
+    (e.g. routes of a router in an async graph) are not batched
+
     Example
     -------
     defining a class::
@@ -87,6 +100,15 @@ class V2ModelServer:
 
         self.metrics = {}
         self.labels = {}
+        self._batcher = None
+        # max events the async (storey) step of the model handles concurrently
+        self.async_max_in_flight = None
+        max_batch_size = int(self.get_param("max_batch_size", 0) or 0)
+        if max_batch_size > 1:
+            self._batcher = _MicroBatcher(
+                self, max_batch_size, float(self.get_param("max_batch_wait_ms", 10)),
+            )
+            self.async_max_in_flight = max_batch_size
         if model:
             self.model = model
             self.ready = True
@@ -201,19 +223,18 @@ class V2ModelServer:
             # predict operation
             request = self._pre_event_processing_actions(event, op)
             try:
-                outputs = self.predict(request)
+                if self._batcher and not _in_event_loop():
+                    outputs = self._batcher.get_outputs(
+                        self._batcher.submit(request).result()
+                    )
+                else:
+                    outputs = self.predict(request)
             except Exception as exc:
                 if self._model_logger:
                     self._model_logger.push(start, request, op=op, error=exc)
                 raise exc
 
-            response = {
-                "id": request["id"],
-                "model_name": self.name,
-                "outputs": outputs,
-            }
-            if self.version:
-                response["model_version"] = self.version
+            response = self._build_response(request, outputs)
 
         elif op == "ready" and event.method == "GET":
             # get model health operation
@@ -250,13 +271,7 @@ class V2ModelServer:
                     self._model_logger.push(start, request, op=op, error=exc)
                 raise exc
 
-            response = {
-                "id": request["id"],
-                "model_name": self.name,
-                "outputs": outputs,
-            }
-            if self.version:
-                response["model_version"] = self.version
+            response = self._build_response(request, outputs)
 
         elif hasattr(self, "op_" + op):
             # custom operation (child methods starting with "op_")
@@ -267,6 +282,40 @@ class V2ModelServer:
         else:
             raise ValueError(f"illegal model operation {op}, method={event.method}")
 
+        return self._respond(event, start, request, response, op)
+
+    async def do_event_async(self, event, *args, **kwargs):
+        """model event handler for async graphs, awaits the batched predictions
+        without blocking the event loop"""
+        op = event.path.strip("/")
+        if not self._batcher or op not in ["predict", "infer"]:
+            return self.do_event(event, *args, **kwargs)
+
+        start = now_date()
+        request = self._pre_event_processing_actions(event, op)
+        try:
+            outputs = self._batcher.get_outputs(
+                await asyncio.wrap_future(self._batcher.submit(request))
+            )
+        except Exception as exc:
+            if self._model_logger:
+                self._model_logger.push(start, request, op=op, error=exc)
+            raise exc
+
+        response = self._build_response(request, outputs)
+        return self._respond(event, start, request, response, op)
+
+    def _build_response(self, request, outputs):
+        response = {
+            "id": request["id"],
+            "model_name": self.name,
+            "outputs": outputs,
+        }
+        if self.version:
+            response["model_version"] = self.version
+        return response
+
+    def _respond(self, event, start, request, response, op):
         response = self.postprocess(response)
         if self._model_logger:
             self._model_logger.push(start, request, response, op)
@@ -301,6 +350,174 @@ class V2ModelServer:
         raise NotImplementedError()
 
 
+class _MicroBatcher:
+    """collects concurrent predict requests of a model into micro batches
+
+    requests are queued with a future, a single worker thread waits for up to max_batch_size
+    requests (or max_batch_wait_ms from the first queued request), calls the model predict()
+    once with the concatenated inputs and resolves each request future with its own outputs
+    and batch timings, which are counted in the model metrics by the request thread (get_outputs)
+    """
+
+    batch_size_buckets = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+    queue_wait_ms_buckets = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000]
+
+    def __init__(self, model, max_batch_size: int, max_batch_wait_ms: float):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait = max_batch_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._batch_size_histogram = {}
+        self._queue_wait_histogram = {}
+
+    def submit(self, request: dict) -> concurrent.futures.Future:
+        """queue a (validated) request, the returned future resolves to the request result (see get_outputs)"""
+        future = concurrent.futures.Future()
+        self._queue.put((request, future, time.monotonic()))
+        if not self._worker:
+            self._start_worker()
+        return future
+
+    def _start_worker(self):
+        with self._lock:
+            if not self._worker:
+                self._worker = threading.Thread(
+                    target=self._run, name=f"{self.model.name}-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = batch[0][2] + self.max_batch_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        # the wait is over, only take requests which are already queued
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._process_batch(batch)
+
+    def _process_batch(self, batch: list):
+        now = time.monotonic()
+        # the batch size is counted once per batch, by its first request
+        timings = [
+            (len(batch) if index == 0 else None, (now - queued) * 1000)
+            for index, (_, _, queued) in enumerate(batch)
+        ]
+
+        # only requests with the same other fields (e.g. parameters) are predicted together
+        groups = []
+        for (request, future, _), request_timings in zip(batch, timings):
+            fields = _request_fields(request)
+            for group_fields, group in groups:
+                if group_fields == fields:
+                    group.append((request, future, request_timings))
+                    break
+            else:
+                groups.append((fields, [(request, future, request_timings)]))
+        for _, group in groups:
+            self._predict_group(group)
+
+    def _predict_group(self, group: list):
+        sizes = [len(request["inputs"]) for request, _, _ in group]
+        inputs = []
+        for request, _, _ in group:
+            inputs.extend(request["inputs"])
+        batch_request = dict(group[0][0], inputs=inputs)
+
+        try:
+            outputs = _split_batch_outputs(self.model.predict(batch_request), sizes)
+        except Exception as exc:
+            for _, future, _ in group:
+                future.set_exception(exc)
+            return
+        for (_, future, timings), request_outputs in zip(group, outputs):
+            future.set_result((request_outputs, timings))
+
+    def get_outputs(self, result: tuple):
+        """count the batch timings of a request result in the model metrics and return its outputs, called by the
+        request thread, which also reads the model metrics (the worker thread doesn't update them)"""
+        outputs, (batch_size, queue_wait_ms) = result
+        with self._metrics_lock:
+            if batch_size is not None:
+                _add_to_histogram(
+                    self._batch_size_histogram, self.batch_size_buckets, batch_size
+                )
+            _add_to_histogram(
+                self._queue_wait_histogram, self.queue_wait_ms_buckets, queue_wait_ms
+            )
+            self.model.set_metric("batch_size", dict(self._batch_size_histogram))
+            self.model.set_metric(
+                "batch_queue_wait_ms", dict(self._queue_wait_histogram)
+            )
+        return outputs
+
+
+def _request_fields(request: dict) -> dict:
+    """the request fields which must be equal for the requests to be predicted in one batch"""
+    return {key: value for key, value in request.items() if key not in ["id", "inputs"]}
+
+
+def _in_event_loop() -> bool:
+    """is the caller running on an (async graph) event loop, where waiting for a batch blocks the loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _add_to_histogram(histogram: dict, buckets: list, value):
+    """count the value in the first bucket (upper bound) which holds it"""
+    bucket = next((str(bound) for bound in buckets if value <= bound), "+Inf")
+    histogram[bucket] = histogram.get(bucket, 0) + 1
+
+
+def _split_batch_outputs(outputs, sizes: List[int]) -> list:
+    """split the outputs of a batch predict() (list or dict of lists) back to the requests"""
+    total = sum(sizes)
+    if isinstance(outputs, dict):
+        split_values = {
+            key: _split_batch_outputs(value, sizes)
+            if _is_batch_list(value, total)
+            else [value] * len(sizes)
+            for key, value in outputs.items()
+        }
+        return [
+            {key: values[index] for key, values in split_values.items()}
+            for index in range(len(sizes))
+        ]
+
+    if hasattr(outputs, "tolist"):
+        outputs = outputs.tolist()
+    if not _is_batch_list(outputs, total):
+        raise ValueError(
+            f"batch predict must return a list of {total} results (one per input), got {outputs}"
+        )
+    split_outputs = []
+    offset = 0
+    for size in sizes:
+        split_outputs.append(outputs[offset : offset + size])
+        offset += size
+    return split_outputs
+
+
+def _is_batch_list(value, total: int) -> bool:
+    return (
+        hasattr(value, "__len__")
+        and not isinstance(value, (str, bytes, dict))
+        and len(value) == total
+    )
+
+
 class _ModelLogPusher:
     def __init__(self, model, context, output_stream=None):
         self.model = model
@@ -311,6 +528,10 @@ class _ModelLogPusher:
         self.stream_batch = int(context.get_param("log_stream_batch", 1))
         self.stream_sample = int(context.get_param("log_stream_sample", 1))
         self.output_stream = output_stream or context.stream.output_stream
+        # records are pushed by the (shared) background stream pusher, off the request path
+        self._log_pusher = (
+            None if output_stream else getattr(context.stream, "log_pusher", None)
+        )
         self._worker = context.worker_id
         self._sample_iter = 0
         self._batch_iter = 0
@@ -330,16 +551,18 @@ class _ModelLogPusher:
         return base_data
 
     def push(self, start, request, resp=None, op=None, error=None):
+        # the records are pushed later (after the next requests in a batch, or by the background stream pusher),
+        # the request/response are copied (shallow) once here, so the graph changes to them don't change the records
         if error:
             data = self.base_data()
-            data["request"] = request
+            data["request"] = copy.copy(request)
             data["op"] = op
             data["when"] = str(start)
             message = str(error)
             if self.verbose:
                 message = f"{message}\n{traceback.format_exc()}"
             data["error"] = message
-            self.output_stream.push([data])
+            self._push(data, flush=True)
             return
 
         self._sample_iter = (self._sample_iter + 1) % self.stream_sample
@@ -350,7 +573,14 @@ class _ModelLogPusher:
                 if self._batch_iter == 0:
                     self._batch = []
                 self._batch.append(
-                    [request, op, resp, str(start), microsec, self.model.metrics]
+                    [
+                        copy.copy(request),
+                        op,
+                        copy.copy(resp),
+                        str(start),
+                        microsec,
+                        dict(self.model.metrics),
+                    ]
                 )
                 self._batch_iter = (self._batch_iter + 1) % self.stream_batch
 
@@ -365,17 +595,23 @@ class _ModelLogPusher:
                         "metrics",
                     ]
                     data["values"] = self._batch
-                    self.output_stream.push([data])
+                    self._push(data)
             else:
                 data = self.base_data()
-                data["request"] = request
+                data["request"] = copy.copy(request)
                 data["op"] = op
-                data["resp"] = resp
+                data["resp"] = copy.copy(resp)
                 data["when"] = str(start)
                 data["microsec"] = microsec
                 if getattr(self.model, "metrics", None):
-                    data["metrics"] = self.model.metrics
-                self.output_stream.push([data])
+                    data["metrics"] = dict(self.model.metrics)
+                self._push(data)
+
+    def _push(self, data, flush=False):
+        if self._log_pusher:
+            self._log_pusher.push([data], flush=flush)
+        else:
+            self.output_stream.push([data])
 
 
 def _init_endpoint_record(graph_server, model: V2ModelServer):
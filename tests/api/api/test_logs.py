@@ -0,0 +1,206 @@
+import datetime
+import threading
+import time
+import unittest.mock
+from http import HTTPStatus
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+import mlrun.api.crud
+import mlrun.runtimes.constants
+from mlrun.api.db.sqldb.session import create_session
+from mlrun.config import config
+
+
+def _store_run(db: Session, project: str, uid: str, state: str):
+    mlrun.api.crud.Runs().store_run(
+        db,
+        {"metadata": {"name": "run-name"}, "status": {"state": state}},
+        uid,
+        project=project,
+    )
+
+
+def test_get_log_range(db: Session, client: TestClient) -> None:
+    project = "some-project"
+    uid = "some-uid"
+    _store_run(db, project, uid, mlrun.runtimes.constants.RunStates.completed)
+    mlrun.api.crud.Logs().store_log(b"0123456789", project, uid)
+
+    response = client.get(f"/api/log/{project}/{uid}", params={"offset": 2, "size": 5})
+    assert response.status_code == HTTPStatus.OK.value
+    assert response.content == b"23456"
+    assert (
+        response.headers["x-mlrun-run-state"]
+        == mlrun.runtimes.constants.RunStates.completed
+    )
+
+    response = client.get(f"/api/log/{project}/{uid}", params={"offset": 8})
+    assert response.content == b"89"
+
+    response = client.get(f"/api/log/{project}/not-existing-uid")
+    assert response.status_code == HTTPStatus.NOT_FOUND.value
+
+
+def test_get_log_long_poll(db: Session, client: TestClient) -> None:
+    config.httpdb.logs.wait_poll_interval = 0.1
+    project = "some-project"
+    uid = "some-uid"
+    _store_run(db, project, uid, mlrun.runtimes.constants.RunStates.running)
+    mlrun.api.crud.Logs().store_log(b"first line\n", project, uid)
+    offset = len(b"first line\n")
+
+    # no new logs - responds after the timeout
+    start = time.monotonic()
+    response = client.get(
+        f"/api/log/{project}/{uid}", params={"offset": offset, "wait_timeout": 1}
+    )
+    assert time.monotonic() - start >= 1
+    assert response.content == b""
+    assert response.headers["x-mlrun-log-wait-timeout"] == "1"
+
+    # responds as soon as new logs are written
+    timer = threading.Timer(
+        0.5, mlrun.api.crud.Logs().store_log, args=(b"second line\n", project, uid),
+    )
+    timer.start()
+    start = time.monotonic()
+    response = client.get(
+        f"/api/log/{project}/{uid}", params={"offset": offset, "wait_timeout": 30}
+    )
+    timer.join()
+    assert time.monotonic() - start < 10
+    assert response.content == b"second line\n"
+
+    # runs in terminal state are not waited for
+    _store_run(db, project, uid, mlrun.runtimes.constants.RunStates.completed)
+    start = time.monotonic()
+    response = client.get(
+        f"/api/log/{project}/{uid}", params={"offset": 100, "wait_timeout": 30}
+    )
+    assert time.monotonic() - start < 10
+    assert (
+        response.headers["x-mlrun-run-state"]
+        == mlrun.runtimes.constants.RunStates.completed
+    )
+
+
+def test_get_log_long_poll_run_completed(db: Session, client: TestClient) -> None:
+    config.httpdb.logs.wait_poll_interval = 0.1
+    project = "some-project"
+    uid = "some-uid"
+    _store_run(db, project, uid, mlrun.runtimes.constants.RunStates.running)
+    mlrun.api.crud.Logs().store_log(b"first line\n", project, uid)
+
+    # the waiter sees the state change (written by another session) while polling
+    def complete_run():
+        db_session = create_session()
+        try:
+            _store_run(
+                db_session, project, uid, mlrun.runtimes.constants.RunStates.completed
+            )
+        finally:
+            db_session.close()
+
+    timer = threading.Timer(0.5, complete_run)
+    timer.start()
+    start = time.monotonic()
+    response = client.get(
+        f"/api/log/{project}/{uid}", params={"offset": 100, "wait_timeout": 30}
+    )
+    timer.join()
+    assert time.monotonic() - start < 10
+    assert (
+        response.headers["x-mlrun-run-state"]
+        == mlrun.runtimes.constants.RunStates.completed
+    )
+
+
+class _K8sLogs:
+    """fake k8s helper, serving the logs (with timestamps) of a single running pod"""
+
+    def __init__(self):
+        self.lines = []
+        self.since_seconds_calls = []
+
+    def add_line(self, line: bytes, seconds_ago: float = 0):
+        timestamp = datetime.datetime.fromtimestamp(
+            time.time() - seconds_ago, tz=datetime.timezone.utc
+        )
+        self.lines.append((timestamp, line))
+
+    def get_logger_pods(self, project, uid):
+        return {"pod": mlrun.runtimes.constants.PodPhases.running}
+
+    def stream_logs(self, pod, since_seconds=None, timestamps=False, chunk_size=None):
+        self.since_seconds_calls.append(since_seconds)
+        since = time.time() - since_seconds if since_seconds else 0
+        logs = b"".join(
+            f"{timestamp.strftime('%Y-%m-%dT%H:%M:%S.%fZ')} ".encode() + line
+            for timestamp, line in self.lines
+            if timestamp.timestamp() >= since
+        )
+        # small chunks, so the lines are split between them
+        for index in range(0, len(logs), 7):
+            yield logs[index : index + 7]
+
+
+def test_get_log_k8s(db: Session, client: TestClient) -> None:
+    project = "some-project"
+    uid = "k8s-uid"
+    _store_run(db, project, uid, mlrun.runtimes.constants.RunStates.running)
+    k8s = _K8sLogs()
+    k8s.add_line(b"first line\n", seconds_ago=100)
+    k8s.add_line(b"second line\n", seconds_ago=100)
+    with unittest.mock.patch("mlrun.api.crud.logs.get_k8s", return_value=k8s):
+        response = client.get(f"/api/log/{project}/{uid}")
+        assert response.content == b"first line\nsecond line\n"
+        assert k8s.since_seconds_calls == [None]
+
+        # reading from where the previous read ended asks k8s only for the logs since the last read line
+        k8s.add_line(b"third line\n", seconds_ago=100)
+        k8s.add_line(b"fourth line\n")
+        offset = len(b"first line\nsecond line\n")
+        response = client.get(f"/api/log/{project}/{uid}", params={"offset": offset})
+        assert response.content == b"third line\nfourth line\n"
+        assert 100 <= k8s.since_seconds_calls[-1] < 200
+
+        # other ranges are read from the start
+        response = client.get(
+            f"/api/log/{project}/{uid}", params={"offset": 2, "size": 15}
+        )
+        assert response.content == b"rst line\nsecond"
+        assert k8s.since_seconds_calls[-1] is None
+
+
+def test_get_log_k8s_long_poll(db: Session, client: TestClient) -> None:
+    config.httpdb.logs.k8s_wait_poll_interval = 0.1
+    project = "some-project"
+    uid = "k8s-uid"
+    _store_run(db, project, uid, mlrun.runtimes.constants.RunStates.running)
+    k8s = _K8sLogs()
+    k8s.add_line(b"first line\n")
+    offset = len(b"first line\n")
+    with unittest.mock.patch("mlrun.api.crud.logs.get_k8s", return_value=k8s):
+        # the logs weren't read before, so there is no cheap check for new logs
+        response = client.get(
+            f"/api/log/{project}/{uid}", params={"offset": offset, "wait_timeout": 30}
+        )
+        assert response.content == b""
+        assert response.headers["x-mlrun-log-wait-timeout"] == "0"
+
+        response = client.get(f"/api/log/{project}/{uid}")
+        assert response.content == b"first line\n"
+
+        # responds as soon as new logs are written
+        timer = threading.Timer(0.5, k8s.add_line, args=(b"second line\n",))
+        timer.start()
+        start = time.monotonic()
+        response = client.get(
+            f"/api/log/{project}/{uid}", params={"offset": offset, "wait_timeout": 30}
+        )
+        timer.join()
+        assert time.monotonic() - start < 10
+        assert response.content == b"second line\n"
+        assert response.headers["x-mlrun-log-wait-timeout"] == "30"
@@ -3,6 +3,7 @@ import string
 from random import choice, randint
 from typing import Optional
 
+import pandas
 import pytest
 
 import mlrun.api.crud
@@ -14,6 +15,8 @@ from mlrun.api.schemas import (
     ModelEndpointStatus,
 )
 from mlrun.errors import MLRunBadRequestError, MLRunInvalidArgumentError
+from mlrun.utils.model_monitoring import parse_model_endpoint_store_prefix
+from tests.common_fixtures import V3ioClientsMock
 
 TEST_PROJECT = "test_model_endpoints"
 
@@ -239,6 +242,73 @@ def test_get_endpoint_features_function():
     assert len(features) == 3
 
 
+def test_list_endpoints_single_scan_and_metrics_read(
+    v3io_clients_mock: V3ioClientsMock,
+):
+    auth_info = mlrun.api.schemas.AuthInfo(data_session="some-access-key")
+    endpoints = []
+    for index in range(5):
+        endpoint = _mock_random_endpoint("testing")
+        endpoint.spec.model = f"model_{index}:v1"
+        endpoint.metadata.uid = f"endpoint-{index}"
+        endpoint.spec.feature_names = ["f0", "f1"]
+        mlrun.api.crud.ModelEndpoints().write_endpoint_to_kv(
+            access_key=auth_info.data_session, endpoint=endpoint
+        )
+        endpoints.append(endpoint)
+
+    events_path = mlrun.mlconf.model_endpoint_monitoring.store_prefixes.default.format(
+        project=TEST_PROJECT, kind=mlrun.api.crud.ModelEndpoints.EVENTS
+    )
+    _, _, events_path = parse_model_endpoint_store_prefix(events_path)
+    v3io_clients_mock.tsdb_tables[events_path] = pandas.DataFrame(
+        {
+            "endpoint_id": ["endpoint-0", "endpoint-1", "endpoint-0"],
+            "predictions_per_second": [1.0, 2.0, 3.0],
+        },
+        index=pandas.to_datetime(
+            ["2021-01-01 00:00:00", "2021-01-01 00:00:00", "2021-01-01 00:01:00"]
+        ),
+    )
+
+    endpoint_list = mlrun.api.crud.ModelEndpoints().list_endpoints(
+        auth_info, TEST_PROJECT, metrics=["predictions_per_second"]
+    )
+    assert [endpoint.metadata.uid for endpoint in endpoint_list.endpoints] == [
+        endpoint.metadata.uid for endpoint in endpoints
+    ]
+    for endpoint, listed_endpoint in zip(endpoints, endpoint_list.endpoints):
+        assert listed_endpoint.metadata.labels == endpoint.metadata.labels
+        assert listed_endpoint.spec.model == endpoint.spec.model
+        assert listed_endpoint.spec.feature_names == ["f0", "f1"]
+        assert listed_endpoint.status.state == "testing"
+
+    metrics = endpoint_list.endpoints[0].status.metrics["predictions_per_second"]
+    assert [value for _, value in metrics.values] == [1.0, 3.0]
+    metrics = endpoint_list.endpoints[1].status.metrics["predictions_per_second"]
+    assert [value for _, value in metrics.values] == [2.0]
+    assert endpoint_list.endpoints[2].status.metrics is None
+
+    # the endpoints are fully read in the scan, and the metrics of all of them in a single query
+    assert v3io_clients_mock.calls["kv.get"] == 0
+    assert v3io_clients_mock.calls["kv.new_cursor"] == 1
+    assert v3io_clients_mock.calls["tsdb.read"] == 1
+
+    endpoint_list = mlrun.api.crud.ModelEndpoints().list_endpoints(
+        auth_info, TEST_PROJECT, model="model_1:v1", metrics=["predictions_per_second"]
+    )
+    assert len(endpoint_list.endpoints) == 1
+    metrics = endpoint_list.endpoints[0].status.metrics["predictions_per_second"]
+    assert [value for _, value in metrics.values] == [2.0]
+
+    endpoint = mlrun.api.crud.ModelEndpoints().get_endpoint(
+        auth_info, TEST_PROJECT, "endpoint-0", metrics=["predictions_per_second"]
+    )
+    assert endpoint.spec.model == "model_0:v1"
+    metrics = endpoint.status.metrics["predictions_per_second"]
+    assert [value for _, value in metrics.values] == [1.0, 3.0]
+
+
 def _get_auth_info() -> mlrun.api.schemas.AuthInfo:
     return mlrun.api.schemas.AuthInfo(data_session=os.environ.get("V3IO_ACCESS_KEY"))
 
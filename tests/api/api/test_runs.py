@@ -1,6 +1,8 @@
+import json
+import threading
 import time
 import unittest.mock
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 
 from fastapi.testclient import TestClient
@@ -9,8 +11,7 @@ from sqlalchemy.orm import Session
 import mlrun.api.crud
 import mlrun.errors
 import mlrun.runtimes.constants
-from mlrun.api.db.sqldb.models import Run
-from mlrun.api.utils.singletons.db import get_db
+from mlrun.api.db.sqldb.session import create_session
 from mlrun.config import config
 
 
@@ -89,32 +90,23 @@ def test_list_runs_times_filters(db: Session, client: TestClient) -> None:
     normal_run_1_uid = "normal_run_1_uid"
     normal_run_1 = {
         "metadata": {"uid": normal_run_1_uid},
-        "status": {"last_update": timestamp2.isoformat()},
+        "status": {
+            "start_time": timestamp1.isoformat(),
+            "last_update": timestamp2.isoformat(),
+        },
     }
-    run = Run(
-        uid=normal_run_1_uid,
-        project=config.default_project,
-        iteration=0,
-        start_time=timestamp1,
-    )
-    run.struct = normal_run_1
-    get_db()._upsert(db, run, ignore=True)
+    mlrun.api.crud.Runs().store_run(db, normal_run_1, normal_run_1_uid)
 
     timestamp3 = datetime.now(timezone.utc)
 
     run_without_last_update_uid = "run_without_last_update_uid"
     run_without_last_update = {
         "metadata": {"uid": run_without_last_update_uid},
-        "status": {},
+        "status": {"start_time": timestamp3.isoformat()},
     }
-    run = Run(
-        uid=run_without_last_update_uid,
-        project=config.default_project,
-        iteration=0,
-        start_time=timestamp3,
+    mlrun.api.crud.Runs().store_run(
+        db, run_without_last_update, run_without_last_update_uid
     )
-    run.struct = run_without_last_update
-    get_db()._upsert(db, run, ignore=True)
 
     timestamp4 = datetime.now(timezone.utc)
 
@@ -125,16 +117,12 @@ def test_list_runs_times_filters(db: Session, client: TestClient) -> None:
     normal_run_2_uid = "normal_run_2_uid"
     normal_run_2 = {
         "metadata": {"uid": normal_run_2_uid},
-        "status": {"last_update": timestamp5.isoformat()},
+        "status": {
+            "start_time": timestamp4.isoformat(),
+            "last_update": timestamp5.isoformat(),
+        },
     }
-    run = Run(
-        uid=normal_run_2_uid,
-        project=config.default_project,
-        iteration=0,
-        start_time=timestamp4,
-    )
-    run.struct = normal_run_2
-    get_db()._upsert(db, run, ignore=True)
+    mlrun.api.crud.Runs().store_run(db, normal_run_2, normal_run_2_uid)
 
     # all start time range
     assert_time_range_request(
@@ -202,6 +190,61 @@ def test_list_runs_times_filters(db: Session, client: TestClient) -> None:
     )
 
 
+def test_list_runs_pagination(db: Session, client: TestClient) -> None:
+    project = "some-project"
+    start_time = datetime.now(timezone.utc)
+    expected_uids = []
+    for index in range(5):
+        uid = f"uid-{index}"
+        run = {
+            "metadata": {"uid": uid},
+            "status": {
+                "start_time": (start_time + timedelta(minutes=index)).isoformat()
+            },
+        }
+        mlrun.api.crud.Runs().store_run(db, run, uid, project=project)
+        expected_uids.insert(0, uid)
+
+    uids = []
+    params = {"project": project, "page_size": 2}
+    while True:
+        resp = client.get("/api/runs", params=params)
+        assert resp.status_code == HTTPStatus.OK.value
+        uids.extend(run["metadata"]["uid"] for run in resp.json()["runs"])
+        if not resp.json()["next_page_token"]:
+            break
+        params["page_token"] = resp.json()["next_page_token"]
+    assert uids == expected_uids
+
+    resp = client.get("/api/runs", params={"project": project})
+    assert resp.json()["next_page_token"] is None
+    assert len(resp.json()["runs"]) == 5
+
+    resp = client.get(
+        "/api/runs", params={"project": project, "page_size": 2, "format": "jsonl"}
+    )
+    assert resp.status_code == HTTPStatus.OK.value
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    uids = [json.loads(line)["metadata"]["uid"] for line in resp.text.splitlines()]
+    assert uids == expected_uids
+
+    resp = client.get(
+        "/api/runs",
+        params={"project": project, "page_size": 2, "page_token": "invalid"},
+    )
+    assert resp.status_code == HTTPStatus.BAD_REQUEST.value
+    resp = client.get(
+        "/api/runs",
+        params={
+            "project": project,
+            "page_size": 2,
+            "page_token": "invalid",
+            "format": "jsonl",
+        },
+    )
+    assert resp.status_code == HTTPStatus.BAD_REQUEST.value
+
+
 def assert_time_range_request(client: TestClient, expected_run_uids: list, **filters):
     resp = client.get("/api/runs", params=filters)
     assert resp.status_code == HTTPStatus.OK.value
@@ -210,3 +253,75 @@ def assert_time_range_request(client: TestClient, expected_run_uids: list, **fil
     assert len(runs) == len(expected_run_uids)
     for run in runs:
         assert run["metadata"]["uid"] in expected_run_uids
+
+
+def test_list_runs_states(db: Session, client: TestClient) -> None:
+    project = "some-project"
+    states = {
+        "running-uid": mlrun.runtimes.constants.RunStates.running,
+        "completed-uid": mlrun.runtimes.constants.RunStates.completed,
+    }
+    for uid, state in states.items():
+        mlrun.api.crud.Runs().store_run(
+            db, {"status": {"state": state}}, uid, project=project
+        )
+
+    body = {
+        "runs": [
+            {"project": project, "uid": "running-uid"},
+            {"project": project, "uid": "completed-uid"},
+            {"project": project, "uid": "not-existing-uid"},
+            {"project": project, "uid": "running-uid", "iter": 3},
+        ]
+    }
+    resp = client.post("/api/runs/states", json=body)
+    assert resp.status_code == HTTPStatus.OK.value
+    assert resp.json()["states"] == [
+        mlrun.runtimes.constants.RunStates.running,
+        mlrun.runtimes.constants.RunStates.completed,
+        None,
+        None,
+    ]
+
+
+def test_list_runs_states_long_poll(db: Session, client: TestClient) -> None:
+    config.httpdb.runs.wait_poll_interval = 0.1
+    project = "some-project"
+    uid = "some-uid"
+    running = mlrun.runtimes.constants.RunStates.running
+    mlrun.api.crud.Runs().store_run(
+        db, {"status": {"state": running}}, uid, project=project
+    )
+    body = {
+        "runs": [{"project": project, "uid": uid, "state": running}],
+        "wait_timeout": 1,
+    }
+
+    # no state change - responds after the timeout
+    start = time.monotonic()
+    resp = client.post("/api/runs/states", json=body)
+    assert time.monotonic() - start >= 1
+    assert resp.json() == {"states": [running], "wait_timeout": 1}
+
+    # responds as soon as the state changes
+    def complete_run():
+        db_session = create_session()
+        try:
+            mlrun.api.crud.Runs().update_run(
+                db_session,
+                project,
+                uid,
+                0,
+                {"status.state": mlrun.runtimes.constants.RunStates.completed},
+            )
+        finally:
+            db_session.close()
+
+    timer = threading.Timer(0.5, complete_run)
+    timer.start()
+    body["wait_timeout"] = 30
+    start = time.monotonic()
+    resp = client.post("/api/runs/states", json=body)
+    timer.join()
+    assert time.monotonic() - start < 10
+    assert resp.json()["states"] == [mlrun.runtimes.constants.RunStates.completed]
@@ -169,6 +169,45 @@ def test_list_artifact_category_filter(db: DBInterface, db_session: Session):
     assert artifacts[1]["metadata"]["name"] == artifact_name_2
 
 
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_list_artifacts_pagination(db: DBInterface, db_session: Session):
+    uid = "artifact_uid"
+    artifact_names = [f"artifact_name_{index}" for index in range(5)]
+    for artifact_name in artifact_names:
+        db.store_artifact(
+            db_session,
+            artifact_name,
+            _generate_artifact(artifact_name, kind=ChartArtifact.kind),
+            uid,
+        )
+
+    names = []
+    page_token = None
+    pages_count = 0
+    while True:
+        artifacts = db.list_artifacts(db_session, page_size=2, page_token=page_token)
+        pages_count += 1
+        assert len(artifacts) <= 2
+        names.extend(artifact["metadata"]["name"] for artifact in artifacts)
+        page_token = artifacts.next_page_token
+        if not page_token:
+            break
+    assert pages_count == 3
+    assert names == artifact_names
+
+    artifacts = db.list_artifacts(
+        db_session, category=schemas.ArtifactCategories.other, page_size=10
+    )
+    assert len(artifacts) == 5
+    assert artifacts.next_page_token is None
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        db.list_artifacts(db_session, page_size=2, best_iteration=True)
+
+
 # running only on sqldb cause filedb is not really a thing anymore, will be removed soon
 @pytest.mark.parametrize(
     "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
@@ -8,8 +8,10 @@ import sqlalchemy.orm
 import mlrun.api.initial_data
 import mlrun.api.schemas
 import mlrun.api.utils.singletons.db
+import mlrun.artifacts
 import mlrun.config
 import mlrun.errors
+import mlrun.runtimes.constants
 from mlrun.api.db.base import DBInterface
 from mlrun.api.db.sqldb.models import Project
 from tests.api.db.conftest import dbs
@@ -350,3 +352,75 @@ def test_delete_project(
 
     with pytest.raises(mlrun.errors.MLRunNotFoundError):
         db.get_project(db_session, project_name)
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_refresh_project_resources_counters(
+    db: DBInterface, db_session: sqlalchemy.orm.Session,
+):
+    project_name = "project-name"
+    counter = iter(range(1000))
+
+    def uid():
+        return f"uid-{next(counter)}"
+
+    def store_run(name, state, start_time=None):
+        start_time = start_time or datetime.datetime.now()
+        run = {
+            "metadata": {"name": name, "uid": uid(), "project": project_name},
+            "status": {"state": state, "start_time": start_time.isoformat()},
+        }
+        db.store_run(db_session, run, run["metadata"]["uid"], project_name)
+
+    # runs with the same name are counted once
+    for name in ["a", "a", "b"]:
+        store_run(name, mlrun.runtimes.constants.RunStates.running)
+    store_run("c", mlrun.runtimes.constants.RunStates.completed)
+    store_run("d", mlrun.runtimes.constants.RunStates.error)
+    store_run("e", mlrun.runtimes.constants.RunStates.aborted)
+    store_run(
+        "f",
+        mlrun.runtimes.constants.RunStates.error,
+        datetime.datetime.now() - datetime.timedelta(hours=48),
+    )
+    # only the latest version of each model is counted
+    for key, tree in [("model", "1"), ("model", "2"), ("other-model", "1")]:
+        db.store_artifact(
+            db_session,
+            key,
+            {"kind": mlrun.artifacts.model.ModelArtifact.kind, "tree": tree},
+            tree,
+            project=project_name,
+        )
+    db.store_artifact(
+        db_session,
+        "dataset",
+        {"kind": mlrun.artifacts.dataset.DatasetArtifact.kind},
+        "1",
+        project=project_name,
+    )
+
+    (
+        _,
+        _,
+        project_to_models_count,
+        project_to_recent_failed_runs_count,
+        project_to_running_runs_count,
+    ) = db.refresh_project_resources_counters(db_session)
+    assert project_to_models_count[project_name] == 2
+    assert project_to_recent_failed_runs_count[project_name] == 2
+    assert project_to_running_runs_count[project_name] == 2
+
+    # requests are served from the cache until it expires or gets refreshed
+    store_run("g", mlrun.runtimes.constants.RunStates.running)
+    mlrun.config.config.httpdb.projects.counters_cache_ttl = "1 hour"
+    db.refresh_project_resources_counters(db_session)
+    store_run("h", mlrun.runtimes.constants.RunStates.running)
+    summary = db.generate_projects_summaries(db_session, [project_name])[0]
+    assert summary.runs_running_count == 3
+    db.refresh_project_resources_counters(db_session)
+    summary = db.generate_projects_summaries(db_session, [project_name])[0]
+    assert summary.runs_running_count == 4
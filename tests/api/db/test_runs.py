@@ -1,10 +1,10 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy.orm import Session
 
+import mlrun.errors
 from mlrun.api.db.base import DBInterface
-from mlrun.api.db.sqldb.models import Run
 from tests.api.db.conftest import dbs
 
 
@@ -52,99 +52,180 @@ def test_list_runs_state_filter(db: DBInterface, db_session: Session):
     run_without_state = {"metadata": {"uid": run_without_state_uid}, "bla": "blabla"}
     db.store_run(db_session, run_without_state, run_without_state_uid, project)
 
-    run_with_json_state_state = "some_json_state"
-    run_with_json_state_uid = "run_with_json_state_uid"
-    run_with_json_state = {
-        "metadata": {"uid": run_with_json_state_uid},
-        "status": {"state": run_with_json_state_state},
+    run_state_1 = "some_state_1"
+    run_with_state_1_uid = "run_with_state_1_uid"
+    run_with_state_1 = {
+        "metadata": {"uid": run_with_state_1_uid},
+        "status": {"state": run_state_1},
     }
-    run = Run(
-        uid=run_with_json_state_uid,
-        project=project,
-        iteration=0,
-        start_time=datetime.now(timezone.utc),
-    )
-    run.struct = run_with_json_state
-    db._upsert(db_session, run, ignore=True)
-
-    run_with_record_state_state = "some_record_state"
-    run_with_record_state_uid = "run_with_record_state_uid"
-    run_with_record_state = {
-        "metadata": {"uid": run_with_record_state_uid},
-        "bla": "blabla",
-    }
-    run = Run(
-        uid=run_with_record_state_uid,
-        project=project,
-        iteration=0,
-        state=run_with_record_state_state,
-        start_time=datetime.now(timezone.utc),
-    )
-    run.struct = run_with_record_state
-    db._upsert(db_session, run, ignore=True)
+    db.store_run(db_session, run_with_state_1, run_with_state_1_uid, project)
 
-    run_with_equal_json_and_record_state_state = "some_equal_json_and_record_state"
-    run_with_equal_json_and_record_state_uid = (
-        "run_with_equal_json_and_record_state_uid"
-    )
-    run_with_equal_json_and_record_state = {
-        "metadata": {"uid": run_with_equal_json_and_record_state_uid},
-        "status": {"state": run_with_equal_json_and_record_state_state},
+    run_state_2 = "some_state_2"
+    run_with_state_2_uid = "run_with_state_2_uid"
+    run_with_state_2 = {
+        "metadata": {"uid": run_with_state_2_uid},
+        "status": {"state": "some_initial_state"},
     }
-    db.store_run(
-        db_session,
-        run_with_equal_json_and_record_state,
-        run_with_equal_json_and_record_state_uid,
-        project,
+    db.store_run(db_session, run_with_state_2, run_with_state_2_uid, project)
+    # the state column is promoted from the updated body as well
+    db.update_run(
+        db_session, {"status.state": run_state_2}, run_with_state_2_uid, project
     )
 
-    run_with_unequal_json_and_record_state_json_state = "some_unequal_json_state"
-    run_with_unequal_json_and_record_state_record_state = "some_unequal_record_state"
-    run_with_unequal_json_and_record_state_uid = (
-        "run_with_unequal_json_and_record_state_uid"
-    )
-    run_with_unequal_json_and_record_state = {
-        "metadata": {"uid": run_with_unequal_json_and_record_state_uid},
-        "status": {"state": run_with_unequal_json_and_record_state_json_state},
-    }
-    run = Run(
-        uid=run_with_unequal_json_and_record_state_uid,
-        project=project,
-        iteration=0,
-        state=run_with_unequal_json_and_record_state_record_state,
-        start_time=datetime.now(timezone.utc),
-    )
-    run.struct = run_with_unequal_json_and_record_state
-    db._upsert(db_session, run, ignore=True)
-
     runs = db.list_runs(db_session, project=project)
-    assert len(runs) == 5
+    assert len(runs) == 3
 
-    runs = db.list_runs(db_session, state=run_with_json_state_state, project=project)
+    runs = db.list_runs(db_session, state=run_state_1, project=project)
     assert len(runs) == 1
-    assert runs[0]["metadata"]["uid"] == run_with_json_state_uid
+    assert runs[0]["metadata"]["uid"] == run_with_state_1_uid
 
-    runs = db.list_runs(db_session, state=run_with_record_state_state, project=project)
+    runs = db.list_runs(db_session, state=run_state_2, project=project)
     assert len(runs) == 1
-    assert runs[0]["metadata"]["uid"] == run_with_record_state_uid
+    assert runs[0]["metadata"]["uid"] == run_with_state_2_uid
+
+    runs = db.list_runs(db_session, state="some_initial_state", project=project)
+    assert len(runs) == 0
+
+    runs = db.list_runs(db_session, state=[run_state_1, run_state_2], project=project)
+    assert len(runs) == 2
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_list_runs_last_update_time_filter(db: DBInterface, db_session: Session):
+    project = "project-name"
+    now = datetime.now(timezone.utc)
+    for index in range(3):
+        uid = f"uid-{index}"
+        run = {
+            "metadata": {"uid": uid},
+            "status": {"last_update": (now - timedelta(days=index)).isoformat()},
+        }
+        db.store_run(db_session, run, uid, project)
 
     runs = db.list_runs(
-        db_session, state=run_with_equal_json_and_record_state_state, project=project
+        db_session,
+        project=project,
+        last_update_time_from=now - timedelta(days=1, hours=1),
     )
-    assert len(runs) == 1
-    assert runs[0]["metadata"]["uid"] == run_with_equal_json_and_record_state_uid
+    assert sorted(run["metadata"]["uid"] for run in runs) == ["uid-0", "uid-1"]
+
+    runs = db.list_runs(
+        db_session, project=project, last_update_time_to=now - timedelta(hours=1),
+    )
+    assert sorted(run["metadata"]["uid"] for run in runs) == ["uid-1", "uid-2"]
 
+    # sort and limit are applied after the filters
     runs = db.list_runs(
         db_session,
-        state=run_with_unequal_json_and_record_state_json_state,
         project=project,
+        last=1,
+        last_update_time_to=now - timedelta(hours=1),
     )
     assert len(runs) == 1
-    assert runs[0]["metadata"]["uid"] == run_with_unequal_json_and_record_state_uid
 
-    runs = db.list_runs(
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_list_runs_for_monitoring(db: DBInterface, db_session: Session):
+    project = "project-name"
+    running_run_uid = "running_run_uid"
+    completed_run_uid = "completed_run_uid"
+    db.store_run(
         db_session,
-        state=run_with_unequal_json_and_record_state_record_state,
-        project=project,
+        {"metadata": {"uid": running_run_uid}, "status": {"state": "running"}},
+        running_run_uid,
+        project,
     )
-    assert len(runs) == 0
+    db.store_run(
+        db_session,
+        {"metadata": {"uid": completed_run_uid}, "status": {"state": "completed"}},
+        completed_run_uid,
+        project,
+    )
+
+    runs = db.list_runs_for_monitoring(db_session)
+    assert len(runs) == 1
+    assert runs[0]["metadata"]["uid"] == running_run_uid
+
+    # the completed run was updated after the given time so it should be included as well
+    runs = db.list_runs_for_monitoring(
+        db_session, datetime.now(timezone.utc) - timedelta(minutes=1)
+    )
+    assert len(runs) == 2
+
+    runs = db.list_runs_for_monitoring(
+        db_session, datetime.now(timezone.utc) + timedelta(minutes=1)
+    )
+    assert len(runs) == 1
+    assert runs[0]["metadata"]["uid"] == running_run_uid
+
+
+# running only on sqldb cause filedb is not really a thing anymore, will be removed soon
+@pytest.mark.parametrize(
+    "db,db_session", [(dbs[0], dbs[0])], indirect=["db", "db_session"]
+)
+def test_list_runs_pagination(db: DBInterface, db_session: Session):
+    project = "project"
+    start_time = datetime.now(timezone.utc)
+    # some runs share the same start time to verify the pages don't skip or repeat runs with the same sort key
+    runs_start_times = [
+        start_time - timedelta(minutes=index // 2) for index in range(7)
+    ]
+    for index, run_start_time in enumerate(runs_start_times):
+        uid = f"uid-{index}"
+        run = {
+            "metadata": {"uid": uid},
+            "status": {"start_time": run_start_time.isoformat()},
+        }
+        db.store_run(db_session, run, uid, project)
+
+    # latest first, runs with the same start time are ordered by their insertion (latest first)
+    expected_uids = [f"uid-{index}" for index in [1, 0, 3, 2, 5, 4, 6]]
+    for sort in [True, False]:
+        uids = []
+        page_token = None
+        pages_count = 0
+        while True:
+            runs = db.list_runs(
+                db_session,
+                project=project,
+                sort=sort,
+                page_size=3,
+                page_token=page_token,
+            )
+            pages_count += 1
+            assert len(runs) <= 3
+            uids.extend(run["metadata"]["uid"] for run in runs)
+            page_token = runs.next_page_token
+            if not page_token:
+                break
+        assert pages_count == 3
+        if sort:
+            assert uids == expected_uids
+        else:
+            assert sorted(uids) == sorted(expected_uids)
+
+    # a run added after the first page was fetched, with an earlier start time, appears in the following pages
+    runs = db.list_runs(db_session, project=project, page_size=3)
+    new_run_uid = "uid-new"
+    new_run = {
+        "metadata": {"uid": new_run_uid},
+        "status": {"start_time": (start_time - timedelta(days=1)).isoformat()},
+    }
+    db.store_run(db_session, new_run, new_run_uid, project)
+    runs = db.list_runs(
+        db_session, project=project, page_size=10, page_token=runs.next_page_token
+    )
+    assert [run["metadata"]["uid"] for run in runs] == expected_uids[3:] + [new_run_uid]
+    assert runs.next_page_token is None
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        db.list_runs(db_session, project=project, page_size=3, page_token="invalid")
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        db.list_runs(db_session, project=project, page_size=3, last=2)
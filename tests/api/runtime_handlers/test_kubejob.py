@@ -380,6 +380,39 @@ class TestKubejobRuntimeHandler(TestRuntimeHandlerBase):
             db, self.project, self.run_uid, log, self.completed_job_pod.metadata.name,
         )
 
+    def test_monitor_run_terminal_run_not_in_monitoring_snapshot(
+        self, db: Session, client: TestClient
+    ):
+        self.run["metadata"]["name"] = "some-run-name"
+        self.run["status"]["state"] = RunStates.error
+        mlrun.api.crud.Runs().store_run(
+            db, self.run, self.run_uid, project=self.project
+        )
+        # terminal runs aren't part of the snapshot
+        project_run_uid_map = self.runtime_handler.list_runs_for_monitoring(
+            get_db(), db
+        )
+        assert self.run_uid not in project_run_uid_map.get(self.project, {})
+
+        list_namespaced_pods_calls = [
+            [self.failed_job_pod],
+            # additional time for the get_logger_pods
+            [self.failed_job_pod],
+        ]
+        self._mock_list_namespaced_pods(list_namespaced_pods_calls)
+        log = self._mock_read_namespaced_pod_log()
+        self.runtime_handler.monitor_runs(get_db(), db, project_run_uid_map)
+        self._assert_list_namespaced_pods_calls(
+            self.runtime_handler, len(list_namespaced_pods_calls)
+        )
+        self._assert_run_reached_state(db, self.project, self.run_uid, RunStates.error)
+        # verifying the run was read from the db and not re-created
+        run = get_db().read_run(db, self.run_uid, self.project)
+        assert run["metadata"]["name"] == "some-run-name"
+        self._assert_run_logs(
+            db, self.project, self.run_uid, log, self.failed_job_pod.metadata.name,
+        )
+
     def _mock_list_resources_pods(self, pod=None):
         pod = pod or self.completed_job_pod
         mocked_responses = self._mock_list_namespaced_pods([[pod]])
@@ -0,0 +1,29 @@
+import unittest.mock
+
+from sqlalchemy.orm import Session
+
+import mlrun.api.main
+from mlrun.api.utils.singletons.db import get_db
+from mlrun.runtimes import RuntimeKinds
+
+
+def test_runs_monitoring_cycle_stats(db: Session):
+    for uid in ["uid1", "uid2"]:
+        get_db().store_run(
+            db,
+            {
+                "metadata": {"uid": uid, "project": "project"},
+                "status": {"state": "running"},
+            },
+            uid,
+            project="project",
+        )
+    cycles_count = mlrun.api.main.get_runs_monitoring_cycle_stats()["cycles_count"]
+    with unittest.mock.patch.object(
+        RuntimeKinds, "runtime_with_handlers", return_value=[]
+    ):
+        mlrun.api.main._monitor_runs()
+    stats = mlrun.api.main.get_runs_monitoring_cycle_stats()
+    assert stats["cycles_count"] == cycles_count + 1
+    assert stats["last_cycle_runs_count"] == 2
+    assert stats["last_cycle_duration_seconds"] >= 0
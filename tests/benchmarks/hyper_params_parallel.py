@@ -0,0 +1,73 @@
+"""
+Compares running many tiny hyper param iterations of a handler sequentially, in a local dask cluster and in the
+built-in process and thread pools (parallel_executor), with a file run db and the artifacts in a temporary dir
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import mlrun
+from mlrun.config import config
+
+
+def tiny_handler(context, x, y):
+    context.log_result("score", x * y)
+
+
+def run_hyper(
+    iterations: int,
+    artifact_path: str,
+    executor: str = None,
+    parallel_runs: int = None,
+):
+    task = mlrun.new_task(params={"y": 2})
+    task.with_hyper_params(
+        {"x": list(range(iterations))},
+        strategy="list",
+        selector="max.score",
+        parallel_runs=parallel_runs,
+        parallel_executor=executor,
+    )
+    start = time.monotonic()
+    run = mlrun.new_function().run(
+        task, handler=tiny_handler, artifact_path=artifact_path
+    )
+    elapsed = time.monotonic() - start
+    assert run.status.state == "completed", run.status.error
+    assert len(run.status.iterations) == iterations + 1
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--parallel-runs", type=int, default=4)
+    parser.add_argument(
+        "--executors",
+        default="sequential,process,thread,dask",
+        help="comma separated, sequential and/or parallel executors",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # the runs and the artifacts (e.g. iteration_results.csv) are written to the temporary dir, not the working
+        # dir, also by the dask workers (processes which load their config from the environment)
+        config.dbpath = os.environ["MLRUN_DBPATH"] = temp_dir
+        config.artifact_path = os.environ["MLRUN_ARTIFACT_PATH"] = temp_dir
+        config.ipython_widget = False
+        print(f"iterations: {args.iterations}, parallel runs: {args.parallel_runs}")
+        for executor in args.executors.split(","):
+            if executor == "sequential":
+                elapsed = run_hyper(args.iterations, temp_dir)
+            else:
+                elapsed = run_hyper(
+                    args.iterations, temp_dir, executor, args.parallel_runs
+                )
+            print(
+                f"{executor:<12} {elapsed:8.2f} s {args.iterations / elapsed:10.1f} iterations/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Compares list_runs/list_artifacts filtering in SQL (on the promoted, indexed columns) to the previous approach of
+loading all the records and filtering them by their bodies in Python, on a seeded SQLite DB
+"""
+import argparse
+import pathlib
+import tempfile
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from mlrun.api.db.sqldb.db import SQLDB
+from mlrun.api.db.sqldb.models import Artifact, Run
+from mlrun.api.db.sqldb.session import _init_engine, create_session
+from mlrun.api.initial_data import init_data
+from mlrun.config import config
+
+project = "benchmark"
+states = ["completed", "error", "running", "created"]
+kinds = ["model", "dataset", "plot", "table", ""]
+
+
+def seed(db_session, runs_count: int, artifacts_count: int):
+    now = datetime.now(timezone.utc)
+    for index in range(runs_count):
+        struct = {
+            "metadata": {"name": f"run-{index % 100}", "uid": f"uid-{index}"},
+            "status": {
+                "state": states[index % len(states)],
+                "last_update": (now - timedelta(minutes=index)).isoformat(),
+                "results": {"accuracy": index / runs_count},
+            },
+        }
+        run = Run(
+            uid=f"uid-{index}",
+            project=project,
+            iteration=0,
+            start_time=now - timedelta(minutes=index),
+        )
+        SQLDB._update_run_record_from_struct(run, struct)
+        db_session.add(run)
+    for index in range(artifacts_count):
+        struct = {"key": f"artifact-{index}", "kind": kinds[index % len(kinds)]}
+        artifact = Artifact(
+            key=f"artifact-{index}",
+            project=project,
+            uid=f"uid-{index}",
+            updated=now,
+            kind=struct["kind"],
+        )
+        artifact.struct = struct
+        db_session.add(artifact)
+    db_session.commit()
+
+
+def list_runs_filtered_in_python(db_session, name, state):
+    return [
+        run.struct
+        for run in db_session.query(Run).filter(Run.project == project)
+        if run.struct["metadata"].get("name") == name
+        and run.struct["status"].get("state") == state
+    ]
+
+
+def list_artifacts_filtered_in_python(db_session, kind):
+    return [
+        artifact.struct
+        for artifact in db_session.query(Artifact).filter(Artifact.project == project)
+        if artifact.struct.get("kind") == kind
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20000)
+    parser.add_argument("--artifacts", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config.httpdb.dsn = f"sqlite:///{pathlib.Path(temp_dir) / 'mlrun.db'}"
+        _init_engine()
+        init_data()
+        db = SQLDB(config.httpdb.dsn)
+        db_session = create_session()
+        try:
+            seed(db_session, args.runs, args.artifacts)
+            cases = {
+                "list_runs name+state (python filter)": lambda: list_runs_filtered_in_python(
+                    db_session, "run-7", "error"
+                ),
+                "list_runs name+state (sql filter)": lambda: db.list_runs(
+                    db_session, name="run-7", state="error", project=project
+                ),
+                "list_artifacts kind (python filter)": lambda: list_artifacts_filtered_in_python(
+                    db_session, "model"
+                ),
+                "list_artifacts kind (sql filter)": lambda: db.list_artifacts(
+                    db_session, project=project, kind="model"
+                ),
+            }
+            print(f"runs: {args.runs}, artifacts: {args.artifacts}")
+            for case_name, case in cases.items():
+                best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+                print(f"{case_name:<40} {best * 1000:10.1f} ms")
+        finally:
+            db_session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Compares the model monitoring stream processing throughput (rows/second) of the row mode, which explodes every model
+invocation into an event per row, to the columnar mode, which keeps every invocation as a single batch of numpy
+columns. The v3io KV/TSDB/parquet targets are replaced by a local stand-in that only counts the records it gets.
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+from storey import (
+    AggregateByKey,
+    FlatMap,
+    Map,
+    NoopDriver,
+    Reduce,
+    SyncEmitSource,
+    Table,
+    build_flow,
+)
+from storey.dtypes import SlidingWindows
+from storey.steps import SampleWindow
+
+from mlrun.model_monitoring.stream_processing import (
+    ENDPOINT_ID,
+    ISO_8061_UTC,
+    ComputeColumnarAggregations,
+    EventStreamProcessor,
+    FilterNotNone,
+    MapFeatureNames,
+    ProcessEndpointEvent,
+    build_aggregators,
+    enrich_even_details,
+    explode_columnar_event,
+    select_last_row,
+)
+from mlrun.utils import logger
+
+windows = ["5m", "1h"]
+
+
+def build_processing_flow(columnar: bool, endpoint_id: str, features_count: int):
+    process_endpoint_event = ProcessEndpointEvent(
+        kv_container="", kv_path="", v3io_access_key="", columnar=columnar
+    )
+    map_feature_names = MapFeatureNames(
+        kv_container="", kv_path="", access_key="", columnar=columnar
+    )
+    # the endpoint record (kv) is already known
+    process_endpoint_event.endpoints.add(endpoint_id)
+    map_feature_names.feature_names[endpoint_id] = [
+        f"f{index}" for index in range(features_count)
+    ]
+    map_feature_names.label_columns[endpoint_id] = ["p0"]
+
+    def count_records(count, _):
+        return count + 1
+
+    return build_flow(
+        [
+            SyncEmitSource(),
+            process_endpoint_event,
+            FilterNotNone(),
+            *([] if columnar else [FlatMap(lambda x: x)]),
+            map_feature_names,
+            [
+                AggregateByKey(
+                    aggregates=build_aggregators(
+                        columnar,
+                        SlidingWindows(windows, "30s"),
+                        SlidingWindows(windows, "30s"),
+                    ),
+                    table=Table("notable", NoopDriver()),
+                ),
+                SampleWindow(10, key=ENDPOINT_ID),
+                *([ComputeColumnarAggregations(windows, windows)] if columnar else []),
+                Map(EventStreamProcessor.compute_predictions_per_second),
+                [Reduce(0, count_records)],
+                [
+                    *([Map(select_last_row)] if columnar else []),
+                    Map(EventStreamProcessor.process_before_events_tsdb),
+                    Reduce(0, count_records),
+                ],
+            ],
+            [
+                *([FlatMap(explode_columnar_event)] if columnar else []),
+                Map(EventStreamProcessor.process_before_parquet),
+                Reduce(0, count_records),
+            ],
+        ]
+    ).run()
+
+
+def generate_events(invocations: int, rows: int, features_count: int):
+    start = datetime.now(timezone.utc) - timedelta(minutes=1)
+    events = []
+    for index in range(invocations):
+        event = {
+            "function_uri": "default/serving",
+            "model": "model",
+            "class": "Model",
+            "labels": {"team": "benchmark"},
+            "when": (start + timedelta(milliseconds=index)).strftime(ISO_8061_UTC),
+            "microsec": 100 + index % 50,
+            "request": {
+                "id": f"id-{index}",
+                "inputs": [
+                    [float(row + column) for column in range(features_count)]
+                    for row in range(rows)
+                ],
+            },
+            "resp": {"outputs": [row % 2 for row in range(rows)]},
+        }
+        events.append(enrich_even_details(event))
+    return events
+
+
+def run(columnar: bool, events: list, features_count: int) -> float:
+    controller = build_processing_flow(columnar, events[0][ENDPOINT_ID], features_count)
+    start = time.monotonic()
+    for event in events:
+        controller.emit(
+            event,
+            key=event[ENDPOINT_ID],
+            event_time=datetime.strptime(event["when"], ISO_8061_UTC),
+        )
+    controller.terminate()
+    controller.await_termination()
+    return time.monotonic() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--invocations", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=50, help="rows per invocation")
+    parser.add_argument("--features", type=int, default=10)
+    args = parser.parse_args()
+
+    # the row mode logs every mapped row, measure the processing and not the logging
+    logger.set_logger_level("WARNING")
+
+    total_rows = args.invocations * args.rows
+    print(
+        f"invocations: {args.invocations}, rows per invocation: {args.rows}, features: {args.features}"
+    )
+    for mode, columnar in [("row", False), ("columnar", True)]:
+        events = generate_events(args.invocations, args.rows, args.features)
+        duration = run(columnar, events, args.features)
+        print(f"{mode:<10} {duration:8.2f} s {total_rows / duration:12.0f} rows/second")
+
+
+if __name__ == "__main__":
+    main()
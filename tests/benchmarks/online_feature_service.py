@@ -0,0 +1,128 @@
+"""
+Measures the latency of OnlineVectorService.get for batches of entities, against an in-memory table (with an optional
+simulated KV round trip latency) so only the service and graph overhead is measured. Compares a get call per entity, a
+single batched get call with distinct entities and one with repeated entities (which are queried once), the
+list/DataFrame outputs, and a service with a local online cache.
+"""
+import argparse
+import asyncio
+import time
+import unittest.mock
+
+from storey import Driver, Table
+
+import mlrun.feature_store as fs
+from mlrun.feature_store import Feature
+from mlrun.feature_store.feature_vector import FixedWindowType, OnlineVectorService
+from mlrun.feature_store.retrieval.online import init_feature_vector_graph
+from mlrun.utils import logger
+
+
+class InMemoryDriver(Driver):
+    def __init__(self, rows: dict, latency: float):
+        self.rows = rows
+        self.latency = latency
+
+    async def _load_aggregates_by_key(self, container, table_path, key):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return None, self.rows.get(key)
+
+
+def build_service(
+    entities: int, features: int, kv_latency: float, **cache_options
+) -> OnlineVectorService:
+    feature_names = [f"f{index}" for index in range(features)]
+    feature_set = fs.FeatureSet("bench", entities=[fs.Entity("id")])
+    rows = {
+        str(key): {name: float(key) for name in feature_names}
+        for key in range(entities)
+    }
+    driver = InMemoryDriver(rows, kv_latency)
+    vector = fs.FeatureVector("bench-vector", ["bench.*"])
+    vector.status.features = [Feature(name=name) for name in feature_names]
+    online_target = unittest.mock.Mock()
+    online_target.get_table_object.side_effect = lambda driver_wrapper=None: Table(
+        "", driver_wrapper(driver) if driver_wrapper else driver
+    )
+    with unittest.mock.patch.object(
+        fs.FeatureVector,
+        "parse_features",
+        return_value=(
+            {"bench": feature_set},
+            {"bench": [(name, None) for name in feature_names]},
+        ),
+    ), unittest.mock.patch(
+        "mlrun.feature_store.retrieval.online.get_online_target",
+        return_value=online_target,
+    ):
+        graph, index_columns, online_caches = init_feature_vector_graph(
+            vector, FixedWindowType.LastClosedWindow, **cache_options
+        )
+    return OnlineVectorService(vector, graph, index_columns, online_caches)
+
+
+def measure(function, repeats: int) -> float:
+    durations = []
+    for _ in range(repeats):
+        start = time.monotonic()
+        function()
+        durations.append(time.monotonic() - start)
+    return sorted(durations)[len(durations) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--distinct",
+        type=int,
+        default=100,
+        help="distinct entities in the repeated batch",
+    )
+    parser.add_argument("--features", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--kv-latency-ms",
+        type=float,
+        default=0.5,
+        help="simulated online target latency",
+    )
+    args = parser.parse_args()
+
+    logger.set_logger_level("WARNING")
+    kv_latency = args.kv_latency_ms / 1000
+    service = build_service(args.batch_size, args.features, kv_latency)
+    cached_service = build_service(
+        args.batch_size, args.features, kv_latency, cache_size=args.batch_size
+    )
+    distinct_rows = [{"id": str(key)} for key in range(args.batch_size)]
+    repeated_rows = [{"id": str(key % args.distinct)} for key in range(args.batch_size)]
+    # warm the online cache
+    cached_service.get(distinct_rows)
+
+    cases = [
+        ("get per entity", lambda: [service.get([row]) for row in distinct_rows]),
+        ("batch", lambda: service.get(distinct_rows)),
+        ("batch, as_list", lambda: service.get(distinct_rows, as_list=True)),
+        ("batch, return_df", lambda: service.get(distinct_rows, return_df=True)),
+        ("repeated batch", lambda: service.get(repeated_rows)),
+        ("batch, cached", lambda: cached_service.get(distinct_rows)),
+    ]
+    print(
+        f"batch size: {args.batch_size}, features: {args.features}, repeated batch distinct: {args.distinct}, "
+        f"kv latency: {args.kv_latency_ms} ms"
+    )
+    try:
+        for name, function in cases:
+            duration = measure(function, args.repeats)
+            print(
+                f"{name:<20} {duration * 1000:10.1f} ms {args.batch_size / duration:12.0f} entities/second"
+            )
+    finally:
+        service.close()
+        cached_service.close()
+
+
+if __name__ == "__main__":
+    main()
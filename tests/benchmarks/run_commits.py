@@ -0,0 +1,66 @@
+"""
+Measures the time a training loop is blocked by the run context commits (a commit per epoch, with many logged
+artifacts), writing the whole run on every commit vs. the coalesced background (write-behind) updates, with a file
+run db in a temporary dir
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import mlrun
+from mlrun.config import config
+from mlrun.execution import MLClientCtx
+
+
+def run_epochs(epochs: int, artifacts: int, write_behind: bool):
+    config.run_updates.write_behind = write_behind
+    context = MLClientCtx.from_dict(
+        {"metadata": {"name": "commits", "project": "default"}},
+        rundb=mlrun.get_run_db(),
+    )
+    for i in range(artifacts):
+        context.log_artifact(
+            f"artifact{i}", body=b"data", local_path=f"artifact{i}.txt"
+        )
+
+    start = time.monotonic()
+    for epoch in range(epochs):
+        context.log_result("epoch", epoch)
+        context.log_result("accuracy", epoch / epochs)
+        context.commit()
+    loop_time = time.monotonic() - start
+    context.commit(completed=True)
+    total_time = time.monotonic() - start
+
+    stored = mlrun.get_run_db().read_run(context.uid, context.project)
+    assert stored["status"]["results"]["epoch"] == epochs - 1
+    assert stored["status"]["state"] == "completed"
+    return loop_time, total_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--epochs", type=int, default=200)
+    parser.add_argument("--artifacts", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # the artifacts local files are written to the working dir
+        os.chdir(temp_dir)
+        config.dbpath = temp_dir
+        config.artifact_path = temp_dir
+        print(f"epochs: {args.epochs}, artifacts: {args.artifacts}")
+        for write_behind in [False, True]:
+            loop_time, total_time = run_epochs(
+                args.epochs, args.artifacts, write_behind
+            )
+            mode = "write-behind" if write_behind else "store run"
+            print(
+                f"{mode:<14} loop {loop_time:8.3f} s ({loop_time / args.epochs * 1000:7.2f} ms/epoch), "
+                f"with final write {total_time:8.3f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import collections
+import re
 import unittest
 from http import HTTPStatus
 from os import environ
@@ -5,6 +7,7 @@ from typing import Callable, Generator
 from unittest.mock import Mock
 
 import deepdiff
+import pandas
 import pytest
 import requests
 import v3io.dataplane
@@ -17,6 +20,7 @@ import mlrun.db
 import mlrun.k8s_utils
 import mlrun.utils
 import mlrun.utils.singleton
+import mlrun.utils.v3io_clients
 from mlrun.api.db.sqldb.db import SQLDB
 from mlrun.api.db.sqldb.session import _init_engine, create_session
 from mlrun.api.initial_data import init_data
@@ -262,3 +266,92 @@ def rundb_mock() -> RunDBMock:
     BaseRuntime._use_remote_api = orig_use_remote_api
     BaseRuntime._get_db = orig_get_db
     config.dbpath = orig_db_path
+
+
+# In memory fake of the v3io KV and frames TSDB clients, supports only the simple (project=='x' AND exists(_y)) KV
+# filter expressions and the (endpoint_id=='x' OR ...) TSDB ones that we generate
+class V3ioClientsMock:
+    def __init__(self):
+        self.kv = self
+        self.tables = collections.defaultdict(dict)
+        self.tsdb_tables = collections.defaultdict(pandas.DataFrame)
+        self.calls = collections.Counter()
+
+    def put(self, container, table_path, key, attributes, **kwargs):
+        self.calls["kv.put"] += 1
+        self.tables[(container, table_path)][key] = dict(attributes)
+
+    def update(self, container, table_path, key, attributes, **kwargs):
+        self.calls["kv.update"] += 1
+        self.tables[(container, table_path)].setdefault(key, {}).update(attributes)
+
+    def get(self, container, table_path, key, **kwargs):
+        self.calls["kv.get"] += 1
+        item = self.tables[(container, table_path)].get(key)
+        return Mock(output=Mock(item=dict(item) if item is not None else None))
+
+    def delete(self, container, table_path, key, **kwargs):
+        self.calls["kv.delete"] += 1
+        self.tables[(container, table_path)].pop(key, None)
+
+    def new_cursor(
+        self,
+        container,
+        table_path,
+        filter_expression=None,
+        attribute_names=None,
+        **kwargs,
+    ):
+        self.calls["kv.new_cursor"] += 1
+        items = []
+        for item in self.tables[(container, table_path)].values():
+            if not self._match_kv_filter(item, filter_expression):
+                continue
+            if attribute_names and attribute_names != ["*"]:
+                item = {
+                    name: value
+                    for name, value in item.items()
+                    if name in attribute_names
+                }
+            items.append(dict(item))
+        items_iterator = iter(items)
+        return Mock(next_item=lambda: next(items_iterator, None))
+
+    def read(self, backend, table, columns=None, filter=None, **kwargs):
+        self.calls[f"{backend}.read"] += 1
+        data = self.tsdb_tables[table]
+        if filter and not data.empty:
+            endpoint_ids = re.findall(r"endpoint_id=='([^']*)'", filter)
+            data = data[data["endpoint_id"].isin(endpoint_ids)]
+        if columns and not data.empty:
+            data = data[[column for column in columns if column in data.columns]]
+        return data
+
+    @staticmethod
+    def _match_kv_filter(item, filter_expression):
+        if not filter_expression:
+            return True
+        for condition in filter_expression.split(" AND "):
+            exists = re.fullmatch(r"exists\((.*)\)", condition)
+            if exists:
+                if exists.group(1) not in item:
+                    return False
+                continue
+            name, value = re.fullmatch(r"(.*)=='(.*)'", condition).groups()
+            if item.get(name) != value:
+                return False
+        return True
+
+
+@pytest.fixture()
+def v3io_clients_mock(monkeypatch) -> V3ioClientsMock:
+    mock_object = V3ioClientsMock()
+    monkeypatch.setattr(mlrun.utils.v3io_clients, "_v3io_clients", {})
+    monkeypatch.setattr(mlrun.utils.v3io_clients, "_frames_clients", {})
+    monkeypatch.setattr(
+        mlrun.utils.v3io_clients, "V3IOClient", Mock(return_value=mock_object)
+    )
+    monkeypatch.setattr(
+        mlrun.utils.v3io_clients, "get_client", Mock(return_value=mock_object)
+    )
+    yield mock_object
@@ -0,0 +1,65 @@
+import unittest.mock
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+import mlrun
+import mlrun.errors
+
+
+def test_file_memoryview(tmpdir):
+    data = bytes(range(256)) * 100
+    path = f"{tmpdir}/data.bin"
+    with open(path, "wb") as fp:
+        fp.write(data)
+    item = mlrun.get_dataitem(path)
+
+    view = item.get(as_memoryview=True)
+    assert isinstance(view, memoryview) and view.readonly
+    assert view == data
+    assert item.get(size=10, offset=300, as_memoryview=True) == data[300:310]
+    assert item.get(offset=25590, as_memoryview=True) == data[25590:]
+
+    with item.open_buffer() as buffer:
+        assert len(buffer) == len(data)
+        assert bytes(buffer[:8]) == data[:8]
+    # released when the context exits
+    with pytest.raises(ValueError):
+        len(buffer)
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        item.get(encoding="utf-8", as_memoryview=True)
+
+    empty_path = f"{tmpdir}/empty.bin"
+    open(empty_path, "wb").close()
+    assert mlrun.get_dataitem(empty_path).get(as_memoryview=True) == b""
+    with mlrun.get_dataitem(empty_path).open_buffer() as buffer:
+        assert len(buffer) == 0
+
+
+def test_memory_store_memoryview():
+    data = b"in memory data"
+    mlrun.datastore.set_in_memory_item("buffer", data)
+    item = mlrun.get_dataitem("memory://buffer")
+    assert item.get(size=6, offset=3, as_memoryview=True) == data[3:9]
+    with item.open_buffer() as buffer:
+        # a view of the stored object
+        assert buffer.obj is data
+    mlrun.datastore.get_in_memory_items().pop("buffer")
+
+
+def test_file_parquet_as_df_memory_mapped(tmpdir):
+    df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]}).set_index("y")
+    path = f"{tmpdir}/data.parquet"
+    df.to_parquet(path)
+
+    with unittest.mock.patch.object(
+        pq, "read_table", side_effect=pq.read_table
+    ) as read_table:
+        result = mlrun.get_dataitem(path).as_df()
+    pd.testing.assert_frame_equal(result, df)
+    assert read_table.call_args[1]["memory_map"] is True
+    pd.testing.assert_frame_equal(
+        mlrun.get_dataitem(path).as_df(columns=["x"]), df[["x"]]
+    )
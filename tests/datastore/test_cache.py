@@ -0,0 +1,105 @@
+import os
+
+import pandas as pd
+import pytest
+
+import mlrun
+from mlrun.datastore.base import DataItem, DataStore, FileStats
+from mlrun.datastore.cache import LocalCache
+
+
+class _RemoteStore(DataStore):
+    """remote like (non file) store which keeps the objects in memory and counts the downloads"""
+
+    def __init__(self):
+        super().__init__(None, "remote", "remote", "")
+        self.objects = {}
+        self.downloads = 0
+
+    def _secret(self, key):
+        return None
+
+    def get(self, key, size=None, offset=0):
+        self.downloads += 1
+        return self.objects[key][0]
+
+    def stat(self, key):
+        data, modified = self.objects[key]
+        return FileStats(len(data), modified)
+
+
+@pytest.fixture
+def local_cache(tmpdir):
+    old_cache = mlrun.mlconf.local_cache
+    mlrun.mlconf.local_cache = {
+        "enabled": True,
+        "path": str(tmpdir / "cache"),
+        "max_size": 1000,
+    }
+    yield
+    mlrun.mlconf.local_cache = old_cache
+
+
+def test_local_cache(tmpdir):
+    cache = LocalCache(str(tmpdir), max_size=25)
+    downloads = []
+
+    def download(data):
+        def _download(target_path):
+            downloads.append(target_path)
+            with open(target_path, "w") as fp:
+                fp.write(data)
+
+        return _download
+
+    first = cache.get_path("s3://a", download("a" * 10), FileStats(10, 1.0))
+    assert cache.get_path("s3://a", download("a" * 10), FileStats(10, 1.0)) == first
+    assert len(downloads) == 1
+    # a modified object gets a new entry
+    second = cache.get_path("s3://a", download("b" * 10), FileStats(10, 2.0))
+    assert second != first and open(second).read() == "b" * 10
+    # not identified by a hash or stats
+    assert cache.get_path("http://a", download("c"), None) is None
+
+    # same content (hash) from another url
+    by_hash = cache.get_path("s3://b", download("d" * 10), content_hash="abc")
+    assert cache.get_path("s3://c", download("e" * 10), content_hash="abc") == by_hash
+
+    # the least recently used (first) is evicted, the total is below max size
+    assert not os.path.exists(first)
+    assert cache.size() <= 25
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 3 and stats["evictions"] == 1
+
+    # failed downloads are not cached
+    def failed_download(target_path):
+        with open(target_path, "w") as fp:
+            fp.write("partial")
+        raise OSError("connection reset")
+
+    with pytest.raises(OSError):
+        cache.get_path("s3://d", failed_download, FileStats(10, 1.0))
+    assert cache.size() <= 25
+    assert not [
+        file for _, _, files in os.walk(tmpdir) for file in files if "tmp" in file
+    ]
+
+
+def test_dataitem_local_and_as_df_are_cached(local_cache):
+    store = _RemoteStore()
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    store.objects["data.csv"] = (df.to_csv(index=False), 1.0)
+
+    for _ in range(2):
+        item = DataItem("data", store, "data.csv", url="remote://data.csv")
+        local_path = item.local()
+        assert local_path.endswith(".csv")
+        pd.testing.assert_frame_equal(pd.read_csv(local_path), df)
+        pd.testing.assert_frame_equal(item.as_df(), df)
+    assert store.downloads == 1
+
+    # the object was modified
+    store.objects["data.csv"] = (df.assign(x=df.x * 2).to_csv(index=False), 2.0)
+    item = DataItem("data", store, "data.csv", url="remote://data.csv")
+    assert item.as_df().x.tolist() == [2, 4, 6]
+    assert store.downloads == 2
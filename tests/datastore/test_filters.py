@@ -0,0 +1,102 @@
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+import mlrun
+import mlrun.errors
+from mlrun.datastore.utils import (
+    and_filters,
+    filter_df,
+    normalize_filters,
+    row_group_may_match,
+)
+
+
+def _df():
+    return pd.DataFrame(
+        {
+            "ticker": ["GOOG", "MSFT", "AAPL", "GOOG", "MSFT", "AMZN"] * 10,
+            "price": np.arange(60, dtype=float),
+            "volume": np.arange(60) * 10,
+        }
+    )
+
+
+def test_normalize_filters():
+    assert normalize_filters(None) is None
+    assert normalize_filters([("x", "in", ("a", "b"))]) == [[("x", "in", ["a", "b"])]]
+    # as loaded from yaml/json
+    assert normalize_filters([["x", ">", 1], ["y", "=", 2]]) == [
+        [("x", ">", 1), ("y", "=", 2)]
+    ]
+    assert normalize_filters([[("x", ">", 1)], [("y", "NOT IN", [2])]]) == [
+        [("x", ">", 1)],
+        [("y", "not in", [2])],
+    ]
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        normalize_filters([("x", "like", 1)])
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        normalize_filters([[("x", ">")]])
+
+    assert and_filters([[("a", ">", 1)], [("b", ">", 1)]], [("c", "<", 2)]) == [
+        [("a", ">", 1), ("c", "<", 2)],
+        [("b", ">", 1), ("c", "<", 2)],
+    ]
+    assert and_filters(None, [("c", "<", 2)]) == [[("c", "<", 2)]]
+
+
+def test_filter_df():
+    df = _df()
+    result = filter_df(df, [("ticker", "in", ["GOOG", "MSFT"]), ("price", ">=", 30)])
+    expected = df[df.ticker.isin(["GOOG", "MSFT"]) & (df.price >= 30)]
+    pd.testing.assert_frame_equal(result, expected)
+    result = filter_df(df, [[("ticker", "==", "AAPL")], [("volume", "<", 20)]])
+    pd.testing.assert_frame_equal(result, df[(df.ticker == "AAPL") | (df.volume < 20)])
+
+
+def test_parquet_as_df_filters(tmpdir):
+    df = _df()
+    path = f"{tmpdir}/data.parquet"
+    df.to_parquet(path, row_group_size=10)
+    filters = [("ticker", "in", ["GOOG", "MSFT"]), ("price", ">=", 30)]
+    expected = df[df.ticker.isin(["GOOG", "MSFT"]) & (df.price >= 30)]
+
+    item = mlrun.get_dataitem(path)
+    result = item.as_df(filters=filters)
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True), expected.reset_index(drop=True)
+    )
+    # the filter columns don't have to be selected
+    result = item.as_df(columns=["volume"], filters=filters)
+    assert result.columns.tolist() == ["volume"]
+    assert result.volume.tolist() == expected.volume.tolist()
+
+    result = item.as_df(columns=["volume"], df_module=dd, filters=filters).compute()
+    assert result.columns.tolist() == ["volume"]
+    assert result.volume.tolist() == expected.volume.tolist()
+
+    # row groups are pruned by their statistics
+    metadata = pq.ParquetFile(path).metadata
+    assert [
+        row_group_may_match(metadata.row_group(index), [("price", ">=", 30)])
+        for index in range(metadata.num_row_groups)
+    ] == [False, False, False, True, True, True]
+
+
+def test_csv_as_df_filters(tmpdir):
+    df = _df()
+    path = f"{tmpdir}/data.csv"
+    df.to_csv(path, index=False)
+    filters = [("ticker", "=", "AAPL")]
+    expected = df[df.ticker == "AAPL"]
+
+    item = mlrun.get_dataitem(path)
+    result = item.as_df(columns=["price"], filters=filters)
+    assert result.columns.tolist() == ["price"]
+    assert result.price.tolist() == expected.price.tolist()
+
+    chunks = list(item.as_df(chunksize=25, filters=filters))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
@@ -0,0 +1,73 @@
+import os
+
+import mlrun
+from mlrun.artifacts.base import DirArtifact
+from mlrun.datastore.base import DataStore, FileStats, get_range
+from mlrun.datastore.transfer import TransferManager
+from mlrun.utils import calculate_local_file_hash
+
+
+class _RangedStore(DataStore):
+    """remote like store which keeps the objects in memory and reads byte ranges"""
+
+    def __init__(self):
+        super().__init__(None, "ranged", "ranged", "")
+        self.objects = {}
+        self.gets = []
+
+    def _secret(self, key):
+        return None
+
+    def supports_range_get(self):
+        return True
+
+    def get(self, key, size=None, offset=0):
+        self.gets.append((offset, size))
+        data = self.objects[key]
+        return data[offset : offset + size] if size else data[offset:]
+
+    def stat(self, key):
+        return FileStats(len(self.objects[key]), 1.0)
+
+
+def test_get_range():
+    assert get_range(10, 5) == "bytes=5-14"
+    assert get_range(None, 5) == "bytes=5-"
+
+
+def test_download_in_parts(tmpdir):
+    store = _RangedStore()
+    store.objects["big"] = os.urandom(1000)
+    store.objects["small"] = b"small"
+    transfer = TransferManager(max_workers=4, multipart_threshold=100, part_size=128)
+
+    transfer.download(store, "big", f"{tmpdir}/big")
+    assert open(f"{tmpdir}/big", "rb").read() == store.objects["big"]
+    assert sorted(store.gets) == [(offset, 128) for offset in range(0, 896, 128)] + [
+        (896, 104)
+    ]
+
+    store.gets = []
+    transfer.download(store, "small", f"{tmpdir}/small")
+    assert open(f"{tmpdir}/small", "rb").read() == b"small"
+    assert store.gets == [(0, None)]
+
+
+def test_upload_files_and_dir_artifact(tmpdir):
+    src_dir = tmpdir.mkdir("src")
+    for i in range(5):
+        src_dir.join(f"file{i}.bin").write_binary(os.urandom(1000 + i))
+
+    items = [
+        (mlrun.get_dataitem(f"{tmpdir}/target/file{i}.bin"), f"{src_dir}/file{i}.bin")
+        for i in range(5)
+    ]
+    hashes = TransferManager(max_workers=3).upload_files(items, calc_hash=True)
+    assert hashes == [calculate_local_file_hash(src) for _, src in items]
+    for item, src in items:
+        assert item.get() == open(src, "rb").read()
+
+    artifact = DirArtifact("dir", target_path=f"{tmpdir}/artifact")
+    artifact.src_path = str(src_dir)
+    artifact.upload()
+    assert sorted(os.listdir(f"{tmpdir}/artifact")) == sorted(os.listdir(src_dir))
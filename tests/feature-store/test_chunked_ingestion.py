@@ -0,0 +1,153 @@
+import unittest.mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlrun.feature_store as fs
+from mlrun.datastore.sources import CSVSource, ParquetSource
+from mlrun.datastore.targets import CSVTarget, ParquetTarget
+from mlrun.feature_store.ingestion import iterate_source_chunks
+
+
+def _source_df():
+    return pd.DataFrame(
+        {
+            "id": np.arange(100) % 7,
+            "x": np.linspace(0, 1, 100),
+            "time": pd.date_range("2021-01-01", periods=100, freq="min"),
+        }
+    )
+
+
+def _feature_set(engine):
+    feature_set = fs.FeatureSet(
+        "chunked",
+        entities=[fs.Entity("id")],
+        timestamp_key="time" if engine == "storey" else None,
+        engine=engine,
+    )
+    # not using the db
+    feature_set.save = unittest.mock.Mock()
+    feature_set.reload = unittest.mock.Mock()
+    return feature_set
+
+
+def test_iterate_source_chunks(tmpdir):
+    df = _source_df()
+    df.to_csv(f"{tmpdir}/source.csv", index=False)
+    df.to_parquet(f"{tmpdir}/source.parquet", row_group_size=40)
+
+    assert [len(chunk) for chunk in iterate_source_chunks(df, 30)] == [30, 30, 30, 10]
+    assert [
+        len(chunk) for chunk in iterate_source_chunks(f"{tmpdir}/source.csv", 30)
+    ] == [30, 30, 30, 10]
+    # a row group at a time
+    chunks = list(
+        ParquetSource(path=f"{tmpdir}/source.parquet").to_dataframe_chunks(30)
+    )
+    assert [len(chunk) for chunk in chunks] == [30, 10, 30, 10, 20]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+
+@pytest.mark.parametrize("engine", ["pandas", "storey"])
+def test_ingest_in_chunks(tmpdir, engine):
+    df = _source_df()
+    df.to_csv(f"{tmpdir}/source.csv", index=False)
+    feature_set = _feature_set(engine)
+    targets = [
+        ParquetTarget(path=f"{tmpdir}/target.parquet"),
+        CSVTarget(path=f"{tmpdir}/target.csv"),
+    ]
+
+    result = fs.ingest(
+        feature_set,
+        f"{tmpdir}/source.csv",
+        targets=targets,
+        chunk_size=30,
+        return_df=False,
+    )
+    assert result is None
+
+    sort_columns = ["time"]
+    parquet_df = pd.read_parquet(f"{tmpdir}/target.parquet").reset_index()
+    csv_df = pd.read_csv(f"{tmpdir}/target.csv", parse_dates=["time"])
+    for target_df in [parquet_df, csv_df]:
+        assert len(target_df) == len(df)
+        pd.testing.assert_series_equal(
+            target_df.sort_values(sort_columns, ignore_index=True)["x"], df["x"]
+        )
+
+    stats = feature_set.status.stats
+    assert stats["x"]["count"] == len(df)
+    assert stats["x"]["mean"] == pytest.approx(df["x"].mean())
+    assert stats["x"]["std"] == pytest.approx(df["x"].std())
+    assert sum(stats["x"]["hist"][0]) == len(df)
+    # 20 lines + 1 for headers
+    assert len(feature_set.status.preview) == 21
+
+
+def test_parquet_target_chunks(tmpdir):
+    df = _source_df()
+    target = ParquetTarget(path=f"{tmpdir}/chunks")
+    for chunk_id, start in enumerate(range(0, len(df), 30)):
+        size = target.write_dataframe(df.iloc[start : start + 30], chunk_id=chunk_id)
+    assert size > 0
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(f"{tmpdir}/chunks").reset_index(drop=True), df
+    )
+
+
+def test_source_columns_and_filters(tmpdir):
+    df = _source_df().assign(y=lambda df: df.x * 2)
+    df.to_csv(f"{tmpdir}/source.csv", index=False)
+    df.to_parquet(f"{tmpdir}/source.parquet", row_group_size=40)
+    filters = [("id", "in", [1, 2]), ("x", "<", 0.5)]
+    expected = df[df.id.isin([1, 2]) & (df.x < 0.5)][["x", "id"]].reset_index(drop=True)
+
+    csv_source = CSVSource(
+        path=f"{tmpdir}/source.csv", key_field="id", columns=["x"], filters=filters
+    )
+    parquet_source = ParquetSource(
+        path=f"{tmpdir}/source.parquet", key_field="id", columns=["x"], filters=filters,
+    )
+    for source in [csv_source, parquet_source]:
+        # csv columns are in the file order
+        result = source.to_dataframe().reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected, check_like=True)
+        chunks = list(source.to_dataframe_chunks(5))
+        assert max(len(chunk) for chunk in chunks) <= 5
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks, ignore_index=True), expected, check_like=True
+        )
+
+    # only the first row group can match
+    chunks = list(
+        ParquetSource(
+            path=f"{tmpdir}/source.parquet", filters=[("x", "<", 0.3)]
+        ).to_dataframe_chunks(100)
+    )
+    assert len(chunks) == 1
+
+    # kept in the source spec
+    source = ParquetSource.from_dict(parquet_source.to_dict())
+    assert source.columns == ["x"]
+    pd.testing.assert_frame_equal(source.to_dataframe(), expected)
+
+
+@pytest.mark.parametrize("source_kind", ["csv", "parquet"])
+def test_ingest_filtered_source(tmpdir, source_kind):
+    df = _source_df()
+    df.to_csv(f"{tmpdir}/source.csv", index=False)
+    df.to_parquet(f"{tmpdir}/source.parquet")
+    source_class = CSVSource if source_kind == "csv" else ParquetSource
+    source = source_class(
+        path=f"{tmpdir}/source.{source_kind}", filters=[("id", "=", 3)]
+    )
+    feature_set = _feature_set("storey")
+    result = fs.ingest(
+        feature_set, source, targets=[ParquetTarget(path=f"{tmpdir}/target.parquet")]
+    )
+    expected = df[df.id == 3]
+    assert len(result) == len(expected)
+    assert result["x"].tolist() == pytest.approx(expected["x"].tolist())
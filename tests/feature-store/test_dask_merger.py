@@ -0,0 +1,76 @@
+import unittest.mock
+
+import dask.dataframe as dd
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from test_local_merger import _merge_inputs
+
+import mlrun.errors
+import mlrun.feature_store as fs
+from mlrun.datastore.targets import ParquetTarget
+from mlrun.feature_store.retrieval import (
+    DaskFeatureMerger,
+    LocalFeatureMerger,
+    get_merger,
+)
+
+sort_columns = ["time", "ticker"]
+
+
+def _sorted(df):
+    return df.sort_values(sort_columns, ignore_index=True)
+
+
+def test_dask_merge_same_as_local_merge():
+    trades, feature_sets, dfs = _merge_inputs()
+    local_merger = LocalFeatureMerger(fs.FeatureVector("vector", []))
+    local_merger.merge(trades, "time", feature_sets, dfs)
+
+    dask_merger = DaskFeatureMerger(fs.FeatureVector("vector", []), npartitions=2)
+    dask_merger.merge(trades, "time", feature_sets, dfs)
+    df = dask_merger.get_df().compute()
+    assert_frame_equal(_sorted(df), _sorted(local_merger.get_df()))
+
+
+def test_dask_merger_start_from_parquet_targets(tmpdir):
+    trades, feature_sets, dfs = _merge_inputs()
+    vector = fs.FeatureVector("vector", ["quotes.bid", "stocks.name"])
+    # the feature sets are read (lazily) from their parquet targets
+    targets = {}
+    for feature_set, df in zip(feature_sets, dfs):
+        target = ParquetTarget(path=f"{tmpdir}/{feature_set.metadata.name}.parquet")
+        df.to_parquet(target.path)
+        targets[feature_set.metadata.name] = target
+    vector.parse_features = unittest.mock.Mock(
+        return_value=(
+            {feature_set.metadata.name: feature_set for feature_set in feature_sets},
+            {"quotes": [("bid", None)], "stocks": [("name", None)]},
+        )
+    )
+    vector.save = unittest.mock.Mock()
+
+    with unittest.mock.patch(
+        "mlrun.feature_store.feature_set.get_offline_target",
+        side_effect=lambda feature_set, name=None: targets[feature_set.metadata.name],
+    ):
+        local_df = LocalFeatureMerger(vector).start(trades, "time").to_dataframe()
+        with unittest.mock.patch.object(
+            ParquetTarget, "as_df", autospec=True, side_effect=ParquetTarget.as_df
+        ) as as_df:
+            response = get_merger("dask")(vector, npartitions=2).start(trades, "time")
+    df = response.to_dataframe()
+    assert isinstance(df, pd.DataFrame)
+    assert_frame_equal(
+        df.sort_values(["price", "quote_time"], ignore_index=True),
+        local_df.sort_values(["price", "quote_time"], ignore_index=True),
+    )
+    assert as_df.call_args_list
+    assert all(call[1]["df_module"] is dd for call in as_df.call_args_list)
+
+
+def test_get_merger():
+    assert get_merger(None) == LocalFeatureMerger
+    assert get_merger("dask") == DaskFeatureMerger
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        get_merger("spark")
@@ -1,8 +1,12 @@
+import dask.dataframe as dd
 import deepdiff
+import numpy as np
 import pandas as pd
+import pytest
 
 import mlrun.feature_store as fs
 from mlrun.data_types import InferOptions
+from mlrun.data_types.infer import DFStatsAccumulator, QuantileSketch, get_df_stats
 from mlrun.datastore.targets import ParquetTarget
 from mlrun.feature_store.api import infer_from_static_df
 from tests.conftest import tests_root_directory
@@ -99,3 +103,141 @@ def test_backwards_compatibility_step_vs_state():
     assert (
         deepdiff.DeepDiff(from_dict_feature_set.to_dict(), quotes_set.to_dict()) == {}
     )
+
+
+def _describe_stats(df, num_bins=20):
+    # the stats as computed by pandas describe
+    results = {}
+    for col, values in df.describe(
+        include="all", percentiles=[], datetime_is_numeric=True
+    ).items():
+        stats_dict = {}
+        for stat, val in values.dropna().items():
+            if stat == "50%":
+                continue
+            if isinstance(val, (float, np.floating)):
+                stats_dict[stat] = float(val)
+            elif isinstance(val, (int, np.integer)) and not isinstance(val, bool):
+                stats_dict[stat] = int(val)
+            else:
+                stats_dict[stat] = str(val)
+        if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(
+            df[col]
+        ):
+            hist, bins = np.histogram(df[col].dropna(), bins=num_bins)
+            stats_dict["hist"] = [hist.tolist(), bins.tolist()]
+        results[col] = stats_dict
+    return results
+
+
+def test_stats_accumulator():
+    df = pd.read_csv(this_dir + "testdata.csv")
+    df.set_index("patient_id", inplace=True)
+    options = InferOptions.default()
+    expected = get_df_stats(df, options)
+    # same as pandas describe
+    for column, column_stats in _describe_stats(df.reset_index()).items():
+        hist = column_stats.pop("hist", None)
+        assert {
+            stat: value for stat, value in expected[column].items() if stat != "hist"
+        } == pytest.approx(column_stats), column
+        if hist:
+            assert expected[column]["hist"][0] == hist[0]
+            assert expected[column]["hist"][1] == pytest.approx(hist[1])
+
+    stats = DFStatsAccumulator(options)
+    stats.update(df)
+    assert stats.get_stats() == expected
+    assert stats.get_preview() == fs.api.get_infer_interface(df).get_preview(df)
+
+    # merged chunk by chunk
+    chunks_stats = DFStatsAccumulator(options)
+    for start in range(0, len(df), 50):
+        chunks_stats.update(df.iloc[start : start + 50])
+    for column, column_stats in chunks_stats.get_stats().items():
+        hist = column_stats.pop("hist", None)
+        expected_hist = expected[column].pop("hist", None)
+        assert column_stats == pytest.approx(expected[column]), column
+        if expected_hist:
+            assert sum(hist[0]) == sum(expected_hist[0])
+            assert hist[1][0] == expected_hist[1][0]
+            assert hist[1][-1] == expected_hist[1][-1]
+
+    # stats of different partitions
+    partition_stats = DFStatsAccumulator(options)
+    partition_stats.update(df.iloc[:100])
+    other_partition_stats = DFStatsAccumulator(options)
+    other_partition_stats.update(df.iloc[100:])
+    partition_stats.merge(other_partition_stats)
+    assert partition_stats.get_stats()["hr"]["std"] == pytest.approx(
+        expected["hr"]["std"]
+    )
+    assert partition_stats.get_stats()["department"] == expected["department"]
+
+
+def test_sampled_stats():
+    rows = 10000
+    df = pd.DataFrame(
+        {
+            "x": np.random.default_rng(1).normal(10, 2, rows),
+            "group": np.where(np.arange(rows) % 10 == 0, "a", "b"),
+        }
+    )
+    options = InferOptions.Histogram + InferOptions.Quantiles + InferOptions.Sample
+    stats = get_df_stats(df, options, sample_size=1000, random_state=1)
+    # the counts and moments are exact, the rest are estimated from the sample
+    assert stats["x"]["count"] == rows
+    assert stats["x"]["mean"] == pytest.approx(df["x"].mean())
+    assert stats["x"]["std"] == pytest.approx(df["x"].std())
+    assert sum(stats["x"]["hist"][0]) == pytest.approx(rows, abs=10)
+    for quantile in [0.25, 0.5, 0.75]:
+        assert stats["x"][f"{quantile * 100:g}%"] == pytest.approx(
+            df["x"].quantile(quantile), abs=0.2
+        )
+    assert stats["group"]["count"] == rows
+    assert stats["group"]["top"] == "b"
+    assert stats["group"]["freq"] == pytest.approx(9000, rel=0.05)
+
+    # the stratified sample keeps the groups proportions
+    stats = get_df_stats(
+        df, options, sample_size=1000, stratify_by="group", random_state=1
+    )
+    assert stats["group"]["freq"] == 9000
+
+
+def test_quantile_sketch_merge():
+    values = np.random.default_rng(2).exponential(5, 100000)
+    sketch = QuantileSketch(compression=100)
+    for chunk in np.array_split(values, 10):
+        chunk_sketch = QuantileSketch(compression=100)
+        chunk_sketch.update(chunk)
+        sketch.merge(chunk_sketch)
+    assert len(sketch.means) <= 100
+    assert sketch.quantile(0) == values.min()
+    assert sketch.quantile(1) == values.max()
+    for quantile in [0.01, 0.25, 0.5, 0.75, 0.99]:
+        assert sketch.quantile(quantile) == pytest.approx(
+            np.quantile(values, quantile), rel=0.02
+        )
+
+
+def test_dask_df_stats():
+    df = pd.read_csv(this_dir + "testdata.csv")
+    options = InferOptions.Histogram + InferOptions.Quantiles
+    expected = get_df_stats(df, options)
+    stats = get_df_stats(dd.from_pandas(df, npartitions=3), options)
+    assert stats.keys() == expected.keys()
+    for column, column_stats in stats.items():
+        hist = column_stats.pop("hist", None)
+        expected_hist = expected[column].pop("hist", None)
+        for quantile in ["25%", "50%", "75%"]:
+            if quantile in expected[column]:
+                # the partitions sketches are merged, the interpolation between the values of the (mostly discrete)
+                # columns can differ by a fraction of their range
+                tolerance = (column_stats["max"] - column_stats["min"]) * 0.1
+                assert column_stats.pop(quantile) == pytest.approx(
+                    expected[column].pop(quantile), abs=tolerance
+                )
+        assert column_stats == pytest.approx(expected[column]), column
+        if expected_hist:
+            assert sum(hist[0]) == sum(expected_hist[0])
@@ -0,0 +1,242 @@
+import unittest.mock
+
+import pandas as pd
+import pyarrow as pa
+from pandas.testing import assert_frame_equal
+
+import mlrun
+import mlrun.feature_store as fs
+from mlrun.datastore.targets import ParquetTarget
+from mlrun.datastore.utils import filter_df
+from mlrun.feature_store.retrieval import LocalFeatureMerger
+
+
+def _feature_set(name, timestamp_key=None):
+    return fs.FeatureSet(
+        name, entities=[fs.Entity("ticker")], timestamp_key=timestamp_key
+    )
+
+
+def _merge_inputs():
+    trades = pd.DataFrame(
+        {
+            "time": pd.to_datetime(
+                [
+                    "2016-05-25 13:30:00.023",
+                    "2016-05-25 13:30:00.038",
+                    "2016-05-25 13:30:00.048",
+                    "2016-05-25 13:30:00.048",
+                    "2016-05-25 13:30:00.049",
+                ]
+            ),
+            "ticker": ["MSFT", "MSFT", "GOOG", "AAPL", "GOOG"],
+            "price": [51.95, 51.95, 720.77, 98.00, 720.92],
+        }
+    )
+    # unsorted and with the entity as the index, as read from the offline target
+    quotes = pd.DataFrame(
+        {
+            "quote_time": pd.to_datetime(
+                [
+                    "2016-05-25 13:30:00.048",
+                    "2016-05-25 13:30:00.023",
+                    "2016-05-25 13:30:00.030",
+                    "2016-05-25 13:30:00.041",
+                    "2016-05-25 13:30:00.049",
+                    "2016-05-25 13:30:00.072",
+                ]
+            ),
+            "ticker": ["GOOG", "GOOG", "MSFT", "MSFT", "AAPL", "GOOG"],
+            "bid": [720.5, 720.5, 51.97, 51.99, 97.99, 720.5],
+        }
+    ).set_index("ticker")
+    stocks = pd.DataFrame(
+        {"ticker": ["MSFT", "GOOG", "AAPL"], "name": ["Microsoft", "Google", "Apple"]}
+    ).set_index("ticker")
+    feature_sets = [
+        _feature_set("quotes", "quote_time"),
+        _feature_set("stocks"),
+    ]
+    return trades, feature_sets, [quotes, stocks]
+
+
+def test_merge_asof_and_join():
+    trades, feature_sets, dfs = _merge_inputs()
+    merger = LocalFeatureMerger(fs.FeatureVector("vector", []))
+    merger.merge(trades, "time", feature_sets, dfs)
+
+    expected = pd.merge_asof(
+        trades,
+        dfs[0].reset_index().sort_values("quote_time"),
+        left_on="time",
+        right_on="quote_time",
+        by=["ticker"],
+    ).merge(dfs[1].reset_index(), on=["ticker"])
+    assert_frame_equal(merger.get_df(), expected)
+    bids = merger.get_df().set_index(["ticker", "time"])["bid"]
+    assert bids["MSFT"].tolist()[1] == 51.97
+    # no quote before the trade
+    assert bids["AAPL"].isna().all()
+
+    # chunks are joined the same way
+    chunks = list(
+        merger._iterate_merged_chunks(trades, "time", feature_sets, dfs, chunk_size=2)
+    )
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    # the join (of stocks) groups the rows by key, so the order within the chunks differs
+    sort_columns = ["time", "ticker"]
+    assert_frame_equal(
+        pd.concat(chunks).sort_values(sort_columns, ignore_index=True),
+        expected.sort_values(sort_columns, ignore_index=True),
+    )
+
+
+def test_parquet_target_write_dataframe_chunks(tmpdir):
+    trades, _, _ = _merge_inputs()
+    target = ParquetTarget(path=f"{tmpdir}/chunks.parquet")
+    size = target.write_dataframe_chunks(
+        [trades.iloc[:2], trades.iloc[2:4], trades.iloc[4:]]
+    )
+    assert size > 0
+    assert_frame_equal(pd.read_parquet(f"{tmpdir}/chunks.parquet"), trades)
+
+
+def test_parquet_target_write_dataframe_chunks_schema(tmpdir):
+    # the types can't be inferred from the first chunk: no values in the "s" column and no missing "i" values
+    chunks = [
+        pd.DataFrame({"i": [1], "s": pd.Series([None], dtype=object)}),
+        pd.DataFrame({"i": [1.5], "s": ["v"]}),
+    ]
+    target = ParquetTarget(path=f"{tmpdir}/chunks.parquet")
+    target.write_dataframe_chunks(
+        chunks, schema=pa.schema([("i", pa.float64()), ("s", pa.string())])
+    )
+    df = pd.read_parquet(f"{tmpdir}/chunks.parquet")
+    assert df["i"].tolist() == [1.0, 1.5]
+    assert df["s"].tolist() == [None, "v"]
+
+
+def test_start_with_chunks_to_parquet_target(tmpdir):
+    trades, feature_sets, dfs = _merge_inputs()
+    vector = fs.FeatureVector("vector", ["quotes.bid", "stocks.name"])
+    for feature_set, df in zip(feature_sets, dfs):
+        feature_set.to_dataframe = unittest.mock.Mock(return_value=df)
+    vector.parse_features = unittest.mock.Mock(
+        return_value=(
+            {feature_set.metadata.name: feature_set for feature_set in feature_sets},
+            {"quotes": [("bid", None)], "stocks": [("name", None)]},
+        )
+    )
+    vector.save = unittest.mock.Mock()
+
+    target = ParquetTarget(path=f"{tmpdir}/vector.parquet")
+    response = LocalFeatureMerger(vector).start(
+        trades, "time", target=target, chunk_size=2
+    )
+    df = response.to_dataframe()
+    assert sorted(df.columns) == ["bid", "name", "price", "quote_time"]
+    assert len(df) == len(trades)
+    assert sorted(df["name"].tolist()) == sorted(
+        ["Microsoft", "Microsoft", "Google", "Apple", "Google"]
+    )
+
+
+def test_start_with_chunks_misses_in_later_chunk(tmpdir):
+    trades, feature_sets, _ = _merge_inputs()
+    # the trades of the first chunk (2 rows) have quotes, the AAPL trade has no quote before it
+    quotes = pd.DataFrame(
+        {
+            "quote_time": pd.to_datetime(
+                [
+                    "2016-05-25 13:30:00.048",
+                    "2016-05-25 13:30:00.020",
+                    "2016-05-25 13:30:00.023",
+                    "2016-05-25 13:30:00.041",
+                    "2016-05-25 13:30:00.060",
+                ]
+            ),
+            "ticker": ["GOOG", "MSFT", "GOOG", "MSFT", "AAPL"],
+            "size": [6, 3, 5, 4, 7],
+        }
+    )
+    # no flags before the first chunk (2 trades) time
+    flags = pd.DataFrame(
+        {
+            "flag_time": pd.to_datetime(
+                ["2016-05-25 13:30:00.040", "2016-05-25 13:30:00.045"]
+            ),
+            "ticker": ["GOOG", "AAPL"],
+            "active": [True, False],
+        }
+    )
+    feature_sets = [feature_sets[0], _feature_set("flags", "flag_time")]
+    for feature_set, feature, value_type in zip(
+        feature_sets, ["size", "active"], ["int", "bool"]
+    ):
+        feature_set.spec.features[feature] = fs.Feature(value_type=value_type)
+    for feature_set, df in zip(feature_sets, [quotes, flags]):
+        feature_set.to_dataframe = unittest.mock.Mock(
+            side_effect=lambda df=df, **kwargs: filter_df(df, kwargs["filters"])
+        )
+    vector = fs.FeatureVector("vector", ["quotes.size", "flags.active"])
+    vector.parse_features = unittest.mock.Mock(
+        return_value=(
+            {feature_set.metadata.name: feature_set for feature_set in feature_sets},
+            {"quotes": [("size", None)], "flags": [("active", None)]},
+        )
+    )
+    vector.save = unittest.mock.Mock()
+
+    target = ParquetTarget(path=f"{tmpdir}/vector.parquet")
+    with unittest.mock.patch(
+        "mlrun.feature_store.retrieval.local_merger.get_offline_target",
+        return_value=ParquetTarget(),
+    ):
+        response = LocalFeatureMerger(vector).start(
+            trades, "time", target=target, chunk_size=2
+        )
+    df = response.to_dataframe()
+    assert df["size"].tolist()[:3] == [3.0, 3.0, 6.0]
+    assert pd.isna(df["size"][3])
+    assert df["active"].tolist() == [None, None, True, False, True]
+
+    # the feature sets are read by the time windows of the chunks
+    filters = feature_sets[0].to_dataframe.call_args_list[1][1]["filters"]
+    assert filters == [
+        [
+            ("ticker", "in", ["MSFT", "GOOG", "AAPL"]),
+            ("quote_time", ">", pd.Timestamp("2016-05-25 13:30:00.038")),
+            ("quote_time", "<=", pd.Timestamp("2016-05-25 13:30:00.048")),
+        ]
+    ]
+
+
+def test_entity_filters_pushdown():
+    trades, feature_sets, dfs = _merge_inputs()
+    trades = trades[trades.ticker == "MSFT"]
+    vector = fs.FeatureVector("vector", ["quotes.bid", "stocks.name"])
+    for feature_set, df in zip(feature_sets, dfs):
+        feature_set.to_dataframe = unittest.mock.Mock(return_value=df)
+    vector.parse_features = unittest.mock.Mock(
+        return_value=(
+            {feature_set.metadata.name: feature_set for feature_set in feature_sets},
+            {"quotes": [("bid", None)], "stocks": [("name", None)]},
+        )
+    )
+    vector.save = unittest.mock.Mock()
+
+    df = LocalFeatureMerger(vector).start(trades, "time").to_dataframe()
+    assert df["name"].tolist() == ["Microsoft", "Microsoft"]
+    # only the rows of the entity rows keys are read
+    for feature_set in feature_sets:
+        filters = feature_set.to_dataframe.call_args[1]["filters"]
+        assert filters == [("ticker", "in", ["MSFT"])]
+
+    # too many keys to filter by
+    max_keys = mlrun.mlconf.feature_store.max_entity_filter_keys
+    mlrun.mlconf.feature_store.max_entity_filter_keys = 0
+    try:
+        LocalFeatureMerger(vector).start(trades, "time")
+    finally:
+        mlrun.mlconf.feature_store.max_entity_filter_keys = max_keys
+    assert feature_sets[0].to_dataframe.call_args[1]["filters"] is None
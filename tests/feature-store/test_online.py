@@ -0,0 +1,170 @@
+import time
+import unittest.mock
+
+import pandas as pd
+from storey import Driver, Table
+
+import mlrun.feature_store as fs
+from mlrun.feature_store import Feature
+from mlrun.feature_store.feature_vector import FixedWindowType, OnlineVectorService
+from mlrun.feature_store.retrieval.online import init_feature_vector_graph
+
+
+class _InMemoryDriver(Driver):
+    def __init__(self, rows: dict):
+        self.rows = rows
+        self.loads = 0
+
+    async def _load_aggregates_by_key(self, container, table_path, key):
+        self.loads += 1
+        row = self.rows.get(key)
+        return None, dict(row) if row else None
+
+
+def _online_service_with_in_memory_table(
+    driver: Driver, **cache_options
+) -> OnlineVectorService:
+    stocks = fs.FeatureSet("stocks", entities=[fs.Entity("ticker")])
+    vector = fs.FeatureVector("vector", ["stocks.*"])
+    vector.status.features = [Feature(name="name"), Feature(name="exchange")]
+    online_target = unittest.mock.Mock()
+    online_target.get_table_object.side_effect = lambda driver_wrapper=None: Table(
+        "", driver_wrapper(driver) if driver_wrapper else driver
+    )
+    with unittest.mock.patch.object(
+        fs.FeatureVector,
+        "parse_features",
+        return_value=(
+            {"stocks": stocks},
+            {"stocks": [("name", None), ("exchange", None)]},
+        ),
+    ), unittest.mock.patch(
+        "mlrun.feature_store.retrieval.online.get_online_target",
+        return_value=online_target,
+    ):
+        graph, index_columns, online_caches = init_feature_vector_graph(
+            vector, FixedWindowType.LastClosedWindow, **cache_options
+        )
+    return OnlineVectorService(vector, graph, index_columns, online_caches)
+
+
+def test_online_vector_service_get():
+    service = _online_service_with_in_memory_table(
+        _InMemoryDriver(
+            {
+                "GOOG": {"name": "Alphabet Inc", "exchange": "NASDAQ"},
+                "MSFT": {"name": "Microsoft"},
+            }
+        )
+    )
+    emit = unittest.mock.Mock(wraps=service._controller.emit)
+    service._controller.emit = emit
+    try:
+        entity_rows = [
+            {"ticker": "GOOG"},
+            {"ticker": "MSFT"},
+            {"ticker": "not-existing"},
+            {"ticker": "GOOG"},
+        ]
+        vectors = service.get(entity_rows)
+        assert vectors == [
+            {"name": "Alphabet Inc", "exchange": "NASDAQ"},
+            {"name": "Microsoft", "exchange": None},
+            None,
+            {"name": "Alphabet Inc", "exchange": "NASDAQ"},
+        ]
+        # identical entities are queried once, but don't share the result object
+        assert emit.call_count == 3
+        assert vectors[0] is not vectors[3]
+
+        assert service.get(entity_rows, as_list=True) == [
+            ["Alphabet Inc", "NASDAQ"],
+            ["Microsoft", None],
+            None,
+            ["Alphabet Inc", "NASDAQ"],
+        ]
+
+        df = service.get(pd.DataFrame(entity_rows), return_df=True)
+        assert list(df.columns) == ["name", "exchange"]
+        assert df["name"].tolist()[:2] == ["Alphabet Inc", "Microsoft"]
+        assert df.iloc[2].isna().all()
+    finally:
+        service.close()
+
+
+def test_online_vector_service_cache():
+    driver = _InMemoryDriver(
+        {
+            "GOOG": {"name": "Alphabet Inc", "exchange": "NASDAQ"},
+            "MSFT": {"name": "Microsoft", "exchange": "NASDAQ"},
+            "AAPL": {"name": "Apple Inc", "exchange": "NASDAQ"},
+        }
+    )
+    service = _online_service_with_in_memory_table(
+        driver, cache_size=2, cache_ttl={"stocks": 60}
+    )
+    try:
+        assert service.get({"ticker": "GOOG"}) == [
+            {"name": "Alphabet Inc", "exchange": "NASDAQ"}
+        ]
+        assert service.get({"ticker": "GOOG"}) == [
+            {"name": "Alphabet Inc", "exchange": "NASDAQ"}
+        ]
+        assert driver.loads == 1
+
+        # missing keys are cached as well
+        assert service.get({"ticker": "not-existing"}) == [None]
+        assert service.get({"ticker": "not-existing"}) == [None]
+        assert driver.loads == 2
+
+        # the least recently used key (GOOG) is evicted
+        service.get({"ticker": "MSFT"})
+        service.get({"ticker": "GOOG"})
+        assert driver.loads == 4
+        assert service.cache_stats == {
+            "stocks": {
+                "size": 2,
+                "hits": 1,
+                "negative_hits": 1,
+                "misses": 4,
+                "evictions": 2,
+                "expirations": 0,
+            }
+        }
+    finally:
+        service.close()
+
+    # feature sets without a ttl are not cached
+    driver = _InMemoryDriver({"GOOG": {"name": "Alphabet Inc"}})
+    service = _online_service_with_in_memory_table(
+        driver, cache_size=2, cache_ttl={"other": 60}
+    )
+    try:
+        service.get({"ticker": "GOOG"})
+        service.get({"ticker": "GOOG"})
+        assert driver.loads == 2
+        assert service.cache_stats == {}
+    finally:
+        service.close()
+
+
+def test_online_vector_service_cache_ttl():
+    driver = _InMemoryDriver({"GOOG": {"name": "Alphabet Inc", "exchange": "NASDAQ"}})
+    service = _online_service_with_in_memory_table(driver, cache_size=10, cache_ttl=0.5)
+    try:
+        service.get({"ticker": "GOOG"})
+        driver.rows["GOOG"] = {"name": "Google", "exchange": "NASDAQ"}
+        assert service.get({"ticker": "GOOG"}) == [
+            {"name": "Alphabet Inc", "exchange": "NASDAQ"}
+        ]
+        assert driver.loads == 1
+
+        # the (storey) table reads the expired key from the driver again
+        time.sleep(0.6)
+        assert service.get({"ticker": "GOOG"}) == [
+            {"name": "Google", "exchange": "NASDAQ"}
+        ]
+        assert driver.loads == 2
+        assert service.cache_stats["stocks"]["expirations"] == 1
+    finally:
+        service.close()
@@ -0,0 +1,137 @@
+from datetime import datetime
+
+from storey import (
+    AggregateByKey,
+    FlatMap,
+    Map,
+    NoopDriver,
+    Reduce,
+    SyncEmitSource,
+    Table,
+    build_flow,
+)
+from storey.dtypes import SlidingWindows
+
+from mlrun.model_monitoring.stream_processing import (
+    ENDPOINT_ID,
+    ISO_8061_UTC,
+    ComputeColumnarAggregations,
+    EventStreamProcessor,
+    FilterNotNone,
+    MapFeatureNames,
+    ProcessEndpointEvent,
+    build_aggregators,
+    enrich_even_details,
+    explode_columnar_event,
+)
+
+
+def _processing_steps(columnar: bool, endpoint_id: str):
+    process_endpoint_event = ProcessEndpointEvent(
+        kv_container="", kv_path="", v3io_access_key="", columnar=columnar
+    )
+    map_feature_names = MapFeatureNames(
+        kv_container="", kv_path="", access_key="", columnar=columnar
+    )
+    # skip the endpoint records lookup (kv)
+    process_endpoint_event.endpoints.add(endpoint_id)
+    map_feature_names.feature_names[endpoint_id] = ["a", "b", "c"]
+    map_feature_names.label_columns[endpoint_id] = ["label"]
+    if columnar:
+        return [process_endpoint_event, FilterNotNone(), map_feature_names]
+    return [
+        process_endpoint_event,
+        FilterNotNone(),
+        FlatMap(lambda x: x),
+        map_feature_names,
+    ]
+
+
+def _run_flow(steps, events):
+    controller = build_flow(
+        [SyncEmitSource(), *steps, Reduce([], lambda acc, x: acc + [x])]
+    ).run()
+    for event in events:
+        controller.emit(
+            event,
+            key=event[ENDPOINT_ID],
+            event_time=datetime.strptime(event["when"], ISO_8061_UTC),
+        )
+    controller.terminate()
+    return controller.await_termination()
+
+
+def _generate_events():
+    events = []
+    for index in range(5):
+        inputs = [[index, row, row * 0.5] for row in range(index + 1)]
+        if index == 3:
+            # invalid invocation, filtered out by both modes
+            inputs[0][1] = "x"
+        events.append(
+            {
+                "function_uri": "default/serving",
+                "model": "model",
+                "class": "Model",
+                "labels": {"a": "b"},
+                "when": f"2021-08-01 10:00:0{index}.000000+0000",
+                "microsec": 100 * (index + 1),
+                "request": {"id": f"id-{index}", "inputs": inputs},
+                "resp": {"outputs": [row % 2 for row in range(index + 1)]},
+            }
+        )
+    return [enrich_even_details(event) for event in events]
+
+
+def test_columnar_processing_same_as_row_processing():
+    events = _generate_events()
+    endpoint_id = events[0][ENDPOINT_ID]
+
+    parquet_steps = [Map(EventStreamProcessor.process_before_parquet)]
+    rows = _run_flow(_processing_steps(False, endpoint_id) + parquet_steps, events)
+    columnar_rows = _run_flow(
+        _processing_steps(True, endpoint_id)
+        + [FlatMap(explode_columnar_event)]
+        + parquet_steps,
+        _generate_events(),
+    )
+    assert len(rows) == 1 + 2 + 3 + 5
+    assert columnar_rows == rows
+    assert rows[-1]["named_features"] == {"a": 4, "b": 4, "c": 2.0}
+    assert rows[-1]["named_predictions"] == {"label": 0}
+
+
+def test_columnar_aggregations_count_rows():
+    count_windows = SlidingWindows(["5m", "1h"], "30s")
+    avg_windows = SlidingWindows(["5m", "1h"], "30s")
+
+    def aggregation_steps(columnar):
+        steps = [
+            AggregateByKey(
+                aggregates=build_aggregators(columnar, count_windows, avg_windows),
+                table=Table("notable", NoopDriver()),
+            )
+        ]
+        if columnar:
+            steps.append(ComputeColumnarAggregations(["5m", "1h"], ["5m", "1h"]))
+        return steps
+
+    events = _generate_events()
+    endpoint_id = events[0][ENDPOINT_ID]
+    results = _run_flow(
+        _processing_steps(False, endpoint_id) + aggregation_steps(False), events
+    )
+    columnar_results = _run_flow(
+        _processing_steps(True, endpoint_id) + aggregation_steps(True),
+        _generate_events(),
+    )
+
+    # the last event of each mode holds the aggregations of all the processed rows
+    for key in [
+        "predictions_count_5m",
+        "predictions_count_1h",
+        "latency_avg_5m",
+        "latency_avg_1h",
+    ]:
+        assert columnar_results[-1][key] == results[-1][key], key
+    assert columnar_results[-1]["predictions_count_5m"] == 11
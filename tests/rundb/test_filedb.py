@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import unittest.mock
 from datetime import datetime, timedelta, timezone
 from tempfile import mkdtemp
 
 import pytest
 
 from mlrun.db import FileRunDB
+from mlrun.db.filedb import run_logs
+from mlrun.db.fileindex import index_filename
 
 
 @pytest.fixture
@@ -89,3 +93,130 @@ def test_list_artifact_date(db: FileRunDB):
 
     arts = db.list_artifacts(project=prj, since=t2, until=t2, tag="*")
     assert 2 == len(arts), "since/until t2"
+
+
+def _store_runs(db: FileRunDB, project):
+    for i in range(10):
+        run = {
+            "metadata": {
+                "name": f"run{i % 3}",
+                "uid": f"uid{i}",
+                "iteration": 0,
+                "labels": {"kind": "job" if i % 2 else "dask"},
+            },
+            "status": {
+                "state": "completed" if i % 4 else "error",
+                "start_time": datetime(2021, 1, 1 + i, tzinfo=timezone.utc).isoformat(),
+            },
+        }
+        db.store_run(run, f"uid{i}", project)
+        # a child iteration
+        run["metadata"]["iteration"] = 1
+        run["status"]["start_time"] = datetime(
+            2021, 1, 1 + i, 1, tzinfo=timezone.utc
+        ).isoformat()
+        db.store_run(run, f"uid{i}", project, iter=1)
+
+
+def test_indexed_lists(db: FileRunDB):
+    prj = "indexed"
+    _store_runs(db, prj)
+    db.store_artifact("k1", {"key": "k1", "labels": {"a": "1"}}, "u1", project=prj)
+    db.store_artifact("k2", {"key": "k2"}, "u1", tag="v1", project=prj)
+    db.store_function({"metadata": {"labels": {"a": "1"}}}, "f1", prj)
+    db.store_function({}, "f2", prj, versioned=True)
+    unindexed_db = FileRunDB(dirpath=db.dirpath, use_index=False)
+    unindexed_db.connect()
+
+    for kwargs in [
+        {},
+        {"name": "run1"},
+        {"labels": ["kind=job"]},
+        {"state": ["error"], "iter": True},
+        {"uid": "uid3", "iter": True},
+        {"start_time_from": datetime(2021, 1, 5, tzinfo=timezone.utc), "last": 3},
+    ]:
+        runs = db.list_runs(project=prj, **kwargs)
+        assert runs == unindexed_db.list_runs(project=prj, **kwargs), kwargs
+    assert len(db.list_runs(project=prj, iter=True)) == 20
+
+    for kwargs in [{}, {"tag": "*"}, {"tag": "v1"}, {"tag": "*", "name": "k2"}]:
+        # the files are listed in no particular order
+        artifacts = db.list_artifacts(project=prj, **kwargs)
+        assert sorted(artifacts, key=str) == sorted(
+            unindexed_db.list_artifacts(project=prj, **kwargs), key=str
+        )
+    assert len(db.list_artifacts(project=prj, tag="*")) == 4
+
+    functions = db.list_functions(project=prj)
+    assert sorted(functions, key=str) == sorted(
+        unindexed_db.list_functions(project=prj), key=str
+    )
+    assert len(db.list_functions(project=prj, labels=["a=1"])) == 1
+
+    # only the files of the listed runs are read
+    with unittest.mock.patch.object(db, "_loads", wraps=db._loads) as loads:
+        runs = db.list_runs(project=prj, last=2)
+    assert [run["metadata"]["uid"] for run in runs] == ["uid9", "uid8"]
+    assert loads.call_count == 2
+
+    db.del_runs(project=prj, state="error")
+    assert len(db.list_runs(project=prj, iter=True)) == 14
+    assert not db.list_runs(project=prj, state="error")
+
+
+def test_rebuild_index(db: FileRunDB):
+    prj = "rebuilt"
+    unindexed_db = FileRunDB(dirpath=db.dirpath, use_index=False)
+    unindexed_db.connect()
+    _store_runs(unindexed_db, prj)
+    unindexed_db.store_artifact("k1", {"key": "k1"}, "u1", project=prj)
+
+    db.rebuild_index()
+    assert len(db.list_runs(project=prj)) == 10
+    assert len(db.list_artifacts(project=prj, tag="*")) == 2
+
+    # deleted by another tool
+    os.remove(db._filepath(run_logs, prj, "uid9", "") + db.format)
+    assert len(db.list_runs(project=prj)) == 9
+
+    # an existing dir is indexed on first use
+    new_db = FileRunDB(dirpath=mkdtemp(prefix="mlrun-test"))
+    new_db.connect()
+    _store_runs(FileRunDB(dirpath=new_db.dirpath, use_index=False).connect(), prj)
+    assert len(FileRunDB(dirpath=new_db.dirpath).connect().list_runs(project=prj)) == 10
+
+
+def test_no_index_without_dirpath(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    db = FileRunDB().connect()
+    db.store_run({"status": {"state": "running"}}, "uid-1", "p1")
+    assert len(db.list_runs(project="p1")) == 1
+    assert not os.path.exists(os.path.join(tmpdir, index_filename))
+
+
+def test_list_runs_states(db: FileRunDB):
+    db.store_run({"status": {"state": "running"}}, "uid-1", "p1")
+    db.store_run({"status": {"state": "completed"}}, "uid-2", "p1", iter=2)
+    runs = [("p1", "uid-1", 0), ("p1", "uid-2", 2), ("p1", "uid-3", 0)]
+    # read from the index, not the run files
+    with unittest.mock.patch.object(db, "read_run", side_effect=AssertionError):
+        states = db.list_runs_states(runs)
+    assert states == ["running", "completed", None]
+
+    unindexed_db = FileRunDB(dirpath=db.dirpath, use_index=False).connect()
+    assert unindexed_db.list_runs_states(runs) == states
+
+
+def test_store_runs(db: FileRunDB):
+    runs = [
+        {
+            "metadata": {"uid": "uid-1", "project": "p1", "iteration": iteration},
+            "status": {"state": "completed", "results": {"x": iteration}},
+        }
+        for iteration in range(1, 4)
+    ]
+    db.store_runs(runs)
+    assert db.read_run("uid-1", "p1", iter=2)["status"]["results"] == {"x": 2}
+    listed = db.list_runs(uid="uid-1", project="p1", iter=True)
+    assert sorted(run["metadata"]["iteration"] for run in listed) == [1, 2, 3]
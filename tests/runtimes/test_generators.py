@@ -0,0 +1,135 @@
+import random
+
+import pytest
+
+import mlrun
+from mlrun.model import HyperParamOptions
+from mlrun.runtimes.generators import (
+    BayesianGenerator,
+    GridGenerator,
+    SuccessiveHalvingGenerator,
+    grid_combination,
+    grid_size,
+    wait_for_results,
+)
+
+
+def _run_generator(generator, score):
+    """run the generator tasks one by one (like the sequential runner), return the params and barriers positions"""
+    params = []
+    barriers = []
+    for task in generator.generate(mlrun.new_task(params={"p1": 1})):
+        if task is wait_for_results:
+            barriers.append(len(params))
+            continue
+        params.append(task.spec.parameters)
+        generator.record_result(
+            {
+                "metadata": {"iteration": task.metadata.iteration},
+                "status": {
+                    "state": "completed",
+                    "results": {"score": score(task.spec.parameters)},
+                },
+            }
+        )
+    return params, barriers
+
+
+def test_lazy_grid():
+    hyperparams = {"p2": [2, 1, 3], "p3": [10, 20], "p4": ["a", "b"]}
+    generator = GridGenerator(hyperparams, HyperParamOptions())
+    expected = generator.grid_to_list()
+    tasks = list(generator.generate(mlrun.new_task(params={"p1": 1})))
+
+    assert grid_size(hyperparams) == len(tasks) == 12
+    for index, task in enumerate(tasks):
+        assert task.metadata.iteration == index + 1
+        assert task.spec.parameters == {
+            "p1": 1,
+            **{key: values[index] for key, values in expected.items()},
+        }
+    assert grid_combination(hyperparams, 11) == {"p2": 3, "p3": 20, "p4": "b"}
+
+
+def test_successive_halving():
+    options = HyperParamOptions(
+        strategy="halving",
+        selector="max.score",
+        resource_param="epochs",
+        max_resource=9,
+    )
+    generator = SuccessiveHalvingGenerator({"x": list(range(9))}, options)
+    params, barriers = _run_generator(generator, lambda p: p["x"] * p["epochs"])
+
+    # 9 configurations with 1 epoch, the best 3 with 3 epochs and the best with 9
+    assert barriers == [9, 12, 13]
+    assert [p["epochs"] for p in params] == [1] * 9 + [3] * 3 + [9]
+    assert sorted(p["x"] for p in params[9:12]) == [6, 7, 8]
+    assert params[-1]["x"] == 8
+
+    # a sample of the configurations
+    options.max_iterations = 4
+    generator = SuccessiveHalvingGenerator({"x": list(range(100))}, options)
+    params, barriers = _run_generator(generator, lambda p: -p["x"])
+    assert barriers == [4, 5]
+    assert params[-1]["x"] == min(p["x"] for p in params[:4])
+
+
+def test_hyperband():
+    options = HyperParamOptions(
+        strategy="hyperband",
+        selector="min.loss",
+        resource_param="epochs",
+        max_resource=9,
+        reduction_factor=3,
+    )
+    generator = SuccessiveHalvingGenerator(
+        {"x": list(range(20))}, options, hyperband=True
+    )
+    params, barriers = _run_generator(generator, lambda p: p["x"])
+
+    # brackets of 9 configurations (1, 3, 9 epochs), 5 configurations (3, 9 epochs) and 3 with 9 epochs
+    assert barriers == [9, 12, 13, 18, 19, 22]
+    epochs = [p["epochs"] for p in params]
+    assert epochs == [1] * 9 + [3] * 3 + [9] + [3] * 5 + [9] + [9] * 3
+
+
+def test_bayesian():
+    random.seed(7)
+    options = HyperParamOptions(
+        strategy="bayesian", selector="max.score", max_iterations=30, parallel_runs=3
+    )
+    hyperparams = {"x": list(range(10)), "y": list(range(10))}
+    generator = BayesianGenerator(hyperparams, options)
+    params, barriers = _run_generator(
+        generator, lambda p: -((p["x"] - 7) ** 2) - (p["y"] - 3) ** 2
+    )
+
+    assert len(params) == 30
+    # batches of up to parallel_runs (the 5 random starting points are split to 3 + 2)
+    assert barriers == [3] + list(range(5, 30, 3)) + [30]
+    # no configuration is tried twice
+    assert len({(p["x"], p["y"]) for p in params}) == 30
+    # the suggestions (after the random start) are better on average than the random ones
+    scores = [-((p["x"] - 7) ** 2) - (p["y"] - 3) ** 2 for p in params]
+    assert sum(scores[-10:]) / 10 > sum(scores[:6]) / 6
+
+    # stops when all the combinations were tried
+    options.max_iterations = 10
+    generator = BayesianGenerator({"x": [1, 2, 3]}, options)
+    params, _ = _run_generator(generator, lambda p: p["x"])
+    assert sorted(p["x"] for p in params) == [1, 2, 3]
+
+
+def test_adaptive_options_validation():
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        HyperParamOptions(strategy="bayesian").validate()
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        HyperParamOptions(strategy="halving", selector="max.score").validate()
+    HyperParamOptions(
+        strategy="halving",
+        selector="max.score",
+        resource_param="epochs",
+        max_resource=9,
+        max_iterations=10,
+    ).validate()
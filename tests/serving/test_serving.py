@@ -1,16 +1,26 @@
+import concurrent.futures
 import json
 import os
+import threading
 import time
+import unittest.mock
 
+import storey.flow
 from nuclio_sdk import Context as NuclioContext
 
 import mlrun
 from mlrun.runtimes import nuclio_init_hook
 from mlrun.runtimes.serving import serving_subkind
 from mlrun.serving import V2ModelServer
-from mlrun.serving.server import GraphContext, MockEvent, create_graph_server
+from mlrun.serving.server import (
+    GraphContext,
+    MockEvent,
+    _BufferedStreamPusher,
+    create_graph_server,
+)
 from mlrun.serving.states import RouterStep, TaskStep
-from mlrun.utils import logger
+from mlrun.serving.v2_serving import _ModelLogPusher
+from mlrun.utils import logger, now_date
 
 
 def generate_test_routes(model_class):
@@ -104,6 +114,20 @@ class EnsembleModelTestingClass(ModelTestingClass):
         return resp
 
 
+class SleepyEnsembleModelTestingClass(EnsembleModelTestingClass):
+    def predict(self, request):
+        time.sleep(self.get_param("sleep", 0))
+        return super().predict(request)
+
+
+class BatchingModelTestingClass(ModelTestingClass):
+    batches = []
+
+    def predict(self, request):
+        self.batches.append(len(request["inputs"]))
+        return [value * self.get_param("multiplier") for value in request["inputs"]]
+
+
 class RaiserTestingClass(V2ModelServer):
     def load(self):
         print("loading..")
@@ -176,6 +200,115 @@ def test_ensemble_infer():
     run_model("", 1250.0)
 
 
+def _ensemble_graph_server(graph, multipliers, **model_args):
+    for index, multiplier in enumerate(multipliers):
+        graph.add_route(
+            f"m{index}",
+            class_name=SleepyEnsembleModelTestingClass,
+            model_path="",
+            multiplier=multiplier,
+            **model_args.get(f"m{index}", {}),
+        )
+    server = create_graph_server(graph=graph)
+    server.init_states(None, namespace=globals())
+    server.init_object(globals())
+    return server
+
+
+def test_ensemble_classification_vote_reuses_executor():
+    graph = RouterStep(
+        class_name="mlrun.serving.routers.VotingEnsemble",
+        class_args={
+            "vote_type": "classification",
+            "prediction_col_name": "predictions",
+        },
+    )
+    server = _ensemble_graph_server(graph, [1, 2, 2, 1, 2])
+    ensemble = server.graph._object
+    executor = ensemble._executor
+    assert executor is not None, "executor should be created on post_init"
+
+    # majority of the 5 models predict 2 * input
+    for value in [1, 3]:
+        resp = server.test("/v2/models/infer", {"inputs": [value]})
+        assert resp["outputs"] == {"predictions": [2 * value]}
+    assert ensemble._executor is executor, "executor was re-created per request"
+
+    # ties are broken in favor of the smallest class
+    assert ensemble._max_vote([[3, 1, 3, 1], [2, 2, 5, 7], [4, 4, 4, 4]]) == [1, 2, 4]
+
+
+def test_ensemble_first_k_and_timeout():
+    graph = RouterStep(
+        class_name="mlrun.serving.routers.VotingEnsemble",
+        class_args={
+            "vote_type": "regression",
+            "prediction_col_name": "predictions",
+            "timeout": 1,
+        },
+    )
+    server = _ensemble_graph_server(
+        graph, [100, 200, 300], m2={"sleep": 3}, m1={"sleep": 0.2}
+    )
+
+    # the slowest model does not respond within the latency budget
+    start = time.monotonic()
+    resp = server.test("/v2/models/infer", testdata)
+    assert time.monotonic() - start < 2.5, "ensemble waited for the slow model"
+    assert resp["outputs"] == {"predictions": [750.0]}
+
+    # vote as soon as the first model responded
+    ensemble = server.graph._object
+    ensemble.timeout = None
+    ensemble.first_k = 1
+    resp = server.test("/v2/models/infer", testdata)
+    assert resp["outputs"] == {"predictions": [500.0]}
+
+
+def test_ensemble_timeout_bounds_pool_wait():
+    graph = RouterStep(
+        class_name="mlrun.serving.routers.VotingEnsemble",
+        class_args={
+            "vote_type": "regression",
+            "prediction_col_name": "predictions",
+            "timeout": 0.7,
+            "max_workers": 1,
+        },
+    )
+    server = _ensemble_graph_server(
+        graph, [100, 200], m0={"sleep": 0.5}, m1={"sleep": 0.5}
+    )
+
+    # the second model waits for the first one to free the pool thread, the wait is part of the budget
+    start = time.monotonic()
+    resp = server.test("/v2/models/infer", testdata)
+    assert time.monotonic() - start < 0.95, "ensemble waited for the queued model"
+    assert resp["outputs"] == {"predictions": [500.0]}
+
+
+def test_ensemble_async_flow():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="async")
+    router = graph.to(
+        "*mlrun.serving.routers.VotingEnsemble",
+        name="ensemble",
+        vote_type="regression",
+        prediction_col_name="predictions",
+    ).respond()
+    for index, multiplier in enumerate([100, 200, 300]):
+        router.add_route(
+            f"m{index}",
+            class_name="SleepyEnsembleModelTestingClass",
+            model_path="",
+            multiplier=multiplier,
+        )
+
+    server = fn.to_mock_server()
+    resp = server.test("/v2/models/infer", testdata)
+    server.wait_for_completion()
+    assert resp["outputs"] == {"predictions": [1000.0]}
+
+
 def test_v2_infer():
     def run_model(url, expected):
         event = MockEvent(testdata, path=f"/v2/models/{url}/infer")
@@ -249,6 +382,127 @@ def test_v2_async_mode():
     assert data["outputs"] == 5, f"wrong model response {data}"
 
 
+def test_v2_micro_batching():
+    host = create_graph_server(graph=RouterStep())
+    host.graph.add_route(
+        "my",
+        class_name=BatchingModelTestingClass,
+        model_path="",
+        multiplier=100,
+        max_batch_size=4,
+        max_batch_wait_ms=1000,
+    )
+    host.init_states(None, namespace=globals())
+    host.init_object(globals())
+    BatchingModelTestingClass.batches = []
+    model = host.graph["my"]._object
+    set_metric = model.set_metric
+    metric_threads = set()
+
+    def record_set_metric(name, value):
+        metric_threads.add(threading.current_thread().name)
+        set_metric(name, value)
+
+    model.set_metric = record_set_metric
+
+    # 4 concurrent requests (with 1 or 2 rows) are served with a single predict call
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(
+                host.test, "/v2/models/my/infer", {"inputs": [value] * (value % 2 + 1)}
+            )
+            for value in range(4)
+        ]
+        responses = [future.result() for future in futures]
+    assert BatchingModelTestingClass.batches == [6]
+    for value, resp in enumerate(responses):
+        assert resp["outputs"] == [value * 100] * (value % 2 + 1)
+
+    assert model.metrics["batch_size"] == {"4": 1}
+    assert sum(model.metrics["batch_queue_wait_ms"].values()) == 4
+    # the metrics (read by the request threads) are only updated by the request threads
+    assert metric_threads and "my-batcher" not in metric_threads
+
+
+def test_v2_micro_batching_parameters():
+    host = create_graph_server(graph=RouterStep())
+    host.graph.add_route(
+        "my",
+        class_name=BatchingModelTestingClass,
+        model_path="",
+        multiplier=100,
+        max_batch_size=4,
+        max_batch_wait_ms=1000,
+    )
+    host.init_states(None, namespace=globals())
+    host.init_object(globals())
+    BatchingModelTestingClass.batches = []
+
+    # requests with different parameters are not predicted together
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(
+                host.test,
+                "/v2/models/my/infer",
+                {"inputs": [value], "parameters": {"p": value % 2}},
+            )
+            for value in range(4)
+        ]
+        responses = [future.result() for future in futures]
+    assert sorted(BatchingModelTestingClass.batches) == [2, 2]
+    for value, resp in enumerate(responses):
+        assert resp["outputs"] == [value * 100]
+
+
+def test_v2_micro_batching_async_flow():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="async")
+    graph.to(
+        class_name="BatchingModelTestingClass",
+        name="my",
+        model_path="",
+        multiplier=100,
+        max_batch_size=4,
+        max_batch_wait_ms=1000,
+    ).respond()
+
+    server = fn.to_mock_server()
+    BatchingModelTestingClass.batches = []
+
+    # the model step handles the concurrent events together, so they are batched
+    start = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(server.test, "/infer", {"inputs": [value, value + 1]})
+            for value in range(4)
+        ]
+        responses = [future.result() for future in futures]
+    server.wait_for_completion()
+    assert time.monotonic() - start < 1.5, "the events were not batched together"
+    assert BatchingModelTestingClass.batches == [8]
+    for value, resp in enumerate(responses):
+        assert resp["outputs"] == [value * 100, (value + 1) * 100]
+
+
+def test_v2_micro_batching_async_flow_without_concurrent_storey_step():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="async")
+    graph.to(
+        class_name="BatchingModelTestingClass",
+        name="my",
+        model_path="",
+        multiplier=100,
+        max_batch_size=4,
+    ).respond()
+
+    # the events are handled one at a time when storey doesn't have the concurrent execution step
+    with unittest.mock.patch.object(storey.flow, "_ConcurrentJobExecution", None):
+        server = fn.to_mock_server()
+    resp = server.test("/infer", {"inputs": [1, 2]})
+    server.wait_for_completion()
+    assert resp["outputs"] == [100, 200]
+
+
 def test_v2_explain():
     context = init_ctx()
     event = MockEvent(testdata, path="/v2/models/m1/explain")
@@ -342,5 +596,83 @@ def test_function():
     # expected: source (5) * multiplier (100)
     assert resp["outputs"] == 5 * 100, f"wrong health response {resp}"
 
+    # tracking records are pushed in the background, wait for them to be flushed
+    server.wait_for_completion()
     dummy_stream = server.context.stream.output_stream
     assert len(dummy_stream.event_list) == 1, "expected stream to get one message"
+
+
+class SlowStream:
+    def __init__(self):
+        self.event_list = []
+        self.pushes = 0
+        self.blocked = threading.Event()
+
+    def push(self, data):
+        self.blocked.wait()
+        self.pushes += 1
+        self.event_list.extend(data)
+
+
+def test_buffered_stream_pusher():
+    stream = SlowStream()
+    pusher = _BufferedStreamPusher(
+        stream, buffer_size=5, flush_size=3, flush_interval=0.05
+    )
+
+    # the pusher doesn't block on the slow stream, oldest records are dropped from the full buffer
+    start = time.monotonic()
+    pusher.push(list(range(3)))
+    time.sleep(0.2)
+    pusher.push(list(range(3, 10)))
+    assert time.monotonic() - start < 1
+    stream.blocked.set()
+    assert pusher.flush(timeout=5)
+    assert stream.event_list == [0, 1, 2, 5, 6, 7, 8, 9]
+    assert pusher.dropped_records == 2
+    assert pusher.flushed_records == 8
+    assert stream.pushes == 3
+
+    # drop the new records when the buffer is full
+    stream = SlowStream()
+    pusher = _BufferedStreamPusher(
+        stream, buffer_size=2, flush_size=10, full_policy="drop_newest"
+    )
+    pusher.push([1, 2, 3], flush=True)
+    stream.blocked.set()
+    assert pusher.flush(timeout=5)
+    assert stream.event_list == [1, 2]
+    assert pusher.dropped_records == 1
+
+    # the buffered records are flushed when the process exits
+    stream = SlowStream()
+    stream.blocked.set()
+    pusher = _BufferedStreamPusher(stream, flush_size=10, flush_interval=100)
+    pusher.push([1, 2])
+    time.sleep(0.1)
+    assert stream.event_list == []
+    pusher._flush_at_exit()
+    assert stream.event_list == [1, 2]
+
+
+def test_model_log_pusher_copies_records():
+    context = GraphContext()
+    context.stream = unittest.mock.Mock(hostname="host", function_uri="fn")
+    context.get_param = lambda key, default=None: {"log_stream_batch": 2}.get(
+        key, default
+    )
+    model = V2ModelServer(context, name="my", model_path="")
+    stream = mlrun.datastore._DummyStream()
+    model_logger = _ModelLogPusher(model, context, output_stream=stream)
+
+    # the batch is pushed after the next request, the graph may change the first request/response meanwhile
+    request, resp = {"id": "1", "inputs": [1]}, {"id": "1", "outputs": [2]}
+    model_logger.push(now_date(), request, resp, op="infer")
+    resp["outputs"] = [3]
+    request["inputs"] = [4]
+    model_logger.push(now_date(), {"id": "2", "inputs": [5]}, resp, op="infer")
+    assert len(stream.event_list) == 1
+    first, second = stream.event_list[0]["values"]
+    assert first[0] == {"id": "1", "inputs": [1]}
+    assert first[2] == {"id": "1", "outputs": [2]}
+    assert second[2] == {"id": "1", "outputs": [3]}
@@ -0,0 +1,94 @@
+import time
+from unittest.mock import Mock
+
+import mlrun
+from mlrun.execution import MLClientCtx
+from tests.conftest import verify_state
+
+
+def _new_context(db):
+    return MLClientCtx.from_dict(
+        {"metadata": {"name": "write-behind", "project": "default"}}, rundb=db
+    )
+
+
+def _wait_for(condition, timeout=10):
+    start = time.monotonic()
+    while not condition():
+        assert time.monotonic() - start < timeout, "timeout waiting for condition"
+        time.sleep(0.05)
+
+
+def test_write_behind_coalesced_updates():
+    mlrun.mlconf.run_updates.write_behind = True
+    mlrun.mlconf.run_updates.flush_interval = 100
+    db = Mock()
+    context = _new_context(db)
+    assert db.store_run.call_count == 1
+    artifacts = db.store_run.call_args[0][0]["status"]["artifacts"]
+
+    for epoch in range(10):
+        context.log_result("epoch", epoch, commit=True)
+        context.commit()
+    assert db.update_run.call_count == 0
+
+    # written synchronously on completion, only the changed keys
+    context.commit(completed=True)
+    assert db.store_run.call_count == 1
+    assert db.update_run.call_count == 1
+    updates = db.update_run.call_args[0][0]
+    assert updates["status.results"] == {"epoch": 9}
+    assert updates["status.state"] == "completed"
+    assert "status.artifacts" not in updates and artifacts == []
+    assert "spec.parameters" not in updates
+
+
+def test_write_behind_budgets():
+    mlrun.mlconf.run_updates.write_behind = True
+    mlrun.mlconf.run_updates.flush_interval = 100
+    mlrun.mlconf.run_updates.max_pending = 3
+    db = Mock()
+    context = _new_context(db)
+    for epoch in range(3):
+        context.log_result("epoch", epoch, commit=True)
+    _wait_for(lambda: db.update_run.call_count == 1)
+    assert db.update_run.call_args[0][0]["status.results"] == {"epoch": 2}
+
+    mlrun.mlconf.run_updates.max_pending = 100
+    mlrun.mlconf.run_updates.flush_interval = 0.1
+    context = _new_context(db)
+    context.log_result("accuracy", 0.9, commit=True)
+    _wait_for(lambda: db.update_run.call_count == 2)
+
+    # a failed (background) write is retried
+    db.update_run.side_effect = [RuntimeError("db is down"), None]
+    context.log_result("accuracy", 0.95, commit=True)
+    _wait_for(lambda: db.update_run.call_count == 4)
+    assert db.update_run.call_args[0][0]["status.results"] == {"accuracy": 0.95}
+
+    # errors are written synchronously
+    db.update_run.side_effect = None
+    context.set_state(error="some error")
+    assert db.update_run.call_count == 5
+    updates = db.update_run.call_args[0][0]
+    assert updates["status.state"] == "error"
+    assert updates["status.error"] == "some error"
+
+
+def epochs_func(context, epochs):
+    for epoch in range(epochs):
+        context.log_result("epoch", epoch)
+        context.commit()
+    context.log_artifact("model", body=b"model data", local_path="model.txt")
+
+
+def test_write_behind_run():
+    mlrun.mlconf.run_updates.write_behind = True
+    task = mlrun.new_task(params={"epochs": 20})
+    run = mlrun.new_function().run(task, handler=epochs_func)
+    verify_state(run)
+
+    stored = mlrun.get_run_db().read_run(run.metadata.uid, run.metadata.project)
+    assert stored["status"]["state"] == "completed"
+    assert stored["status"]["results"] == {"epoch": 19}
+    assert [a["key"] for a in stored["status"]["artifacts"]] == ["model"]
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import pathlib
+import time
 from unittest.mock import Mock
 
 import pandas as pd
@@ -237,6 +238,7 @@ def test_hyper_parallel_with_stop():
         selector="max.r1",
         strategy="list",
         stop_condition="r1>=70",
+        parallel_executor="dask",
     )
     run = new_function().run(run_spec, handler=hyper_func)
 
@@ -247,6 +249,56 @@ def test_hyper_parallel_with_stop():
     assert run.output("best_iteration") == 3, "wrong best iteration"
 
 
+def ordered_hyper_func(context, p1, p2, p3):
+    # later iterations take longer, so they complete in order
+    time.sleep(context.iteration * 0.2)
+    if p2 < 0:
+        raise ValueError(f"negative p2 {p2}")
+    print(f"p2={p2}, p3={p3}")
+    context.log_result("r1", p2 * p3)
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_hyper_pool_with_stop(executor):
+    run_spec = mlrun.new_task(params={"p1": 1})
+    run_spec.with_hyper_params(
+        {"p2": [2, 3, 7, 4, 5, 6], "p3": [10, 10, 10, 10, 10, 10]},
+        parallel_runs=2,
+        selector="max.r1",
+        strategy="list",
+        stop_condition="r1>=70",
+        parallel_executor=executor,
+    )
+    run = new_function().run(run_spec, handler=ordered_hyper_func)
+
+    verify_state(run)
+    # stops on the third run, the fourth is already running and the rest are not started
+    assert len(run.status.iterations) == 1 + 4, "wrong number of iterations"
+    assert run.output("best_iteration") == 3, "wrong best iteration"
+
+    # the iterations (child runs) and their logs are stored
+    db = get_run_db()
+    child_runs = db.list_runs(uid=run.metadata.uid, iter=True)
+    iterations = sorted(child["metadata"]["iteration"] for child in child_runs)
+    assert iterations == [0, 1, 2, 3, 4]
+    log = db.get_log(run.metadata.uid)[1].decode()
+    assert "Iteration: (4)" in log and "p2=4, p3=10" in log
+
+
+def test_hyper_pool_max_errors():
+    run_spec = mlrun.new_task(params={"p1": 1})
+    run_spec.with_hyper_params(
+        {"p2": [-1, 2, -3, -4, 5, 6, 7], "p3": [10, 10, 10, 10, 10, 10, 10]},
+        parallel_runs=2,
+        strategy="list",
+        max_errors=1,
+        parallel_executor="thread",
+    )
+    # stops on the second error (third run), the fourth is already running
+    with pytest.raises(mlrun.runtimes.utils.RunError, match="3 of 4 tasks failed"):
+        new_function().run(run_spec, handler=ordered_hyper_func)
+
+
 def test_hyper_random():
     grid_params = {"p2": [2, 1, 3], "p3": [10, 20, 30]}
     run_spec = tag_test(base_spec, "test_hyper_random")
@@ -259,6 +311,51 @@ def test_hyper_random():
     assert len(run.status.iterations) == 1 + 5, "wrong number of iterations"
 
 
+def epochs_hyper_func(context, p1, p2, epochs):
+    context.log_result("r1", p2 * epochs)
+
+
+@pytest.mark.parametrize("executor", [None, "thread"])
+def test_hyper_halving(executor):
+    run_spec = mlrun.new_task(params={"p1": 1})
+    run_spec.with_hyper_params(
+        {"p2": [2, 1, 5, 3, 9, 4, 7, 6, 8]},
+        selector="max.r1",
+        strategy="halving",
+        resource_param="epochs",
+        max_resource=9,
+        parallel_runs=3 if executor else None,
+        parallel_executor=executor,
+    )
+    run = new_function().run(run_spec, handler=epochs_hyper_func)
+
+    verify_state(run)
+    # 9 iterations with 1 epoch, the best 3 with 3 epochs and the best one with 9 epochs
+    assert len(run.status.iterations) == 1 + 13, "wrong number of iterations"
+    assert run.output("best_iteration") == 13, "wrong best iteration"
+    assert run.output("r1") == 81
+
+
+@pytest.mark.parametrize("executor", [None, "process"])
+def test_hyper_bayesian(executor):
+    run_spec = mlrun.new_task(params={"p1": 1})
+    run_spec.with_hyper_params(
+        {"p2": [2, 1, 3], "p3": [10, 20, 30]},
+        selector="max.r1",
+        strategy="bayesian",
+        max_iterations=6,
+        parallel_runs=2 if executor else None,
+        parallel_executor=executor,
+    )
+    run = new_function().run(run_spec, handler=hyper_func)
+
+    verify_state(run)
+    assert len(run.status.iterations) == 1 + 6, "wrong number of iterations"
+    # the iterations are distinct combinations
+    params = {tuple(line[3:5]) for line in run.status.iterations[1:]}
+    assert len(params) == 6
+
+
 def custom_hyper_func(context: mlrun.MLClientCtx):
     best_accuracy = 0
     for param in [1, 2, 4, 3]:
@@ -316,3 +413,44 @@ def test_local_args():
     print(state)
     print(log)
     assert log.find(", '--xyz', '789']") != -1, "params not detected in argv"
+
+
+def test_wait_for_runs_completion(monkeypatch):
+    runs = []
+    for uid in ["uid-1", "uid-2"]:
+        run = mlrun.RunObject.from_dict(
+            {"metadata": {"uid": uid, "project": "some-project"}}
+        )
+        run.status.state = "running"
+        runs.append(run)
+
+    db = Mock()
+    db.list_runs_states.side_effect = [
+        ["running", "running"],
+        ["running", "running"],
+        ["running", "running"],
+        ["completed", "running"],
+        ["running"],
+        ["error"],
+    ]
+    final_states = {"uid-1": "completed", "uid-2": "error"}
+    db.read_run.side_effect = lambda uid, project, iter: {
+        "metadata": {"uid": uid, "project": project},
+        "status": {"state": final_states[uid]},
+    }
+    sleeps = []
+    monkeypatch.setattr(mlrun.run, "get_run_db", lambda: db)
+    monkeypatch.setattr(mlrun, "get_run_db", lambda: db)
+    monkeypatch.setattr(mlrun.run.time, "sleep", sleeps.append)
+
+    completed = mlrun.run.wait_for_runs_completion(runs, sleep=1, max_sleep=3)
+    assert [run.metadata.uid for run in completed] == ["uid-1", "uid-2"]
+    # only the completed runs are read
+    assert db.read_run.call_count == 2
+    # backs off while the states don't change
+    assert sleeps == [1, 2, 1]
+    assert db.list_runs_states.call_args_list[0][0][1] is None
+    assert db.list_runs_states.call_args_list[4][0] == (
+        [("some-project", "uid-2", 0)],
+        ["running"],
+    )